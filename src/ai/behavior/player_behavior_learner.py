@@ -1,58 +1,253 @@
 import json
 import os
+import struct
+import threading
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split
 
-class PlayerBehaviorLearner:
+LEGACY_DATA_FILE = "player_behavior_data.json"
+
+# Sample log record: label length, feature count, JSON label, float64 features
+RECORD_HEADER = struct.Struct("<HH")
+
+def random_forest():
+    # sklearn is only imported when a batch model is first trained
+    from sklearn.ensemble import RandomForestClassifier
+    return RandomForestClassifier(n_estimators=100)
+
+class SampleLog:
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+
+    def load(self):
+        samples = []
+        if not os.path.exists(self.path):
+            return samples
+        with open(self.path, "rb") as f:
+            data = f.read()
+        offset = 0
+        while offset + RECORD_HEADER.size <= len(data):
+            label_length, feature_count = RECORD_HEADER.unpack_from(data, offset)
+            start = offset + RECORD_HEADER.size
+            end = start + label_length + 8 * feature_count
+            if end > len(data):
+                break
+            label = json.loads(data[start:start + label_length].decode("utf-8"))
+            features = np.frombuffer(data, dtype="<f8", count=feature_count,
+                                     offset=start + label_length)
+            samples.append((label, features))
+            offset = end
+        if offset < len(data):
+            # Drop a record cut short by an interrupted write so appends stay aligned
+            os.truncate(self.path, offset)
+        return samples
+
+    def append(self, label, features):
+        if self.file is None:
+            self.file = open(self.path, "ab")
+        encoded = json.dumps(label).encode("utf-8")
+        features = np.asarray(features, dtype="<f8")
+        self.file.write(RECORD_HEADER.pack(len(encoded), len(features)) + encoded + features.tobytes())
+
+    def flush(self):
+        if self.file is not None:
+            self.file.flush()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+class FeatureBuffer:
+    def __init__(self, capacity=1024):
+        self.features = None
+        self.labels = np.empty(capacity, dtype=object)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, features, label):
+        features = np.asarray(features, dtype=np.float64)
+        if self.features is None:
+            self.features = np.empty((len(self.labels), len(features)))
+        if self.size == len(self.labels):
+            # Grow geometrically so appends are amortized O(1)
+            self.features = np.concatenate([self.features, np.empty_like(self.features)])
+            self.labels = np.concatenate([self.labels, np.empty_like(self.labels)])
+        self.features[self.size] = features
+        self.labels[self.size] = label
+        self.size += 1
+
+    @property
+    def X(self):
+        if self.features is None:
+            return np.empty((0, 0))
+        return self.features[:self.size]
+
+    @property
+    def y(self):
+        return self.labels[:self.size]
+
+    def snapshot(self):
+        return self.X.copy(), self.y.copy()
+
+class OnlineCentroidClassifier:
+    # Keeps a running mean game state per action, so each update and
+    # prediction costs O(actions x features) however much data has been seen
     def __init__(self):
-        self.data = []
-        self.model = RandomForestClassifier(n_estimators=100)
+        self.reset()
+
+    def reset(self):
+        self.classes_ = []
+        self.class_index = {}
+        self.sums = None
+        self.counts = np.zeros(0)
+
+    def partial_fit(self, X, y):
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        if self.sums is None:
+            self.sums = np.zeros((0, X.shape[1]))
+        for label in y:
+            if label not in self.class_index:
+                self.class_index[label] = len(self.classes_)
+                self.classes_.append(label)
+                self.sums = np.vstack([self.sums, np.zeros(X.shape[1])])
+                self.counts = np.append(self.counts, 0)
+        rows = np.array([self.class_index[label] for label in y], dtype=np.intp)
+        np.add.at(self.sums, rows, X)
+        np.add.at(self.counts, rows, 1)
+        return self
+
+    def fit(self, X, y):
+        self.reset()
+        return self.partial_fit(X, y)
+
+    def predict(self, X):
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        centroids = self.sums / self.counts[:, None]
+        distances = ((X[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2)
+        labels = np.empty(len(self.classes_), dtype=object)
+        labels[:] = self.classes_
+        return labels[distances.argmin(axis=1)]
+
+class PlayerBehaviorLearner:
+    def __init__(self, data_path="player_behavior_data.bin", model_factory=random_forest,
+                 incremental=False, retrain_interval=50):
+        self.data_path = data_path
+        self.model_factory = model_factory
+        self.incremental = incremental
+        self.retrain_interval = retrain_interval
+        self.buffer = FeatureBuffer()
+        self.log = SampleLog(data_path)
+        # Incremental mode updates one online model per action; otherwise
+        # batch models are retrained and swapped in when training finishes
+        self.model = OnlineCentroidClassifier() if incremental else None
+        self.model_version = 0
+        self.accuracy = None
+        self.samples_since_training = 0
+
+        self.data_lock = threading.Lock()
+        self.train_lock = threading.Lock()
+        self.retrain_event = threading.Event()
+        self.is_running = False
+        self.training_thread = None
         self.load_data()
 
+    def start(self):
+        if self.is_running or self.incremental:
+            return
+        self.is_running = True
+        self.training_thread = threading.Thread(target=self._training_loop, daemon=True)
+        self.training_thread.start()
+
+    def stop(self):
+        self.is_running = False
+        self.retrain_event.set()
+        if self.training_thread:
+            self.training_thread.join()
+            self.training_thread = None
+        self.log.close()
+
     def load_data(self):
-        if os.path.exists("player_behavior_data.json"):
-            with open("player_behavior_data.json", "r") as f:
-                self.data = json.load(f)
+        samples = self.log.load()
+        legacy_path = os.path.join(os.path.dirname(self.data_path), LEGACY_DATA_FILE)
+        if not samples and os.path.exists(legacy_path):
+            # Carry over data written by the old JSON format
+            with open(legacy_path, "r") as f:
+                samples = [(data_point["player_action"], data_point["game_state"])
+                           for data_point in json.load(f)]
+            for label, features in samples:
+                self.log.append(label, features)
+            self.log.flush()
+        for label, features in samples:
+            self.buffer.append(features, label)
+        if self.incremental and samples:
+            self.model.partial_fit(self.buffer.X, self.buffer.y)
 
     def save_data(self):
-        with open("player_behavior_data.json", "w") as f:
-            json.dump(self.data, f, indent=4)
+        self.log.flush()
 
     def collect_data(self, player_action, game_state):
-        self.data.append({"player_action": player_action, "game_state": game_state})
-        self.save_data()
+        with self.data_lock:
+            self.buffer.append(game_state, player_action)
+            self.log.append(player_action, game_state)
+            self.log.flush()
+        if self.incremental:
+            self.model.partial_fit([game_state], [player_action])
+            return
+        self.samples_since_training += 1
+        if self.samples_since_training >= self.retrain_interval:
+            self.update_model()
 
     def train_model(self):
-        X = []
-        y = []
-        for data_point in self.data:
-            X.append(data_point["game_state"])
-            y.append(data_point["player_action"])
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-        self.model.fit(X_train, y_train)
+        with self.train_lock:
+            with self.data_lock:
+                X, y = self.buffer.snapshot()
+            if len(y) < 2:
+                return None
+            order = np.random.RandomState(42).permutation(len(y))
+            split = max(1, int(len(y) * 0.8))
+            train, test = order[:split], order[split:]
+            model = self.model_factory()
+            model.fit(X[train], y[train])
+            accuracy = float(np.mean(model.predict(X[test]) == y[test])) if len(test) else None
+            # Predictions keep using the previous model until this assignment
+            self.model, self.accuracy = model, accuracy
+            self.model_version += 1
+            return model
+
+    def _training_loop(self):
+        while True:
+            self.retrain_event.wait()
+            if not self.is_running:
+                return
+            self.retrain_event.clear()
+            self.train_model()
 
     def predict_player_action(self, game_state):
-        return self.model.predict([game_state])[0]
+        model = self.model
+        if model is None or (self.incremental and not model.classes_):
+            return None
+        return model.predict(np.asarray(game_state, dtype=np.float64)[None, :])[0]
 
     def evaluate_model(self):
-        X = []
-        y = []
-        for data_point in self.data:
-            X.append(data_point["game_state"])
-            y.append(data_point["player_action"])
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-        y_pred = self.model.predict(X_test)
-        accuracy = np.mean(y_pred == y_test)
-        print(f"Model accuracy: {accuracy:.2f}")
+        if self.accuracy is not None:
+            print(f"Model accuracy: {self.accuracy:.2f}")
+        return self.accuracy
 
     def update_model(self):
-        self.train_model()
-        self.evaluate_model()
+        self.samples_since_training = 0
+        if self.incremental:
+            return
+        if self.is_running:
+            self.retrain_event.set()
+        else:
+            self.train_model()
+            self.evaluate_model()
 
     def get_player_action(self, game_state):
         return self.predict_player_action(game_state)
 
     def add_data_point(self, player_action, game_state):
         self.collect_data(player_action, game_state)
-        self.update_model()
\ No newline at end of file
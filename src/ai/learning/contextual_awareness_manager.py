@@ -1,15 +1,26 @@
 import json
 import os
+import threading
+from collections import deque
 
 class ContextualAwarenessManager:
-    def __init__(self):
+    def __init__(self, rules_path="context_rules.json", history_size=256, save_delay=1.0):
+        self.rules_path = rules_path
+        self.save_delay = save_delay
         self.context = {}
-        self.context_history = []
+        self.context_history = deque(maxlen=history_size)
         self.context_rules = self.load_context_rules()
+        self.rule_index = {}
+        self.compile_context_rules()
+
+        # Rule edits are written behind, save_delay seconds after the last edit
+        self.save_lock = threading.RLock()
+        self.save_timer = None
+        self.rules_dirty = False
 
     def load_context_rules(self):
-        if os.path.exists("context_rules.json"):
-            with open("context_rules.json", "r") as f:
+        if os.path.exists(self.rules_path):
+            with open(self.rules_path, "r") as f:
                 return json.load(f)
         else:
             return {
@@ -27,45 +38,97 @@ class ContextualAwarenessManager:
                 }
             }
 
+    def compile_context_rules(self, key=None):
+        keys = [key] if key is not None else list(self.context_rules)
+        for rule_key in keys:
+            rule = self.context_rules.get(rule_key)
+            if isinstance(rule, dict):
+                self.rule_index[rule_key] = {value: tuple(actions) for value, actions in rule.items()}
+            else:
+                self.rule_index.pop(rule_key, None)
+
     def save_context_rules(self):
-        with open("context_rules.json", "w") as f:
-            json.dump(self.context_rules, f, indent=4)
+        with self.save_lock:
+            if self.save_timer is not None:
+                self.save_timer.cancel()
+                self.save_timer = None
+            self.rules_dirty = False
+            temp_path = f"{self.rules_path}.tmp"
+            with open(temp_path, "w") as f:
+                json.dump(self.context_rules, f, indent=4)
+            os.replace(temp_path, self.rules_path)
+
+    def schedule_save(self):
+        with self.save_lock:
+            self.rules_dirty = True
+            if self.save_timer is not None:
+                self.save_timer.cancel()
+            self.save_timer = threading.Timer(self.save_delay, self.flush)
+            self.save_timer.daemon = True
+            self.save_timer.start()
+
+    def flush(self):
+        with self.save_lock:
+            if self.rules_dirty:
+                self.save_context_rules()
+
+    def close(self):
+        # The write-behind timer is a daemon thread, so pending edits must be
+        # written out before the process exits
+        with self.save_lock:
+            if self.save_timer is not None:
+                self.save_timer.cancel()
+                self.save_timer = None
+            self.flush()
 
     def manage_context(self, new_context):
         self.context = new_context
         self.context_history.append(new_context)
-        self.apply_context_rules()
+        return self.apply_context_rules()
 
     def apply_context_rules(self):
+        applied = {}
         for key, value in self.context.items():
-            if key in self.context_rules:
-                for rule in self.context_rules[key]:
-                    if value in rule:
-                        print(f"Context rule applied: {key} = {value}")
+            values = self.rule_index.get(key)
+            if values is None:
+                continue
+            try:
+                actions = values.get(value)
+            except TypeError:
+                continue
+            if actions is not None:
+                applied[key] = actions
+        return applied
 
     def get_context(self):
         return self.context
 
     def get_context_history(self):
-        return self.context_history
+        return list(self.context_history)
 
     def update_context_rule(self, key, value):
         if key in self.context_rules:
-            self.context_rules[key] = value
-            self.save_context_rules()
+            with self.save_lock:
+                self.context_rules[key] = value
+                self.compile_context_rules(key)
+                self.schedule_save()
             print(f"Context rule updated: {key} = {value}")
         else:
             print(f"Invalid key: {key}")
 
     def add_context_rule(self, key, value):
-        self.context_rules[key] = value
-        self.save_context_rules()
+        with self.save_lock:
+            self.context_rules[key] = value
+            self.compile_context_rules(key)
+            self.schedule_save()
         print(f"Context rule added: {key} = {value}")
 
     def remove_context_rule(self, key):
         if key in self.context_rules:
-            del self.context_rules[key]
-            self.save_context_rules()
+            with self.save_lock:
+                del self.context_rules[key]
+                self.compile_context_rules(key)
+                self.schedule_save()
             print(f"Context rule removed: {key}")
         else:
             print(f"Invalid key: {key}")
@@ -77,4 +140,4 @@ class ContextualAwarenessManager:
 
     def predict_context(self):
         # Add prediction logic here
-        pass
\ No newline at end of file
+        pass
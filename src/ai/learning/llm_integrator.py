@@ -1,32 +1,197 @@
 import json
 import os
-import torch
-from transformers import AutoModelForSequenceClassification, AutoTokenizer
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 
-class LLMIntegrator:
-    def __init__(self):
-        self.model_name = "distilbert-base-uncased"
-        self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+
+class TransformersClassifier:
+    # torch and transformers are only imported once the model is first used
+    def __init__(self, model_name, quantize=False):
+        self.model_name = model_name
+        self.quantize = quantize
+        self.model = None
+        self.tokenizer = None
+
+    def load(self):
+        if self.model is not None:
+            return
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+        model.eval()
+        if self.quantize:
+            # Dynamic int8 quantization of the linear layers, CPU inference only
+            model = torch.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
         self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        self.model = model
+
+    def prepare_input(self, texts):
+        encoded = self.tokenizer(texts, padding=True, truncation=True, return_tensors="pt")
+        return encoded["input_ids"], encoded["attention_mask"]
+
+    def classify(self, texts):
+        import torch
+
+        self.load()
+        input_ids, attention_mask = self.prepare_input(texts)
+        with torch.no_grad():
+            logits = self.model(input_ids, attention_mask=attention_mask).logits
+        return torch.argmax(logits, dim=-1).tolist()
+
+
+class LLMIntegrator:
+    def __init__(self, model_name="distilbert-base-uncased", classifier=None,
+                 max_batch_size=16, batch_wait=0.005, cache_size=1024, quantize=False):
+        self.model_name = model_name
+        self.classifier = classifier or TransformersClassifier(model_name, quantize)
         self.context = {}
 
+        # LRU of normalized context text -> predicted class
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.cache_lock = threading.Lock()
+        self.cache_hits = 0
+
+        # Micro-batching: concurrent requests wait up to batch_wait seconds
+        # so they can share one forward pass
+        self.max_batch_size = max_batch_size
+        self.batch_wait = batch_wait
+        self.pending = []
+        self.pending_condition = threading.Condition()
+        self.forward_passes = 0
+        self.is_running = False
+        self.batch_thread = None
+
+    @property
+    def model(self):
+        self.classifier.load()
+        return self.classifier.model
+
+    @property
+    def tokenizer(self):
+        self.classifier.load()
+        return self.classifier.tokenizer
+
+    def start(self):
+        with self.pending_condition:
+            if self.is_running:
+                return
+            self.is_running = True
+        self.batch_thread = threading.Thread(target=self._batch_loop, daemon=True)
+        self.batch_thread.start()
+
+    def stop(self):
+        with self.pending_condition:
+            self.is_running = False
+            self.pending_condition.notify_all()
+        if self.batch_thread:
+            self.batch_thread.join()
+            self.batch_thread = None
+
     def integrate_llm(self, context):
         self.context = context
-        input_ids, attention_mask = self.prepare_input(context)
-        outputs = self.model(input_ids, attention_mask=attention_mask)
-        logits = outputs.logits
-        predicted_class = torch.argmax(logits)
-        return predicted_class
+        return self.classify(context)
+
+    @staticmethod
+    def normalize_context(context):
+        if not isinstance(context, str):
+            context = json.dumps(context, sort_keys=True, default=str)
+        # The default model is uncased, so case and spacing don't change its input
+        return " ".join(context.lower().split())
+
+    def classify(self, context):
+        text = self.normalize_context(context)
+        cached = self._cache_get(text)
+        if cached is not None:
+            return cached
+
+        # Checked under the condition so the worker can't stop between the
+        # check and the append; once stopped, requests run inline
+        future = Future()
+        with self.pending_condition:
+            queued = self.is_running
+            if queued:
+                self.pending.append((text, future))
+                self.pending_condition.notify_all()
+        if not queued:
+            return self._run_batch([text])[0]
+        return future.result()
+
+    def classify_many(self, contexts):
+        texts = [self.normalize_context(context) for context in contexts]
+        results = [self._cache_get(text) for text in texts]
+        missing = list(OrderedDict.fromkeys(
+            text for text, result in zip(texts, results) if result is None
+        ))
+        computed = {}
+        for start in range(0, len(missing), self.max_batch_size):
+            batch = missing[start:start + self.max_batch_size]
+            computed.update(zip(batch, self._run_batch(batch)))
+        return [result if result is not None else computed[text]
+                for text, result in zip(texts, results)]
+
+    def _cache_get(self, text):
+        with self.cache_lock:
+            result = self.cache.get(text)
+            if result is not None:
+                self.cache.move_to_end(text)
+                self.cache_hits += 1
+            return result
+
+    def _cache_put(self, text, result):
+        with self.cache_lock:
+            self.cache[text] = result
+            self.cache.move_to_end(text)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    def _run_batch(self, texts):
+        results = self.classifier.classify(texts)
+        with self.cache_lock:
+            self.forward_passes += 1
+        for text, result in zip(texts, results):
+            self._cache_put(text, result)
+        return results
+
+    def _batch_loop(self):
+        while True:
+            with self.pending_condition:
+                self.pending_condition.wait_for(lambda: self.pending or not self.is_running)
+                if not self.pending and not self.is_running:
+                    return
+                # Give concurrent callers a moment to join the batch
+                self.pending_condition.wait_for(
+                    lambda: len(self.pending) >= self.max_batch_size or not self.is_running,
+                    self.batch_wait
+                )
+                batch = self.pending[:self.max_batch_size]
+                del self.pending[:self.max_batch_size]
+
+            # Duplicate texts in one batch share a row
+            texts = list(OrderedDict.fromkeys(text for text, _ in batch))
+            try:
+                results = dict(zip(texts, self._run_batch(texts)))
+            except Exception as error:
+                for _, future in batch:
+                    future.set_exception(error)
+                continue
+            for text, future in batch:
+                future.set_result(results[text])
 
     def prepare_input(self, context):
-        input_text = self.tokenizer.encode(context, return_tensors="pt")
-        input_ids = input_text["input_ids"]
-        attention_mask = input_text["attention_mask"]
-        return input_ids, attention_mask
+        self.classifier.load()
+        return self.classifier.prepare_input([self.normalize_context(context)])
 
     def train_llm(self, dataset):
+        import torch
+
         device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self.model.to(device)
+        self.model.train()
         optimizer = torch.optim.Adam(self.model.parameters(), lr=1e-5)
         for epoch in range(5):
             for batch in dataset:
@@ -38,15 +203,26 @@ class LLMIntegrator:
                 loss.backward()
                 optimizer.step()
                 print(f"Epoch {epoch+1}, Loss: {loss.item()}")
+        self.model.eval()
+        self.clear_cache()
 
     def save_llm(self):
+        import torch
+
         torch.save(self.model.state_dict(), "llm_model.pth")
 
     def load_llm(self):
+        import torch
+
         self.model.load_state_dict(torch.load("llm_model.pth"))
+        self.clear_cache()
+
+    def clear_cache(self):
+        with self.cache_lock:
+            self.cache.clear()
 
     def get_context(self):
         return self.context
 
     def update_context(self, new_context):
-        self.context = new_context
\ No newline at end of file
+        self.context = new_context
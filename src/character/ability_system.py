@@ -108,10 +108,13 @@ class AbilitySystem:
         self.active_abilities: Set[str] = set()
         self.passive_abilities: Set[str] = set()
         self.ability_cooldowns: Dict[str, float] = {}
+        # Bumped whenever an ability is (re)registered, so derived caches can tell
+        self.revision = 0
         
     def register_ability(self, ability: Ability) -> None:
         """Register a new ability"""
         self.abilities[ability.name] = ability
+        self.revision += 1
         if ability.trigger == AbilityTrigger.PASSIVE:
             self.passive_abilities.add(ability.name)
         else:
@@ -3,6 +3,7 @@ from typing import Dict, List, Set, Optional, Tuple
 from enum import Enum, auto
 import math
 import random
+import numpy as np
 from src.combat_system.dimensional_combat import DimensionalLayer, Position, DimensionalEffect
 from src.character.ability_system import AbilitySystem, Ability, AbilityType
 from src.character.progression_system import ProgressionSystem, StatType
@@ -47,6 +48,26 @@ class TacticalState:
     available_abilities: Set[str]
     ability_cooldowns: Dict[str, float]
 
+# Offsets of the candidate positions around an NPC, in _get_nearby_positions order
+NEIGHBOR_OFFSETS = np.array([
+    (dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy
+], dtype=float)
+
+MAX_ABILITY_TABLES = 64
+
+@dataclass
+class AbilityTable:
+    """Ability features packed into arrays for batch scoring"""
+    names: Tuple[str, ...]
+    type_preferences: np.ndarray
+    cost_ability: np.ndarray  # Row of the ability each cost belongs to
+    cost_resource: List[str]
+    cost_amount: np.ndarray
+    cost_count: np.ndarray
+    has_buff: np.ndarray
+    has_aoe: np.ndarray
+    has_stabilizing: np.ndarray
+
 class NPCAI:
     """Manages NPC AI behavior and decision making"""
     
@@ -74,6 +95,8 @@ class NPCAI:
         self.behavior_weights = self._initialize_behavior_weights()
         self.ability_preferences = self._initialize_ability_preferences()
         self.tactical_preferences = self._initialize_tactical_preferences()
+        self._ability_tables: Dict[Tuple[str, ...], AbilityTable] = {}
+        self._ability_tables_revision = ability_system.revision
         
     def _initialize_behavior_weights(self) -> Dict[str, float]:
         """Initialize behavior weights based on type"""
@@ -181,38 +204,51 @@ class NPCAI:
         state: TacticalState
     ) -> Dict[Position, float]:
         """Evaluate possible tactical positions"""
-        position_scores = {}
+        positions, scores = self.score_tactical_positions(state)
+        return dict(zip(positions, scores.tolist()))
         
-        # Get possible positions (simplified for example)
-        possible_positions = self._get_nearby_positions(state.current_position)
+    def choose_tactical_position(self, state: TacticalState) -> Position:
+        """Choose the best scoring nearby position"""
+        positions, scores = self.score_tactical_positions(state)
+        return positions[int(np.argmax(scores))]
         
-        for position in possible_positions:
-            score = 0.0
-            
-            # Distance to allies
-            for ally_pos in state.nearby_allies:
-                distance = self._calculate_distance(position, ally_pos)
-                score += self._score_ally_distance(distance)
-                
-            # Distance to enemies
-            for enemy_pos in state.nearby_enemies:
-                distance = self._calculate_distance(position, enemy_pos)
-                score += self._score_enemy_distance(distance)
-                
-            # Terrain evaluation
-            terrain_score = self._evaluate_terrain(state.current_terrain)
-            score += terrain_score
-            
-            # Dimensional stability
-            stability_score = self._evaluate_stability(
-                state.active_effects,
-                state.current_terrain
-            )
-            score += stability_score
-            
-            position_scores[position] = score
-            
-        return position_scores
+    def score_tactical_positions(
+        self,
+        state: TacticalState
+    ) -> Tuple[List[Position], np.ndarray]:
+        """Score all nearby positions against all allies and enemies at once"""
+        current = state.current_position
+        candidates = np.array([current.x, current.y], dtype=float) + NEIGHBOR_OFFSETS
+        
+        scores = self._score_distances(
+            candidates, state.nearby_allies, self.tactical_preferences["ally_proximity"]
+        )
+        scores += self._score_distances(
+            candidates, state.nearby_enemies, self.tactical_preferences["enemy_proximity"]
+        )
+        
+        # Terrain and stability come from the current cell, so every candidate shares them
+        scores += self._evaluate_terrain(state.current_terrain)
+        scores += self._evaluate_stability(
+            state.active_effects,
+            state.current_terrain
+        )
+        
+        return self._get_nearby_positions(current), scores
+        
+    def _score_distances(
+        self,
+        candidates: np.ndarray,
+        others: List[Position],
+        optimal: float
+    ) -> np.ndarray:
+        """Sum distance scores from each candidate to every other position"""
+        if not others:
+            return np.zeros(len(candidates))
+        points = np.array([(other.x, other.y) for other in others], dtype=float)
+        offsets = candidates[:, np.newaxis, :] - points[np.newaxis, :, :]
+        distances = np.sqrt((offsets ** 2).sum(axis=2))
+        return np.maximum(0.0, 1.0 - np.abs(distances - optimal) / optimal).sum(axis=1)
         
     def choose_ability(
         self,
@@ -220,27 +256,127 @@ class NPCAI:
         target_position: Position
     ) -> Optional[str]:
         """Choose the best ability for the current situation"""
-        available_abilities = {
-            name: self.ability_system.abilities[name]
-            for name in state.available_abilities
-            if name not in state.ability_cooldowns
-        }
-        
-        if not available_abilities:
+        names, scores = self.score_abilities(state, target_position)
+        if not names or np.isneginf(scores).all():
             return None
+        return names[int(np.argmax(scores))]
+        
+    def score_abilities(
+        self,
+        state: TacticalState,
+        target_position: Position
+    ) -> Tuple[List[str], np.ndarray]:
+        """Score every available ability at once, -inf for those on cooldown"""
+        table = self._get_ability_table(tuple(sorted(state.available_abilities)))
+        if not table.names:
+            return [], np.zeros(0)
             
-        ability_scores = {}
-        for name, ability in available_abilities.items():
-            score = self._score_ability(
-                ability,
-                state,
-                target_position
-            )
-            ability_scores[name] = score
+        # Range scoring only depends on the distance, so it is the same for every ability
+        distance = self._calculate_distance(
+            state.current_position,
+            target_position
+        )
+        scores = table.type_preferences + self._score_ability_range(None, distance)
+        scores += self._score_resource_costs(table, state.resource_percentages)
+        scores += self._score_tactical_values(table, state)
+        scores += self._score_historical_successes(table.names)
+        
+        ready = np.array([name not in state.ability_cooldowns for name in table.names])
+        return list(table.names), np.where(ready, scores, -np.inf)
+        
+    def _get_ability_table(self, names: Tuple[str, ...]) -> AbilityTable:
+        """Pack abilities into arrays, cached per set of available abilities"""
+        # A re-registered ability may have new costs or effects
+        if self._ability_tables_revision != self.ability_system.revision:
+            self._ability_tables.clear()
+            self._ability_tables_revision = self.ability_system.revision
+            
+        table = self._ability_tables.get(names)
+        if table is not None:
+            return table
             
-        if ability_scores:
-            return max(ability_scores.items(), key=lambda x: x[1])[0]
-        return None
+        abilities = [self.ability_system.abilities[name] for name in names]
+        costs = [
+            (row, str(cost.resource_type), cost.base_amount)
+            for row, ability in enumerate(abilities)
+            for cost in ability.costs
+        ]
+        table = AbilityTable(
+            names=names,
+            type_preferences=np.array(
+                [self.ability_preferences[ability.ability_type] for ability in abilities],
+                dtype=float
+            ),
+            cost_ability=np.array([row for row, _, _ in costs], dtype=np.intp),
+            cost_resource=[resource for _, resource, _ in costs],
+            cost_amount=np.array([amount for _, _, amount in costs], dtype=float),
+            cost_count=np.array([len(ability.costs) for ability in abilities], dtype=float),
+            has_buff=np.array([
+                any(effect.is_buff for effect in ability.effects) for ability in abilities
+            ]),
+            has_aoe=np.array([
+                any(effect.radius > 0 for effect in ability.effects) for ability in abilities
+            ]),
+            has_stabilizing=np.array([
+                any(effect.effect_type == DimensionalEffect.PURIFICATION
+                    for effect in ability.effects)
+                for ability in abilities
+            ])
+        )
+        
+        if len(self._ability_tables) >= MAX_ABILITY_TABLES:
+            self._ability_tables.clear()
+        self._ability_tables[names] = table
+        return table
+        
+    def _score_resource_costs(
+        self,
+        table: AbilityTable,
+        resource_percentages: Dict[str, float]
+    ) -> np.ndarray:
+        """Score all abilities' resource costs at once"""
+        count = len(table.names)
+        percents = np.array(
+            [resource_percentages.get(resource, np.nan) for resource in table.cost_resource],
+            dtype=float
+        )
+        margins = percents - table.cost_amount
+        known = ~np.isnan(margins)
+        
+        totals = np.bincount(table.cost_ability[known], weights=margins[known], minlength=count)
+        blocked = np.bincount(table.cost_ability[known & (margins < 0)], minlength=count) > 0
+        scores = np.divide(
+            totals, table.cost_count,
+            out=np.zeros(count), where=table.cost_count > 0
+        )
+        return np.where(blocked, -1000.0, scores)  # Cannot use
+        
+    def _score_tactical_values(
+        self,
+        table: AbilityTable,
+        state: TacticalState
+    ) -> np.ndarray:
+        """Score all abilities for the tactical situation at once"""
+        scores = np.zeros(len(table.names))
+        if state.health_percentage < 0.3:
+            scores += 2.0 * table.has_buff
+        if len(state.nearby_enemies) > 2:
+            scores += 1.5 * table.has_aoe
+        if self._is_warping_active(state.active_effects):
+            scores += 1.0 * table.has_stabilizing
+        return scores
+        
+    def _score_historical_successes(self, names: Tuple[str, ...]) -> np.ndarray:
+        """Score all abilities' historical success at once"""
+        dealt = np.array(
+            [self.combat_memory.damage_dealt.get(name, 0) for name in names], dtype=float
+        )
+        taken = np.array(
+            [self.combat_memory.damage_taken.get(name, 0) for name in names], dtype=float
+        )
+        total = dealt + taken
+        ratios = np.divide(dealt, total, out=np.zeros(len(names)), where=total > 0)
+        return np.where(total > 0, ratios * 2.0 - 1.0, 0.0)
         
     def _score_ability(
         self,
@@ -318,15 +454,21 @@ class NPCAI:
                 score += 1.5
                 
         # Dimensional considerations
-        if any(effect.effect_type == DimensionalEffect.WARPING 
-               for effect in state.active_effects):
+        if self._is_warping_active(state.active_effects):
             # Favor stabilizing abilities when dimensional warping is active
-            if any(effect.effect_type == DimensionalEffect.STABILIZING 
+            if any(effect.effect_type == DimensionalEffect.PURIFICATION 
                    for effect in ability.effects):
                 score += 1.0
                 
         return score
         
+    def _is_warping_active(self, active_effects: Set[DimensionalEffect]) -> bool:
+        """Check whether dimensional warping is among the active effects"""
+        return any(
+            getattr(effect, "effect_type", effect) == DimensionalEffect.WARPING
+            for effect in active_effects
+        )
+        
     def _score_historical_success(self, ability_name: str) -> float:
         """Score ability based on historical success"""
         damage_dealt = self.combat_memory.damage_dealt.get(ability_name, 0)
@@ -400,7 +542,7 @@ class NPCAI:
         
         # Consider active effects
         for effect in active_effects:
-            if effect == DimensionalEffect.STABILIZING:
+            if effect == DimensionalEffect.PURIFICATION:
                 score += 0.2
             elif effect == DimensionalEffect.WARPING:
                 score -= 0.3
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 from typing import Dict, List, Set, Optional, Tuple, Any
 from enum import Enum, auto
@@ -0,0 +1,182 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass
+import numpy as np
+
+@dataclass
+class DamageBatch:
+    """Per-hit results of a batched damage resolution"""
+    damage: np.ndarray    # Final damage, 0 for dodged hits
+    critical: np.ndarray  # Whether each hit was a critical
+    dodged: np.ndarray    # Whether each hit was dodged
+
+    def __len__(self) -> int:
+        return len(self.damage)
+
+    @property
+    def total_damage(self) -> float:
+        return float(self.damage.sum())
+
+class BatchDamageResolver:
+    """Resolves many attacker/target hits at once.
+
+    resolve() uses the same formula as CombatCalculator.calculate_damage and
+    resolve_basic() the untyped one from Enemy._calculate_damage; both add the
+    dodge roll from damage application. All random rolls come from one
+    seedable generator, so a batch resolved from the same seed always gives
+    the same results.
+    """
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        base_damage_variance: float = 0.1,
+        critical_multiplier: float = 2.0,
+        defense_scaling: float = 100.0,
+        resistance_cap: float = 0.75,
+        vulnerability_multiplier: float = 1.5
+    ):
+        self.base_damage_variance = base_damage_variance
+        self.critical_multiplier = critical_multiplier
+        self.defense_scaling = defense_scaling
+        self.resistance_cap = resistance_cap
+        self.vulnerability_multiplier = vulnerability_multiplier
+        self.rng = np.random.default_rng(seed)
+
+    def reseed(self, seed: Optional[int]):
+        """Restart the random stream, e.g. to replay a fight"""
+        self.rng = np.random.default_rng(seed)
+
+    def _unique(self, entities: Sequence[Any]) -> Tuple[List[Any], np.ndarray]:
+        """Deduplicate entities so each one's stats are read once per batch"""
+        slots: Dict[int, int] = {}
+        unique = []
+        index = np.empty(len(entities), dtype=np.intp)
+        for i, entity in enumerate(entities):
+            slot = slots.get(id(entity))
+            if slot is None:
+                slot = slots[id(entity)] = len(unique)
+                unique.append(entity)
+            index[i] = slot
+        return unique, index
+
+    def _damage_modifiers(self, attackers: List[Any], attacker_index: np.ndarray) -> np.ndarray:
+        """Offensive damage multiplier for each hit"""
+        return np.array([
+            1 + a.stats.damage_modifier if hasattr(a.stats, 'damage_modifier') else 1.0
+            for a in attackers
+        ])[attacker_index]
+
+    def _roll(self, count: int, crit_rate: np.ndarray,
+              dodge_chance: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Variance, critical and dodge rolls for each hit"""
+        # Rolls are drawn in a fixed order so results depend only on the seed
+        variance = self.rng.uniform(
+            1 - self.base_damage_variance, 1 + self.base_damage_variance, count
+        )
+        critical = self.rng.random(count) < crit_rate
+        dodged = self.rng.random(count) < dodge_chance
+        return variance, critical, dodged
+
+    def _check_lengths(self, attackers: Sequence[Any], targets: Sequence[Any]):
+        """Every hit needs exactly one attacker and one target"""
+        if len(attackers) != len(targets):
+            raise ValueError("Attackers and targets must have the same length")
+
+    def _type_modifiers(self, targets: List[Any], target_index: np.ndarray,
+                        damage_types: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Capped resistance and weakness multiplier for each hit"""
+        cache: Dict[Tuple[int, str], Tuple[float, float]] = {}
+        resistance = np.empty(len(target_index))
+        weakness = np.empty(len(target_index))
+        for i, (slot, damage_type) in enumerate(zip(target_index, damage_types)):
+            key = (slot, damage_type)
+            modifiers = cache.get(key)
+            if modifiers is None:
+                stats = targets[slot].stats
+                modifiers = cache[key] = (
+                    min(stats.resistance.get(damage_type, 0), self.resistance_cap),
+                    self.vulnerability_multiplier if damage_type in stats.weakness else 1.0
+                )
+            resistance[i], weakness[i] = modifiers
+        return resistance, weakness
+
+    def resolve(
+        self,
+        attackers: Sequence[Any],
+        targets: Sequence[Any],
+        base_damage: Union[float, Sequence[float]],
+        damage_types: Union[str, Sequence[str]]
+    ) -> DamageBatch:
+        """Resolve one hit per (attacker, target) pair.
+
+        base_damage and damage_types may be a single value shared by every
+        hit or one value per hit.
+        """
+        count = len(targets)
+        self._check_lengths(attackers, targets)
+        if isinstance(damage_types, str):
+            damage_types = [damage_types] * count
+        base = np.broadcast_to(np.asarray(base_damage, dtype=float), (count,))
+
+        attacker_list, attacker_index = self._unique(attackers)
+        target_list, target_index = self._unique(targets)
+
+        crit_rate = np.array([a.stats.critical_rate for a in attacker_list])[attacker_index]
+        crit_damage = np.array([
+            getattr(a.stats, 'critical_damage', 1.0) for a in attacker_list
+        ])[attacker_index]
+        damage_modifier = self._damage_modifiers(attacker_list, attacker_index)
+        defense = np.array([t.stats.defense for t in target_list])[target_index]
+        dodge_chance = np.array([t.stats.dodge_chance for t in target_list])[target_index]
+        resistance, weakness = self._type_modifiers(target_list, target_index, damage_types)
+
+        variance, critical, dodged = self._roll(count, crit_rate, dodge_chance)
+
+        damage = base * variance
+        damage *= np.where(critical, self.critical_multiplier * crit_damage, 1.0)
+        damage *= damage_modifier * weakness
+        damage *= self.defense_scaling / (self.defense_scaling + defense)
+        damage *= 1 - resistance
+        damage = np.where(dodged, 0.0, np.maximum(damage, 1.0))  # Minimum 1 damage
+
+        return DamageBatch(damage=damage, critical=critical, dodged=dodged)
+
+    def resolve_basic(
+        self,
+        attackers: Sequence[Any],
+        targets: Sequence[Any],
+        base_damage: Union[float, Sequence[float]]
+    ) -> DamageBatch:
+        """Resolve one hit per pair with the formula of Enemy._calculate_damage.
+
+        Critical hits apply the flat critical multiplier only, and each
+        target's resistance is a single uncapped value; damage types and
+        weaknesses play no part.
+        """
+        count = len(targets)
+        self._check_lengths(attackers, targets)
+        base = np.broadcast_to(np.asarray(base_damage, dtype=float), (count,))
+
+        attacker_list, attacker_index = self._unique(attackers)
+        target_list, target_index = self._unique(targets)
+
+        crit_rate = np.array([a.stats.critical_rate for a in attacker_list])[attacker_index]
+        damage_modifier = self._damage_modifiers(attacker_list, attacker_index)
+        defense = np.array([t.stats.defense for t in target_list])[target_index]
+        dodge_chance = np.array([t.stats.dodge_chance for t in target_list])[target_index]
+        resistance = np.array([t.stats.resistance for t in target_list], dtype=float)[target_index]
+
+        variance, critical, dodged = self._roll(count, crit_rate, dodge_chance)
+
+        damage = base * damage_modifier
+        damage *= np.where(critical, self.critical_multiplier, 1.0)
+        damage *= self.defense_scaling / (self.defense_scaling + defense)
+        damage *= 1 - resistance
+        damage *= variance
+        damage = np.where(dodged, 0.0, np.maximum(damage, 1.0))  # Minimum 1 damage
+
+        return DamageBatch(damage=damage, critical=critical, dodged=dodged)
+
+    def resolve_area(self, attacker: Any, targets: Sequence[Any],
+                     base_damage: float, damage_type: str) -> DamageBatch:
+        """Resolve one attacker hitting every target, e.g. an AoE ability"""
+        return self.resolve([attacker] * len(targets), targets, base_damage, damage_type)
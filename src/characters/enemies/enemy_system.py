@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from typing import Dict, List, Optional, Set, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
@@ -5,6 +7,12 @@ import random
 import math
 import time
 
+from .damage_resolver import BatchDamageResolver, DamageBatch
+from .spatial_index import SpatialHashGrid
+
+# Grid cell size for enemy neighbour queries; matches the default AI search radius
+NEIGHBOR_CELL_SIZE = 5.0
+
 class EnemyType(Enum):
     """Core enemy types with clear progression paths"""
     NORMAL = "Normal"          # 👤 Basic enemies
@@ -150,9 +158,14 @@ class Enemy:
         
         # Runtime state
         self.current_phase = None
+        self.current_action = None
+        self.position = (0, 0)
         self.combat_state = {}
         self.interaction_state = {}
         self.memory = []
+        
+        # Owning EnemySystem, set on registration; it holds the neighbour index
+        self.system: Optional[EnemySystem] = None
 
     def update(self, context: Dict[str, any]) -> Dict[str, any]:
         """Update enemy state based on context"""
@@ -747,11 +760,12 @@ class Enemy:
         if not targets:
             return
         
-        # Calculate damage
+        # Calculate damage for every target in one batch
         base_damage = enemy.stats.damage * 0.8
-        for target in targets:
-            actual_damage = self._calculate_damage(enemy, target, base_damage)
-            self._apply_damage(target, actual_damage)
+        batch = self.system.damage_resolver.resolve_basic(
+            [enemy] * len(targets), targets, base_damage
+        )
+        self._apply_damage_batch(targets, batch)
         
         # Create attack effects
         self.particle_system.create_effect(enemy.position, 'area_attack_wave')
@@ -945,11 +959,13 @@ class Enemy:
         """Execute an attack move"""
         targets = self._get_move_targets(enemy, move_data)
         
+        base_damage = move_data['damage'] * enemy.stats.damage
+        batch = self.system.damage_resolver.resolve_basic(
+            [enemy] * len(targets), targets, base_damage
+        )
+        self._apply_damage_batch(targets, batch)
+        
         for target in targets:
-            base_damage = move_data['damage'] * enemy.stats.damage
-            actual_damage = self._calculate_damage(enemy, target, base_damage)
-            self._apply_damage(target, actual_damage)
-            
             # Apply additional effects
             if 'effects' in move_data:
                 for effect in move_data['effects']:
@@ -993,7 +1009,7 @@ class Enemy:
         if move_data['utility_type'] == 'teleport':
             new_pos = self._calculate_teleport_position(enemy, move_data)
             if new_pos:
-                enemy.position = new_pos
+                self.system.move_enemy(enemy, new_pos)
         elif move_data['utility_type'] == 'summon':
             self._execute_summon(enemy, move_data)
         elif move_data['utility_type'] == 'terrain':
@@ -1037,11 +1053,7 @@ class Enemy:
 
     def _find_nearest_ally(self, enemy: Enemy) -> Optional[Enemy]:
         """Find the nearest ally"""
-        allies = self._get_nearby_allies(enemy)
-        if not allies:
-            return None
-        
-        return min(allies, key=lambda a: self._calculate_distance(enemy.position, a.position))
+        return self.system.find_nearest_ally(enemy)
 
     def _calculate_protection_position(self, enemy: 'Enemy', ally: 'Enemy') -> tuple:
         """Calculate best position to protect an ally"""
@@ -1192,47 +1204,24 @@ class Enemy:
         if terrain in {'wall', 'water', 'lava'}:
             return False
         
-        # Check for other entities
-        if self.world_system.is_position_occupied(position):
+        # Check for other entities; the enemy index answers without a world lookup
+        if (self.system.spatial_index.is_occupied(position) or
+                self.world_system.is_position_occupied(position)):
             return False
         
         return True
 
     def _get_nearby_threats(self, enemy: Enemy, range: int = 5) -> List[Enemy]:
         """Get nearby threats"""
-        threats = []
-        
-        for other in self.world_system.get_nearby_entities(enemy.position, range):
-            if (isinstance(other, Enemy) and 
-                other.core.faction != enemy.core.faction and
-                self._calculate_threat_level(other) > 0):
-                threats.append(other)
-        
-        return threats
+        return self.system.get_nearby_threats(enemy, range)
 
     def _get_nearby_allies(self, enemy: Enemy, range: int = 5) -> List[Enemy]:
         """Get nearby allies"""
-        allies = []
-        
-        for other in self.world_system.get_nearby_entities(enemy.position, range):
-            if (isinstance(other, Enemy) and 
-                other.core.faction == enemy.core.faction and
-                other != enemy):
-                allies.append(other)
-        
-        return allies
+        return self.system.get_nearby_allies(enemy, range)
 
     def _get_nearby_targets(self, enemy: Enemy, range: int = 5) -> List[Enemy]:
         """Get nearby valid targets"""
-        targets = []
-        
-        for other in self.world_system.get_nearby_entities(enemy.position, range):
-            if (isinstance(other, Enemy) and 
-                other.core.faction != enemy.core.faction and
-                not other.current_action == 'escaped'):
-                targets.append(other)
-        
-        return targets
+        return self.system.get_nearby_targets(enemy, range)
 
     def _calculate_damage(self, attacker: Enemy, target: Enemy, base_damage: float) -> float:
         """Calculate actual damage after modifiers"""
@@ -1273,6 +1262,21 @@ class Enemy:
         if target.stats.health <= 0:
             self._handle_defeat(target)
 
+    def _apply_damage_batch(self, targets: List[Enemy], batch: DamageBatch):
+        """Apply batch-resolved damage; dodges were already rolled by the resolver"""
+        for target, damage, dodged in zip(targets, batch.damage.tolist(), batch.dodged.tolist()):
+            if dodged:
+                self.particle_system.create_effect(target.position, 'dodge')
+                self.sound_system.play_sound('dodge')
+                continue
+            
+            target.stats.health -= damage
+            self.particle_system.create_effect(target.position, 'hit')
+            self.sound_system.play_sound('hit')
+            
+            if target.stats.health <= 0:
+                self._handle_defeat(target)
+
     def _handle_defeat(self, enemy: Enemy):
         """Handle enemy defeat"""
         enemy.current_action = 'defeated'
@@ -1289,6 +1293,7 @@ class Enemy:
         self._trigger_defeat_responses(enemy)
         
         # Remove from world
+        self.system.unregister_enemy(enemy)
         self.world_system.remove_entity(enemy)
 
     def _generate_loot(self, enemy: Enemy):
@@ -1711,6 +1716,7 @@ class SystemIntegrationHandlers:
         """Setup combat system integration"""
         self.combat_handlers.update({
             'calculate_damage': self._handle_damage_calculation,
+            'calculate_damage_batch': self._handle_damage_batch,
             'process_ability': self._handle_ability_processing,
             'apply_status_effect': self._handle_status_effect,
             'check_combat_conditions': self._handle_combat_conditions,
@@ -1778,15 +1784,34 @@ class SystemIntegrationHandlers:
     # Combat System Handlers
     def _handle_damage_calculation(self, attacker: Enemy, target: Any, base_damage: float) -> float:
         """Handle damage calculation through combat system"""
-        if self.enemy_system.combat_system:
-            return self.enemy_system.combat_system.calculate_damage(
+        return self._handle_damage_batch(attacker, [target], base_damage)[0]
+
+    def _handle_damage_batch(self, attacker: Enemy, targets: List[Any], base_damage: float) -> List[float]:
+        """Handle damage calculation against many targets through combat system"""
+        combat_system = self.enemy_system.combat_system
+        if not combat_system:
+            return [base_damage] * len(targets)
+        
+        # Modifiers depend only on the attacker, so they are gathered once per batch
+        modifiers = self._get_damage_modifiers(attacker)
+        if hasattr(combat_system, 'calculate_damage_batch'):
+            return list(combat_system.calculate_damage_batch(
+                attacker=attacker,
+                targets=targets,
+                base_damage=base_damage,
+                damage_type='enemy',
+                modifiers=modifiers
+            ))
+        return [
+            combat_system.calculate_damage(
                 attacker=attacker,
                 target=target,
                 base_damage=base_damage,
                 damage_type='enemy',
-                modifiers=self._get_damage_modifiers(attacker)
+                modifiers=modifiers
             )
-        return base_damage
+            for target in targets
+        ]
 
     def _handle_ability_processing(self, enemy: Enemy, ability: Dict[str, Any], targets: List[Any]):
         """Handle ability processing through combat system"""
@@ -1928,7 +1953,8 @@ class EnemySystem:
         combat_system: 'CombatSystem',
         world_system: 'WorldSystem',
         event_system: 'EventSystem',
-        faction_system: 'FactionSystem'
+        faction_system: 'FactionSystem',
+        damage_seed: Optional[int] = None
     ):
         self.combat_system = combat_system
         self.world_system = world_system
@@ -1939,6 +1965,9 @@ class EnemySystem:
         self.templates: Dict[str, Dict[str, any]] = {}
         self.spawn_rules: Dict[str, Dict[str, any]] = {}
         self.balance_metrics: Dict[str, Dict[str, float]] = {}
+        self.spatial_index = SpatialHashGrid(NEIGHBOR_CELL_SIZE)
+        # Seeded so a fight's damage rolls can be replayed exactly
+        self.damage_resolver = BatchDamageResolver(seed=damage_seed)
         
         # Initialize system integration handlers
         self.system_handlers = SystemIntegrationHandlers(self)
@@ -1951,8 +1980,9 @@ class EnemySystem:
         self._initialize_balance_metrics()
         self._setup_event_handlers()
 
-    def create_enemy(self, template_id: str, level: int, context: Dict[str, Any] = None) -> Enemy:
-        """Create a new enemy instance"""
+    def create_enemy(self, template_id: str, level: int, context: Dict[str, Any] = None,
+                     position: tuple = (0, 0)) -> Enemy:
+        """Create a new enemy instance and register it at the given position"""
         if context is None:
             context = {}
         
@@ -1999,6 +2029,7 @@ class EnemySystem:
             self._apply_behavior_adjustments(enemy, adjustments)
             self._apply_scaling_adjustments(enemy, adjustments)
         
+        self.register_enemy(enemy, position)
         return enemy
 
     def spawn_enemy(self, location: str, player_level: int, context: Dict[str, Any] = None) -> Enemy:
@@ -2049,8 +2080,67 @@ class EnemySystem:
         # Create enemy
         return self.create_enemy(selected_template, player_level, context)
 
+    def register_enemy(self, enemy: Enemy, position: tuple):
+        """Track an enemy and index its position for neighbour queries"""
+        enemy.position = position
+        enemy.system = self
+        self.enemies[enemy.core.id] = enemy
+        self.spatial_index.insert(enemy.core.id, enemy, position, enemy.core.faction)
+
+    def unregister_enemy(self, enemy: Enemy):
+        """Stop tracking an enemy and drop it from the neighbour index"""
+        self.enemies.pop(enemy.core.id, None)
+        self.spatial_index.remove(enemy.core.id)
+
+    def move_enemy(self, enemy: Enemy, position: tuple):
+        """Move an enemy, keeping the neighbour index in sync"""
+        enemy.position = position
+        if enemy.core.id in self.spatial_index:
+            self.spatial_index.move(enemy.core.id, position)
+
+    def find_nearest_ally(self, enemy: Enemy, radius: float = 5) -> Optional[Enemy]:
+        """Find the nearest enemy of the same faction within radius"""
+        nearest = self.spatial_index.nearest(
+            enemy.position,
+            max_radius=radius,
+            faction=enemy.core.faction,
+            exclude=enemy.core.id
+        )
+        return nearest[0] if nearest else None
+
+    def get_nearby_threats(self, enemy: Enemy, radius: float = 5) -> List[Enemy]:
+        """Get enemies of other factions within radius that pose a threat"""
+        return self.spatial_index.query_radius(
+            enemy.position,
+            radius,
+            exclude_faction=enemy.core.faction,
+            predicate=lambda other: enemy._calculate_threat_level(other) > 0
+        )
+
+    def get_nearby_allies(self, enemy: Enemy, radius: float = 5) -> List[Enemy]:
+        """Get enemies of the same faction within radius"""
+        return self.spatial_index.query_radius(
+            enemy.position,
+            radius,
+            faction=enemy.core.faction,
+            exclude=enemy.core.id
+        )
+
+    def get_nearby_targets(self, enemy: Enemy, radius: float = 5) -> List[Enemy]:
+        """Get enemies of other factions within radius that can still be attacked"""
+        return self.spatial_index.query_radius(
+            enemy.position,
+            radius,
+            exclude_faction=enemy.core.faction,
+            predicate=lambda other: not other.current_action == 'escaped'
+        )
+
     def update_enemy(self, enemy: Enemy, context: Dict[str, Any]):
         """Update enemy state based on context"""
+        # Movement patterns set positions directly, so resync the index first
+        if enemy.core.id in self.spatial_index:
+            self.spatial_index.move(enemy.core.id, enemy.position)
+        
         # Process system interactions
         self._process_faction_interactions(enemy, context)
         self._process_world_interactions(enemy, context)
@@ -2132,9 +2222,39 @@ class CombatCalculator:
     defense_scaling: float = 100.0
     resistance_cap: float = 0.75
     vulnerability_multiplier: float = 1.5
+    seed: Optional[int] = None
+    resolver: BatchDamageResolver = field(init=False, repr=False)
     
-    def calculate_damage(self, attacker: Enemy, target: Enemy, base_damage: float, damage_type: str) -> float:
+    def __post_init__(self):
+        self.resolver = BatchDamageResolver(
+            seed=self.seed,
+            base_damage_variance=self.base_damage_variance,
+            critical_multiplier=self.critical_multiplier,
+            defense_scaling=self.defense_scaling,
+            resistance_cap=self.resistance_cap,
+            vulnerability_multiplier=self.vulnerability_multiplier
+        )
+    
+    def resolve_damage_batch(self, attackers: List[Enemy], targets: List[Enemy],
+                             base_damage: Any, damage_types: Any) -> DamageBatch:
+        """Resolve many hits at once, including dodge rolls"""
+        return self.resolver.resolve(attackers, targets, base_damage, damage_types)
+    
+    def calculate_damage_batch(self, attacker: Enemy, targets: List[Enemy], base_damage: float,
+                               damage_type: str,
+                               modifiers: Optional[Dict[str, float]] = None) -> List[float]:
+        """Calculate one attacker's damage against many targets; dodged hits deal 0"""
+        if modifiers:
+            base_damage *= math.prod(modifiers.values())
+        return self.resolver.resolve_area(attacker, targets, base_damage, damage_type).damage.tolist()
+    
+    def calculate_damage(self, attacker: Enemy, target: Enemy, base_damage: float, damage_type: str,
+                         modifiers: Optional[Dict[str, float]] = None) -> float:
         """Calculate final damage with all modifiers"""
+        # Multipliers gathered by the caller, e.g. level and faction bonuses
+        if modifiers:
+            base_damage *= math.prod(modifiers.values())
+        
         # Base damage variation (±10%)
         damage = base_damage * random.uniform(1 - self.base_damage_variance, 1 + self.base_damage_variance)
         
@@ -0,0 +1,245 @@
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+import heapq
+import math
+
+Cell = Tuple[int, int]
+
+class SpatialHashGrid:
+    """Uniform grid of enemy positions for neighbour queries.
+
+    Entities are bucketed by cell and then by faction, so radius queries only
+    look at the cells overlapping the search circle, and faction-filtered
+    queries skip the buckets of other factions entirely.
+    """
+    def __init__(self, cell_size: float = 5.0):
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+        self.cell_size = cell_size
+
+        # cell -> faction -> key -> entity
+        self.cells: Dict[Cell, Dict[Optional[str], Dict[Hashable, Any]]] = {}
+        # key -> (entity, position, faction, cell)
+        self.entries: Dict[Hashable, Tuple[Any, Tuple[float, float], Optional[str], Cell]] = {}
+        # exact position -> number of entities standing on it
+        self.occupied: Dict[Tuple[float, float], int] = {}
+        # Non-empty cells per cell column and row, and the cached cell bounds
+        # (min_x, min_y, max_x, max_y); None means recompute on next use
+        self._columns: Dict[int, int] = {}
+        self._rows: Dict[int, int] = {}
+        self._bounds: Optional[Tuple[int, int, int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
+
+    def _cell_of(self, position: Tuple[float, float]) -> Cell:
+        return (
+            math.floor(position[0] / self.cell_size),
+            math.floor(position[1] / self.cell_size)
+        )
+
+    def _track_cell(self, cell: Cell):
+        x, y = cell
+        self._columns[x] = self._columns.get(x, 0) + 1
+        self._rows[y] = self._rows.get(y, 0) + 1
+        if self._bounds is not None:
+            min_x, min_y, max_x, max_y = self._bounds
+            self._bounds = (min(min_x, x), min(min_y, y), max(max_x, x), max(max_y, y))
+
+    def _untrack_cell(self, cell: Cell):
+        for counts, coordinate in ((self._columns, cell[0]), (self._rows, cell[1])):
+            counts[coordinate] -= 1
+            if not counts[coordinate]:
+                del counts[coordinate]
+                # The bounds may have shrunk; recomputed from the counts on demand
+                self._bounds = None
+
+    def _grid_bounds(self) -> Tuple[int, int, int, int]:
+        if self._bounds is None:
+            self._bounds = (
+                min(self._columns), min(self._rows),
+                max(self._columns), max(self._rows)
+            )
+        return self._bounds
+
+    def insert(self, key: Hashable, entity: Any, position: Tuple[float, float],
+               faction: Optional[str] = None):
+        """Add an entity, replacing any previous entry under the same key"""
+        if key in self.entries:
+            self.remove(key)
+
+        position = tuple(position)
+        cell = self._cell_of(position)
+        if cell not in self.cells:
+            self._track_cell(cell)
+        self.cells.setdefault(cell, {}).setdefault(faction, {})[key] = entity
+        self.entries[key] = (entity, position, faction, cell)
+        self.occupied[position] = self.occupied.get(position, 0) + 1
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove an entity; returns False if it was not indexed"""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return False
+
+        _, position, faction, cell = entry
+        buckets = self.cells[cell]
+        del buckets[faction][key]
+        if not buckets[faction]:
+            del buckets[faction]
+            if not buckets:
+                del self.cells[cell]
+                self._untrack_cell(cell)
+
+        self.occupied[position] -= 1
+        if not self.occupied[position]:
+            del self.occupied[position]
+        return True
+
+    def move(self, key: Hashable, position: Tuple[float, float]):
+        """Update an entity's position, re-bucketing only if its cell changed"""
+        entity, old_position, faction, old_cell = self.entries[key]
+        position = tuple(position)
+        if position == old_position:
+            return
+
+        cell = self._cell_of(position)
+        if cell != old_cell:
+            self.remove(key)
+            self.insert(key, entity, position, faction)
+            return
+
+        self.entries[key] = (entity, position, faction, cell)
+        self.occupied[old_position] -= 1
+        if not self.occupied[old_position]:
+            del self.occupied[old_position]
+        self.occupied[position] = self.occupied.get(position, 0) + 1
+
+    def position_of(self, key: Hashable) -> Optional[Tuple[float, float]]:
+        entry = self.entries.get(key)
+        return entry[1] if entry else None
+
+    def is_occupied(self, position: Tuple[float, float]) -> bool:
+        """Check whether any indexed entity stands exactly on a position"""
+        return tuple(position) in self.occupied
+
+    def _candidates(self, cells: Iterator[Cell], faction: Optional[str],
+                    exclude_faction: Optional[str]) -> Iterator[Tuple[Hashable, Any]]:
+        for cell in cells:
+            buckets = self.cells.get(cell)
+            if not buckets:
+                continue
+            if faction is not None:
+                yield from buckets.get(faction, {}).items()
+                continue
+            for bucket_faction, bucket in buckets.items():
+                if exclude_faction is not None and bucket_faction == exclude_faction:
+                    continue
+                yield from bucket.items()
+
+    def _cells_in_radius(self, position: Tuple[float, float], radius: float) -> Iterator[Cell]:
+        min_x, min_y = self._cell_of((position[0] - radius, position[1] - radius))
+        max_x, max_y = self._cell_of((position[0] + radius, position[1] + radius))
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                yield (cell_x, cell_y)
+
+    def _cells_in_ring(self, center: Cell, ring: int) -> Iterator[Cell]:
+        if ring == 0:
+            yield center
+            return
+        cx, cy = center
+        for dx in range(-ring, ring + 1):
+            yield (cx + dx, cy - ring)
+            yield (cx + dx, cy + ring)
+        for dy in range(-ring + 1, ring):
+            yield (cx - ring, cy + dy)
+            yield (cx + ring, cy + dy)
+
+    def query_radius(
+        self,
+        position: Tuple[float, float],
+        radius: float,
+        faction: Optional[str] = None,
+        exclude_faction: Optional[str] = None,
+        exclude: Optional[Hashable] = None,
+        predicate: Optional[Callable[[Any], bool]] = None
+    ) -> List[Any]:
+        """Get entities within radius, optionally restricted to (or excluding) a faction"""
+        radius_sq = radius * radius
+        px, py = position
+        results = []
+        for key, entity in self._candidates(
+            self._cells_in_radius(position, radius), faction, exclude_faction
+        ):
+            if key == exclude:
+                continue
+            x, y = self.entries[key][1]
+            if (x - px) ** 2 + (y - py) ** 2 > radius_sq:
+                continue
+            if predicate is None or predicate(entity):
+                results.append(entity)
+        return results
+
+    def nearest(
+        self,
+        position: Tuple[float, float],
+        k: int = 1,
+        max_radius: Optional[float] = None,
+        faction: Optional[str] = None,
+        exclude_faction: Optional[str] = None,
+        exclude: Optional[Hashable] = None,
+        predicate: Optional[Callable[[Any], bool]] = None
+    ) -> List[Any]:
+        """Get up to k nearest entities, closest first.
+
+        Searches outward ring by ring and stops once the next ring cannot
+        hold anything closer than the k-th match found so far.
+        """
+        if k <= 0 or not self.entries:
+            return []
+
+        px, py = position
+        center = self._cell_of(position)
+        # Outermost ring that still reaches an indexed cell, so the search
+        # always terminates; the bounds are kept up to date incrementally
+        min_x, min_y, max_x, max_y = self._grid_bounds()
+        max_ring = max(
+            center[0] - min_x, max_x - center[0],
+            center[1] - min_y, max_y - center[1],
+            0
+        )
+        if max_radius is not None:
+            max_ring = min(max_ring, int(max_radius // self.cell_size) + 1)
+
+        # Max-heap of the best k as (-distance_sq, tie_breaker, entity)
+        best: List[Tuple[float, int, Any]] = []
+        counter = 0
+        limit_sq = max_radius * max_radius if max_radius is not None else math.inf
+        for ring in range(max_ring + 1):
+            # Anything in this ring or beyond is at least this far away
+            ring_distance = (ring - 1) * self.cell_size if ring > 0 else 0.0
+            if len(best) == k and ring_distance * ring_distance > -best[0][0]:
+                break
+            for key, entity in self._candidates(
+                self._cells_in_ring(center, ring), faction, exclude_faction
+            ):
+                if key == exclude:
+                    continue
+                x, y = self.entries[key][1]
+                distance_sq = (x - px) ** 2 + (y - py) ** 2
+                if distance_sq > limit_sq:
+                    continue
+                if len(best) == k and distance_sq >= -best[0][0]:
+                    continue
+                if predicate is not None and not predicate(entity):
+                    continue
+                counter += 1
+                if len(best) == k:
+                    heapq.heapreplace(best, (-distance_sq, counter, entity))
+                else:
+                    heapq.heappush(best, (-distance_sq, counter, entity))
+
+        return [entity for _, _, entity in sorted(best, key=lambda item: (-item[0], item[1]))]
@@ -1,7 +1,14 @@
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Callable, Hashable, Tuple, Union
+from dataclasses import dataclass, replace
+from collections import OrderedDict
 from enum import Enum
+from types import MappingProxyType
+import copy
+import hashlib
+import os
+import pickle
 import random
+import threading
 
 class DialogueCategory(Enum):
     MAIN_STORY = "Main Story"      # 📖
@@ -265,14 +272,130 @@ class HealingSystem:
     duration_modifiers: Dict[str, float]
     special_conditions: Dict[str, any]
 
+# Game state outside the DialogueContext that dialogue evaluation may read
+# through the managers. Changing one drops the cached evaluations that read it.
+DIALOGUE_DEPENDENCIES = ("stats", "quests", "factions")
+
+# Dialogue condition sections and the dependency each one reads
+CONDITION_DEPENDENCIES = {
+    "player": "stats",
+    "stats": "stats",
+    "quest": "quests",
+    "quests": "quests",
+    "faction": "factions",
+    "factions": "factions",
+    "reputation": "factions"
+}
+
+_MISSING = object()
+
+def _freeze(value):
+    """Hashable snapshot of nested context data"""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+class DialogueContextCache:
+    """LRU cache of dialogue evaluations keyed on a context fingerprint.
+
+    The fingerprint covers everything in the DialogueContext, so a change
+    to world, player or NPC state simply misses. Each entry is also tagged
+    with the dependencies its evaluation read, and invalidate drops only
+    the entries tagged with a changed dependency, e.g. "stats" after the
+    stat manager applies a change.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.entries: OrderedDict = OrderedDict()  # key -> (value, tags)
+        self.tagged: Dict[str, Set[Hashable]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(*parts) -> Optional[Hashable]:
+        """Hashable fingerprint of contexts and other inputs, or None if they can't be hashed"""
+        frozen = []
+        try:
+            for part in parts:
+                if isinstance(part, DialogueContext):
+                    part = (part.world_state, part.player_state, part.npc_state,
+                            part.environmental_factors, part.active_effects)
+                frozen.append(_freeze(part))
+            frozen = tuple(frozen)
+            hash(frozen)
+        except TypeError:
+            return None
+        return frozen
+
+    def get_or_compute(self, key: Optional[Hashable],
+                       tags: Union[Tuple[str, ...], Callable[[], Tuple[str, ...]]],
+                       compute: Callable):
+        """Cached value for key, computing and storing it on a miss.
+
+        tags may be a callable, which is only called on a miss.
+        """
+        if key is None:
+            return compute()
+
+        entry = self.entries.get(key, _MISSING)
+        if entry is not _MISSING:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        value = compute()
+        if callable(tags):
+            tags = tags()
+        self.entries[key] = (value, tags)
+        for tag in tags:
+            self.tagged.setdefault(tag, set()).add(key)
+        if len(self.entries) > self.max_entries:
+            oldest, (_, oldest_tags) = self.entries.popitem(last=False)
+            for tag in oldest_tags:
+                self.tagged[tag].discard(oldest)
+        return value
+
+    def invalidate(self, *tags: str):
+        """Drop every entry that depends on one of the tags"""
+        for tag in tags:
+            for key in self.tagged.pop(tag, ()):
+                entry = self.entries.pop(key, None)
+                if entry is None:
+                    continue
+                for other in entry[1]:
+                    if other != tag and other in self.tagged:
+                        self.tagged[other].discard(key)
+
+    def clear(self):
+        self.entries.clear()
+        self.tagged.clear()
+
 class DialogueSystem:
-    def __init__(self, stat_manager, quest_manager, faction_manager):
+    def __init__(self, stat_manager, quest_manager, faction_manager,
+                 content: Optional['DialogueContentRegistry'] = None):
         self.stat_manager = stat_manager
         self.quest_manager = quest_manager
         self.faction_manager = faction_manager
+        self.content = content or DIALOGUE_CONTENT
         self.active_dialogues = {}
         self.dialogue_history = []
-        self.context_cache = {}
+        self.context_cache = DialogueContextCache()
+        
+    def __getattr__(self, name: str):
+        """Look up dialogue content in the shared registry on first use"""
+        if name in INSTANCE_CONTENT:
+            value = copy.deepcopy(self.content.get(name))
+            setattr(self, name, value)
+            return value
+        if name in CONTENT_ATTRIBUTES:
+            return self.content.get(name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
         
     def initialize_dialogue(
         self,
@@ -281,24 +404,20 @@ class DialogueSystem:
         context: DialogueContext
     ) -> Optional[Dict[str, any]]:
         """Initialize a new dialogue interaction"""
-        # Check availability
-        if not self._check_dialogue_availability(dialogue_id, context):
+        cached_state = self.context_cache.get_or_compute(
+            self.context_cache.fingerprint("open", dialogue_id, category, context),
+            lambda: self._dialogue_dependencies(dialogue_id),
+            lambda: self._evaluate_dialogue(dialogue_id, category, context)
+        )
+        if cached_state is None:
             return None
             
-        # Create dialogue state
-        dialogue_state = DialogueState(
-            category=category,
-            importance=self._calculate_importance(dialogue_id, context),
-            urgency=self._calculate_urgency(dialogue_id, context),
-            availability_conditions=self._get_conditions(dialogue_id),
-            completion_effects=self._get_effects(dialogue_id),
-            branching_paths=set()
-        )
-        
-        # Apply context modifiers
-        modified_state = self._apply_context_modifiers(
-            dialogue_state,
-            context
+        # Active dialogues change as they run, so each gets its own copy
+        modified_state = replace(
+            cached_state,
+            availability_conditions=dict(cached_state.availability_conditions),
+            completion_effects=dict(cached_state.completion_effects),
+            branching_paths=set(cached_state.branching_paths)
         )
         
         self.active_dialogues[dialogue_id] = modified_state
@@ -329,7 +448,7 @@ class DialogueSystem:
             choice_id,
             context
         )
-        results["effects"] = choice_results["effects"]
+        results["effects"] = choice_results
         
         # Update states
         state_changes = self._update_states(
@@ -349,14 +468,53 @@ class DialogueSystem:
         results["response"] = response
         
         # Get new options
-        results["new_options"] = self._get_available_options(
-            dialogue_id,
-            context,
-            state_changes
-        )
+        results["new_options"] = list(self.context_cache.get_or_compute(
+            self.context_cache.fingerprint("options", dialogue_id, context, state_changes),
+            lambda: self._dialogue_dependencies(dialogue_id),
+            lambda: self._get_available_options(dialogue_id, context, state_changes)
+        ))
         
         return results
         
+    def _dialogue_dependencies(self, dialogue_id: str) -> Tuple[str, ...]:
+        """Dependencies a dialogue's conditions read beyond its context"""
+        return tuple(sorted({
+            CONDITION_DEPENDENCIES[section]
+            for section in self._get_conditions(dialogue_id)
+            if section in CONDITION_DEPENDENCIES
+        }))
+        
+    def invalidate_context(self, *dependencies: str):
+        """Drop cached evaluations after stats, quests or factions change elsewhere"""
+        self.context_cache.invalidate(*(dependencies or DIALOGUE_DEPENDENCIES))
+        
+    def _evaluate_dialogue(
+        self,
+        dialogue_id: str,
+        category: DialogueCategory,
+        context: DialogueContext
+    ) -> Optional[DialogueState]:
+        """Check availability and build the context-modified dialogue state"""
+        # Check availability
+        if not self._check_dialogue_availability(dialogue_id, context):
+            return None
+            
+        # Create dialogue state
+        dialogue_state = DialogueState(
+            category=category,
+            importance=self._calculate_importance(dialogue_id, context),
+            urgency=self._calculate_urgency(dialogue_id, context),
+            availability_conditions=self._get_conditions(dialogue_id),
+            completion_effects=self._get_effects(dialogue_id),
+            branching_paths=set()
+        )
+        
+        # Apply context modifiers
+        return self._apply_context_modifiers(
+            dialogue_state,
+            context
+        )
+        
     def _check_dialogue_availability(
         self,
         dialogue_id: str,
@@ -481,24 +639,32 @@ class DialogueSystem:
                 choice_info["stat_changes"],
                 context.player_state
             )
+            self.context_cache.invalidate("stats")
             
         # Apply reputation changes
         if "reputation_changes" in choice_info:
             effects["reputation_changes"] = self.faction_manager.apply_reputation_changes(
                 choice_info["reputation_changes"]
             )
+            self.context_cache.invalidate("factions")
             
         # Apply quest effects
         if "quest_effects" in choice_info:
             effects["quest_effects"] = self.quest_manager.apply_quest_effects(
                 choice_info["quest_effects"]
             )
+            self.context_cache.invalidate("quests")
             
         return effects 
 
     def initialize_advanced_systems(self):
         """Initialize advanced dialogue systems"""
-        self.advanced_contexts = {
+        self.content.load_group("advanced_systems")
+
+    @staticmethod
+    def _build_advanced_systems(content):
+        """Build advanced dialogue systems"""
+        content.advanced_contexts = {
             "emotional": {
                 "base_emotions": {
                     "joy": 0.0,
@@ -526,7 +692,7 @@ class DialogueSystem:
             }
         }
 
-        self.state_transitions = {
+        content.state_transitions = {
             "trust_building": StateTransition(
                 from_state="neutral",
                 to_state="trusted",
@@ -558,7 +724,7 @@ class DialogueSystem:
             )
         }
 
-        self.effect_chains = {
+        content.effect_chains = {
             "revelation_chain": EffectChain(
                 trigger_effect="reveal_secret",
                 chain_sequence=[
@@ -590,7 +756,7 @@ class DialogueSystem:
             )
         }
 
-        self.special_conditions = {
+        content.special_conditions = {
             "moon_phase": SpecialCondition(
                 name="Lunar Influence",
                 check_function="check_moon_phase",
@@ -621,8 +787,13 @@ class DialogueSystem:
 
     def initialize_advanced_chains(self):
         """Initialize advanced effect chains and systems"""
+        self.content.load_group("advanced_chains")
+
+    @staticmethod
+    def _build_advanced_chains(content):
+        """Build advanced effect chains and systems"""
         # Add more effect chains
-        self.effect_chains.update({
+        content.effect_chains.update({
             "betrayal_revelation": EffectChain(
                 trigger_effect="discover_betrayal",
                 chain_sequence=[
@@ -705,7 +876,7 @@ class DialogueSystem:
         })
 
         # Initialize emotional systems
-        self.emotional_states = {
+        content.emotional_states = {
             "deep_trust": EmotionalState(
                 base_emotion="trust",
                 intensity=0.8,
@@ -733,7 +904,7 @@ class DialogueSystem:
         }
 
         # Initialize social dynamics
-        self.social_dynamics = {
+        content.social_dynamics = {
             "mentor_student": SocialDynamic(
                 relationship_type="mentorship",
                 strength=0.7,
@@ -775,7 +946,7 @@ class DialogueSystem:
         }
 
         # Initialize knowledge tracking
-        self.knowledge_tracker = KnowledgeTracker(
+        content.knowledge_tracker = KnowledgeTracker(
             known_facts=set(),
             understanding_level={
                 "world_lore": 0.0,
@@ -996,7 +1167,12 @@ class DialogueSystem:
 
     def initialize_advanced_emotional_states(self):
         """Initialize advanced emotional systems"""
-        self.emotional_complexes = {
+        self.content.load_group("advanced_emotional_states")
+
+    @staticmethod
+    def _build_advanced_emotional_states(content):
+        """Build advanced emotional systems"""
+        content.emotional_complexes = {
             "spiritual_awakening": EmotionalComplex(
                 primary_emotion="enlightenment",
                 secondary_emotions={
@@ -1050,7 +1226,7 @@ class DialogueSystem:
         }
 
         # Initialize relationship dynamics
-        self.relationship_dynamics.update({
+        content.relationship_dynamics.update({
             "sacred_bond": RelationshipDynamic(
                 bond_type="spiritual",
                 depth=0.8,
@@ -1084,7 +1260,7 @@ class DialogueSystem:
         })
 
         # Initialize knowledge systems
-        self.knowledge_systems = {
+        content.knowledge_systems = {
             "ancient_mysteries": KnowledgeSystem(
                 category="mystical_knowledge",
                 subcategories={
@@ -1226,8 +1402,13 @@ class DialogueSystem:
 
     def initialize_advanced_complexes(self):
         """Initialize advanced emotional and mastery systems"""
+        self.content.load_group("advanced_complexes")
+
+    @staticmethod
+    def _build_advanced_complexes(content):
+        """Build advanced emotional and mastery systems"""
         # Add more emotional complexes
-        self.emotional_complexes.update({
+        content.emotional_complexes.update({
             "divine_revelation": EmotionalComplex(
                 primary_emotion="divine_awe",
                 secondary_emotions={
@@ -1283,7 +1464,7 @@ class DialogueSystem:
         })
 
         # Initialize mastery systems
-        self.mastery_systems = {
+        content.mastery_systems = {
             "divine_magic": MasterySystem(
                 path_name="Divine Spellcraft",
                 levels=[
@@ -1380,7 +1561,7 @@ class DialogueSystem:
         }
 
         # Initialize special interactions
-        self.special_interactions.update({
+        content.special_interactions.update({
             "divine_communion": SpecialInteraction(
                 name="Divine Communion",
                 trigger_conditions={
@@ -1452,8 +1633,13 @@ class DialogueSystem:
 
     def initialize_advanced_paths(self):
         """Initialize advanced mastery paths and synergies"""
+        self.content.load_group("advanced_paths")
+
+    @staticmethod
+    def _build_advanced_paths(content):
+        """Build advanced mastery paths and synergies"""
         # Add mastery paths
-        self.mastery_paths = {
+        content.mastery_paths = {
             "elemental_archon": MasteryPath(
                 name="Elemental Archon",
                 tier=5,
@@ -1536,7 +1722,7 @@ class DialogueSystem:
         }
 
         # Initialize synergy systems
-        self.synergy_systems = {
+        content.synergy_systems = {
             "elemental_harmony": SynergySystem(
                 primary_aspect="elemental_magic",
                 secondary_aspects=[
@@ -1587,7 +1773,7 @@ class DialogueSystem:
         }
 
         # Initialize special events
-        self.special_events = {
+        content.special_events = {
             "celestial_convergence": SpecialEvent(
                 name="Celestial Convergence",
                 trigger_conditions={
@@ -1687,7 +1873,12 @@ class DialogueSystem:
 
     def initialize_unique_interactions(self):
         """Initialize unique interaction systems"""
-        self.unique_interactions = {
+        self.content.load_group("unique_interactions")
+
+    @staticmethod
+    def _build_unique_interactions(content):
+        """Build unique interaction systems"""
+        content.unique_interactions = {
             "soul_binding_ritual": UniqueInteraction(
                 name="Soul Binding Ritual",
                 type="ritual",
@@ -1915,7 +2106,12 @@ class DialogueSystem:
 
     def initialize_ritual_types(self):
         """Initialize advanced ritual systems"""
-        self.ritual_types = {
+        self.content.load_group("ritual_types")
+
+    @staticmethod
+    def _build_ritual_types(content):
+        """Build advanced ritual systems"""
+        content.ritual_types = {
             "celestial_summoning": RitualType(
                 name="Celestial Summoning",
                 category="summoning",
@@ -2011,7 +2207,7 @@ class DialogueSystem:
         }
 
         # Initialize risk systems
-        self.risk_systems = {
+        content.risk_systems = {
             "ritual_risk": RiskSystem(
                 base_risk=0.3,
                 modifiers={
@@ -2141,7 +2337,12 @@ class DialogueSystem:
 
     def initialize_ritual_variations(self):
         """Initialize advanced ritual variations"""
-        self.ritual_variations = {
+        self.content.load_group("ritual_variations")
+
+    @staticmethod
+    def _build_ritual_variations(content):
+        """Build advanced ritual variations"""
+        content.ritual_variations = {
             "celestial_summoning": {
                 "astral_convergence": RitualVariation(
                     base_type="celestial_summoning",
@@ -2195,7 +2396,7 @@ class DialogueSystem:
         }
 
         # Initialize participant synergies
-        self.participant_synergies = {
+        content.participant_synergies = {
             "celestial_resonance": ParticipantSynergy(
                 roles=["summoner", "anchor"],
                 compatibility_factors={
@@ -2222,7 +2423,7 @@ class DialogueSystem:
         }
 
         # Initialize consequence chains
-        self.consequence_chains = {
+        content.consequence_chains = {
             "power_overflow": ConsequenceChain(
                 trigger_condition="excessive_power",
                 severity_levels={
@@ -2382,8 +2583,13 @@ class DialogueSystem:
 
     def initialize_advanced_rituals(self):
         """Initialize advanced ritual variants and synergies"""
+        self.content.load_group("advanced_rituals")
+
+    @staticmethod
+    def _build_advanced_rituals(content):
+        """Build advanced ritual variants and synergies"""
         # Add new ritual variations
-        self.ritual_variations["void_summoning"] = {
+        content.ritual_variations["void_summoning"] = {
             "abyssal_calling": RitualVariation(
                 base_type="void_summoning",
                 variant_name="Abyssal Calling",
@@ -2435,7 +2641,7 @@ class DialogueSystem:
         }
 
         # Add synergy combinations
-        self.synergy_combinations = {
+        content.synergy_combinations = {
             "void_celestial": {
                 "primary_aspects": ["void_magic", "celestial_magic"],
                 "resonance_effects": {
@@ -2485,7 +2691,7 @@ class DialogueSystem:
         }
 
         # Add consequence types
-        self.consequence_types = {
+        content.consequence_types = {
             "reality_fracture": {
                 "severity_levels": {
                     "minor": {
@@ -2524,7 +2730,7 @@ class DialogueSystem:
         }
 
         # Add recovery systems
-        self.recovery_systems = {
+        content.recovery_systems = {
             "ritual_stabilization": {
                 "methods": {
                     "power_channeling": {
@@ -2553,7 +2759,7 @@ class DialogueSystem:
         }
 
         # Add mitigation mechanics
-        self.mitigation_mechanics = {
+        content.mitigation_mechanics = {
             "protective_barriers": {
                 "types": {
                     "energy_shield": {
@@ -2585,8 +2791,13 @@ class DialogueSystem:
 
     def initialize_advanced_combinations(self):
         """Initialize advanced ritual combinations and protection systems"""
+        self.content.load_group("advanced_combinations")
+
+    @staticmethod
+    def _build_advanced_combinations(content):
+        """Build advanced ritual combinations and protection systems"""
         # Add ritual combinations
-        self.ritual_combinations = {
+        content.ritual_combinations = {
             "void_celestial_fusion": RitualCombination(
                 name="Void-Celestial Fusion",
                 base_rituals=["void_summoning", "celestial_summoning"],
@@ -2645,7 +2856,7 @@ class DialogueSystem:
         }
 
         # Add protection systems
-        self.protection_systems = {
+        content.protection_systems = {
             "dimensional_ward": ProtectionSystem(
                 name="Dimensional Ward",
                 tier=4,
@@ -2702,7 +2913,7 @@ class DialogueSystem:
         }
 
         # Add emergency measures
-        self.emergency_measures = {
+        content.emergency_measures = {
             "reality_anchor": EmergencyMeasure(
                 name="Reality Anchor",
                 trigger_conditions={
@@ -2871,7 +3082,12 @@ class DialogueSystem:
 
     def initialize_emergency_protocols(self):
         """Initialize advanced emergency protocols"""
-        self.emergency_protocols = {
+        self.content.load_group("emergency_protocols")
+
+    @staticmethod
+    def _build_emergency_protocols(content):
+        """Build advanced emergency protocols"""
+        content.emergency_protocols = {
             "dimensional_collapse": EmergencyProtocol(
                 name="Dimensional Collapse Protocol",
                 priority=5,
@@ -3107,7 +3323,12 @@ class DialogueSystem:
 
     def initialize_recovery_variations(self):
         """Initialize advanced recovery variations"""
-        self.recovery_variations = {
+        self.content.load_group("recovery_variations")
+
+    @staticmethod
+    def _build_recovery_variations(content):
+        """Build advanced recovery variations"""
+        content.recovery_variations = {
             "soul_mending": RecoveryVariation(
                 name="Soul Mending",
                 type="spiritual",
@@ -3186,7 +3407,7 @@ class DialogueSystem:
         }
 
         # Initialize healing systems
-        self.healing_systems = {
+        content.healing_systems = {
             "divine_restoration": HealingSystem(
                 name="Divine Restoration",
                 power_level=0.9,
@@ -3375,4 +3596,141 @@ class DialogueSystem:
             else:
                 results["requirements_failed"].append(condition_name)
                 
-        return results
\ No newline at end of file
+        return results
+
+# Content groups in build order, with the DialogueSystem attributes each
+# builder assigns or extends
+CONTENT_GROUPS = {
+    "advanced_systems": ("advanced_contexts", "state_transitions", "effect_chains", "special_conditions"),
+    "advanced_chains": ("effect_chains", "emotional_states", "social_dynamics", "knowledge_tracker"),
+    "advanced_emotional_states": ("emotional_complexes", "relationship_dynamics", "knowledge_systems"),
+    "advanced_complexes": ("emotional_complexes", "mastery_systems", "special_interactions"),
+    "advanced_paths": ("mastery_paths", "synergy_systems", "special_events"),
+    "unique_interactions": ("unique_interactions",),
+    "ritual_types": ("ritual_types", "risk_systems"),
+    "ritual_variations": ("ritual_variations", "participant_synergies", "consequence_chains"),
+    "advanced_rituals": ("ritual_variations", "synergy_combinations", "consequence_types",
+                         "recovery_systems", "mitigation_mechanics"),
+    "advanced_combinations": ("ritual_combinations", "protection_systems", "emergency_measures"),
+    "emergency_protocols": ("emergency_protocols",),
+    "recovery_variations": ("recovery_variations", "healing_systems")
+}
+
+# Attribute -> groups that contribute to it, in build order
+CONTENT_ATTRIBUTES: Dict[str, List[str]] = {}
+for _group, _attributes in CONTENT_GROUPS.items():
+    for _attribute in _attributes:
+        CONTENT_ATTRIBUTES.setdefault(_attribute, []).append(_group)
+
+# Content that dialogue mutates as it runs, so each DialogueSystem gets its own copy
+INSTANCE_CONTENT = {"knowledge_tracker"}
+
+class _ContentNamespace:
+    """Scratch target for the builders; extending missing content starts it empty"""
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = {}
+        setattr(self, name, value)
+        return value
+
+def _source_hash() -> str:
+    with open(__file__, "rb") as source:
+        return hashlib.sha1(source.read()).hexdigest()
+
+class DialogueContentRegistry:
+    """Process-wide dialogue content, built once and shared read-only.
+
+    Content is built the first time one of its attributes is asked for,
+    running only the builder groups that attribute needs. With a
+    cache_path the registry first looks in a pickle cache written by
+    compile_cache, which holds each attribute separately so loading one
+    doesn't unpickle the rest. The cache is ignored once this module's
+    source changes.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None):
+        self.cache_path = cache_path
+        self._namespace = _ContentNamespace()
+        self._built: Set[str] = set()
+        self._content: Dict[str, any] = {}
+        self._cached: Optional[Dict[str, bytes]] = None
+        self._lock = threading.RLock()
+
+    def get(self, attribute: str):
+        """Shared content for a DialogueSystem attribute, building it if needed"""
+        try:
+            return self._content[attribute]
+        except KeyError:
+            pass
+
+        if attribute not in CONTENT_ATTRIBUTES:
+            raise KeyError(attribute)
+
+        with self._lock:
+            if attribute not in self._content:
+                value = self._load_cached(attribute)
+                if value is None:
+                    for group in CONTENT_ATTRIBUTES[attribute]:
+                        self._build_group(group)
+                    value = getattr(self._namespace, attribute)
+                if isinstance(value, dict):
+                    value = MappingProxyType(value)
+                self._content[attribute] = value
+            return self._content[attribute]
+
+    def load_group(self, group: str):
+        """Make sure every attribute a builder group contributes to is loaded"""
+        for attribute in CONTENT_GROUPS[group]:
+            self.get(attribute)
+
+    def _build_group(self, group: str):
+        if group in self._built:
+            return
+        # Earlier groups sharing an attribute go first, so a later
+        # assignment can't wipe out what an earlier update added
+        for attribute in CONTENT_GROUPS[group]:
+            for earlier in CONTENT_ATTRIBUTES[attribute]:
+                if earlier == group:
+                    break
+                self._build_group(earlier)
+        getattr(DialogueSystem, f"_build_{group}")(self._namespace)
+        self._built.add(group)
+
+    def _load_cached(self, attribute: str):
+        if self.cache_path is None:
+            return None
+        if self._cached is None:
+            self._cached = {}
+            try:
+                with open(self.cache_path, "rb") as cache:
+                    data = pickle.load(cache)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                return None
+            if data.get("source_hash") == _source_hash():
+                self._cached = data["attributes"]
+        pickled = self._cached.get(attribute)
+        return pickle.loads(pickled) if pickled is not None else None
+
+    def compile_cache(self, path: Optional[str] = None) -> str:
+        """Build all content and write it to a pickle cache"""
+        path = path or self.cache_path
+        with self._lock:
+            for group in CONTENT_GROUPS:
+                self._build_group(group)
+            data = {
+                "source_hash": _source_hash(),
+                "attributes": {
+                    attribute: pickle.dumps(getattr(self._namespace, attribute),
+                                            protocol=pickle.HIGHEST_PROTOCOL)
+                    for attribute in CONTENT_ATTRIBUTES
+                }
+            }
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as cache:
+            pickle.dump(data, cache, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        return path
+
+# Shared by every DialogueSystem that isn't given its own registry
+DIALOGUE_CONTENT = DialogueContentRegistry()
@@ -0,0 +1,185 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Any, Iterable, FrozenSet
+from collections import defaultdict, Counter
+
+@dataclass
+class WorldEvent:
+    """A world event waiting to be fanned out to interested NPCs"""
+    event_type: str
+    event_data: Dict[str, Any]
+    location: Optional[str] = None  # None reaches every location
+    faction: Optional[str] = None  # Also reaches the faction's NPCs anywhere
+
+@dataclass
+class InterestSubscription:
+    """What an NPC wants to hear about"""
+    npc: Any
+    location: str
+    faction: str
+    factions: FrozenSet[str] = frozenset()  # Other factions it follows
+    event_types: FrozenSet[str] = frozenset()  # Empty means every type
+    background: bool = False  # Only gets periodic summaries
+    summary: Counter = field(default_factory=Counter)
+
+class NPCInterestManager:
+    """Delivers world events only to the NPCs that can perceive them.
+
+    NPCs are indexed by location, faction and event type. Published events
+    are queued and fanned out once per tick, grouped per NPC. Background
+    NPCs skip the full process_world_event path and instead get an event
+    count summary every summary_interval ticks.
+    """
+
+    def __init__(self, summary_interval: int = 10):
+        self.summary_interval = summary_interval
+        self.tick = 0
+
+        self.subscriptions: Dict[int, InterestSubscription] = {}
+        self.by_location: Dict[str, Set[int]] = defaultdict(set)
+        self.by_faction: Dict[str, Set[int]] = defaultdict(set)
+        self.by_event_type: Dict[str, Set[int]] = defaultdict(set)
+        self.any_event_type: Set[int] = set()
+
+        self.pending: List[WorldEvent] = []
+        self.delivered = 0
+        self.summarized = 0
+
+    def subscribe(self,
+                  npc: Any,
+                  event_types: Optional[Iterable[str]] = None,
+                  factions: Iterable[str] = (),
+                  background: bool = False) -> InterestSubscription:
+        """Register an NPC at its current location and faction.
+
+        The NPC also hears about events for any extra factions given, and
+        only about the listed event types if event_types is set.
+        """
+        self.unsubscribe(npc)
+        subscription = InterestSubscription(
+            npc=npc,
+            location=npc.location,
+            faction=npc.faction,
+            factions=frozenset(factions),
+            event_types=frozenset(event_types or ()),
+            background=background
+        )
+        self._index(id(npc), subscription)
+        return subscription
+
+    def unsubscribe(self, npc: Any) -> None:
+        """Stop delivering events to an NPC, dropping any pending summary"""
+        subscription = self.subscriptions.get(id(npc))
+        if subscription is not None:
+            self._unindex(id(npc), subscription)
+
+    def refresh(self, npc: Any) -> None:
+        """Re-read an NPC's location and faction after it moved or defected"""
+        subscription = self.subscriptions.get(id(npc))
+        if subscription is None:
+            return
+        npc_id = id(npc)
+        self._unindex(npc_id, subscription)
+        subscription.location = npc.location
+        subscription.faction = npc.faction
+        self._index(npc_id, subscription)
+
+    def set_background(self, npc: Any, background: bool) -> None:
+        """Move an NPC between full event processing and periodic summaries"""
+        subscription = self.subscriptions.get(id(npc))
+        if subscription is None or subscription.background == background:
+            return
+        if not background:
+            # Catch the NPC up before it starts getting every event
+            self._flush_summary(subscription)
+        subscription.background = background
+
+    def _index(self, npc_id: int, subscription: InterestSubscription) -> None:
+        self.subscriptions[npc_id] = subscription
+        self.by_location[subscription.location].add(npc_id)
+        for faction in subscription.factions | {subscription.faction}:
+            self.by_faction[faction].add(npc_id)
+        if subscription.event_types:
+            for event_type in subscription.event_types:
+                self.by_event_type[event_type].add(npc_id)
+        else:
+            self.any_event_type.add(npc_id)
+
+    def _unindex(self, npc_id: int, subscription: InterestSubscription) -> None:
+        del self.subscriptions[npc_id]
+        self._discard(self.by_location, subscription.location, npc_id)
+        for faction in subscription.factions | {subscription.faction}:
+            self._discard(self.by_faction, faction, npc_id)
+        for event_type in subscription.event_types:
+            self._discard(self.by_event_type, event_type, npc_id)
+        self.any_event_type.discard(npc_id)
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[int]], key: str, npc_id: int) -> None:
+        members = index.get(key)
+        if members is not None:
+            members.discard(npc_id)
+            if not members:
+                del index[key]
+
+    def publish(self,
+                event_type: str,
+                event_data: Dict[str, Any],
+                location: Optional[str] = None,
+                faction: Optional[str] = None) -> None:
+        """Queue a world event for delivery on the next update"""
+        self.pending.append(WorldEvent(event_type, event_data, location, faction))
+
+    def recipients(self, event: WorldEvent) -> Set[int]:
+        """Ids of the NPCs whose subscription matches an event"""
+        if event.location is None:
+            reached = self.subscriptions.keys()
+        else:
+            reached = self.by_location.get(event.location, set())
+        if event.faction is not None:
+            reached = self.by_faction.get(event.faction, set()) | reached
+
+        interested = self.by_event_type.get(event.event_type)
+        if interested:
+            interested = interested | self.any_event_type
+        else:
+            interested = self.any_event_type
+
+        if len(interested) < len(reached):
+            return {npc_id for npc_id in interested if npc_id in reached}
+        return {npc_id for npc_id in reached if npc_id in interested}
+
+    def update(self) -> int:
+        """Deliver this tick's events. Returns the number of deliveries."""
+        self.tick += 1
+        events, self.pending = self.pending, []
+
+        batches: Dict[int, List[WorldEvent]] = defaultdict(list)
+        for event in events:
+            for npc_id in self.recipients(event):
+                subscription = self.subscriptions[npc_id]
+                if subscription.background:
+                    subscription.summary[event.event_type] += 1
+                else:
+                    batches[npc_id].append(event)
+
+        delivered = 0
+        for npc_id, batch in batches.items():
+            npc = self.subscriptions[npc_id].npc
+            for event in batch:
+                npc.process_world_event(event.event_type, event.event_data)
+            delivered += len(batch)
+        self.delivered += delivered
+
+        if self.tick % self.summary_interval == 0:
+            for subscription in self.subscriptions.values():
+                if subscription.background:
+                    self._flush_summary(subscription)
+
+        return delivered
+
+    def _flush_summary(self, subscription: InterestSubscription) -> None:
+        if not subscription.summary:
+            return
+        subscription.npc.process_event_summary(dict(subscription.summary))
+        subscription.summary.clear()
+        self.summarized += 1
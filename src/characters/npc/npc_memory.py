@@ -0,0 +1,163 @@
+from typing import Dict, List, Optional, Any, Iterator, Tuple
+from bisect import bisect_left, insort
+import heapq
+import itertools
+import math
+
+# Importance floor so unimportant memories still get a finite retention score
+MIN_IMPORTANCE = 1e-3
+SECONDS_PER_HOUR = 3600.0
+
+class NPCMemoryStore:
+    """Bounded store for an NPC's significant events.
+
+    Memories are dicts with "type", "data", "time" and "importance" keys,
+    as built by NPC.remember_event. Once the store is over capacity the
+    memory with the lowest importance x recency is evicted. Every memory
+    decays at the same rate, so that ranking is fixed when a memory is
+    stored and a min-heap keyed on log(importance) + decay_rate * hours
+    finds the weakest one without rescoring.
+
+    Recall goes through time-ordered indexes by event type and by player,
+    so it costs a bisect plus the number of memories returned.
+    """
+
+    def __init__(self, capacity: int = 200, decay_rate: float = 0.1):
+        self.capacity = capacity
+        self.decay_rate = decay_rate  # Per hour
+
+        self.memories: Dict[int, Dict[str, Any]] = {}
+        self._sequence = itertools.count()
+        self._retention: List[Tuple[float, int]] = []  # Min-heap of (score, seq)
+        self._timeline: List[Tuple[float, int]] = []  # Sorted (time, seq)
+        self._by_type: Dict[str, List[Tuple[float, int]]] = {}
+        self._by_player: Dict[str, List[Tuple[float, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.memories)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Memories from oldest to newest"""
+        for _, seq in self._timeline:
+            yield self.memories[seq]
+
+    def retention_score(self, memory: Dict[str, Any]) -> float:
+        """Log of importance x recency, offset so it doesn't change over time"""
+        importance = max(MIN_IMPORTANCE, memory.get("importance", 0.0))
+        return math.log(importance) + self.decay_rate * memory["time"] / SECONDS_PER_HOUR
+
+    def append(self, memory: Dict[str, Any]) -> None:
+        """Store a memory, evicting the weakest one if over capacity"""
+        seq = next(self._sequence)
+        key = (memory["time"], seq)
+        self.memories[seq] = memory
+
+        heapq.heappush(self._retention, (self.retention_score(memory), seq))
+        insort(self._timeline, key)
+        insort(self._by_type.setdefault(memory["type"], []), key)
+        player_id = self._player_id(memory)
+        if player_id is not None:
+            insort(self._by_player.setdefault(player_id, []), key)
+
+        while len(self.memories) > self.capacity:
+            _, weakest = heapq.heappop(self._retention)
+            self._remove(weakest)
+
+    def _remove(self, seq: int) -> None:
+        memory = self.memories.pop(seq)
+        key = (memory["time"], seq)
+        self._discard(self._timeline, key)
+        self._discard_indexed(self._by_type, memory["type"], key)
+        player_id = self._player_id(memory)
+        if player_id is not None:
+            self._discard_indexed(self._by_player, player_id, key)
+
+    @staticmethod
+    def _discard(index: List[Tuple[float, int]], key: Tuple[float, int]) -> None:
+        position = bisect_left(index, key)
+        if position < len(index) and index[position] == key:
+            del index[position]
+
+    def _discard_indexed(self, indexes: Dict[str, List[Tuple[float, int]]],
+                         name: str, key: Tuple[float, int]) -> None:
+        index = indexes.get(name)
+        if index is not None:
+            self._discard(index, key)
+            if not index:
+                del indexes[name]
+
+    @staticmethod
+    def _player_id(memory: Dict[str, Any]) -> Optional[str]:
+        data = memory.get("data")
+        return data.get("player_id") if isinstance(data, dict) else None
+
+    def recall(self,
+               event_type: Optional[str] = None,
+               player_id: Optional[str] = None,
+               since: Optional[float] = None,
+               limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Memories matching the filters, newest first"""
+        if event_type is not None and player_id is not None:
+            # Walk the shorter index and check the other field
+            by_type = self._by_type.get(event_type, [])
+            by_player = self._by_player.get(player_id, [])
+            if len(by_type) <= len(by_player):
+                index, matches = by_type, lambda memory: self._player_id(memory) == player_id
+            else:
+                index, matches = by_player, lambda memory: memory["type"] == event_type
+        elif event_type is not None:
+            index, matches = self._by_type.get(event_type, []), None
+        elif player_id is not None:
+            index, matches = self._by_player.get(player_id, []), None
+        else:
+            index, matches = self._timeline, None
+
+        start = bisect_left(index, (since, -1)) if since is not None else 0
+        recalled = []
+        for position in range(len(index) - 1, start - 1, -1):
+            memory = self.memories[index[position][1]]
+            if matches is not None and not matches(memory):
+                continue
+            recalled.append(memory)
+            if limit is not None and len(recalled) >= limit:
+                break
+        return recalled
+
+    def latest(self, event_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """The most recent memory, optionally of one event type"""
+        recalled = self.recall(event_type=event_type, limit=1)
+        return recalled[0] if recalled else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact column form for saves, with event types stored once"""
+        types: Dict[str, int] = {}
+        memories = list(self)
+        type_codes = [types.setdefault(memory["type"], len(types)) for memory in memories]
+        return {
+            "capacity": self.capacity,
+            "decay_rate": self.decay_rate,
+            "types": list(types),
+            "type_codes": type_codes,
+            "times": [memory["time"] for memory in memories],
+            "importance": [memory.get("importance", 0.0) for memory in memories],
+            "data": [memory.get("data") for memory in memories],
+            "emotional_impact": [memory.get("emotional_impact", {}) for memory in memories]
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'NPCMemoryStore':
+        """Rebuild a store saved with to_dict"""
+        store = cls(state["capacity"], state["decay_rate"])
+        types = state["types"]
+        for code, time, importance, data, emotional_impact in zip(
+            state["type_codes"], state["times"], state["importance"],
+            state["data"], state["emotional_impact"]
+        ):
+            store.append({
+                "type": types[code],
+                "data": data,
+                "time": time,
+                "importance": importance,
+                "emotional_impact": emotional_impact
+            })
+        return store
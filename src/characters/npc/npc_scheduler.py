@@ -0,0 +1,190 @@
+from enum import Enum
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Callable
+from collections import deque
+from bisect import bisect_right
+import math
+
+class LODTier(Enum):
+    FULL = "full"  # Behavior updated every tick
+    REDUCED = "reduced"  # Behavior updated every reduced_interval ticks
+    SCHEDULE = "schedule"  # Only follows its daily routine, computed on demand
+
+@dataclass
+class ScheduledNPC:
+    """Scheduler bookkeeping for one NPC"""
+    npc: Any
+    tier: LODTier = LODTier.SCHEDULE
+    generation: int = 0  # Bumped on tier changes to retire stale queue entries
+    last_interaction: Optional[int] = None
+    synced_hour: Optional[int] = None
+    last_update: Optional[int] = None
+
+def routine_activity(daily_routine: Dict[int, str], hour: int) -> Optional[str]:
+    """The routine activity in effect at an hour, wrapping around midnight"""
+    if not daily_routine:
+        return None
+    hours = sorted(daily_routine)
+    position = bisect_right(hours, hour % 24)
+    return daily_routine[hours[position - 1]]
+
+class NPCSimulationScheduler:
+    """Level-of-detail scheduler holding NPC simulation to a fixed budget.
+
+    Each NPC is placed in an LOD tier from its distance to the player and
+    how recently the player interacted with it. Every tick at most
+    frame_budget NPCs run update_behavior: full-detail NPCs first, then
+    reduced NPCs in rotation. Schedule-only NPCs cost nothing per tick;
+    their activity is read straight off their daily routine, and their
+    schedule is brought up to date whenever they are promoted.
+
+    Tiers are re-evaluated for retier_budget NPCs per tick in rotation,
+    so the distance checks are bounded too. record_interaction promotes
+    an NPC immediately.
+    """
+
+    def __init__(self,
+                 distance_fn: Callable[[Any], float],
+                 frame_budget: int = 64,
+                 retier_budget: int = 128,
+                 full_radius: float = 30.0,
+                 reduced_radius: float = 120.0,
+                 reduced_interval: int = 5,
+                 interaction_window: int = 300):
+        self.distance_fn = distance_fn
+        self.frame_budget = frame_budget
+        self.retier_budget = retier_budget
+        self.full_radius = full_radius
+        self.reduced_radius = reduced_radius
+        self.reduced_interval = reduced_interval
+        self.interaction_window = interaction_window
+
+        self.tick = 0
+        self.current_hour = 0
+        self.entries: Dict[int, ScheduledNPC] = {}
+        self.queues: Dict[LODTier, deque] = {
+            LODTier.FULL: deque(),
+            LODTier.REDUCED: deque()
+        }
+        self.tier_counts: Dict[LODTier, int] = {tier: 0 for tier in LODTier}
+        self._retier_queue: deque = deque()
+
+    def add_npc(self, npc: Any) -> LODTier:
+        """Start scheduling an NPC, placing it in a tier right away"""
+        entry = ScheduledNPC(npc=npc)
+        self.entries[id(npc)] = entry
+        self.tier_counts[entry.tier] += 1
+        self._retier_queue.append(entry)
+        self._set_tier(entry, self._choose_tier(entry))
+        return entry.tier
+
+    def remove_npc(self, npc: Any) -> None:
+        """Stop scheduling an NPC"""
+        entry = self.entries.pop(id(npc), None)
+        if entry is not None:
+            self.tier_counts[entry.tier] -= 1
+            entry.generation += 1  # Leaves its queue entries stale
+
+    def tier_of(self, npc: Any) -> Optional[LODTier]:
+        """An NPC's current tier, or None if it isn't scheduled"""
+        entry = self.entries.get(id(npc))
+        return entry.tier if entry else None
+
+    def record_interaction(self, npc: Any) -> None:
+        """Note a player interaction, promoting the NPC to full detail"""
+        entry = self.entries.get(id(npc))
+        if entry is not None:
+            entry.last_interaction = self.tick
+            self._set_tier(entry, LODTier.FULL)
+
+    def current_activity(self, npc: Any) -> Optional[str]:
+        """What an NPC is doing now, modelled from its routine if not simulated"""
+        entry = self.entries.get(id(npc))
+        if entry is None or entry.tier is not LODTier.SCHEDULE:
+            return npc.schedule.current_activity
+        activity = routine_activity(npc.schedule.daily_routine, self.current_hour)
+        return activity if activity is not None else npc.schedule.current_activity
+
+    def _choose_tier(self, entry: ScheduledNPC) -> LODTier:
+        if (entry.last_interaction is not None and
+                self.tick - entry.last_interaction <= self.interaction_window):
+            return LODTier.FULL
+        distance = self.distance_fn(entry.npc)
+        if distance <= self.full_radius:
+            return LODTier.FULL
+        if distance <= self.reduced_radius:
+            return LODTier.REDUCED
+        return LODTier.SCHEDULE
+
+    def _set_tier(self, entry: ScheduledNPC, tier: LODTier) -> None:
+        if tier is entry.tier:
+            return
+        promoted = entry.tier is LODTier.SCHEDULE
+        self.tier_counts[entry.tier] -= 1
+        self.tier_counts[tier] += 1
+        entry.tier = tier
+        entry.generation += 1
+        if tier in self.queues:
+            self.queues[tier].append((entry, entry.generation))
+        if promoted:
+            self._sync_schedule(entry)
+
+    def _sync_schedule(self, entry: ScheduledNPC) -> None:
+        """Catch an NPC's schedule up to the current hour"""
+        if entry.synced_hour == self.current_hour:
+            return
+        entry.synced_hour = self.current_hour
+        npc = entry.npc
+        routine = npc.schedule.daily_routine
+        activity = routine_activity(routine, self.current_hour)
+        if activity is None or activity == npc.schedule.current_activity:
+            return
+        # Replay the routine entry that should have fired, so observers
+        # see the same event a fully simulated NPC would have sent
+        hours = sorted(routine)
+        npc.update_schedule(hours[bisect_right(hours, self.current_hour % 24) - 1])
+
+    def _retier(self) -> None:
+        for _ in range(min(self.retier_budget, len(self._retier_queue))):
+            entry = self._retier_queue.popleft()
+            if self.entries.get(id(entry.npc)) is not entry:
+                continue
+            self._retier_queue.append(entry)
+            self._set_tier(entry, self._choose_tier(entry))
+
+    def _take(self, tier: LODTier, count: int, interval: int = 1) -> List[ScheduledNPC]:
+        """Next NPCs in a tier's rotation not updated within interval ticks"""
+        queue = self.queues[tier]
+        taken = []
+        # Each queue holds at most one live entry per NPC in the tier
+        for _ in range(len(queue)):
+            if len(taken) >= count:
+                break
+            entry, generation = queue.popleft()
+            if generation != entry.generation or self.entries.get(id(entry.npc)) is not entry:
+                continue
+            if entry.last_update is not None and self.tick - entry.last_update < interval:
+                # The rotation runs oldest update first, so stop at the first NPC not due
+                queue.appendleft((entry, generation))
+                break
+            queue.append((entry, generation))
+            taken.append(entry)
+        return taken
+
+    def update(self, current_hour: int) -> int:
+        """Run one tick. Returns the number of behavior updates made."""
+        self.tick += 1
+        self.current_hour = current_hour
+        self._retier()
+
+        full = self._take(LODTier.FULL, self.frame_budget)
+        reduced_quota = math.ceil(self.tier_counts[LODTier.REDUCED] / self.reduced_interval)
+        reduced = self._take(LODTier.REDUCED,
+                             min(reduced_quota, self.frame_budget - len(full)),
+                             self.reduced_interval)
+
+        for entry in full + reduced:
+            entry.last_update = self.tick
+            self._sync_schedule(entry)
+            entry.npc.update_behavior()
+        return len(full) + len(reduced)
@@ -1,6 +1,12 @@
 from enum import Enum
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+import time
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Any, Callable, Iterator, Mapping, Set, Tuple
+from collections import ChainMap
+from collections.abc import MutableMapping
+from functools import lru_cache
+from types import MappingProxyType
+from .npc_memory import NPCMemoryStore
 from visual_system import VisualSystem, EmotionType, EnvironmentMood, VisualTheme
 
 class NPCType(Enum):
@@ -92,11 +98,16 @@ class NPCSchedule:
 
 @dataclass
 class NPCMemory:
-    significant_events: List[Dict[str, Any]] = field(default_factory=list)
+    significant_events: Optional[NPCMemoryStore] = None  # Built from the settings below
     player_interactions: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
     faction_history: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
     location_memories: Dict[str, Dict[str, Any]] = field(default_factory=dict)
-    memory_decay_rate: float = 0.1  # Rate at which old memories fade
+    memory_decay_rate: float = 0.1  # Rate at which old memories fade, per hour
+    memory_capacity: int = 200  # Significant events kept before the weakest is forgotten
+    
+    def __post_init__(self):
+        if self.significant_events is None:
+            self.significant_events = NPCMemoryStore(self.memory_capacity, self.memory_decay_rate)
 
 @dataclass
 class NPCBehavior:
@@ -180,56 +191,327 @@ class FactionNPCTemplate:
     relationship_modifiers: Dict[NPCFaction, float]
     specialization_weights: Dict[NPCSpecialization, float]
 
+# Behavior patterns shared through NPC archetypes. Each NPC copies a
+# pattern only once it looks it up, so spawning one costs no pattern objects.
+BASE_BEHAVIOR_PATTERNS = (
+    SAMSBehaviorPattern(
+        pattern_id="combat_defensive",
+        trigger_conditions=[
+            {"type": "threat_level", "value": 0.7, "operator": ">="},
+            {"type": "health_percentage", "value": 0.4, "operator": "<="}
+        ],
+        response_sequence=["seek_cover", "heal", "assess_threat", "counter_attack"],
+        priority=0.8,
+        cooldown=30.0
+    ),
+    SAMSBehaviorPattern(
+        pattern_id="combat_aggressive",
+        trigger_conditions=[
+            {"type": "threat_level", "value": 0.4, "operator": "<="},
+            {"type": "health_percentage", "value": 0.7, "operator": ">="}
+        ],
+        response_sequence=["charge", "power_attack", "press_advantage"],
+        priority=0.7,
+        cooldown=20.0
+    ),
+    SAMSBehaviorPattern(
+        pattern_id="trade_opportunistic",
+        trigger_conditions=[
+            {"type": "player_wealth", "value": 1000, "operator": ">="},
+            {"type": "rare_item_available", "value": True, "operator": "=="}
+        ],
+        response_sequence=["assess_value", "negotiate_price", "offer_deal"],
+        priority=0.6,
+        cooldown=300.0
+    ),
+    SAMSBehaviorPattern(
+        pattern_id="trade_cautious",
+        trigger_conditions=[
+            {"type": "player_reputation", "value": 50, "operator": "<"},
+            {"type": "valuable_item_requested", "value": True, "operator": "=="}
+        ],
+        response_sequence=["verify_credentials", "check_references", "limited_offer"],
+        priority=0.65,
+        cooldown=150.0
+    ),
+    SAMSBehaviorPattern(
+        pattern_id="quest_urgent",
+        trigger_conditions=[
+            {"type": "quest_importance", "value": 0.8, "operator": ">="},
+            {"type": "time_remaining", "value": 3600, "operator": "<="}
+        ],
+        response_sequence=["emphasize_urgency", "offer_bonus", "provide_aid"],
+        priority=0.9,
+        cooldown=600.0
+    ),
+    SAMSBehaviorPattern(
+        pattern_id="social_friendly",
+        trigger_conditions=[
+            {"type": "player_relationship", "value": 70, "operator": ">="},
+            {"type": "recent_interaction", "value": True, "operator": "=="}
+        ],
+        response_sequence=["share_secret", "offer_discount", "give_gift"],
+        priority=0.5,
+        cooldown=3600.0
+    )
+)
+
+TYPE_BEHAVIOR_PATTERNS: Dict[NPCType, Tuple[SAMSBehaviorPattern, ...]] = {
+    NPCType.MERCHANT: (
+        SAMSBehaviorPattern(
+            pattern_id="merchant_supply_chain",
+            trigger_conditions=[
+                {"type": "inventory_level", "value": 0.3, "operator": "<="},
+                {"type": "market_demand", "value": 0.7, "operator": ">="}
+            ],
+            response_sequence=["order_supplies", "adjust_prices", "notify_customers"],
+            priority=0.75,
+            cooldown=7200.0
+        ),
+    ),
+    NPCType.QUEST_GIVER: (
+        SAMSBehaviorPattern(
+            pattern_id="quest_chain_progression",
+            trigger_conditions=[
+                {"type": "player_quest_completion", "value": "previous_quest", "operator": "=="},
+                {"type": "story_progression", "value": 0.5, "operator": ">="}
+            ],
+            response_sequence=["check_prerequisites", "reveal_next_quest", "hint_future_developments"],
+            priority=0.85,
+            cooldown=1800.0
+        ),
+        SAMSBehaviorPattern(
+            pattern_id="quest_urgency_escalation",
+            trigger_conditions=[
+                {"type": "world_event_active", "value": True, "operator": "=="},
+                {"type": "quest_time_remaining", "value": 7200, "operator": "<="}
+            ],
+            response_sequence=["increase_rewards", "emphasize_consequences", "offer_assistance"],
+            priority=0.9,
+            cooldown=3600.0
+        )
+    ),
+    NPCType.TRAINER: (
+        SAMSBehaviorPattern(
+            pattern_id="adaptive_training",
+            trigger_conditions=[
+                {"type": "player_skill_progress", "value": 0.8, "operator": ">="},
+                {"type": "training_sessions", "value": 3, "operator": ">="}
+            ],
+            response_sequence=["assess_readiness", "introduce_advanced_technique", "practical_demonstration"],
+            priority=0.8,
+            cooldown=900.0
+        ),
+        SAMSBehaviorPattern(
+            pattern_id="remedial_instruction",
+            trigger_conditions=[
+                {"type": "training_success_rate", "value": 0.4, "operator": "<="},
+                {"type": "player_frustration", "value": 0.6, "operator": ">="}
+            ],
+            response_sequence=["simplify_instruction", "break_down_concepts", "encourage_practice"],
+            priority=0.75,
+            cooldown=600.0
+        )
+    ),
+    NPCType.LOREKEEPER: (
+        SAMSBehaviorPattern(
+            pattern_id="knowledge_revelation",
+            trigger_conditions=[
+                {"type": "player_insight", "value": 0.7, "operator": ">="},
+                {"type": "relevant_discovery", "value": True, "operator": "=="}
+            ],
+            response_sequence=["verify_understanding", "reveal_hidden_knowledge", "suggest_connections"],
+            priority=0.8,
+            cooldown=1200.0
+        ),
+    ),
+    NPCType.MYSTIC: (
+        SAMSBehaviorPattern(
+            pattern_id="power_awakening",
+            trigger_conditions=[
+                {"type": "player_potential", "value": 0.8, "operator": ">="},
+                {"type": "mystical_alignment", "value": True, "operator": "=="}
+            ],
+            response_sequence=["test_readiness", "channel_power", "guide_awakening"],
+            priority=0.9,
+            cooldown=7200.0
+        ),
+    )
+}
+
+# Patterns layered on top of the type's for specialized NPCs
+SPECIALIZATION_BEHAVIOR_PATTERNS: Dict[NPCSpecialization, Tuple[SAMSBehaviorPattern, ...]] = {}
+
+BASE_EMOTIONS = {
+    "joy": 0.5, "trust": 0.5, "fear": 0.2, "surprise": 0.3,
+    "sadness": 0.2, "disgust": 0.2, "anger": 0.2, "anticipation": 0.4
+}
+
+# Starting value of every emotion for each SAMSEmotionalProfile field
+EMOTIONAL_PROFILE_DEFAULTS = {
+    "emotional_momentum": 0.0,
+    "emotional_thresholds": 0.7,
+    "emotional_decay": 0.1,
+    "emotional_resistance": 0.3
+}
+
+@dataclass(frozen=True)
+class NPCArchetype:
+    """Read-only defaults shared by every NPC of one type and specialization"""
+    npc_type: NPCType
+    specialization: Optional[NPCSpecialization]
+    base_mood: NPCMood
+    behavior_patterns: Mapping[str, SAMSBehaviorPattern]
+    emotional_profile: Mapping[str, Mapping[str, float]]  # Profile field -> emotion -> value
+
+@lru_cache(maxsize=None)
+def get_archetype(npc_type: NPCType,
+                  specialization: Optional[NPCSpecialization] = None) -> NPCArchetype:
+    """Get the shared archetype for an NPC type and specialization"""
+    patterns = {}
+    for pattern in (BASE_BEHAVIOR_PATTERNS +
+                    TYPE_BEHAVIOR_PATTERNS.get(npc_type, ()) +
+                    SPECIALIZATION_BEHAVIOR_PATTERNS.get(specialization, ())):
+        patterns[pattern.pattern_id] = pattern
+
+    emotional_profile = {"base_emotions": MappingProxyType(dict(BASE_EMOTIONS))}
+    for profile_field, value in EMOTIONAL_PROFILE_DEFAULTS.items():
+        emotional_profile[profile_field] = MappingProxyType(dict.fromkeys(BASE_EMOTIONS, value))
+
+    return NPCArchetype(
+        npc_type=npc_type,
+        specialization=specialization,
+        base_mood=NPCMood.NEUTRAL,
+        behavior_patterns=MappingProxyType(patterns),
+        emotional_profile=MappingProxyType(emotional_profile)
+    )
+
+class BehaviorPatternOverlay(MutableMapping):
+    """An NPC's behavior patterns, stored as deltas over its archetype.
+
+    Callers adapt priorities and triggers in place, so a shared pattern is
+    copied into the NPC the first time it is looked up. Only patterns an
+    NPC has touched, added or removed take up memory of its own.
+    """
+    __slots__ = ("shared", "local", "removed")
+
+    def __init__(self, shared: Mapping[str, SAMSBehaviorPattern]):
+        self.shared = shared
+        self.local: Dict[str, SAMSBehaviorPattern] = {}
+        self.removed: Set[str] = set()
+
+    def __getitem__(self, pattern_id: str) -> SAMSBehaviorPattern:
+        if pattern_id in self.local:
+            return self.local[pattern_id]
+        if pattern_id in self.removed:
+            raise KeyError(pattern_id)
+        shared = self.shared[pattern_id]
+        pattern = replace(
+            shared,
+            trigger_conditions=[dict(condition) for condition in shared.trigger_conditions],
+            response_sequence=list(shared.response_sequence)
+        )
+        self.local[pattern_id] = pattern
+        return pattern
+
+    def __setitem__(self, pattern_id: str, pattern: SAMSBehaviorPattern):
+        self.local[pattern_id] = pattern
+        self.removed.discard(pattern_id)
+
+    def __delitem__(self, pattern_id: str):
+        if pattern_id not in self:
+            raise KeyError(pattern_id)
+        self.local.pop(pattern_id, None)
+        if pattern_id in self.shared:
+            self.removed.add(pattern_id)
+
+    def __contains__(self, pattern_id) -> bool:
+        return pattern_id in self.local or (
+            pattern_id in self.shared and pattern_id not in self.removed
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.local
+        for pattern_id in self.shared:
+            if pattern_id not in self.local and pattern_id not in self.removed:
+                yield pattern_id
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+def _emotional_profile(npc: "NPC") -> SAMSEmotionalProfile:
+    # Writes land in each ChainMap's first map, leaving the defaults shared
+    return SAMSEmotionalProfile(**{
+        profile_field: ChainMap({}, defaults)
+        for profile_field, defaults in npc.archetype.emotional_profile.items()
+    })
+
+# NPC state built on first access rather than at spawn
+_LAZY_STATE: Dict[str, Callable[["NPC"], Any]] = {
+    "knowledge": lambda npc: NPCKnowledge(),
+    "personality": lambda npc: NPCPersonality(base_mood=npc.archetype.base_mood),
+    "inventory": lambda npc: NPCInventory(),
+    "schedule": lambda npc: NPCSchedule(),
+    "player_relationships": lambda npc: {},
+    "faction_relationships": lambda npc: {},
+    "active_quests": lambda npc: {},
+    "completed_quests": lambda npc: [],
+    "conversation_history": lambda npc: [],
+    "memory": lambda npc: NPCMemory(),
+    "behavior": lambda npc: NPCBehavior(),
+    "faction_influence": lambda npc: FactionInfluence(),
+    "sams_memory": lambda npc: SAMSMemoryProfile(),
+    "sams_personality": lambda npc: SAMSPersonalityModel(),
+    "sams_context": lambda npc: SAMSInteractionContext(),
+    "emotional_profile": _emotional_profile,
+    "behavior_patterns": lambda npc: BehaviorPatternOverlay(npc.archetype.behavior_patterns),
+    "decision_matrix": lambda npc: SAMSDecisionMatrix()
+}
+
 class NPC:
-    def __init__(self, name: str, npc_type: NPCType, visual_system: VisualSystem, event_manager):
+    # Compact per-NPC state. Slots left unset until first use are filled
+    # from _LAZY_STATE by __getattr__, so NPCs nobody talks to stay small.
+    __slots__ = (
+        "name", "npc_type", "visual_system", "event_manager", "archetype",
+        "level", "specialization", "faction", "location", "current_mood",
+        "learning_patterns", *_LAZY_STATE
+    )
+
+    def __init__(self, name: str, npc_type: NPCType, visual_system: VisualSystem, event_manager,
+                 specialization: Optional[NPCSpecialization] = None):
         self.name = name
         self.npc_type = npc_type
         self.visual_system = visual_system
         self.event_manager = event_manager
+        self.archetype = get_archetype(npc_type, specialization)
         
         # Core attributes
         self.level = 1
-        self.specialization: Optional[NPCSpecialization] = None
+        self.specialization = specialization
         self.faction: str = "neutral"
         self.location: str = "starting_area"
         
-        # Complex attributes
-        self.knowledge = NPCKnowledge()
-        self.personality = NPCPersonality()
-        self.inventory = NPCInventory()
-        self.schedule = NPCSchedule()
-        
-        # Relationship tracking
-        self.player_relationships: Dict[str, float] = {}  # player_id -> relationship value
-        self.faction_relationships: Dict[str, float] = {}
-        
         # State tracking
-        self.current_mood = self.personality.base_mood
-        self.active_quests: Dict[str, Dict[str, Any]] = {}
-        self.completed_quests: List[str] = []
-        self.conversation_history: List[Dict[str, Any]] = []
-        
-        # New systems
-        self.memory = NPCMemory()
-        self.behavior = NPCBehavior()
-        self.faction_influence = FactionInfluence()
-        
-        # SAMS Integration
-        self.sams_memory = SAMSMemoryProfile()
-        self.sams_personality = SAMSPersonalityModel()
-        self.sams_context = SAMSInteractionContext()
-        
-        # Enhanced SAMS Integration
-        self.emotional_profile = SAMSEmotionalProfile()
-        self.behavior_patterns: Dict[str, SAMSBehaviorPattern] = {}
-        self.decision_matrix = SAMSDecisionMatrix()
-        
-        # Initialize emotional profile
-        self._initialize_emotional_profile()
-        # Initialize behavior patterns
-        self._initialize_behavior_patterns()
-        # Initialize decision matrix
-        self._initialize_decision_matrix()
+        self.current_mood = self.archetype.base_mood
+        
+    def __getattr__(self, name: str):
+        """Build lazily initialized state the first time it is accessed"""
+        factory = _LAZY_STATE.get(name)
+        if factory is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = factory(self)
+        setattr(self, name, value)
+        return value
+        
+    def specialize(self, specialization: Optional[NPCSpecialization]):
+        """Switch the NPC to the archetype for a new specialization"""
+        self.specialization = specialization
+        self.archetype = get_archetype(self.npc_type, specialization)
+        try:
+            patterns = object.__getattribute__(self, "behavior_patterns")
+        except AttributeError:
+            return  # Not built yet, so it will pick up the new archetype
+        patterns.shared = self.archetype.behavior_patterns
         
     def interact(self, player) -> Dict[str, Any]:
         """Enhanced interaction system with emotional awareness"""
@@ -820,6 +1102,10 @@ class NPC:
         self.memory.significant_events.append(memory)
         self._update_behavior_based_on_memory(memory)
         
+    def _get_current_time(self) -> float:
+        """Timestamp used for memories and interaction records"""
+        return time.time()
+        
     def update_faction_influence(self, faction: str, change: float):
         """Update NPC's influence within a faction"""
         current_influence = self.faction_influence.influence_level
@@ -876,6 +1162,16 @@ class NPC:
             }
         )
         
+    def process_event_summary(self, event_counts: Dict[str, int]):
+        """Fold a batch of world events seen from the background into one memory"""
+        self.memory.significant_events.append({
+            "type": "world_summary",
+            "data": {"event_counts": event_counts},
+            "time": self._get_current_time(),
+            "importance": 0.1,
+            "emotional_impact": {}
+        })
+        
     def update_behavior(self):
         """Update NPC's behavior based on current state and goals"""
         # Update current goal if needed
@@ -1170,206 +1466,6 @@ class NPC:
             theme=self._get_theme_for_response(response_type)
         ) 
         
-    def _initialize_emotional_profile(self):
-        """Initialize the emotional profile with sophisticated tracking"""
-        base_emotions = {
-            "joy": 0.5, "trust": 0.5, "fear": 0.2, "surprise": 0.3,
-            "sadness": 0.2, "disgust": 0.2, "anger": 0.2, "anticipation": 0.4
-        }
-        
-        for emotion, value in base_emotions.items():
-            self.emotional_profile.base_emotions[emotion] = value
-            self.emotional_profile.emotional_momentum[emotion] = 0.0
-            self.emotional_profile.emotional_thresholds[emotion] = 0.7
-            self.emotional_profile.emotional_decay[emotion] = 0.1
-            self.emotional_profile.emotional_resistance[emotion] = 0.3
-            
-    def _initialize_behavior_patterns(self):
-        """Initialize complex behavior patterns for each NPC type"""
-        # Base patterns
-        self._init_combat_patterns()
-        self._init_trade_patterns()
-        self._init_quest_patterns()
-        self._init_social_patterns()
-        self._init_specialized_patterns()
-        
-    def _init_combat_patterns(self):
-        """Initialize combat-related behavior patterns"""
-        self.behavior_patterns["combat_defensive"] = SAMSBehaviorPattern(
-            pattern_id="combat_defensive",
-            trigger_conditions=[
-                {"type": "threat_level", "value": 0.7, "operator": ">="},
-                {"type": "health_percentage", "value": 0.4, "operator": "<="}
-            ],
-            response_sequence=["seek_cover", "heal", "assess_threat", "counter_attack"],
-            priority=0.8,
-            cooldown=30.0
-        )
-        
-        self.behavior_patterns["combat_aggressive"] = SAMSBehaviorPattern(
-            pattern_id="combat_aggressive",
-            trigger_conditions=[
-                {"type": "threat_level", "value": 0.4, "operator": "<="},
-                {"type": "health_percentage", "value": 0.7, "operator": ">="}
-            ],
-            response_sequence=["charge", "power_attack", "press_advantage"],
-            priority=0.7,
-            cooldown=20.0
-        )
-        
-    def _init_trade_patterns(self):
-        """Initialize trade-related behavior patterns"""
-        self.behavior_patterns["trade_opportunistic"] = SAMSBehaviorPattern(
-            pattern_id="trade_opportunistic",
-            trigger_conditions=[
-                {"type": "player_wealth", "value": 1000, "operator": ">="},
-                {"type": "rare_item_available", "value": True, "operator": "=="}
-            ],
-            response_sequence=["assess_value", "negotiate_price", "offer_deal"],
-            priority=0.6,
-            cooldown=300.0
-        )
-        
-        self.behavior_patterns["trade_cautious"] = SAMSBehaviorPattern(
-            pattern_id="trade_cautious",
-            trigger_conditions=[
-                {"type": "player_reputation", "value": 50, "operator": "<"},
-                {"type": "valuable_item_requested", "value": True, "operator": "=="}
-            ],
-            response_sequence=["verify_credentials", "check_references", "limited_offer"],
-            priority=0.65,
-            cooldown=150.0
-        )
-        
-    def _init_quest_patterns(self):
-        """Initialize quest-related behavior patterns"""
-        self.behavior_patterns["quest_urgent"] = SAMSBehaviorPattern(
-            pattern_id="quest_urgent",
-            trigger_conditions=[
-                {"type": "quest_importance", "value": 0.8, "operator": ">="},
-                {"type": "time_remaining", "value": 3600, "operator": "<="}
-            ],
-            response_sequence=["emphasize_urgency", "offer_bonus", "provide_aid"],
-            priority=0.9,
-            cooldown=600.0
-        )
-        
-    def _init_social_patterns(self):
-        """Initialize social interaction patterns"""
-        self.behavior_patterns["social_friendly"] = SAMSBehaviorPattern(
-            pattern_id="social_friendly",
-            trigger_conditions=[
-                {"type": "player_relationship", "value": 70, "operator": ">="},
-                {"type": "recent_interaction", "value": True, "operator": "=="}
-            ],
-            response_sequence=["share_secret", "offer_discount", "give_gift"],
-            priority=0.5,
-            cooldown=3600.0
-        )
-        
-    def _init_specialized_patterns(self):
-        """Initialize NPC type-specific behavior patterns"""
-        type_patterns = {
-            NPCType.MERCHANT: self._init_merchant_patterns,
-            NPCType.QUEST_GIVER: self._init_quest_giver_patterns,
-            NPCType.TRAINER: self._init_trainer_patterns,
-            NPCType.LOREKEEPER: self._init_lorekeeper_patterns,
-            NPCType.ARTISAN: self._init_artisan_patterns,
-            NPCType.GUARD: self._init_guard_patterns,
-            NPCType.MYSTIC: self._init_mystic_patterns,
-            NPCType.WANDERER: self._init_wanderer_patterns
-        }
-        
-        if self.npc_type in type_patterns:
-            type_patterns[self.npc_type]()
-            
-    def _init_merchant_patterns(self):
-        """Initialize merchant-specific patterns"""
-        self.behavior_patterns["merchant_supply_chain"] = SAMSBehaviorPattern(
-            pattern_id="merchant_supply_chain",
-            trigger_conditions=[
-                {"type": "inventory_level", "value": 0.3, "operator": "<="},
-                {"type": "market_demand", "value": 0.7, "operator": ">="}
-            ],
-            response_sequence=["order_supplies", "adjust_prices", "notify_customers"],
-            priority=0.75,
-            cooldown=7200.0
-        )
-        
-    def _init_quest_giver_patterns(self):
-        """Initialize quest giver-specific patterns"""
-        self.behavior_patterns["quest_chain_progression"] = SAMSBehaviorPattern(
-            pattern_id="quest_chain_progression",
-            trigger_conditions=[
-                {"type": "player_quest_completion", "value": "previous_quest", "operator": "=="},
-                {"type": "story_progression", "value": 0.5, "operator": ">="}
-            ],
-            response_sequence=["check_prerequisites", "reveal_next_quest", "hint_future_developments"],
-            priority=0.85,
-            cooldown=1800.0
-        )
-        
-        self.behavior_patterns["quest_urgency_escalation"] = SAMSBehaviorPattern(
-            pattern_id="quest_urgency_escalation",
-            trigger_conditions=[
-                {"type": "world_event_active", "value": True, "operator": "=="},
-                {"type": "quest_time_remaining", "value": 7200, "operator": "<="}
-            ],
-            response_sequence=["increase_rewards", "emphasize_consequences", "offer_assistance"],
-            priority=0.9,
-            cooldown=3600.0
-        )
-
-    def _init_trainer_patterns(self):
-        """Initialize trainer-specific patterns"""
-        self.behavior_patterns["adaptive_training"] = SAMSBehaviorPattern(
-            pattern_id="adaptive_training",
-            trigger_conditions=[
-                {"type": "player_skill_progress", "value": 0.8, "operator": ">="},
-                {"type": "training_sessions", "value": 3, "operator": ">="}
-            ],
-            response_sequence=["assess_readiness", "introduce_advanced_technique", "practical_demonstration"],
-            priority=0.8,
-            cooldown=900.0
-        )
-        
-        self.behavior_patterns["remedial_instruction"] = SAMSBehaviorPattern(
-            pattern_id="remedial_instruction",
-            trigger_conditions=[
-                {"type": "training_success_rate", "value": 0.4, "operator": "<="},
-                {"type": "player_frustration", "value": 0.6, "operator": ">="}
-            ],
-            response_sequence=["simplify_instruction", "break_down_concepts", "encourage_practice"],
-            priority=0.75,
-            cooldown=600.0
-        )
-
-    def _init_lorekeeper_patterns(self):
-        """Initialize lorekeeper-specific patterns"""
-        self.behavior_patterns["knowledge_revelation"] = SAMSBehaviorPattern(
-            pattern_id="knowledge_revelation",
-            trigger_conditions=[
-                {"type": "player_insight", "value": 0.7, "operator": ">="},
-                {"type": "relevant_discovery", "value": True, "operator": "=="}
-            ],
-            response_sequence=["verify_understanding", "reveal_hidden_knowledge", "suggest_connections"],
-            priority=0.8,
-            cooldown=1200.0
-        )
-
-    def _init_mystic_patterns(self):
-        """Initialize mystic-specific patterns"""
-        self.behavior_patterns["power_awakening"] = SAMSBehaviorPattern(
-            pattern_id="power_awakening",
-            trigger_conditions=[
-                {"type": "player_potential", "value": 0.8, "operator": ">="},
-                {"type": "mystical_alignment", "value": True, "operator": "=="}
-            ],
-            response_sequence=["test_readiness", "channel_power", "guide_awakening"],
-            priority=0.9,
-            cooldown=7200.0
-        )
-
     def _calculate_emotional_synergies(self, emotions: Dict[str, float]) -> Dict[str, float]:
         """Enhanced emotional synergy calculation"""
         synergies = {}
@@ -1,12 +1,16 @@
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, List, Set, Optional, Tuple, Any, Callable
+from typing import Dict, List, Set, Optional, Tuple, Any, Callable, FrozenSet, Iterator
+from collections.abc import MutableMapping
 from datetime import datetime
+import heapq
 import math
+import operator
 import random
+import time
 
 from .dimensional_combat import DimensionalLayer, DimensionalEffect, DimensionalAffinity
-from .combat_types import Position, DamageType
+from .combat_types import Position
 
 class BehaviorType(Enum):
     """Types of AI behaviors"""
@@ -47,6 +51,66 @@ class BehaviorPattern:
     last_used: Optional[datetime] = None
     success_rate: float = 0.0
     usage_count: int = 0
+    phases: Optional[Set[CombatPhase]] = None  # None means any phase
+
+def compile_conditions(conditions: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """Turn a pattern's conditions dict into a predicate over combat state.
+
+    Booleans and strings must match exactly and numbers are minimum
+    thresholds; any other value only requires the key to be present.
+    """
+    checks: List[Tuple[str, Optional[Callable[[Any, Any], bool]], Any]] = []
+    for condition, value in conditions.items():
+        if isinstance(value, (bool, str)):
+            checks.append((condition, operator.eq, value))
+        elif isinstance(value, (int, float)):
+            checks.append((condition, operator.ge, value))
+        else:
+            checks.append((condition, None, value))
+    checks = tuple(checks)
+
+    def predicate(combat_state: Dict[str, Any]) -> bool:
+        for condition, compare, value in checks:
+            if condition not in combat_state:
+                return False
+            if compare is not None and not compare(combat_state[condition], value):
+                return False
+        return True
+
+    return predicate
+
+class BehaviorPatternMap(MutableMapping):
+    """Behavior patterns by name that keep their owner's indexes in step.
+
+    Assigning a pattern compiles and indexes it, and deleting one drops it
+    from the indexes. A pattern whose conditions, actions or phases are
+    changed in place has to be assigned again to be re-indexed.
+    """
+    def __init__(self, owner: 'AIBehaviorSystem'):
+        self._patterns: Dict[str, BehaviorPattern] = {}
+        self._owner = owner
+
+    def __getitem__(self, name: str) -> BehaviorPattern:
+        return self._patterns[name]
+
+    def __setitem__(self, name: str, pattern: BehaviorPattern) -> None:
+        if name in self._patterns:
+            self._owner._unindex_pattern(name)
+        self._patterns[name] = pattern
+        self._owner._index_pattern(name, pattern)
+
+    def __delitem__(self, name: str) -> None:
+        del self._patterns[name]
+        self._owner._unindex_pattern(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._patterns)
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._patterns!r})"
 
 @dataclass
 class CombatMemory:
@@ -65,12 +129,22 @@ class AIBehaviorSystem:
     """Manages AI behavior in combat"""
     
     def __init__(self):
-        self.behavior_patterns: Dict[str, BehaviorPattern] = {}
         self.combat_memories: List[CombatMemory] = []
         self.current_phase: CombatPhase = CombatPhase.OPENING
         self.learning_rate: float = 0.1
         self.exploration_rate: float = 0.2
         
+        self.clock: Callable[[], float] = time.monotonic
+        # Exploration rolls; swap in a seeded random.Random to replay fights
+        self.rng: Any = random
+        # Compiled predicates and indexes, maintained by behavior_patterns
+        self._predicates: Dict[str, Callable[[Dict[str, Any]], bool]] = {}
+        self._phase_index: Dict[CombatPhase, List[str]] = {phase: [] for phase in CombatPhase}
+        self._candidate_cache: Dict[Tuple[CombatPhase, FrozenSet[str]], List[str]] = {}
+        self._cooldown_heap: List[Tuple[float, str]] = []
+        self._cooling_down: Set[str] = set()
+        self.behavior_patterns: BehaviorPatternMap = BehaviorPatternMap(self)
+        
         self._initialize_behavior_patterns()
         
     def _initialize_behavior_patterns(self) -> None:
@@ -100,7 +174,8 @@ class AIBehaviorSystem:
                     'target_distance': 'close',
                     'resource_threshold': 0.5
                 },
-                actions=['close_distance', 'heavy_attack', 'combo_attack']
+                actions=['close_distance', 'heavy_attack', 'combo_attack'],
+                phases={CombatPhase.OPENING, CombatPhase.ADVANTAGE, CombatPhase.FINISHING}
             ),
             BehaviorPattern(
                 name="dimensional_assault",
@@ -111,7 +186,8 @@ class AIBehaviorSystem:
                     'dimensional_energy': 0.6,
                     'target_vulnerable': True
                 },
-                actions=['dimension_shift', 'dimensional_strike', 'return_shift']
+                actions=['dimension_shift', 'dimensional_strike', 'return_shift'],
+                phases={CombatPhase.OPENING, CombatPhase.ADVANTAGE, CombatPhase.DISADVANTAGE, CombatPhase.FINISHING}
             ),
             # New aggressive patterns
             BehaviorPattern(
@@ -124,7 +200,8 @@ class AIBehaviorSystem:
                     'target_health_threshold': 0.6,
                     'adrenaline_charged': True
                 },
-                actions=['activate_frenzy', 'rapid_strikes', 'finishing_blow']
+                actions=['activate_frenzy', 'rapid_strikes', 'finishing_blow'],
+                phases={CombatPhase.DISADVANTAGE, CombatPhase.CRITICAL}
             ),
             BehaviorPattern(
                 name="void_hunter",
@@ -136,7 +213,8 @@ class AIBehaviorSystem:
                     'target_isolated': True,
                     'stealth_available': True
                 },
-                actions=['void_step', 'mark_target', 'void_strike', 'execute']
+                actions=['void_step', 'mark_target', 'void_strike', 'execute'],
+                phases={CombatPhase.OPENING, CombatPhase.ADVANTAGE, CombatPhase.FINISHING}
             ),
             BehaviorPattern(
                 name="reality_breaker",
@@ -148,12 +226,13 @@ class AIBehaviorSystem:
                     'dimensional_power': 0.8,
                     'target_dimensional_shift': False
                 },
-                actions=['reality_shatter', 'dimensional_cascade', 'power_surge']
+                actions=['reality_shatter', 'dimensional_cascade', 'power_surge'],
+                phases={CombatPhase.ADVANTAGE, CombatPhase.FINISHING}
             )
         ]
         
         for pattern in patterns:
-            self.behavior_patterns[pattern.name] = pattern
+            self.add_behavior_pattern(pattern)
             
     def _add_defensive_patterns(self) -> None:
         """Add defensive behavior patterns"""
@@ -167,7 +246,8 @@ class AIBehaviorSystem:
                     'health_threshold': 0.3,
                     'has_escape_route': True
                 },
-                actions=['create_distance', 'defensive_stance', 'heal']
+                actions=['create_distance', 'defensive_stance', 'heal'],
+                phases={CombatPhase.DISADVANTAGE, CombatPhase.CRITICAL}
             ),
             BehaviorPattern(
                 name="dimensional_defense",
@@ -178,7 +258,8 @@ class AIBehaviorSystem:
                     'under_pressure': True,
                     'dimensional_energy': 0.4
                 },
-                actions=['dimension_shift', 'stabilize_dimension', 'defensive_barrier']
+                actions=['dimension_shift', 'stabilize_dimension', 'defensive_barrier'],
+                phases={CombatPhase.DISADVANTAGE, CombatPhase.CRITICAL}
             ),
             # New defensive patterns
             BehaviorPattern(
@@ -191,7 +272,8 @@ class AIBehaviorSystem:
                     'celestial_energy': 0.6,
                     'incoming_damage_high': True
                 },
-                actions=['celestial_shield', 'protection_aura', 'healing_burst', 'divine_intervention']
+                actions=['celestial_shield', 'protection_aura', 'healing_burst', 'divine_intervention'],
+                phases={CombatPhase.DISADVANTAGE, CombatPhase.CRITICAL}
             ),
             BehaviorPattern(
                 name="void_absorption",
@@ -203,7 +285,8 @@ class AIBehaviorSystem:
                     'corruption_level': 0.5,
                     'health_threshold': 0.4
                 },
-                actions=['void_embrace', 'absorb_damage', 'corruption_pulse', 'void_regeneration']
+                actions=['void_embrace', 'absorb_damage', 'corruption_pulse', 'void_regeneration'],
+                phases={CombatPhase.DISADVANTAGE, CombatPhase.CRITICAL}
             ),
             BehaviorPattern(
                 name="reality_anchor",
@@ -215,12 +298,13 @@ class AIBehaviorSystem:
                     'allies_in_danger': True,
                     'reality_anchor_available': True
                 },
-                actions=['deploy_anchor', 'stabilize_reality', 'dimensional_barrier', 'reality_restoration']
+                actions=['deploy_anchor', 'stabilize_reality', 'dimensional_barrier', 'reality_restoration'],
+                phases={CombatPhase.DISADVANTAGE, CombatPhase.CRITICAL}
             )
         ]
         
         for pattern in patterns:
-            self.behavior_patterns[pattern.name] = pattern
+            self.add_behavior_pattern(pattern)
             
     def _add_tactical_patterns(self) -> None:
         """Add tactical behavior patterns"""
@@ -234,7 +318,8 @@ class AIBehaviorSystem:
                     'target_exposed': True,
                     'has_positioning': True
                 },
-                actions=['stealth_approach', 'surprise_attack', 'quick_retreat']
+                actions=['stealth_approach', 'surprise_attack', 'quick_retreat'],
+                phases={CombatPhase.OPENING, CombatPhase.ADVANTAGE}
             ),
             BehaviorPattern(
                 name="control_zone",
@@ -245,7 +330,8 @@ class AIBehaviorSystem:
                     'in_control_zone': True,
                     'allies_nearby': True
                 },
-                actions=['area_control', 'support_allies', 'counter_attack']
+                actions=['area_control', 'support_allies', 'counter_attack'],
+                phases={CombatPhase.OPENING, CombatPhase.ADVANTAGE, CombatPhase.DISADVANTAGE}
             ),
             # New tactical patterns
             BehaviorPattern(
@@ -258,7 +344,8 @@ class AIBehaviorSystem:
                     'tactical_advantage': True,
                     'multiple_dimensions_active': True
                 },
-                actions=['analyze_dimensions', 'coordinate_shifts', 'exploit_weakness', 'dimensional_combo']
+                actions=['analyze_dimensions', 'coordinate_shifts', 'exploit_weakness', 'dimensional_combo'],
+                phases={CombatPhase.OPENING, CombatPhase.ADVANTAGE, CombatPhase.DISADVANTAGE}
             ),
             BehaviorPattern(
                 name="void_tactician",
@@ -270,7 +357,8 @@ class AIBehaviorSystem:
                     'tactical_insight': 0.6,
                     'enemy_pattern_recognized': True
                 },
-                actions=['void_analysis', 'predict_movement', 'tactical_void_step', 'counter_strategy']
+                actions=['void_analysis', 'predict_movement', 'tactical_void_step', 'counter_strategy'],
+                phases={CombatPhase.OPENING, CombatPhase.DISADVANTAGE}
             ),
             BehaviorPattern(
                 name="reality_manipulator",
@@ -282,12 +370,13 @@ class AIBehaviorSystem:
                     'dimensional_control': 0.7,
                     'environment_manipulatable': True
                 },
-                actions=['analyze_reality', 'manipulate_terrain', 'create_advantage', 'reality_trap']
+                actions=['analyze_reality', 'manipulate_terrain', 'create_advantage', 'reality_trap'],
+                phases={CombatPhase.OPENING, CombatPhase.ADVANTAGE, CombatPhase.DISADVANTAGE}
             )
         ]
         
         for pattern in patterns:
-            self.behavior_patterns[pattern.name] = pattern
+            self.add_behavior_pattern(pattern)
             
     def _add_dimensional_patterns(self) -> None:
         """Add dimension-focused behavior patterns"""
@@ -301,7 +390,8 @@ class AIBehaviorSystem:
                     'dimensional_energy': 0.8,
                     'reality_unstable': True
                 },
-                actions=['destabilize_dimension', 'dimensional_surge', 'reality_anchor']
+                actions=['destabilize_dimension', 'dimensional_surge', 'reality_anchor'],
+                phases={CombatPhase.OPENING, CombatPhase.ADVANTAGE, CombatPhase.DISADVANTAGE}
             ),
             BehaviorPattern(
                 name="void_manipulation",
@@ -312,7 +402,8 @@ class AIBehaviorSystem:
                     'void_presence': True,
                     'corruption_level': 0.5
                 },
-                actions=['void_channel', 'corrupt_reality', 'void_step']
+                actions=['void_channel', 'corrupt_reality', 'void_step'],
+                phases={CombatPhase.ADVANTAGE, CombatPhase.DISADVANTAGE, CombatPhase.CRITICAL}
             ),
             # New dimensional patterns
             BehaviorPattern(
@@ -325,7 +416,8 @@ class AIBehaviorSystem:
                     'reality_threads_visible': True,
                     'dimensional_convergence': True
                 },
-                actions=['analyze_threads', 'weave_dimensions', 'reality_reshape', 'dimensional_lock']
+                actions=['analyze_threads', 'weave_dimensions', 'reality_reshape', 'dimensional_lock'],
+                phases={CombatPhase.OPENING, CombatPhase.ADVANTAGE}
             ),
             BehaviorPattern(
                 name="void_sovereign",
@@ -337,7 +429,8 @@ class AIBehaviorSystem:
                     'reality_corruption': 0.7,
                     'dimensional_weakness': True
                 },
-                actions=['void_dominance', 'reality_corrupt', 'dimensional_collapse', 'void_empowerment']
+                actions=['void_dominance', 'reality_corrupt', 'dimensional_collapse', 'void_empowerment'],
+                phases={CombatPhase.ADVANTAGE, CombatPhase.FINISHING}
             ),
             BehaviorPattern(
                 name="reality_architect",
@@ -349,37 +442,75 @@ class AIBehaviorSystem:
                     'dimensional_stability': 0.3,
                     'architecture_possible': True
                 },
-                actions=['analyze_structure', 'reality_blueprint', 'dimensional_construct', 'reality_fortify']
+                actions=['analyze_structure', 'reality_blueprint', 'dimensional_construct', 'reality_fortify'],
+                phases={CombatPhase.OPENING, CombatPhase.DISADVANTAGE}
             )
         ]
         
         for pattern in patterns:
-            self.behavior_patterns[pattern.name] = pattern
+            self.add_behavior_pattern(pattern)
+
+    def add_behavior_pattern(self, pattern: BehaviorPattern) -> None:
+        """Register a pattern, compiling its conditions and indexing it by phase"""
+        self.behavior_patterns[pattern.name] = pattern
+
+    def _index_pattern(self, name: str, pattern: BehaviorPattern) -> None:
+        self._predicates[name] = compile_conditions(pattern.conditions)
+        for phase in pattern.phases or CombatPhase:
+            self._phase_index[phase].append(name)
+        self._candidate_cache.clear()
+
+    def _unindex_pattern(self, name: str) -> None:
+        self._predicates.pop(name, None)
+        for names in self._phase_index.values():
+            if name in names:
+                names.remove(name)
+        self._candidate_cache.clear()
+
+    def _get_candidates(self, available_actions: Set[str]) -> List[str]:
+        """Patterns usable in the current phase with the given actions, in registration order"""
+        key = (self.current_phase, frozenset(available_actions))
+        candidates = self._candidate_cache.get(key)
+        if candidates is None:
+            candidates = [
+                name for name in self._phase_index[self.current_phase]
+                if key[1].issuperset(self.behavior_patterns[name].actions)
+            ]
+            # Agents tend to share a handful of action sets; bound the cache anyway
+            if len(self._candidate_cache) >= 256:
+                self._candidate_cache.clear()
+            self._candidate_cache[key] = candidates
+        return candidates
+
+    def _release_cooldowns(self) -> None:
+        """Pop every pattern whose cooldown has elapsed"""
+        now = self.clock()
+        while self._cooldown_heap and self._cooldown_heap[0][0] < now:
+            _, name = heapq.heappop(self._cooldown_heap)
+            self._cooling_down.discard(name)
 
     def select_behavior(self, 
                        combat_state: Dict[str, Any],
                        available_actions: Set[str]) -> Optional[List[str]]:
         """Select the most appropriate behavior pattern"""
-        valid_patterns = []
-        
         # Update current phase
         self._update_combat_phase(combat_state)
+        self._release_cooldowns()
         
-        # Filter patterns by conditions and available actions
-        for pattern in self.behavior_patterns.values():
-            if self._check_pattern_conditions(pattern, combat_state):
-                if all(action in available_actions for action in pattern.actions):
-                    if not pattern.last_used or \
-                       (datetime.now() - pattern.last_used).total_seconds() > pattern.cooldown:
-                        valid_patterns.append(pattern)
+        # Filter indexed candidates by cooldown and compiled conditions
+        valid_patterns = [
+            self.behavior_patterns[name]
+            for name in self._get_candidates(available_actions)
+            if name not in self._cooling_down and self._predicates[name](combat_state)
+        ]
         
         if not valid_patterns:
             return None
             
         # Exploration vs exploitation
-        if random.random() < self.exploration_rate:
+        if self.rng.random() < self.exploration_rate:
             # Explore: Choose random valid pattern
-            chosen_pattern = random.choice(valid_patterns)
+            chosen_pattern = self.rng.choice(valid_patterns)
         else:
             # Exploit: Choose highest priority pattern considering success rate
             chosen_pattern = max(
@@ -389,27 +520,19 @@ class AIBehaviorSystem:
             
         chosen_pattern.last_used = datetime.now()
         chosen_pattern.usage_count += 1
+        if chosen_pattern.cooldown > 0:
+            heapq.heappush(self._cooldown_heap, (self.clock() + chosen_pattern.cooldown, chosen_pattern.name))
+            self._cooling_down.add(chosen_pattern.name)
         return chosen_pattern.actions
 
     def _check_pattern_conditions(self,
                                 pattern: BehaviorPattern,
                                 combat_state: Dict[str, Any]) -> bool:
         """Check if conditions for a pattern are met"""
-        for condition, value in pattern.conditions.items():
-            if condition not in combat_state:
-                return False
-                
-            if isinstance(value, bool):
-                if combat_state[condition] != value:
-                    return False
-            elif isinstance(value, (int, float)):
-                if combat_state[condition] < value:
-                    return False
-            elif isinstance(value, str):
-                if combat_state[condition] != value:
-                    return False
-                    
-        return True
+        predicate = self._predicates.get(pattern.name)
+        if predicate is None:
+            predicate = compile_conditions(pattern.conditions)
+        return predicate(combat_state)
 
     def _update_combat_phase(self, combat_state: Dict[str, Any]) -> None:
         """Update the current combat phase"""
@@ -0,0 +1,352 @@
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Set, Optional, Any, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from collections import defaultdict
+from functools import lru_cache
+import itertools
+import random
+
+import numpy as np
+
+from .dimensional_combat import DimensionalCombat, DimensionalLayer, LAYERS
+from .ai_behavior import AIBehaviorSystem
+from .dynamic_difficulty import DynamicDifficulty, CombatStats
+from ..characters.enemies.damage_resolver import BatchDamageResolver
+
+# Keywords that decide what a behavior pattern's action does in a simulated fight
+OFFENSIVE_KEYWORDS = ('attack', 'strike', 'blow', 'execute', 'shatter', 'cascade',
+                      'surge', 'pulse', 'collapse', 'combo', 'trap', 'corrupt')
+DEFENSIVE_KEYWORDS = ('defensive', 'barrier', 'shield', 'absorb', 'stance', 'anchor',
+                      'fortify', 'protection', 'stabilize')
+HEALING_KEYWORDS = ('heal', 'regeneration', 'restoration', 'intervention')
+SHIFT_KEYWORDS = ('shift', '_step')
+
+DEFAULT_ACTIONS = frozenset({
+    'close_distance', 'heavy_attack', 'combo_attack',
+    'create_distance', 'defensive_stance', 'heal'
+})
+
+@dataclass
+class Combatant:
+    """One side of a simulated fight"""
+    name: str
+    health: float
+    attack: float                 # Base damage of an offensive action
+    defense: float
+    critical_rate: float = 0.05
+    critical_damage: float = 1.5
+    dodge_chance: float = 0.05
+    damage_type: str = 'physical'
+    layer: DimensionalLayer = DimensionalLayer.PHYSICAL
+    resistance: Dict[str, float] = field(default_factory=dict)
+    weakness: Dict[str, float] = field(default_factory=dict)
+    actions: Set[str] = field(default_factory=lambda: set(DEFAULT_ACTIONS))
+    traits: Dict[str, Any] = field(default_factory=dict)  # Extra behavior conditions
+
+    @property
+    def stats(self) -> 'Combatant':
+        # BatchDamageResolver reads combat stats from entity.stats
+        return self
+
+@dataclass
+class Matchup:
+    """A fight to simulate; the seed fully determines its outcome"""
+    player: Combatant
+    enemy: Combatant
+    seed: int
+    label: str = ""
+    max_time: float = 180.0
+    tick: float = 1.0
+    dimension_overrides: Dict[DimensionalLayer, Dict[str, float]] = field(default_factory=dict)
+
+@dataclass
+class FightResult:
+    """Outcome of one simulated fight, from the player's side"""
+    label: str
+    seed: int
+    victory: bool
+    combat_duration: float
+    player_damage_dealt: float
+    player_damage_taken: float
+    player_health_remaining: float  # Fraction of max health
+    dimension_usage: Dict[str, int]
+    effect_duration: float
+    abilities_used: Dict[str, int]
+
+class _EnemyHitTarget:
+    """The player's stats as enemy attacks see them.
+
+    EnemySystem resolves enemy hits with BatchDamageResolver.resolve_basic,
+    which reads a single resistance value instead of per-type ones.
+    """
+    def __init__(self, combatant: Combatant, damage_type: str):
+        self.defense = combatant.defense
+        self.dodge_chance = combatant.dodge_chance
+        self.resistance = combatant.resistance.get(damage_type, 0.0)
+
+    @property
+    def stats(self) -> '_EnemyHitTarget':
+        return self
+
+class _Fighter:
+    """Mutable per-fight state for a combatant"""
+    def __init__(self, combatant: Combatant, seed: int):
+        self.combatant = combatant
+        self.health = combatant.health
+        self.energy = 1.0
+        self.layer = combatant.layer
+        self.queue: List[str] = []
+        self.last_damage_taken = 0.0
+        self.ai = AIBehaviorSystem()
+        self.ai.rng = random.Random(seed)
+
+    @property
+    def health_ratio(self) -> float:
+        return max(0.0, self.health / self.combatant.health)
+
+@lru_cache(maxsize=None)
+def _action_kind(action: str) -> str:
+    if any(keyword in action for keyword in HEALING_KEYWORDS):
+        return 'heal'
+    if any(keyword in action for keyword in DEFENSIVE_KEYWORDS):
+        return 'defend'
+    if any(keyword in action for keyword in OFFENSIVE_KEYWORDS):
+        return 'attack'
+    if any(keyword in action for keyword in SHIFT_KEYWORDS):
+        return 'shift'
+    return 'setup'
+
+class CombatSimulator:
+    """Runs one headless fight between AI-driven combatants"""
+
+    def __init__(self, matchup: Matchup):
+        self.matchup = matchup
+        seeds = np.random.SeedSequence(matchup.seed).generate_state(3)
+        self.resolver = BatchDamageResolver(seed=int(seeds[0]))
+        self.enemy_hit_target = _EnemyHitTarget(matchup.player, matchup.enemy.damage_type)
+        self.dimensions = DimensionalCombat()
+        for layer, values in matchup.dimension_overrides.items():
+            for name, value in values.items():
+                setattr(self.dimensions.dimensional_states[layer], name, value)
+
+        self.time = 0.0
+        self.fighters = [
+            _Fighter(matchup.player, int(seeds[1])),
+            _Fighter(matchup.enemy, int(seeds[2]))
+        ]
+        for fighter in self.fighters:
+            fighter.ai.clock = lambda: self.time
+
+    def _combat_state(self, fighter: _Fighter, target: _Fighter) -> Dict[str, Any]:
+        """Behavior conditions as seen by one fighter"""
+        layer_state = self.dimensions.dimensional_states[fighter.layer]
+        state = {
+            'combat_time': self.time,
+            'health': fighter.health_ratio,
+            'target_health': target.health_ratio,
+            'advantage_score': fighter.health_ratio /
+                               max(1e-9, fighter.health_ratio + target.health_ratio),
+            'health_threshold': fighter.health_ratio,
+            'target_health_threshold': target.health_ratio,
+            'resource_threshold': fighter.energy,
+            'target_distance': 'close',
+            'dimensional_energy': layer_state.energy_level,
+            'dimensional_power': layer_state.energy_level * layer_state.stability,
+            'dimensional_stability': layer_state.stability,
+            'corruption_level': layer_state.corruption_level,
+            'reality_unstable': layer_state.stability < 0.5,
+            'void_presence': DimensionalLayer.VOID in (fighter.layer, target.layer),
+            'under_pressure': fighter.health_ratio < target.health_ratio,
+            'incoming_damage_high': fighter.last_damage_taken > 0.1 * fighter.combatant.health
+        }
+        state.update(fighter.combatant.traits)
+        return state
+
+    def _next_action(self, fighter: _Fighter, target: _Fighter, result: FightResult) -> str:
+        if not fighter.queue:
+            actions = fighter.ai.select_behavior(
+                self._combat_state(fighter, target), fighter.combatant.actions
+            )
+            fighter.queue = list(actions) if actions else ['basic_attack']
+        action = fighter.queue.pop(0)
+        if fighter is self.fighters[0]:
+            result.abilities_used[action] = result.abilities_used.get(action, 0) + 1
+        return action
+
+    def _best_layer(self, fighter: _Fighter, target: _Fighter) -> DimensionalLayer:
+        """Layer to shift into for the strongest attack on the target"""
+        return max(LAYERS, key=lambda layer: self.dimensions.calculate_dimensional_effect(
+            layer, target.layer, 1.0
+        )[0])
+
+    def run(self) -> FightResult:
+        matchup = self.matchup
+        player, enemy = self.fighters
+        result = FightResult(
+            label=matchup.label,
+            seed=matchup.seed,
+            victory=False,
+            combat_duration=0.0,
+            player_damage_dealt=0.0,
+            player_damage_taken=0.0,
+            player_health_remaining=1.0,
+            dimension_usage={},
+            effect_duration=0.0,
+            abilities_used={}
+        )
+
+        while self.time < matchup.max_time and player.health > 0 and enemy.health > 0:
+            pairs = ((player, enemy), (enemy, player))
+            kinds = []
+            base_damage = []
+            effect_active = False
+
+            for fighter, target in pairs:
+                action = self._next_action(fighter, target, result)
+                kind = _action_kind(action)
+                kinds.append(kind)
+                power = 0.0
+
+                if kind == 'attack' and fighter.energy >= 0.1:
+                    fighter.energy -= 0.1
+                    power, effects = self.dimensions.calculate_dimensional_effect(
+                        fighter.layer, target.layer, fighter.combatant.attack
+                    )
+                    effect_active = effect_active or bool(effects)
+                    if fighter is player:
+                        name = fighter.layer.name
+                        result.dimension_usage[name] = result.dimension_usage.get(name, 0) + 1
+                elif kind == 'heal':
+                    fighter.health = min(fighter.combatant.health,
+                                         fighter.health + 0.15 * fighter.combatant.health)
+                elif kind == 'shift':
+                    fighter.layer = (fighter.combatant.layer if action.startswith('return')
+                                     else self._best_layer(fighter, target))
+                base_damage.append(power)
+                fighter.energy = min(1.0, fighter.energy + 0.05)
+
+            # The player's hit uses the typed CombatCalculator formula and the
+            # enemy's the one EnemySystem attacks resolve with; the player's
+            # rolls are always drawn first so the seed fixes both
+            hits = (
+                self.resolver.resolve(
+                    [player.combatant], [enemy.combatant],
+                    base_damage[0], player.combatant.damage_type
+                ).damage[0],
+                self.resolver.resolve_basic(
+                    [enemy.combatant], [self.enemy_hit_target], base_damage[1]
+                ).damage[0]
+            )
+            for i, (fighter, target) in enumerate(pairs):
+                damage = float(hits[i]) if base_damage[i] > 0 else 0.0
+                if kinds[1 - i] == 'defend':
+                    damage *= 0.5
+                target.health -= damage
+                target.last_damage_taken = damage
+                if fighter is player:
+                    result.player_damage_dealt += damage
+                else:
+                    result.player_damage_taken += damage
+
+            if effect_active:
+                result.effect_duration += matchup.tick
+            self.time += matchup.tick
+
+        result.victory = enemy.health <= 0 < player.health
+        result.combat_duration = self.time
+        result.player_health_remaining = player.health_ratio
+        return result
+
+def simulate_matchup(matchup: Matchup) -> FightResult:
+    """Simulate one matchup; a module-level function so process pools can run it"""
+    return CombatSimulator(matchup).run()
+
+def make_matchups(player: Combatant,
+                  enemy: Combatant,
+                  variants: Optional[Dict[str, Sequence[Any]]] = None,
+                  repeats: int = 1,
+                  base_seed: int = 0,
+                  **matchup_options) -> List[Matchup]:
+    """Build a grid of matchups from enemy parameter variants.
+
+    Every combination of the variant values is applied to the enemy and
+    simulated repeats times, each with its own seed spawned from base_seed.
+    Labels name the combination, e.g. "attack=12,defense=30".
+    """
+    variants = variants or {}
+    names = list(variants)
+    combinations = list(itertools.product(*(variants[name] for name in names)))
+    seeds = np.random.SeedSequence(base_seed).generate_state(len(combinations) * repeats)
+
+    matchups = []
+    for i, values in enumerate(combinations):
+        label = ",".join(f"{name}={value}" for name, value in zip(names, values))
+        variant = replace(enemy, **dict(zip(names, values)))
+        for repeat in range(repeats):
+            matchups.append(Matchup(
+                player=player,
+                enemy=variant,
+                seed=int(seeds[i * repeats + repeat]),
+                label=label,
+                **matchup_options
+            ))
+    return matchups
+
+def run_sweep(matchups: Iterable[Matchup],
+              workers: Optional[int] = None,
+              chunksize: int = 16) -> List[FightResult]:
+    """Simulate matchups over a process pool, returning results in order.
+
+    Results depend only on each matchup's seed, so they are identical for
+    any number of workers. workers=1 runs in this process.
+    """
+    if workers == 1:
+        return [simulate_matchup(matchup) for matchup in matchups]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(simulate_matchup, matchups, chunksize=chunksize))
+
+def summarize_results(results: Iterable[FightResult],
+                      player_stats: Optional[CombatStats] = None) -> Dict[str, Dict[str, Any]]:
+    """Aggregate balance metrics per matchup label"""
+    by_label: Dict[str, List[FightResult]] = defaultdict(list)
+    for result in results:
+        by_label[result.label].append(result)
+
+    summary = {}
+    for label, group in by_label.items():
+        duration = np.array([r.combat_duration for r in group])
+        dealt = np.array([r.player_damage_dealt for r in group])
+        taken = np.array([r.player_damage_taken for r in group])
+        victories = np.array([r.victory for r in group])
+
+        # Replay outcomes through DynamicDifficulty to see where it settles
+        difficulty = DynamicDifficulty()
+        level = difficulty.base_difficulty
+        for result in group:
+            level = difficulty.adjust_difficulty(
+                player_stats, result.player_health_remaining if result.victory else 0.0
+            )
+
+        summary[label] = {
+            'fights': len(group),
+            'victory_rate': float(victories.mean()),
+            'average_duration': float(duration.mean()),
+            'average_dps': float((dealt / np.maximum(duration, 1e-9)).mean()),
+            'average_damage_taken': float(taken.mean()),
+            'recommended_difficulty': level.value
+        }
+    return summary
+
+def apply_balance_metrics(results: Iterable[FightResult],
+                          dimensional_combat: Optional[DimensionalCombat] = None) -> List[str]:
+    """Feed fights into DimensionalCombat's balance metrics and return its recommendations"""
+    dimensional_combat = dimensional_combat or DimensionalCombat()
+    for result in results:
+        dimensional_combat.update_balance_metrics({
+            'damage_dealt': result.player_damage_dealt / max(result.combat_duration, 1e-9),
+            'survival_time': result.combat_duration,
+            'dimension_usage': result.dimension_usage,
+            'effect_duration': result.effect_duration,
+            'total_duration': max(result.combat_duration, 1e-9)
+        })
+    return dimensional_combat.get_balance_recommendations()
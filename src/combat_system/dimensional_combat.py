@@ -1,10 +1,12 @@
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import List, Dict, Optional, Set, Tuple, Any
-from .combat_types import Position, DamageType
+from .combat_types import Position
+import heapq
 import math
 import random
-from datetime import datetime
+from datetime import datetime, timedelta
+import numpy as np
 
 class DimensionalLayer(Enum):
     """Different dimensional layers in combat"""
@@ -35,6 +37,20 @@ class DimensionalAffinity(Enum):
     CATALYZING = auto()  # Dimensions amplify each other
     NULLIFYING = auto()  # Dimensions cancel each other
 
+AFFINITY_MULTIPLIERS = {
+    DimensionalAffinity.HARMONIOUS: 1.5,
+    DimensionalAffinity.NEUTRAL: 1.0,
+    DimensionalAffinity.CONFLICTING: 0.7,
+    DimensionalAffinity.CATALYZING: 2.0,
+    DimensionalAffinity.NULLIFYING: 0.3
+}
+
+LAYERS = list(DimensionalLayer)
+LAYER_INDEX = {layer: index for index, layer in enumerate(LAYERS)}
+
+# State fields that feed the layer x layer multiplier matrix
+MATRIX_FIELDS = frozenset({'stability', 'energy_level', 'corruption_level', 'active_effects'})
+
 @dataclass
 class DimensionalState:
     """Represents the state of a dimension in combat"""
@@ -46,6 +62,22 @@ class DimensionalState:
     active_effects: Set[DimensionalEffect] = field(default_factory=set)
     connected_layers: Set[DimensionalLayer] = field(default_factory=set)
     affinity_modifiers: Dict[DimensionalLayer, DimensionalAffinity] = field(default_factory=dict)
+    version: int = field(default=0, compare=False, repr=False)
+
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name in MATRIX_FIELDS:
+            object.__setattr__(self, 'version', getattr(self, 'version', 0) + 1)
+
+    def add_effect(self, effect: DimensionalEffect):
+        """Activate an effect; use this rather than mutating active_effects"""
+        self.active_effects.add(effect)
+        self.version += 1
+
+    def remove_effect(self, effect: DimensionalEffect):
+        """Deactivate an effect if it is active"""
+        self.active_effects.discard(effect)
+        self.version += 1
 
 @dataclass
 class CombatModifier:
@@ -56,27 +88,103 @@ class CombatModifier:
     source: str = ""
     timestamp: datetime = field(default_factory=datetime.now)
 
+    @property
+    def expires_at(self) -> datetime:
+        return self.timestamp + timedelta(seconds=self.duration)
+
+class ModifierStore:
+    """Combat modifiers grouped by type.
+
+    Expiry times sit in a heap, so a lookup only pops what has actually
+    expired instead of rescanning every modifier. Per-type totals are cached
+    and invalidated through a per-type version counter.
+    """
+    def __init__(self, modifier_types: List[str]):
+        self.modifiers: Dict[str, List[CombatModifier]] = {
+            modifier_type: [] for modifier_type in modifier_types
+        }
+        self.versions: Dict[str, int] = {modifier_type: 0 for modifier_type in modifier_types}
+        self.expiry_heap: List[Tuple[datetime, int, str, CombatModifier]] = []
+        self._totals: Dict[str, Tuple[int, float]] = {}
+        self._counter = 0
+
+    def __contains__(self, modifier_type: str) -> bool:
+        return modifier_type in self.modifiers
+
+    def __getitem__(self, modifier_type: str) -> List[CombatModifier]:
+        self.expire()
+        return self.modifiers[modifier_type]
+
+    def add(self, modifier_type: str, modifier: CombatModifier) -> bool:
+        if modifier_type not in self.modifiers:
+            return False
+        self.modifiers[modifier_type].append(modifier)
+        self.versions[modifier_type] += 1
+        self._counter += 1
+        heapq.heappush(
+            self.expiry_heap, (modifier.expires_at, self._counter, modifier_type, modifier)
+        )
+        return True
+
+    def expire(self, now: Optional[datetime] = None):
+        """Drop every modifier whose duration has elapsed"""
+        if not self.expiry_heap:
+            return
+        now = now or datetime.now()
+        while self.expiry_heap and self.expiry_heap[0][0] <= now:
+            _, _, modifier_type, modifier = heapq.heappop(self.expiry_heap)
+            self.modifiers[modifier_type].remove(modifier)
+            self.versions[modifier_type] += 1
+
+    def total(self, modifier_type: str) -> float:
+        """(1 + additive sum) * product of (1 + multiplicative values)"""
+        if modifier_type not in self.modifiers:
+            return 1.0
+        self.expire()
+
+        version = self.versions[modifier_type]
+        cached = self._totals.get(modifier_type)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        active_modifiers = self.modifiers[modifier_type]
+        additive_total = sum(mod.value for mod in active_modifiers if not mod.is_multiplicative)
+        multiplicative_total = math.prod(1 + mod.value for mod in active_modifiers if mod.is_multiplicative)
+        total = (1 + additive_total) * multiplicative_total
+        self._totals[modifier_type] = (version, total)
+        return total
+
 class DimensionalCombat:
     """Manages dimensional aspects of combat"""
     
     def __init__(self):
         self.dimensional_states: Dict[DimensionalLayer, DimensionalState] = {}
-        self.combat_modifiers: Dict[str, List[CombatModifier]] = {
-            'damage': [],
-            'defense': [],
-            'speed': [],
-            'critical': [],
-            'dimensional_power': []
-        }
+        self.combat_modifiers = ModifierStore([
+            'damage',
+            'defense',
+            'speed',
+            'critical',
+            'dimensional_power'
+        ])
         self.balance_metrics: Dict[str, float] = {
             'avg_damage_per_second': 0.0,
             'avg_survival_time': 0.0,
             'dimension_usage_distribution': 0.0,
             'effect_uptime': 0.0
         }
+        # Cross-dimensional multipliers, rebuilt when any layer's version moves
+        self._layer_matrix: Optional[np.ndarray] = None
+        self._layer_triggers: List[List[List[DimensionalEffect]]] = []
+        self._layer_versions: Optional[Tuple[int, ...]] = None
         self.initialize_dimensions()
         self._setup_affinity_matrix()
 
+    def initialize_dimensions(self):
+        """Create a default state for every dimensional layer"""
+        self.dimensional_states = {
+            layer: DimensionalState(layer=layer) for layer in LAYERS
+        }
+
     def _setup_affinity_matrix(self):
         """Setup the affinity relationships between dimensions"""
         affinities = {
@@ -104,6 +212,42 @@ class DimensionalCombat:
         for source_layer, target_affinities in affinities.items():
             state = self.dimensional_states[source_layer]
             state.affinity_modifiers.update(target_affinities)
+        self._layer_versions = None
+
+    def _get_layer_matrix(self) -> Tuple[np.ndarray, List[List[List[DimensionalEffect]]]]:
+        """Layer x layer power multipliers and the effects each pair triggers"""
+        states = [self.dimensional_states[layer] for layer in LAYERS]
+        versions = tuple(state.version for state in states)
+        if versions == self._layer_versions:
+            return self._layer_matrix, self._layer_triggers
+
+        stability = np.array([state.stability for state in states])
+        energy = np.array([state.energy_level for state in states])
+        corruption = np.array([state.corruption_level for state in states])
+        affinity = np.array([
+            [AFFINITY_MULTIPLIERS[source.affinity_modifiers.get(target, DimensionalAffinity.NEUTRAL)]
+             for target in LAYERS]
+            for source in states
+        ])
+        resonance = np.array([DimensionalEffect.RESONANCE in state.active_effects for state in states])
+        dissonance = np.array([DimensionalEffect.DISSONANCE in state.active_effects for state in states])
+
+        # Base multiplier affected by stability and energy, then affinity and active effects
+        matrix = np.outer(stability * energy, stability * (1 - corruption)) * affinity
+        matrix *= np.where(resonance, 1.5, 1.0)[:, None]
+        matrix *= np.where(dissonance, 0.7, 1.0)[None, :]
+
+        self._layer_triggers = [
+            [
+                ([DimensionalEffect.RESONANCE] if resonance[i] else []) +
+                ([DimensionalEffect.DISSONANCE] if dissonance[j] else [])
+                for j in range(len(LAYERS))
+            ]
+            for i in range(len(LAYERS))
+        ]
+        self._layer_matrix = matrix
+        self._layer_versions = versions
+        return matrix, self._layer_triggers
 
     def calculate_dimensional_effect(self, 
                                   source_layer: DimensionalLayer,
@@ -111,39 +255,21 @@ class DimensionalCombat:
                                   base_power: float,
                                   effect_type: Optional[DimensionalEffect] = None) -> Tuple[float, List[DimensionalEffect]]:
         """Calculate how power changes when crossing dimensions"""
-        source_state = self.dimensional_states[source_layer]
-        target_state = self.dimensional_states[target_layer]
-        
-        # Base multiplier affected by stability and energy
-        multiplier = (source_state.stability * target_state.stability * 
-                     source_state.energy_level * (1 - target_state.corruption_level))
+        source_index = LAYER_INDEX[source_layer]
+        target_index = LAYER_INDEX[target_layer]
         
-        # Apply affinity modifiers
-        affinity = source_state.affinity_modifiers.get(target_layer, DimensionalAffinity.NEUTRAL)
-        affinity_multipliers = {
-            DimensionalAffinity.HARMONIOUS: 1.5,
-            DimensionalAffinity.NEUTRAL: 1.0,
-            DimensionalAffinity.CONFLICTING: 0.7,
-            DimensionalAffinity.CATALYZING: 2.0,
-            DimensionalAffinity.NULLIFYING: 0.3
-        }
-        multiplier *= affinity_multipliers[affinity]
-        
-        # Apply active effects
-        triggered_effects = []
-        if DimensionalEffect.RESONANCE in source_state.active_effects:
-            multiplier *= 1.5
-            triggered_effects.append(DimensionalEffect.RESONANCE)
-        if DimensionalEffect.DISSONANCE in target_state.active_effects:
-            multiplier *= 0.7
-            triggered_effects.append(DimensionalEffect.DISSONANCE)
+        # Stability, energy, corruption, affinity and active effects are all
+        # folded into the cached layer matrix
+        matrix, triggers = self._get_layer_matrix()
+        multiplier = float(matrix[source_index, target_index])
+        triggered_effects = list(triggers[source_index][target_index])
         
         # Special effect interactions
         if effect_type:
             if effect_type == DimensionalEffect.CONVERGENCE:
-                multiplier *= 1.0 + len(source_state.active_effects) * 0.1
+                multiplier *= 1.0 + len(self.dimensional_states[source_layer].active_effects) * 0.1
             elif effect_type == DimensionalEffect.DIVERGENCE:
-                multiplier *= 1.0 + len(target_state.active_effects) * 0.1
+                multiplier *= 1.0 + len(self.dimensional_states[target_layer].active_effects) * 0.1
             triggered_effects.append(effect_type)
         
         # Apply combat modifiers
@@ -185,6 +311,64 @@ class DimensionalCombat:
             dimensional_layer=position.dimensional_layer
         )
 
+    def apply_dimensional_distortion_batch(self,
+                                           coordinates: np.ndarray,
+                                           layers: Any,
+                                           intensity: Any = 1.0) -> np.ndarray:
+        """Distort many positions at once, in place.
+
+        coordinates is an (N, 3) array of x, y, z. layers is either a single
+        DimensionalLayer or an array of N indices into LAYERS, so each row
+        can use its own layer's parameters; intensity may be a scalar or an
+        array of N values. Rows on undistorted layers are left untouched,
+        matching apply_dimensional_distortion.
+
+        The maths runs in the array's own dtype; float32 buffers (particles,
+        projectiles) get NumPy's vectorised single-precision trig. Since the
+        result is written back in place, coordinates must be floating point.
+        """
+        dtype = coordinates.dtype
+        if not np.issubdtype(dtype, np.floating):
+            raise TypeError(f"Coordinates must be a floating-point array, not {dtype}")
+        if isinstance(layers, DimensionalLayer):
+            state = self.dimensional_states[layers]
+            if state.distortion_level == 0:
+                return coordinates
+            rows = slice(None)
+            distortion = state.distortion_level
+            corruption = state.corruption_level
+            energy = state.energy_level
+        else:
+            states = [self.dimensional_states[layer] for layer in LAYERS]
+            layer_index = np.asarray(layers)
+            distortion = np.array([state.distortion_level for state in states], dtype=dtype)[layer_index]
+            active = distortion != 0
+            if not active.any():
+                return coordinates
+            # A slice keeps the all-distorted case a view rather than a copy
+            rows = slice(None) if active.all() else active
+            layer_index = layer_index[rows]
+            distortion = distortion[rows]
+            corruption = np.array([state.corruption_level for state in states], dtype=dtype)[layer_index]
+            energy = np.array([state.energy_level for state in states], dtype=dtype)[layer_index]
+
+        if np.ndim(intensity):
+            intensity = np.asarray(intensity, dtype=dtype)[rows]
+        base_distortion = distortion * intensity
+        x, y, z = coordinates[rows, 0], coordinates[rows, 1], coordinates[rows, 2]
+
+        theta = np.arctan2(y, x)
+        r = np.sqrt(x * x + y * y)
+        new_theta = theta + base_distortion * r / (10 * energy)
+        new_r = r * (1 + np.sin(theta * (1.0 + corruption)) * base_distortion / 5)
+        # sin(r * 0) is 0, so uncorrupted layers get no extra vertical term
+        new_z = z * (1 + base_distortion / 10) + np.sin(r * corruption) * base_distortion
+
+        coordinates[rows, 0] = new_r * np.cos(new_theta)
+        coordinates[rows, 1] = new_r * np.sin(new_theta)
+        coordinates[rows, 2] = new_z
+        return coordinates
+
     def update_dimensional_stability(self, 
                                   layer: DimensionalLayer, 
                                   delta: float,
@@ -231,41 +415,26 @@ class DimensionalCombat:
                           is_multiplicative: bool = False,
                           source: str = "") -> None:
         """Add a combat modifier"""
-        if modifier_type in self.combat_modifiers:
-            self.combat_modifiers[modifier_type].append(
-                CombatModifier(
-                    value=value,
-                    duration=duration,
-                    is_multiplicative=is_multiplicative,
-                    source=source
-                )
+        self.combat_modifiers.add(
+            modifier_type,
+            CombatModifier(
+                value=value,
+                duration=duration,
+                is_multiplicative=is_multiplicative,
+                source=source
             )
+        )
 
     def _get_total_modifier(self, modifier_type: str) -> float:
         """Calculate total value for a modifier type"""
-        if modifier_type not in self.combat_modifiers:
-            return 1.0
-            
-        current_time = datetime.now()
-        active_modifiers = [
-            mod for mod in self.combat_modifiers[modifier_type]
-            if (current_time - mod.timestamp).total_seconds() < mod.duration
-        ]
-        
-        # Clean up expired modifiers
-        self.combat_modifiers[modifier_type] = active_modifiers
-        
-        # Calculate total
-        additive_total = sum(mod.value for mod in active_modifiers if not mod.is_multiplicative)
-        multiplicative_total = math.prod(1 + mod.value for mod in active_modifiers if mod.is_multiplicative)
-        
-        return (1 + additive_total) * multiplicative_total
+        return self.combat_modifiers.total(modifier_type)
 
     def update_balance_metrics(self, combat_data: Dict[str, Any]) -> None:
         """Update combat balance metrics"""
+        alpha = 0.1  # Smoothing factor
+        
         # Update damage metrics
         if 'damage_dealt' in combat_data:
-            alpha = 0.1  # Smoothing factor
             self.balance_metrics['avg_damage_per_second'] = (
                 (1 - alpha) * self.balance_metrics['avg_damage_per_second'] +
                 alpha * combat_data['damage_dealt']
@@ -3,11 +3,15 @@ from enum import Enum, auto
 from typing import Dict, List, Set, Optional, Tuple, Any
 import random
 import math
+import bisect
 from datetime import datetime
 
 from .dimensional_combat import DimensionalLayer, DimensionalEffect
 from .ai_behavior import BehaviorType, TacticalRole
-from .combat_types import Position, DamageType
+from .combat_types import Position
+
+LEVEL_BAND_SIZE = 5       # Player levels per template index bucket
+WEIGHT_TABLE_CACHE_SIZE = 128
 
 class EncounterType(Enum):
     """Types of combat encounters"""
@@ -61,6 +65,13 @@ class EncounterTemplate:
     rewards: Dict[str, Any]
     special_conditions: Dict[str, Any]
 
+@dataclass
+class IndexedTemplate:
+    """Encounter template with its selection inputs precomputed"""
+    template: EncounterTemplate
+    level_mid: float
+    avg_dim_requirement: float
+
 @dataclass
 class SpawnPoint:
     """Represents a point where enemies can spawn"""
@@ -81,6 +92,11 @@ class EncounterGenerator:
         self.difficulty_curve: Dict[int, float] = {}
         self.last_encounter: Optional[str] = None
         
+        # Templates bucketed by level band, and cumulative weight tables
+        # keyed by selection parameters and the excluded template
+        self.level_bands: Dict[int, List[IndexedTemplate]] = {}
+        self._weight_tables: Dict[Tuple, Tuple[List[EncounterTemplate], List[float]]] = {}
+        
         self._initialize_templates()
         self._initialize_difficulty_curve()
         
@@ -530,7 +546,40 @@ class EncounterGenerator:
         ]
         
         for template in templates:
-            self.encounter_templates[template.name] = template
+            self.add_encounter_template(template)
+
+    def add_encounter_template(self, template: EncounterTemplate) -> None:
+        """Register an encounter template and index it by level band"""
+        if template.name in self.encounter_templates:
+            self._unindex_template(template.name)
+        self.encounter_templates[template.name] = template
+        
+        entry = IndexedTemplate(
+            template=template,
+            level_mid=(template.level_range[0] + template.level_range[1]) / 2,
+            avg_dim_requirement=sum(template.dimensional_properties.values()) /
+                                max(1, len(template.dimensional_properties))
+        )
+        first_band = template.level_range[0] // LEVEL_BAND_SIZE
+        last_band = template.level_range[1] // LEVEL_BAND_SIZE
+        for band in range(first_band, last_band + 1):
+            self.level_bands.setdefault(band, []).append(entry)
+        self._weight_tables.clear()
+
+    def remove_encounter_template(self, name: str) -> None:
+        """Remove an encounter template and its index entries"""
+        if name in self.encounter_templates:
+            self._unindex_template(name)
+            del self.encounter_templates[name]
+
+    def _unindex_template(self, name: str) -> None:
+        for band, entries in list(self.level_bands.items()):
+            entries = [entry for entry in entries if entry.template.name != name]
+            if entries:
+                self.level_bands[band] = entries
+            else:
+                del self.level_bands[band]
+        self._weight_tables.clear()
 
     def _initialize_difficulty_curve(self) -> None:
         """Initialize the difficulty progression curve"""
@@ -555,6 +604,52 @@ class EncounterGenerator:
         if not template:
             return None
             
+        return self._build_encounter(
+            template, player_level, desired_difficulty, dimensional_stability
+        )
+
+    def generate_encounters(self,
+                          count: int,
+                          player_level: int,
+                          desired_difficulty: float,
+                          dimensional_stability: float) -> List[Dict[str, Any]]:
+        """Pre-generate a run of encounters for one region.
+        
+        The region's weight tables are built once, so each draw is a
+        bisect, and a template is never repeated twice in a row. Returns
+        fewer than count encounters only if no template fits.
+        """
+        encounters = []
+        
+        for _ in range(count):
+            template = self._select_encounter_template(
+                player_level, desired_difficulty, dimensional_stability
+            )
+            if not template:
+                break
+                
+            encounters.append(self._build_encounter(
+                template, player_level, desired_difficulty, dimensional_stability
+            ))
+            
+        return encounters
+
+    def has_fitting_templates(self,
+                            player_level: int,
+                            desired_difficulty: float,
+                            dimensional_stability: float) -> bool:
+        """Check whether any template fits, ignoring repeat avoidance"""
+        templates, _ = self._get_weight_table(
+            player_level, desired_difficulty, dimensional_stability, None
+        )
+        return bool(templates)
+
+    def _build_encounter(self,
+                       template: EncounterTemplate,
+                       player_level: int,
+                       desired_difficulty: float,
+                       dimensional_stability: float) -> Dict[str, Any]:
+        """Generate an encounter from a selected template"""
         # Generate enemy composition
         enemies = self._generate_enemy_composition(
             template, player_level, desired_difficulty
@@ -596,9 +691,40 @@ class EncounterGenerator:
                                 desired_difficulty: float,
                                 dimensional_stability: float) -> Optional[EncounterTemplate]:
         """Select an appropriate encounter template"""
-        valid_templates = []
+        templates, cumulative = self._get_weight_table(
+            player_level, desired_difficulty, dimensional_stability, self.last_encounter
+        )
         
-        for template in self.encounter_templates.values():
+        if not templates:
+            return None
+            
+        # Select template based on weights
+        total_weight = cumulative[-1]
+        if total_weight <= 0:
+            return random.choice(templates)
+            
+        selection = random.uniform(0, total_weight)
+        index = bisect.bisect_left(cumulative, selection)
+        return templates[min(index, len(templates) - 1)]
+
+    def _get_weight_table(self,
+                        player_level: int,
+                        desired_difficulty: float,
+                        dimensional_stability: float,
+                        exclude: Optional[str]) -> Tuple[List[EncounterTemplate], List[float]]:
+        """Valid templates and their cumulative selection weights"""
+        key = (player_level, desired_difficulty, dimensional_stability, exclude)
+        table = self._weight_tables.get(key)
+        if table is not None:
+            return table
+            
+        templates = []
+        cumulative = []
+        total_weight = 0.0
+        
+        for entry in self.level_bands.get(player_level // LEVEL_BAND_SIZE, ()):
+            template = entry.template
+            
             # Check level range
             if not (template.level_range[0] <= player_level <= template.level_range[1]):
                 continue
@@ -608,45 +734,27 @@ class EncounterGenerator:
                 continue
                 
             # Check dimensional stability requirements
-            avg_dim_requirement = sum(template.dimensional_properties.values()) / \
-                                len(template.dimensional_properties)
-            if abs(avg_dim_requirement - dimensional_stability) > 0.3:
+            if abs(entry.avg_dim_requirement - dimensional_stability) > 0.3:
                 continue
                 
             # Avoid repeating the last encounter
-            if template.name == self.last_encounter:
+            if template.name == exclude:
                 continue
                 
-            valid_templates.append(template)
-            
-        if not valid_templates:
-            return None
-            
-        # Weight templates by how well they match the desired parameters
-        weighted_templates = [
-            (template, self._calculate_template_weight(
-                template, player_level, desired_difficulty, dimensional_stability
-            ))
-            for template in valid_templates
-        ]
-        
-        # Select template based on weights
-        total_weight = sum(weight for _, weight in weighted_templates)
-        if total_weight <= 0:
-            return random.choice(valid_templates)
+            # Weight templates by how well they match the desired parameters
+            total_weight += self._calculate_template_weight(
+                entry, player_level, desired_difficulty, dimensional_stability
+            )
+            templates.append(template)
+            cumulative.append(total_weight)
             
-        selection = random.uniform(0, total_weight)
-        current_weight = 0
-        
-        for template, weight in weighted_templates:
-            current_weight += weight
-            if current_weight >= selection:
-                return template
-                
-        return valid_templates[0]
+        if len(self._weight_tables) >= WEIGHT_TABLE_CACHE_SIZE:
+            self._weight_tables.clear()
+        table = self._weight_tables[key] = (templates, cumulative)
+        return table
 
     def _calculate_template_weight(self,
-                                template: EncounterTemplate,
+                                entry: IndexedTemplate,
                                 player_level: int,
                                 desired_difficulty: float,
                                 dimensional_stability: float) -> float:
@@ -655,18 +763,15 @@ class EncounterGenerator:
         weight = 1.0
         
         # Level appropriateness
-        level_mid = (template.level_range[0] + template.level_range[1]) / 2
-        level_diff = abs(player_level - level_mid)
+        level_diff = abs(player_level - entry.level_mid)
         weight *= 1 / (1 + level_diff * 0.1)
         
         # Difficulty match
-        diff_match = abs(template.difficulty_rating - desired_difficulty)
+        diff_match = abs(entry.template.difficulty_rating - desired_difficulty)
         weight *= 1 / (1 + diff_match)
         
         # Dimensional stability match
-        avg_dim_requirement = sum(template.dimensional_properties.values()) / \
-                            len(template.dimensional_properties)
-        dim_match = abs(avg_dim_requirement - dimensional_stability)
+        dim_match = abs(entry.avg_dim_requirement - dimensional_stability)
         weight *= 1 / (1 + dim_match)
         
         return weight
@@ -949,6 +1054,33 @@ class EncounterGenerator:
             
         return spawn_zones
 
+    def _generate_spawn_points(self,
+                            terrain: Dict[str, Any],
+                            enemy_count: int,
+                            dimensional_properties: Dict[DimensionalLayer, float]) -> List[SpawnPoint]:
+        """Place one spawn point per enemy inside the terrain's spawn zones"""
+        spawn_points = []
+        zones = terrain['spawn_zones']
+        if not zones:
+            return spawn_points
+            
+        for i in range(enemy_count):
+            zone = zones[i % len(zones)]
+            angle = random.uniform(0, 2 * math.pi)
+            distance = random.uniform(0, zone['radius'])
+            spawn_points.append(SpawnPoint(
+                position=Position(
+                    x=zone['position'].x + math.cos(angle) * distance,
+                    y=zone['position'].y + math.sin(angle) * distance,
+                    z=zone['position'].z
+                ),
+                terrain_type=zone['terrain_type'],
+                dimensional_stability=zone['dimensional_stability'],
+                valid_enemy_types=set()
+            ))
+            
+        return spawn_points
+
     def _configure_phases(self,
                         template: EncounterTemplate,
                         enemies: List[Dict[str, Any]],
@@ -0,0 +1,207 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple, Any, Hashable
+from collections import deque
+import threading
+
+from .encounter_generator import EncounterGenerator
+
+@dataclass
+class RegionEncounters:
+    """Ready encounters for one region and the inputs they were built for"""
+    player_level: int
+    desired_difficulty: float
+    dimensional_stability: float
+    encounters: deque = field(default_factory=deque)
+    exhausted: bool = False   # No template fits the current inputs
+    # Template whose repeat avoidance left nothing to generate; the region
+    # is skipped until the generator's last encounter moves on from it
+    blocked_by: Optional[str] = None
+
+class EncounterPool:
+    """Pre-generates encounters per region on a background thread.
+
+    Regions report their player level and local dimensional stability
+    through update_region. The worker keeps each region's queue topped up
+    to pool_size, and a queue is thrown away once its inputs drift past
+    the tolerances, so acquire hands out a ready encounter in O(1).
+    """
+
+    def __init__(self,
+                 generator: Optional[EncounterGenerator] = None,
+                 pool_size: int = 3,
+                 level_tolerance: int = 2,
+                 difficulty_tolerance: float = 0.2,
+                 stability_tolerance: float = 0.1):
+        self.generator = generator or EncounterGenerator()
+        self.pool_size = pool_size
+        self.level_tolerance = level_tolerance
+        self.difficulty_tolerance = difficulty_tolerance
+        self.stability_tolerance = stability_tolerance
+
+        self.regions: Dict[Hashable, RegionEncounters] = {}
+        self.hits = 0
+        self.misses = 0
+
+        # The generator isn't thread-safe, so the worker and fallback
+        # generation in acquire take turns with it
+        self._generator_lock = threading.Lock()
+        self._condition = threading.Condition()
+        self.is_running = False
+        self.worker_thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the background worker"""
+        if self.is_running:
+            return
+
+        self.is_running = True
+        self.worker_thread = threading.Thread(
+            target=self._worker_loop,
+            daemon=True
+        )
+        self.worker_thread.start()
+
+    def stop(self) -> None:
+        """Stop the background worker"""
+        with self._condition:
+            self.is_running = False
+            self._condition.notify_all()
+        if self.worker_thread:
+            self.worker_thread.join()
+            self.worker_thread = None
+
+    def update_region(self,
+                      region_id: Hashable,
+                      player_level: int,
+                      desired_difficulty: float,
+                      dimensional_stability: float) -> None:
+        """Report a region's current inputs, invalidating it if they drifted"""
+        with self._condition:
+            region = self.regions.get(region_id)
+            if region is not None and not self._has_drifted(
+                region, player_level, desired_difficulty, dimensional_stability
+            ):
+                return
+
+            # Replacing the entry also discards anything the worker is
+            # still generating for the old inputs
+            self.regions[region_id] = RegionEncounters(
+                player_level=player_level,
+                desired_difficulty=desired_difficulty,
+                dimensional_stability=dimensional_stability
+            )
+            self._condition.notify_all()
+
+    def remove_region(self, region_id: Hashable) -> None:
+        """Stop pre-generating for a region"""
+        with self._condition:
+            self.regions.pop(region_id, None)
+
+    def _has_drifted(self,
+                     region: RegionEncounters,
+                     player_level: int,
+                     desired_difficulty: float,
+                     dimensional_stability: float) -> bool:
+        return (abs(region.player_level - player_level) > self.level_tolerance or
+                abs(region.desired_difficulty - desired_difficulty) > self.difficulty_tolerance or
+                abs(region.dimensional_stability - dimensional_stability) > self.stability_tolerance)
+
+    def acquire(self, region_id: Hashable) -> Optional[Dict[str, Any]]:
+        """Take a ready encounter for a region.
+
+        Falls back to generating one synchronously if the region's queue is
+        empty. Returns None if the region is unknown or no template fits.
+        """
+        with self._condition:
+            region = self.regions.get(region_id)
+            if region is None:
+                return None
+            if region.encounters:
+                self.hits += 1
+                encounter = region.encounters.popleft()
+                self._condition.notify_all()
+                return encounter
+            self.misses += 1
+
+        with self._generator_lock:
+            encounter = self.generator.generate_encounter(
+                region.player_level,
+                region.desired_difficulty,
+                region.dimensional_stability
+            )
+
+        if encounter is not None:
+            # The last encounter changed, which may unblock other regions
+            with self._condition:
+                self._condition.notify_all()
+        return encounter
+
+    def ready_count(self, region_id: Hashable) -> int:
+        """Number of encounters waiting for a region"""
+        with self._condition:
+            region = self.regions.get(region_id)
+            return len(region.encounters) if region else 0
+
+    def wait_until_ready(self, region_id: Hashable,
+                         timeout: Optional[float] = None) -> bool:
+        """Block until a region's queue is full, e.g. behind a loading screen"""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: (region_id in self.regions and
+                         (self._is_stalled(self.regions[region_id]) or
+                          len(self.regions[region_id].encounters) >= self.pool_size)),
+                timeout
+            )
+
+    def _is_stalled(self, region: RegionEncounters) -> bool:
+        """Whether generating for a region can't succeed right now"""
+        return region.exhausted or (
+            region.blocked_by is not None and
+            region.blocked_by == self.generator.last_encounter
+        )
+
+    def _next_region(self) -> Optional[Tuple[Hashable, RegionEncounters]]:
+        """A region whose queue needs topping up"""
+        for region_id, region in self.regions.items():
+            if not self._is_stalled(region) and len(region.encounters) < self.pool_size:
+                return region_id, region
+        return None
+
+    def _worker_loop(self) -> None:
+        """Fill region queues until stopped"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: not self.is_running or self._next_region() is not None
+                )
+                if not self.is_running:
+                    return
+                region_id, region = self._next_region()
+
+            with self._generator_lock:
+                encounter = self.generator.generate_encounter(
+                    region.player_level,
+                    region.desired_difficulty,
+                    region.dimensional_stability
+                )
+                # A miss only exhausts the region if it isn't down to the
+                # generator refusing to repeat its last template
+                fits = encounter is not None or self.generator.has_fitting_templates(
+                    region.player_level,
+                    region.desired_difficulty,
+                    region.dimensional_stability
+                )
+                last_encounter = self.generator.last_encounter
+
+            with self._condition:
+                # Drop results for regions invalidated while generating
+                if self.regions.get(region_id) is not region:
+                    continue
+                if encounter is not None:
+                    region.encounters.append(encounter)
+                    region.blocked_by = None
+                elif fits:
+                    region.blocked_by = last_encounter
+                else:
+                    region.exhausted = True
+                self._condition.notify_all()
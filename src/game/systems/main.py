@@ -176,6 +176,9 @@ class Game:
     def manage_time(self, time_step):
         self.temporal_controller.manage_time(time_step)
 
+    def shutdown(self):
+        self.contextual_awareness_manager.close()
+
     def render(self):
         screen.fill(WHITE)  # Fill screen with white color
         self.current_menu.render(screen)
@@ -202,6 +205,9 @@ class Game:
 # Example of how to use these modules
 if __name__ == "__main__":
     game = Game()
-    game.run()
+    try:
+        game.run()
+    finally:
+        game.shutdown()
     pygame.quit()
     sys.exit()
\ No newline at end of file
@@ -38,6 +38,9 @@ class TestResult:
 class TestDecorators:
     """Decorators for test methods"""
     
+    # Imported into test modules, so keep pytest from collecting it
+    __test__ = False
+    
     @staticmethod
     def test_type(test_type: TestType):
         def decorator(func):
@@ -1,10 +1,19 @@
 from enum import Enum
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Iterator, Sequence
 from dataclasses import dataclass
+from collections import deque
 import random
 import math
 import json
 import logging
+import time
+
+import numpy as np
+
+# Most recent decisions kept for analysis
+ACTION_HISTORY_LIMIT = 1000
+
+DISABLING_EFFECTS = ("stunned", "frozen", "paralyzed")
 
 class AIBehaviorType(Enum):
     AGGRESSIVE = "aggressive"
@@ -39,8 +48,9 @@ class BehaviorNode:
         self.name = name
         self.children: List[BehaviorNode] = []
         
-    def add_child(self, child: 'BehaviorNode'):
+    def add_child(self, child: 'BehaviorNode') -> 'BehaviorNode':
         self.children.append(child)
+        return self
         
     def evaluate(self, state: AIState) -> bool:
         raise NotImplementedError
@@ -75,6 +85,158 @@ class ActionNode(BehaviorNode):
     def evaluate(self, state: AIState) -> bool:
         return self.action(state)
 
+def _is_offensive(ability: str) -> bool:
+    ability = ability.lower()
+    return "attack" in ability or "strike" in ability
+
+def _is_support(ability: str) -> bool:
+    ability = ability.lower()
+    return "heal" in ability or "buff" in ability
+
+def _is_healing(ability: str) -> bool:
+    ability = ability.lower()
+    return "heal" in ability or "cure" in ability
+
+class AIStateBatch:
+    """Columnar view of many agents' AIState, one array entry per agent"""
+    COLUMNS = (
+        "health", "energy", "threat", "enemy_count", "ally_count",
+        "disabled", "has_offensive", "has_support", "has_healing"
+    )
+
+    def __init__(self, states: Sequence[Any] = ()):
+        rows = [state if isinstance(state, dict) else state.__dict__ for state in states]
+        size = len(rows)
+        self.health = np.fromiter((row["health_percentage"] for row in rows), float, size)
+        self.energy = np.fromiter((row["energy_percentage"] for row in rows), float, size)
+        self.threat = np.fromiter((row["threat_level"] for row in rows), float, size)
+        self.enemy_count = np.fromiter((len(row["enemies_nearby"]) for row in rows), int, size)
+        self.ally_count = np.fromiter((len(row["allies_nearby"]) for row in rows), int, size)
+        self.disabled = np.fromiter((
+            any(effect in DISABLING_EFFECTS for effect in row["status_effects"]) for row in rows
+        ), bool, size)
+        self.has_offensive = np.fromiter((
+            any(_is_offensive(ability) for ability in row["available_abilities"]) for row in rows
+        ), bool, size)
+        self.has_support = np.fromiter((
+            any(_is_support(ability) for ability in row["available_abilities"]) for row in rows
+        ), bool, size)
+        self.has_healing = np.fromiter((
+            any(_is_healing(ability) for ability in row["available_abilities"]) for row in rows
+        ), bool, size)
+
+    @property
+    def size(self) -> int:
+        return len(self.health)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def chunks(self, chunk_size: int) -> Iterator['AIStateBatch']:
+        """Split into smaller batches, e.g. to spread over a worker pool"""
+        for start in range(0, self.size, chunk_size):
+            chunk = AIStateBatch()
+            for column in self.COLUMNS:
+                setattr(chunk, column, getattr(self, column)[start:start + chunk_size])
+            yield chunk
+
+# Vectorised counterparts of CombatAI's condition and action callbacks, keyed
+# by node name. Action kernels return where the action would succeed. They are
+# module-level functions so compiled trees can be pickled to worker processes.
+def _low_health(batch: AIStateBatch) -> np.ndarray:
+    return batch.health < 0.3
+
+def _combat_ready(batch: AIStateBatch) -> np.ndarray:
+    return (batch.health > 0.2) & (batch.energy > 0.1) & ~batch.disabled
+
+def _can_attack(batch: AIStateBatch) -> np.ndarray:
+    return (batch.enemy_count > 0) & batch.has_offensive
+
+def _can_support(batch: AIStateBatch) -> np.ndarray:
+    return (batch.ally_count > 0) & batch.has_support
+
+def _has_healing(batch: AIStateBatch) -> np.ndarray:
+    return batch.has_healing
+
+def _always(batch: AIStateBatch) -> np.ndarray:
+    return np.ones(batch.size, dtype=bool)
+
+def _has_offensive(batch: AIStateBatch) -> np.ndarray:
+    return batch.has_offensive
+
+def _has_enemies(batch: AIStateBatch) -> np.ndarray:
+    return batch.enemy_count > 0
+
+BATCH_KERNELS: Dict[str, Callable[[AIStateBatch], np.ndarray]] = {
+    "LowHealth": _low_health,
+    "CombatReady": _combat_ready,
+    "CanAttack": _can_attack,
+    "CanSupport": _can_support,
+    "UseHealingAbility": _has_healing,
+    "Retreat": _always,
+    "UseSpecialAbility": _has_offensive,
+    "BasicAttack": _has_enemies,
+    "SupportAction": _can_support,
+}
+
+class CompiledBehaviorTree:
+    """A behavior tree flattened for evaluation over a whole AIStateBatch.
+
+    Each node becomes a (kind, kernel, children, action_index) tuple, and
+    evaluation runs every node once over a mask of the agents that reach
+    it instead of walking the tree once per agent.
+    """
+    SEQUENCE, SELECTOR, CONDITION, ACTION = range(4)
+
+    def __init__(self, root: BehaviorNode,
+                 kernels: Dict[str, Callable[[AIStateBatch], np.ndarray]] = None):
+        self.kernels = kernels or BATCH_KERNELS
+        self.action_names: List[str] = []
+        self.root = self._compile(root)
+
+    def _compile(self, node: BehaviorNode) -> tuple:
+        children = tuple(self._compile(child) for child in node.children)
+        if isinstance(node, SequenceNode):
+            return (self.SEQUENCE, None, children, -1)
+        if isinstance(node, SelectorNode):
+            return (self.SELECTOR, None, children, -1)
+        if node.name not in self.kernels:
+            raise ValueError(f"No batch kernel for behavior node {node.name}")
+        if isinstance(node, ActionNode):
+            self.action_names.append(node.name)
+            return (self.ACTION, self.kernels[node.name], children, len(self.action_names) - 1)
+        return (self.CONDITION, self.kernels[node.name], children, -1)
+
+    def evaluate(self, batch: AIStateBatch) -> np.ndarray:
+        """Index into action_names of each agent's chosen action, or -1"""
+        actions = np.full(batch.size, -1, dtype=np.intp)
+        self._evaluate(self.root, batch, np.ones(batch.size, dtype=bool), actions)
+        return actions
+
+    def _evaluate(self, node: tuple, batch: AIStateBatch,
+                  active: np.ndarray, actions: np.ndarray) -> np.ndarray:
+        kind, kernel, children, action_index = node
+        if kind == self.SEQUENCE:
+            succeeded = active
+            for child in children:
+                if not succeeded.any():
+                    break
+                succeeded = self._evaluate(child, batch, succeeded, actions)
+            return succeeded
+        if kind == self.SELECTOR:
+            succeeded = np.zeros_like(active)
+            for child in children:
+                remaining = active & ~succeeded
+                if not remaining.any():
+                    break
+                succeeded |= self._evaluate(child, batch, remaining, actions)
+            return succeeded
+
+        succeeded = active & kernel(batch)
+        if kind == self.ACTION:
+            actions[succeeded] = action_index
+        return succeeded
+
 class CombatAI:
     def __init__(self):
         self.behavior_type = AIBehaviorType.TACTICAL
@@ -82,8 +244,9 @@ class CombatAI:
         self.behavior_tree = self._build_behavior_tree()
         self.state = None
         self.logger = self._setup_logger()
-        self.action_history: List[Dict[str, Any]] = []
+        self.action_history: deque = deque(maxlen=ACTION_HISTORY_LIMIT)
         self.decision_weights = self._initialize_decision_weights()
+        self.compiled_tree = CompiledBehaviorTree(self.behavior_tree)
         
     def _setup_logger(self) -> logging.Logger:
         logger = logging.getLogger("CombatAI")
@@ -178,6 +341,15 @@ class CombatAI:
             self.logger.error(f"Error in decision making: {str(e)}")
             return {"action": "none", "reason": "error"}
             
+    def decide_actions_batch(self, states: Sequence[Any]) -> np.ndarray:
+        """Decide for many agents at once from AIState objects or state dicts.
+
+        Returns an index into compiled_tree.action_names per agent (-1 when
+        no branch succeeds). Targets and abilities for the chosen action are
+        left to the caller, so no per-agent AIState is built.
+        """
+        return self.compiled_tree.evaluate(AIStateBatch(states))
+        
     def _is_low_health(self, state: AIState) -> bool:
         """Check if health is critically low"""
         return state.health_percentage < 0.3
@@ -186,7 +358,7 @@ class CombatAI:
         """Check if ready for combat"""
         return (state.health_percentage > 0.2 and 
                 state.energy_percentage > 0.1 and
-                not any(effect in ["stunned", "frozen", "paralyzed"] 
+                not any(effect in DISABLING_EFFECTS
                        for effect in state.status_effects))
                        
     def _can_attack(self, state: AIState) -> bool:
@@ -353,15 +525,15 @@ class CombatAI:
         
     def _is_offensive_ability(self, ability: str) -> bool:
         """Check if ability is offensive"""
-        return "attack" in ability.lower() or "strike" in ability.lower()
+        return _is_offensive(ability)
         
     def _is_support_ability(self, ability: str) -> bool:
         """Check if ability is supportive"""
-        return "heal" in ability.lower() or "buff" in ability.lower()
+        return _is_support(ability)
         
     def _is_healing_ability(self, ability: str) -> bool:
         """Check if ability is healing"""
-        return "heal" in ability.lower() or "cure" in ability.lower()
+        return _is_healing(ability)
         
     def analyze_performance(self) -> Dict[str, Any]:
         """Analyze AI combat performance"""
@@ -405,7 +577,7 @@ class CombatAI:
             "behavior_type": self.behavior_type.value,
             "combat_role": self.combat_role.value,
             "decision_weights": self.decision_weights,
-            "action_history": self.action_history
+            "action_history": list(self.action_history)
         }
         
         with open(file_path, "w") as f:
@@ -419,4 +591,4 @@ class CombatAI:
         self.behavior_type = AIBehaviorType(data["behavior_type"])
         self.combat_role = CombatRole(data["combat_role"])
         self.decision_weights = data["decision_weights"]
-        self.action_history = data["action_history"] 
\ No newline at end of file
+        self.action_history = deque(data["action_history"], maxlen=ACTION_HISTORY_LIMIT) 
\ No newline at end of file
@@ -1,12 +1,13 @@
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterator, Sequence
 from dataclasses import dataclass
 from enum import Enum
 import json
 import time
 import logging
-import math
 from collections import defaultdict
 
+import numpy as np
+
 class CombatEventType(Enum):
     DAMAGE_DEALT = "damage_dealt"
     DAMAGE_TAKEN = "damage_taken"
@@ -16,6 +17,16 @@ class CombatEventType(Enum):
     POSITION_CHANGE = "position_change"
     RESOURCE_CHANGE = "resource_change"
 
+EVENT_TYPES = list(CombatEventType)
+EVENT_CODES = {event_type: code for code, event_type in enumerate(EVENT_TYPES)}
+
+# Detail key whose value is stored in the label column, per event type
+LABEL_KEYS = {
+    CombatEventType.ABILITY_USED: "ability_name",
+    CombatEventType.RESOURCE_CHANGE: "resource_type",
+    CombatEventType.STATUS_EFFECT: "effect_name"
+}
+
 @dataclass
 class CombatEvent:
     event_type: CombatEventType
@@ -25,6 +36,124 @@ class CombatEvent:
     value: float
     details: Dict[str, Any]
 
+class SessionEventStore:
+    """Columnar event log for one combat session.
+    
+    Events are appended to growable NumPy columns. Ids and labels are
+    interned into a per-session string table, and the detail fields the
+    analyses read are split out into their own columns. Iterating still
+    yields CombatEvent objects.
+    """
+    COLUMNS = {
+        "event_type": np.int8,
+        "timestamp": np.float64,
+        "value": np.float64,
+        "source": np.int32,
+        "target": np.int32,
+        "label": np.int32,    # Ability, resource or effect name; -1 if none
+        "duration": np.float64,
+        "x": np.float64,
+        "y": np.float64,
+        "positioned": np.bool_
+    }
+    
+    def __init__(self, capacity: int = 64):
+        self.size = 0
+        self.columns = {
+            name: np.zeros(capacity, dtype) for name, dtype in self.COLUMNS.items()
+        }
+        self.details: List[Dict[str, Any]] = []
+        self.strings: List[str] = []
+        self._string_codes: Dict[str, int] = {}
+        # Sum of event values per event type, for cross-session trends
+        self.totals = np.zeros(len(EVENT_TYPES))
+        
+    @classmethod
+    def from_columns(cls, columns: Dict[str, np.ndarray], strings: List[str],
+                     details: List[Dict[str, Any]]) -> 'SessionEventStore':
+        """Rebuild a store from exported columns"""
+        store = cls(capacity=0)
+        store.size = len(details)
+        store.columns = {
+            name: np.asarray(columns[name], dtype) for name, dtype in cls.COLUMNS.items()
+        }
+        store.details = details
+        store.strings = list(strings)
+        store._string_codes = {string: code for code, string in enumerate(store.strings)}
+        store.totals = np.bincount(
+            store.columns["event_type"], weights=store.columns["value"],
+            minlength=len(EVENT_TYPES)
+        )
+        return store
+        
+    def __len__(self) -> int:
+        return self.size
+        
+    def _intern(self, string: str) -> int:
+        code = self._string_codes.get(string)
+        if code is None:
+            code = self._string_codes[string] = len(self.strings)
+            self.strings.append(string)
+        return code
+        
+    def append(self, event: CombatEvent):
+        """Add an event, growing the columns when full"""
+        if self.size == len(self.columns["timestamp"]):
+            capacity = max(64, self.size * 2)
+            for name, column in self.columns.items():
+                grown = np.zeros(capacity, column.dtype)
+                grown[:self.size] = column[:self.size]
+                self.columns[name] = grown
+                
+        details = event.details
+        label_key = LABEL_KEYS.get(event.event_type)
+        position = details.get("position", {}) \
+            if event.event_type == CombatEventType.POSITION_CHANGE else {}
+            
+        i = self.size
+        columns = self.columns
+        columns["event_type"][i] = EVENT_CODES[event.event_type]
+        columns["timestamp"][i] = event.timestamp
+        columns["value"][i] = event.value
+        columns["source"][i] = self._intern(event.source_id)
+        columns["target"][i] = self._intern(event.target_id)
+        columns["label"][i] = self._intern(details.get(label_key, "unknown")) if label_key else -1
+        columns["duration"][i] = details.get("duration", 0)
+        columns["x"][i] = position.get("x", 0)
+        columns["y"][i] = position.get("y", 0)
+        columns["positioned"][i] = details.get("positioned", False)
+        self.details.append(details)
+        self.totals[EVENT_CODES[event.event_type]] += event.value
+        self.size += 1
+        
+    def column(self, name: str) -> np.ndarray:
+        """View of a column's filled rows"""
+        return self.columns[name][:self.size]
+        
+    def mask(self, event_type: CombatEventType) -> np.ndarray:
+        """Which rows are events of the given type"""
+        return self.column("event_type") == EVENT_CODES[event_type]
+        
+    def total(self, event_type: CombatEventType) -> float:
+        return float(self.totals[EVENT_CODES[event_type]])
+        
+    def group_by_label(self, event_type: CombatEventType) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Label names, each row's group index and the row mask for an event type"""
+        mask = self.mask(event_type)
+        codes, groups = np.unique(self.column("label")[mask], return_inverse=True)
+        return [self.strings[code] for code in codes], groups, mask
+        
+    def __iter__(self) -> Iterator[CombatEvent]:
+        for i in range(self.size):
+            yield CombatEvent(
+                event_type=EVENT_TYPES[self.columns["event_type"][i]],
+                timestamp=float(self.columns["timestamp"][i]),
+                source_id=self.strings[self.columns["source"][i]],
+                target_id=self.strings[self.columns["target"][i]],
+                value=float(self.columns["value"][i]),
+                details=self.details[i]
+            )
+
 class CombatPhase(Enum):
     OPENING = "opening"
     MIDGAME = "midgame"
@@ -36,7 +165,7 @@ class CombatSession:
     session_id: str
     start_time: float
     end_time: float
-    events: List[CombatEvent]
+    events: SessionEventStore
     victory: bool
     difficulty_level: str
     player_stats: Dict[str, Any]
@@ -77,7 +206,7 @@ class CombatAnalytics:
             session_id=session_id,
             start_time=time.time(),
             end_time=0,
-            events=[],
+            events=SessionEventStore(),
             victory=False,
             difficulty_level=difficulty_level,
             player_stats=player_stats,
@@ -148,64 +277,53 @@ class CombatAnalytics:
         
     def _analyze_damage(self, session: CombatSession) -> Dict[str, Any]:
         """Analyze damage dealt and taken"""
-        damage_dealt = []
-        damage_taken = []
-        
-        for event in session.events:
-            if event.event_type == CombatEventType.DAMAGE_DEALT:
-                damage_dealt.append(event.value)
-            elif event.event_type == CombatEventType.DAMAGE_TAKEN:
-                damage_taken.append(event.value)
-                
+        events = session.events
+        values = events.column("value")
+        damage_dealt = values[events.mask(CombatEventType.DAMAGE_DEALT)]
+        damage_taken = values[events.mask(CombatEventType.DAMAGE_TAKEN)]
+        duration = (session.end_time - session.start_time) or 1
+        
         return {
-            "total_dealt": sum(damage_dealt),
-            "total_taken": sum(damage_taken),
-            "dps": sum(damage_dealt) / session.end_time - session.start_time,
-            "damage_taken_per_second": sum(damage_taken) / session.end_time - session.start_time,
-            "highest_hit": max(damage_dealt) if damage_dealt else 0,
-            "worst_hit_taken": max(damage_taken) if damage_taken else 0
+            "total_dealt": float(damage_dealt.sum()),
+            "total_taken": float(damage_taken.sum()),
+            "dps": float(damage_dealt.sum()) / duration,
+            "damage_taken_per_second": float(damage_taken.sum()) / duration,
+            "highest_hit": float(damage_dealt.max()) if len(damage_dealt) else 0,
+            "worst_hit_taken": float(damage_taken.max()) if len(damage_taken) else 0
         }
         
     def _analyze_abilities(self, session: CombatSession) -> Dict[str, Any]:
         """Analyze ability usage patterns"""
-        ability_usage = defaultdict(int)
-        ability_damage = defaultdict(list)
-        ability_timing = defaultdict(list)
-        
-        for event in session.events:
-            if event.event_type == CombatEventType.ABILITY_USED:
-                ability_name = event.details.get("ability_name", "unknown")
-                ability_usage[ability_name] += 1
-                ability_damage[ability_name].append(event.value)
-                ability_timing[ability_name].append(event.timestamp - session.start_time)
-                
+        events = session.events
+        names, groups, mask = events.group_by_label(CombatEventType.ABILITY_USED)
+        counts = np.bincount(groups, minlength=len(names))
+        damage = np.bincount(groups, weights=events.column("value")[mask], minlength=len(names))
+        timings = events.column("timestamp")[mask] - session.start_time
+        
         return {
-            "usage_counts": dict(ability_usage),
+            "usage_counts": {name: int(count) for name, count in zip(names, counts)},
             "average_damage": {
-                name: sum(damages) / len(damages)
-                for name, damages in ability_damage.items()
+                name: float(total / count)
+                for name, total, count in zip(names, damage, counts)
             },
             "timing_patterns": {
-                name: self._analyze_timing_pattern(timings)
-                for name, timings in ability_timing.items()
+                name: self._analyze_timing_pattern(timings[groups == group])
+                for group, name in enumerate(names)
             }
         }
         
     def _analyze_resources(self, session: CombatSession) -> Dict[str, Any]:
         """Analyze resource usage efficiency"""
-        resource_changes = defaultdict(list)
+        events = session.events
+        names, groups, mask = events.group_by_label(CombatEventType.RESOURCE_CHANGE)
+        changes = events.column("value")[mask]
         
-        for event in session.events:
-            if event.event_type == CombatEventType.RESOURCE_CHANGE:
-                resource_type = event.details.get("resource_type", "unknown")
-                resource_changes[resource_type].append(event.value)
-                
         return {
             resource: {
-                "total_consumed": abs(sum(changes)),
-                "efficiency": self._calculate_efficiency(changes)
+                "total_consumed": float(abs(changes[groups == group].sum())),
+                "efficiency": self._calculate_efficiency(changes[groups == group])
             }
-            for resource, changes in resource_changes.items()
+            for group, resource in enumerate(names)
         }
         
     def _analyze_phases(self, session: CombatSession) -> Dict[str, Any]:
@@ -213,101 +331,86 @@ class CombatAnalytics:
         duration = session.end_time - session.start_time
         phase_duration = duration / 3  # Simple division into three phases
         
-        phases = {
-            CombatPhase.OPENING: [],
-            CombatPhase.MIDGAME: [],
-            CombatPhase.ENDGAME: []
-        }
+        phases = [CombatPhase.OPENING, CombatPhase.MIDGAME, CombatPhase.ENDGAME]
+        relative_time = session.events.column("timestamp") - session.start_time
+        phase_index = np.digitize(relative_time, [phase_duration, phase_duration * 2])
         
-        for event in session.events:
-            relative_time = event.timestamp - session.start_time
-            if relative_time < phase_duration:
-                phases[CombatPhase.OPENING].append(event)
-            elif relative_time < phase_duration * 2:
-                phases[CombatPhase.MIDGAME].append(event)
-            else:
-                phases[CombatPhase.ENDGAME].append(event)
-                
         return {
-            phase.value: self._analyze_phase_events(events)
-            for phase, events in phases.items()
+            phase.value: self._analyze_phase_events(session.events, phase_index == i)
+            for i, phase in enumerate(phases)
         }
         
     def _analyze_positioning(self, session: CombatSession) -> Dict[str, Any]:
         """Analyze combat positioning"""
-        positions = []
+        events = session.events
+        mask = events.mask(CombatEventType.POSITION_CHANGE)
         
-        for event in session.events:
-            if event.event_type == CombatEventType.POSITION_CHANGE:
-                positions.append(event.details.get("position", {}))
-                
         return {
-            "movement_patterns": self._analyze_movement(positions),
+            "movement_patterns": self._analyze_movement(
+                events.column("x")[mask], events.column("y")[mask]
+            ),
             "positioning_effectiveness": self._calculate_positioning_effectiveness(session)
         }
         
     def _analyze_status_effects(self, session: CombatSession) -> Dict[str, Any]:
         """Analyze status effect patterns"""
-        status_effects = defaultdict(list)
-        
-        for event in session.events:
-            if event.event_type == CombatEventType.STATUS_EFFECT:
-                effect_name = event.details.get("effect_name", "unknown")
-                status_effects[effect_name].append({
-                    "timestamp": event.timestamp,
-                    "duration": event.details.get("duration", 0),
-                    "strength": event.value
-                })
-                
+        events = session.events
+        names, groups, mask = events.group_by_label(CombatEventType.STATUS_EFFECT)
+        counts = np.bincount(groups, minlength=len(names))
+        durations = np.bincount(groups, weights=events.column("duration")[mask], minlength=len(names))
+        strengths = np.bincount(groups, weights=events.column("value")[mask], minlength=len(names))
+        
         return {
             effect: {
-                "total_duration": sum(e["duration"] for e in effects),
-                "average_strength": sum(e["strength"] for e in effects) / len(effects),
-                "frequency": len(effects)
+                "total_duration": float(durations[group]),
+                "average_strength": float(strengths[group] / counts[group]),
+                "frequency": int(counts[group])
             }
-            for effect, effects in status_effects.items()
+            for group, effect in enumerate(names)
         }
         
-    def _analyze_timing_pattern(self, timings: List[float]) -> Dict[str, float]:
+    def _analyze_timing_pattern(self, timings: Sequence[float]) -> Dict[str, float]:
         """Analyze timing patterns of events"""
         if len(timings) < 2:
             return {"pattern_strength": 0, "average_interval": 0}
             
-        intervals = [t2 - t1 for t1, t2 in zip(timings[:-1], timings[1:])]
-        avg_interval = sum(intervals) / len(intervals)
-        variance = sum((i - avg_interval) ** 2 for i in intervals) / len(intervals)
+        intervals = np.diff(timings)
         
         return {
-            "pattern_strength": 1 / (1 + math.sqrt(variance)),
-            "average_interval": avg_interval
+            "pattern_strength": float(1 / (1 + intervals.std())),
+            "average_interval": float(intervals.mean())
         }
         
-    def _calculate_efficiency(self, changes: List[float]) -> float:
+    def _calculate_efficiency(self, changes: np.ndarray) -> float:
         """Calculate resource usage efficiency"""
-        if not changes:
+        if not len(changes):
             return 0
             
-        total_gain = sum(c for c in changes if c > 0)
-        total_loss = abs(sum(c for c in changes if c < 0))
+        total_gain = changes[changes > 0].sum()
+        total_loss = abs(changes[changes < 0].sum())
         
         if total_loss == 0:
             return 1.0
             
-        return total_gain / total_loss
+        return float(total_gain / total_loss)
         
-    def _analyze_phase_events(self, events: List[CombatEvent]) -> Dict[str, Any]:
+    def _analyze_phase_events(self, events: SessionEventStore, mask: np.ndarray) -> Dict[str, Any]:
         """Analyze events within a combat phase"""
-        if not events:
+        if not mask.any():
             return {"intensity": 0, "effectiveness": 0}
             
-        damage_dealt = sum(e.value for e in events 
-                          if e.event_type == CombatEventType.DAMAGE_DEALT)
-        damage_taken = sum(e.value for e in events 
-                          if e.event_type == CombatEventType.DAMAGE_TAKEN)
-        abilities_used = sum(1 for e in events 
-                           if e.event_type == CombatEventType.ABILITY_USED)
-                           
-        duration = events[-1].timestamp - events[0].timestamp if len(events) > 1 else 1
+        event_types = events.column("event_type")[mask]
+        values = events.column("value")[mask]
+        timestamps = events.column("timestamp")[mask]
+        
+        damage_dealt = float(values[event_types == EVENT_CODES[CombatEventType.DAMAGE_DEALT]].sum())
+        damage_taken = float(values[event_types == EVENT_CODES[CombatEventType.DAMAGE_TAKEN]].sum())
+        abilities_used = int(np.count_nonzero(
+            event_types == EVENT_CODES[CombatEventType.ABILITY_USED]
+        ))
+        
+        duration = float(timestamps[-1] - timestamps[0]) if len(timestamps) > 1 else 1
+        duration = duration or 1
         
         return {
             "intensity": (damage_dealt + damage_taken) / duration,
@@ -315,20 +418,16 @@ class CombatAnalytics:
             "ability_frequency": abilities_used / duration
         }
         
-    def _analyze_movement(self, positions: List[Dict[str, float]]) -> Dict[str, Any]:
+    def _analyze_movement(self, x: np.ndarray, y: np.ndarray) -> Dict[str, Any]:
         """Analyze movement patterns"""
-        if len(positions) < 2:
+        if len(x) < 2:
             return {"total_distance": 0, "average_speed": 0}
             
-        distances = []
-        for p1, p2 in zip(positions[:-1], positions[1:]):
-            dx = p2.get("x", 0) - p1.get("x", 0)
-            dy = p2.get("y", 0) - p1.get("y", 0)
-            distances.append(math.sqrt(dx*dx + dy*dy))
-            
+        distances = np.hypot(np.diff(x), np.diff(y))
+        
         return {
-            "total_distance": sum(distances),
-            "average_speed": sum(distances) / len(distances)
+            "total_distance": float(distances.sum()),
+            "average_speed": float(distances.mean())
         }
         
     def _calculate_positioning_effectiveness(
@@ -336,20 +435,20 @@ class CombatAnalytics:
         session: CombatSession
     ) -> Dict[str, float]:
         """Calculate effectiveness of positioning"""
-        damage_events = [e for e in session.events 
-                        if e.event_type in [CombatEventType.DAMAGE_DEALT,
-                                          CombatEventType.DAMAGE_TAKEN]]
-                                          
-        if not damage_events:
+        events = session.events
+        damage_mask = (events.mask(CombatEventType.DAMAGE_DEALT) |
+                       events.mask(CombatEventType.DAMAGE_TAKEN))
+                       
+        if not damage_mask.any():
             return {"effectiveness": 0}
             
         # Calculate damage ratio based on positioning
-        positioned_damage = sum(e.value for e in damage_events
-                              if e.details.get("positioned", False))
-        total_damage = sum(e.value for e in damage_events)
+        values = events.column("value")
+        positioned_damage = values[damage_mask & events.column("positioned")].sum()
+        total_damage = values[damage_mask].sum()
         
         return {
-            "effectiveness": positioned_damage / total_damage if total_damage > 0 else 0
+            "effectiveness": float(positioned_damage / total_damage) if total_damage > 0 else 0
         }
         
     def get_session_summary(self, session_id: str) -> Optional[Dict[str, Any]]:
@@ -369,32 +468,28 @@ class CombatAnalytics:
         if not sessions:
             return {"status": "no_data"}
             
+        victories = np.array([s.victory for s in sessions], dtype=bool)
+        durations = np.array([s.end_time - s.start_time for s in sessions])
+        totals = np.array([s.events.totals for s in sessions])
+        
         trends = {
-            "victory_rate": sum(1 for s in sessions if s.victory) / len(sessions),
-            "average_duration": sum(s.end_time - s.start_time for s in sessions) / len(sessions),
-            "damage_trends": self._analyze_damage_trends(sessions),
+            "victory_rate": float(victories.mean()),
+            "average_duration": float(durations.mean()),
+            "damage_trends": self._analyze_damage_trends(totals),
             "ability_trends": self._analyze_ability_trends(sessions),
-            "improvement_rate": self._calculate_improvement_rate(sessions)
+            "improvement_rate": self._calculate_improvement_rate(totals, victories)
         }
         
         return trends
         
     def _analyze_damage_trends(
         self,
-        sessions: List[CombatSession]
+        totals: np.ndarray
     ) -> Dict[str, List[float]]:
         """Analyze damage trends across sessions"""
         return {
-            "damage_dealt": [
-                sum(e.value for e in s.events 
-                    if e.event_type == CombatEventType.DAMAGE_DEALT)
-                for s in sessions
-            ],
-            "damage_taken": [
-                sum(e.value for e in s.events 
-                    if e.event_type == CombatEventType.DAMAGE_TAKEN)
-                for s in sessions
-            ]
+            "damage_dealt": totals[:, EVENT_CODES[CombatEventType.DAMAGE_DEALT]].tolist(),
+            "damage_taken": totals[:, EVENT_CODES[CombatEventType.DAMAGE_TAKEN]].tolist()
         }
         
     def _analyze_ability_trends(
@@ -405,49 +500,47 @@ class CombatAnalytics:
         ability_trends = defaultdict(lambda: defaultdict(list))
         
         for session in sessions:
-            ability_counts = defaultdict(int)
-            for event in session.events:
-                if event.event_type == CombatEventType.ABILITY_USED:
-                    ability_name = event.details.get("ability_name", "unknown")
-                    ability_counts[ability_name] += 1
-                    
-            for ability, count in ability_counts.items():
-                ability_trends[ability]["usage"].append(count)
+            names, groups, _ = session.events.group_by_label(CombatEventType.ABILITY_USED)
+            for ability, count in zip(names, np.bincount(groups, minlength=len(names))):
+                ability_trends[ability]["usage"].append(int(count))
                 
         return dict(ability_trends)
         
     def _calculate_improvement_rate(
         self,
-        sessions: List[CombatSession]
+        totals: np.ndarray,
+        victories: np.ndarray
     ) -> Dict[str, float]:
         """Calculate rate of improvement across sessions"""
-        if len(sessions) < 2:
+        if len(totals) < 2:
             return {"rate": 0}
             
         # Calculate performance scores for each session
-        scores = []
-        for session in sessions:
-            damage_dealt = sum(e.value for e in session.events 
-                             if e.event_type == CombatEventType.DAMAGE_DEALT)
-            damage_taken = sum(e.value for e in session.events 
-                             if e.event_type == CombatEventType.DAMAGE_TAKEN)
-            duration = session.end_time - session.start_time
-            
-            score = (damage_dealt / (damage_taken + 1)) * (1 + 0.1 * session.victory)
-            scores.append(score)
-            
-        # Calculate improvement rate
-        improvement_rates = [
-            (s2 - s1) / s1 for s1, s2 in zip(scores[:-1], scores[1:])
-        ]
+        damage_dealt = totals[:, EVENT_CODES[CombatEventType.DAMAGE_DEALT]]
+        damage_taken = totals[:, EVENT_CODES[CombatEventType.DAMAGE_TAKEN]]
+        scores = (damage_dealt / (damage_taken + 1)) * (1 + 0.1 * victories)
+        
+        # Calculate improvement rate, skipping sessions with no damage
+        previous = scores[:-1]
+        scored = previous != 0
+        improvement_rates = (scores[1:][scored] - previous[scored]) / previous[scored]
         
         return {
-            "rate": sum(improvement_rates) / len(improvement_rates)
-            if improvement_rates else 0
+            "rate": float(improvement_rates.mean())
+            if len(improvement_rates) else 0
         }
         
     def export_analytics(self, file_path: str):
-        """Export analytics data"""
+        """Export analytics data.
+        
+        Paths ending in .npz get a compressed columnar archive holding
+        every session's event columns back to back. Any other path gets
+        JSON.
+        """
+        if file_path.endswith(".npz"):
+            self._export_columnar(file_path)
+            return
+            
         data = {
             "sessions": [
                 {
@@ -475,31 +568,98 @@ class CombatAnalytics:
         with open(file_path, "w") as f:
             json.dump(data, f, indent=4)
             
+    def _export_columnar(self, file_path: str):
+        """Write all sessions as concatenated NumPy columns"""
+        stores = [session.events for session in self.sessions]
+        columns = {
+            name: np.concatenate([store.column(name) for store in stores])
+            if stores else np.zeros(0, dtype)
+            for name, dtype in SessionEventStore.COLUMNS.items()
+        }
+        metadata = [
+            {
+                "session_id": session.session_id,
+                "start_time": session.start_time,
+                "end_time": session.end_time,
+                "victory": session.victory,
+                "difficulty_level": session.difficulty_level,
+                "player_stats": session.player_stats,
+                "enemy_stats": session.enemy_stats,
+                "strings": session.events.strings,
+                # Only events with extra details are stored, by row
+                "details": {
+                    i: details for i, details in enumerate(session.events.details) if details
+                }
+            }
+            for session in self.sessions
+        ]
+        
+        np.savez_compressed(
+            file_path,
+            event_counts=np.array([len(store) for store in stores], dtype=np.int64),
+            sessions=np.array(json.dumps(metadata)),
+            **columns
+        )
+        
     def import_analytics(self, file_path: str):
         """Import analytics data"""
+        if file_path.endswith(".npz"):
+            self._import_columnar(file_path)
+            return
+            
         with open(file_path, "r") as f:
             data = json.load(f)
             
-        self.sessions = [
-            CombatSession(
+        self.sessions = []
+        for s in data["sessions"]:
+            events = SessionEventStore(capacity=len(s["events"]))
+            for e in s["events"]:
+                events.append(CombatEvent(
+                    event_type=CombatEventType(e["event_type"]),
+                    timestamp=e["timestamp"],
+                    source_id=e["source_id"],
+                    target_id=e["target_id"],
+                    value=e["value"],
+                    details=e["details"]
+                ))
+                
+            self.sessions.append(CombatSession(
                 session_id=s["session_id"],
                 start_time=s["start_time"],
                 end_time=s["end_time"],
                 victory=s["victory"],
                 difficulty_level=s["difficulty_level"],
-                events=[
-                    CombatEvent(
-                        event_type=CombatEventType(e["event_type"]),
-                        timestamp=e["timestamp"],
-                        source_id=e["source_id"],
-                        target_id=e["target_id"],
-                        value=e["value"],
-                        details=e["details"]
-                    )
-                    for e in s["events"]
-                ],
+                events=events,
                 player_stats={},  # These would need to be stored in the export
                 enemy_stats={}    # These would need to be stored in the export
-            )
-            for s in data["sessions"]
-        ] 
\ No newline at end of file
+            ))
+            
+    def _import_columnar(self, file_path: str):
+        """Read sessions written by _export_columnar"""
+        with np.load(file_path) as data:
+            metadata = json.loads(str(data["sessions"]))
+            offsets = np.concatenate([[0], np.cumsum(data["event_counts"])])
+            columns = {name: data[name] for name in SessionEventStore.COLUMNS}
+            
+        self.sessions = []
+        for i, s in enumerate(metadata):
+            start, end = offsets[i], offsets[i + 1]
+            details = [{} for _ in range(end - start)]
+            for row, row_details in s["details"].items():
+                details[int(row)] = row_details
+                
+            self.sessions.append(CombatSession(
+                session_id=s["session_id"],
+                start_time=s["start_time"],
+                end_time=s["end_time"],
+                victory=s["victory"],
+                difficulty_level=s["difficulty_level"],
+                events=SessionEventStore.from_columns(
+                    {name: column[start:end] for name, column in columns.items()},
+                    s["strings"],
+                    details
+                ),
+                player_stats=s["player_stats"],
+                enemy_stats=s["enemy_stats"]
+            ))
+            
\ No newline at end of file
@@ -35,4 +35,10 @@ class EconomicSystem:
     def update_market(self, game_time: int):
         """Update market prices and conditions"""
         # Market update logic here
-        pass 
\ No newline at end of file
+        pass
+
+    def fast_forward(self, game_time: int, ticks: int, tick_length: int = 1):
+        """Advance the market over several ticks at once"""
+        # Market updates carry no per-tick state yet, so only the last tick matters
+        if ticks > 0:
+            self.update_market(game_time + (ticks - 1) * tick_length)
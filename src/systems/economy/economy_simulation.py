@@ -0,0 +1,57 @@
+from typing import Dict, Optional
+import logging
+import time
+
+from economic_system import EconomicSystem
+from trading_system import TradeManager
+from weather_economic_integration import WeatherEconomicIntegration
+
+class EconomySimulation:
+    """Advances the coupled economy, trade-route and weather-economy
+    simulation, either one tick at a time or in a single batched skip"""
+
+    def __init__(
+        self,
+        economic_system: EconomicSystem,
+        trade_manager: TradeManager,
+        weather_integration: Optional[WeatherEconomicIntegration] = None,
+        tick_length: int = 1
+    ):
+        self.economic_system = economic_system
+        self.trade_manager = trade_manager
+        self.weather_integration = weather_integration
+        self.tick_length = tick_length
+        self.logger = logging.getLogger("EconomySimulation")
+
+    def step(self, game_time: int):
+        """Advance every subsystem by a single tick"""
+        self.economic_system.update_market(game_time)
+        self.trade_manager.update_market_conditions(game_time)
+        self.trade_manager.update_trade_routes(game_time)
+        if self.weather_integration:
+            self.weather_integration.update(self.tick_length)
+
+    def fast_forward(self, game_time: int, ticks: int) -> Dict[str, float]:
+        """Advance the simulation by ``ticks`` ticks starting at ``game_time``.
+
+        Produces the same end state as calling ``step`` for each of the
+        skipped ticks, within floating point tolerance. Used for resting,
+        fast travel and offline time skips.
+        """
+        if ticks <= 0:
+            return {"ticks": 0, "end_time": game_time, "elapsed": 0.0}
+
+        start = time.perf_counter()
+        self.economic_system.fast_forward(game_time, ticks, self.tick_length)
+        self.trade_manager.fast_forward_market_conditions(game_time, ticks, self.tick_length)
+        self.trade_manager.fast_forward_trade_routes(game_time, ticks, self.tick_length)
+        if self.weather_integration:
+            self.weather_integration.fast_forward(self.tick_length, ticks)
+        elapsed = time.perf_counter() - start
+
+        self.logger.info(f"Fast-forwarded economy by {ticks} ticks in {elapsed * 1000:.1f}ms")
+        return {
+            "ticks": ticks,
+            "end_time": game_time + ticks * self.tick_length,
+            "elapsed": elapsed
+        }
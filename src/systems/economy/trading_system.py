@@ -1,7 +1,8 @@
 from enum import Enum
-from typing import Dict, List, Optional, Set, Tuple, NamedTuple
+from typing import Any, Dict, List, Optional, Set, Tuple, NamedTuple
 from dataclasses import dataclass
 import random
+import numpy as np
 from visual_system import VisualSystem, TextColor
 from faction_system import FactionType, FactionAlignment
 
@@ -189,6 +190,161 @@ class Merchant:
         if self.item_prices is None:
             self.item_prices = {} 
 
+SEASONS = ("spring", "summer", "autumn", "winter")
+
+# Seasonal effects on different item types; anything not listed trades at 1.0
+SEASONAL_EFFECTS: Dict[str, Dict[TradeItemType, float]] = {
+    "spring": {
+        TradeItemType.ESSENCE: 1.2,
+        TradeItemType.GEM: 0.9,
+        TradeItemType.MATERIAL: 0.8
+    },
+    "summer": {
+        TradeItemType.WEAPON: 0.9,
+        TradeItemType.ARMOR: 0.9,
+        TradeItemType.POTION: 1.1
+    },
+    "autumn": {
+        TradeItemType.FOOD: 0.7,
+        TradeItemType.MATERIAL: 1.2,
+        TradeItemType.SCROLL: 1.1
+    },
+    "winter": {
+        TradeItemType.FOOD: 1.3,
+        TradeItemType.ESSENCE: 0.8,
+        TradeItemType.ARTIFACT: 1.2
+    }
+}
+
+TREND_FLUCTUATIONS: Dict[MarketTrend, float] = {
+    MarketTrend.CRASHING: 0.6,
+    MarketTrend.DECLINING: 0.8,
+    MarketTrend.STABLE: 1.0,
+    MarketTrend.GROWING: 1.2,
+    MarketTrend.BOOMING: 1.4
+}
+
+ITEM_TYPES: Tuple[TradeItemType, ...] = tuple(TradeItemType)
+ITEM_TYPE_INDEX: Dict[TradeItemType, int] = {
+    item_type: index for index, item_type in enumerate(ITEM_TYPES)
+}
+
+# season x item type lookup, built once instead of on every market tick
+SEASONAL_MATRIX = np.array([
+    [SEASONAL_EFFECTS[season].get(item_type, 1.0) for item_type in ITEM_TYPES]
+    for season in SEASONS
+])
+
+class MarketTrendHistory:
+    """Fixed-size ring buffer of market modifiers for every item type.
+
+    Each row holds the history of one ``TradeItemType``.  The percentage
+    changes between consecutive samples are kept in a second ring together
+    with their running sum, so the average change (and therefore the trend)
+    is available in O(1) instead of being rebuilt from the whole history.
+    """
+
+    def __init__(self, size: int = 30, min_samples: int = 5):
+        self.size = size
+        self.min_samples = min_samples
+        n_types = len(ITEM_TYPES)
+        self.values = np.ones((n_types, size))
+        self.changes = np.zeros((n_types, size - 1))
+        self.change_sum = np.zeros(n_types)
+        self.count = 0  # samples recorded, capped at size
+        self.head = 0   # next write slot in values
+        self.change_head = 0
+
+    def __contains__(self, item_type: TradeItemType) -> bool:
+        return self.count > 0 and item_type in ITEM_TYPE_INDEX
+
+    def __getitem__(self, item_type: TradeItemType) -> List[float]:
+        return self.history(item_type)
+
+    def history(self, item_type: TradeItemType) -> List[float]:
+        """Return the recorded modifiers for an item type, oldest first"""
+        row = self.values[ITEM_TYPE_INDEX[item_type]]
+        order = (self.head - self.count + np.arange(self.count)) % self.size
+        return row[order].tolist()
+
+    def latest(self) -> np.ndarray:
+        """Most recently recorded modifier per item type"""
+        return self.values[:, (self.head - 1) % self.size]
+
+    def push(self, modifiers: np.ndarray):
+        """Record one modifier per item type"""
+        change_count = max(self.count - 1, 0)
+        if self.count > 0:
+            previous = self.latest()
+            change = (modifiers - previous) / previous
+            if change_count == self.size - 1:
+                # Ring is full: the oldest change drops out of the window
+                self.change_sum -= self.changes[:, self.change_head]
+            self.changes[:, self.change_head] = change
+            self.change_sum += change
+            self.change_head = (self.change_head + 1) % (self.size - 1)
+
+        self.values[:, self.head] = modifiers
+        self.head = (self.head + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def is_settled(self, modifiers: np.ndarray) -> bool:
+        """Whether pushing ``modifiers`` again would leave the window unchanged"""
+        return (
+            self.count == self.size
+            and not self.changes.any()
+            and bool(np.all(self.values == modifiers[:, None]))
+        )
+
+    def fill(self, modifiers: np.ndarray):
+        """Reset the window to a plateau of identical ``modifiers``"""
+        self.values[:] = modifiers[:, None]
+        self.changes[:] = 0.0
+        self.change_sum[:] = 0.0
+        self.count = self.size
+        self.head = 0
+        self.change_head = 0
+
+    def average_changes(self) -> np.ndarray:
+        """Mean percentage change per item type over the window"""
+        change_count = max(self.count - 1, 1)
+        return self.change_sum / change_count
+
+    def trend_fluctuations(self) -> np.ndarray:
+        """Vectorized equivalent of classifying every trend and mapping it
+        through ``TREND_FLUCTUATIONS``"""
+        if self.count < self.min_samples:
+            return np.full(len(ITEM_TYPES), TREND_FLUCTUATIONS[MarketTrend.STABLE])
+        avg_change = self.average_changes()
+        return np.select(
+            [avg_change < -0.2, avg_change < -0.1, avg_change > 0.2, avg_change > 0.1],
+            [
+                TREND_FLUCTUATIONS[MarketTrend.CRASHING],
+                TREND_FLUCTUATIONS[MarketTrend.DECLINING],
+                TREND_FLUCTUATIONS[MarketTrend.BOOMING],
+                TREND_FLUCTUATIONS[MarketTrend.GROWING]
+            ],
+            default=TREND_FLUCTUATIONS[MarketTrend.STABLE]
+        )
+
+    def trend(self, item_type: TradeItemType) -> MarketTrend:
+        """Classify the trend of a single item type"""
+        if self.count < self.min_samples:
+            return MarketTrend.STABLE
+        index = ITEM_TYPE_INDEX[item_type]
+        avg_change = self.change_sum[index] / (self.count - 1)
+
+        if avg_change < -0.2:
+            return MarketTrend.CRASHING
+        elif avg_change < -0.1:
+            return MarketTrend.DECLINING
+        elif avg_change > 0.2:
+            return MarketTrend.BOOMING
+        elif avg_change > 0.1:
+            return MarketTrend.GROWING
+        else:
+            return MarketTrend.STABLE
+
 @dataclass
 class TradeManager:
     """Manages all trading-related functionality"""
@@ -218,7 +374,7 @@ class TradeManager:
             }
         if self.market_state is None:
             self.market_state = {
-                "price_trends": {},
+                "price_trends": MarketTrendHistory(),
                 "current_events": [],
                 "supply_demand": {}
             }
@@ -451,95 +607,94 @@ class TradeManager:
 
     def update_market_conditions(self, game_time: int):
         """Enhanced market condition updates"""
-        # Update base supply and demand
-        for item_type in TradeItemType:
-            # Calculate trend
-            current_trend = self._calculate_market_trend(item_type)
-            
-            # Apply trend-based modification
-            base_fluctuation = self._get_trend_fluctuation(current_trend)
-            seasonal_modifier = self._get_seasonal_modifier(game_time, item_type)
-            event_modifier = self._get_event_modifier(item_type)
-            
-            final_modifier = base_fluctuation * seasonal_modifier * event_modifier
-            self.market_state["supply_demand"][item_type] = final_modifier
-            
-            # Store trend for history
-            if item_type not in self.market_state["price_trends"]:
-                self.market_state["price_trends"][item_type] = []
-            self.market_state["price_trends"][item_type].append(final_modifier)
-            
-            # Keep only last 30 data points
-            if len(self.market_state["price_trends"][item_type]) > 30:
-                self.market_state["price_trends"][item_type].pop(0)
+        # Update supply and demand for every item type in one step
+        history: MarketTrendHistory = self.market_state["price_trends"]
+        season_index = SEASONS.index(self._get_current_season(game_time))
+
+        final_modifiers = (
+            history.trend_fluctuations()
+            * SEASONAL_MATRIX[season_index]
+            * self._get_event_modifiers()
+        )
+        self.market_state["supply_demand"].update(
+            zip(ITEM_TYPES, final_modifiers.tolist())
+        )
+
+        # Store trend for history (ring buffer keeps the last 30 points)
+        history.push(final_modifiers)
+
+    def fast_forward_market_conditions(self, game_time: int, ticks: int, tick_length: int = 1):
+        """Advance market conditions over several ticks at once.
+
+        Equivalent to calling ``update_market_conditions`` for every tick
+        from ``game_time`` in steps of ``tick_length``. Seasonal and event
+        modifiers are resolved for the whole span up front, leaving only the
+        trend feedback to be stepped.
+        """
+        if ticks <= 0:
+            return
+
+        history: MarketTrendHistory = self.market_state["price_trends"]
+        game_times = game_time + tick_length * np.arange(ticks)
+        season_indices = self._get_season_indices(game_times)
+        event_modifiers = self._get_event_modifiers()
+
+        # Within a season the base modifiers are constant, so once the history
+        # has settled on them every further tick is a no-op and can be skipped.
+        # Settling from one season's plateau into the next always takes the
+        # same number of ticks, so repeated season changes are replayed from
+        # that count instead of being stepped again.
+        settle_ticks: Dict[Tuple[int, int], int] = {}
+        previous_base = previous_season = None
+        run_starts = np.flatnonzero(np.diff(season_indices)) + 1
+        run_lengths = np.diff(np.concatenate(([0], run_starts, [ticks])))
+        run_seasons = season_indices[np.concatenate(([0], run_starts))]
+
+        for season, run_length in zip(run_seasons.tolist(), run_lengths.tolist()):
+            base_modifiers = SEASONAL_MATRIX[season] * event_modifiers
+            from_plateau = previous_base is not None and history.is_settled(previous_base)
+            transition = (previous_season, season) if from_plateau else None
+            previous_base, previous_season = base_modifiers, season
+
+            if transition in settle_ticks and settle_ticks[transition] <= run_length:
+                history.fill(base_modifiers)
+                continue
+
+            for tick in range(run_length):
+                if history.is_settled(base_modifiers):
+                    if transition:
+                        settle_ticks[transition] = tick
+                    break
+                final_modifiers = history.trend_fluctuations() * base_modifiers
+                history.push(final_modifiers)
+
+        self.market_state["supply_demand"].update(
+            zip(ITEM_TYPES, history.latest().tolist())
+        )
 
     def _calculate_market_trend(self, item_type: TradeItemType) -> MarketTrend:
         """Calculate market trend based on price history"""
-        if item_type not in self.market_state["price_trends"]:
-            return MarketTrend.STABLE
-            
-        history = self.market_state["price_trends"][item_type]
-        if len(history) < 5:
-            return MarketTrend.STABLE
-            
-        # Calculate recent price changes
-        recent_changes = [
-            (history[i] - history[i-1]) / history[i-1]
-            for i in range(1, len(history))
-        ]
-        avg_change = sum(recent_changes) / len(recent_changes)
-        
-        if avg_change < -0.2:
-            return MarketTrend.CRASHING
-        elif avg_change < -0.1:
-            return MarketTrend.DECLINING
-        elif avg_change > 0.2:
-            return MarketTrend.BOOMING
-        elif avg_change > 0.1:
-            return MarketTrend.GROWING
-        else:
-            return MarketTrend.STABLE
+        return self.market_state["price_trends"].trend(item_type)
 
     def _get_trend_fluctuation(self, trend: MarketTrend) -> float:
         """Get price fluctuation based on market trend"""
-        fluctuations = {
-            MarketTrend.CRASHING: 0.6,
-            MarketTrend.DECLINING: 0.8,
-            MarketTrend.STABLE: 1.0,
-            MarketTrend.GROWING: 1.2,
-            MarketTrend.BOOMING: 1.4
-        }
-        return fluctuations.get(trend, 1.0)
+        return TREND_FLUCTUATIONS.get(trend, 1.0)
 
     def _get_seasonal_modifier(self, game_time: int, item_type: TradeItemType) -> float:
         """Get seasonal price modifier"""
         season = self._get_current_season(game_time)
-        
-        # Define seasonal effects on different item types
-        seasonal_effects = {
-            "spring": {
-                TradeItemType.ESSENCE: 1.2,
-                TradeItemType.GEM: 0.9,
-                TradeItemType.MATERIAL: 0.8
-            },
-            "summer": {
-                TradeItemType.WEAPON: 0.9,
-                TradeItemType.ARMOR: 0.9,
-                TradeItemType.POTION: 1.1
-            },
-            "autumn": {
-                TradeItemType.FOOD: 0.7,
-                TradeItemType.MATERIAL: 1.2,
-                TradeItemType.SCROLL: 1.1
-            },
-            "winter": {
-                TradeItemType.FOOD: 1.3,
-                TradeItemType.ESSENCE: 0.8,
-                TradeItemType.ARTIFACT: 1.2
-            }
-        }
-        
-        return seasonal_effects.get(season, {}).get(item_type, 1.0)
+        return SEASONAL_EFFECTS.get(season, {}).get(item_type, 1.0)
+
+    def _get_event_modifiers(self) -> np.ndarray:
+        """Get event-based price modifiers for every item type"""
+        modifiers = np.ones(len(ITEM_TYPES))
+
+        for event in self.market_state["current_events"]:
+            for item_type, modifier in event.modifiers.items():
+                if item_type in ITEM_TYPE_INDEX:
+                    modifiers[ITEM_TYPE_INDEX[item_type]] *= modifier
+
+        return modifiers
 
     def _get_event_modifier(self, item_type: TradeItemType) -> float:
         """Get event-based price modifier"""
@@ -565,6 +720,11 @@ class TradeManager:
         else:  # Winter: days 270-364
             return "winter"
 
+    def _get_season_indices(self, game_times: np.ndarray) -> np.ndarray:
+        """Vectorized ``_get_current_season``, returning indices into SEASONS"""
+        day_of_year = np.asarray(game_times) % 365
+        return np.searchsorted([90, 180, 270], day_of_year, side="right")
+
     def update_trade_routes(self, game_time: int):
         """Update trade route conditions and apply seasonal effects"""
         current_season = self._get_current_season(game_time)
@@ -580,6 +740,45 @@ class TradeManager:
                     route.risk_level *= crisis.effects.get("route_safety", 1.0)
                     route.maintenance_cost *= crisis.effects.get("transport_cost", 1.0)
 
+    def fast_forward_trade_routes(self, game_time: int, ticks: int, tick_length: int = 1):
+        """Apply several ticks of ``update_trade_routes`` at once.
+
+        Route updates are purely multiplicative, so the per-tick factors are
+        raised to the number of ticks spent in each season instead of being
+        applied one tick at a time.
+        """
+        if ticks <= 0 or not self.trade_network:
+            return
+
+        routes = list(self.trade_network.values())
+        game_times = game_time + tick_length * np.arange(ticks)
+        season_counts = np.bincount(
+            self._get_season_indices(game_times),
+            minlength=len(SEASONS)
+        )
+
+        seasonal = np.array([
+            [route.seasonal_modifiers.get(season, 1.0) for season in SEASONS]
+            for route in routes
+        ])
+        safety = np.ones(len(routes))
+        transport = np.ones(len(routes))
+        for crisis in self.active_crises:
+            affected = np.array([
+                route.start_location in crisis.affected_regions or
+                route.end_location in crisis.affected_regions
+                for route in routes
+            ])
+            safety[affected] *= crisis.effects.get("route_safety", 1.0)
+            transport[affected] *= crisis.effects.get("transport_cost", 1.0)
+
+        cost_factors = np.prod(seasonal ** season_counts, axis=1) * transport ** ticks
+        risk_factors = safety ** ticks
+
+        for route, cost_factor, risk_factor in zip(routes, cost_factors, risk_factors):
+            route.maintenance_cost *= float(cost_factor)
+            route.risk_level *= float(risk_factor)
+
     def calculate_route_profit(self, route_id: str, cargo: Dict[str, int]) -> float:
         """Calculate potential profit for a trade route"""
         if route_id not in self.trade_network:
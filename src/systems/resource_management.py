@@ -1,11 +1,17 @@
+from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
 import json
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
 class ResourceType(Enum):
     # Basic Resources
     GOLD = auto()
@@ -49,6 +55,165 @@ class ResourceType(Enum):
     FESTIVAL_TOKEN = auto()
     SEASONAL_ESSENCE = auto()
     EVENT_TICKET = auto()
+    
+    # Combination Products
+    CELESTIAL_SHARD = auto()
+    PRIMAL_ESSENCE = auto()
+    CHRONO_CRYSTAL = auto()
+    SPIRIT_CRYSTAL = auto()
+
+# Combination recipes: each takes the amount of every ingredient type (first
+# occurrence, as listed by the caller) plus the raw amounts, and returns the
+# output amount. 0.0 means the ratio requirements were not met.
+CombinationRecipe = Callable[[Dict[ResourceType, float], Tuple[float, ...]], float]
+
+def _astral_dust_recipe(amount: Dict[ResourceType, float], amounts: Tuple[float, ...]) -> float:
+    return sum(amounts) * 0.5
+
+def _elemental_core_recipe(amount: Dict[ResourceType, float], amounts: Tuple[float, ...]) -> float:
+    return min(amounts) * 0.3
+
+def _phoenix_feather_recipe(amount: Dict[ResourceType, float], amounts: Tuple[float, ...]) -> float:
+    # Complex formula based on ratios
+    astral_amount = amount[ResourceType.ASTRAL_DUST]
+    temporal_amount = amount[ResourceType.TEMPORAL_SHARD]
+    divine_amount = amount[ResourceType.DIVINE_ESSENCE]
+    if astral_amount >= 5.0 and temporal_amount >= 2.0 and divine_amount >= 1.0:
+        return min(astral_amount/5.0, temporal_amount/2.0, divine_amount) * 0.5
+    return 0.0
+
+def _dragon_scale_recipe(amount: Dict[ResourceType, float], amounts: Tuple[float, ...]) -> float:
+    # Requires specific ratios (2:1:1)
+    mana_amount = amount[ResourceType.MANA_CRYSTAL]
+    soul_amount = amount[ResourceType.SOUL_SHARD]
+    void_amount = amount[ResourceType.VOID_ESSENCE]
+    if mana_amount >= 4.0 and soul_amount >= 2.0 and void_amount >= 2.0:
+        return min(mana_amount/4.0, soul_amount/2.0, void_amount/2.0)
+    return 0.0
+
+def _chaos_fragment_recipe(amount: Dict[ResourceType, float], amounts: Tuple[float, ...]) -> float:
+    # Exponential scaling with diminishing returns
+    core_amount = amount[ResourceType.ELEMENTAL_CORE]
+    rune_amount = amount[ResourceType.RUNIC_ESSENCE]
+    base_output = min(core_amount, rune_amount) * 0.4
+    bonus = min(1.0, (max(core_amount, rune_amount) - min(core_amount, rune_amount)) * 0.1)
+    return base_output * (1.0 + bonus)
+
+def _event_ticket_recipe(amount: Dict[ResourceType, float], amounts: Tuple[float, ...]) -> float:
+    # Linear scaling with minimum threshold
+    essence_amount = amount[ResourceType.SEASONAL_ESSENCE]
+    token_amount = amount[ResourceType.FESTIVAL_TOKEN]
+    if essence_amount >= 10.0 and token_amount >= 5.0:
+        return min(essence_amount/10.0, token_amount/5.0)
+    return 0.0
+
+def _guild_mark_recipe(amount: Dict[ResourceType, float], amounts: Tuple[float, ...]) -> float:
+    # Requires any two faction tokens
+    total_tokens = sum(amounts)
+    if total_tokens >= 5.0:
+        return total_tokens * 0.2
+    return 0.0
+
+def _celestial_shard_recipe(amount: Dict[ResourceType, float], amounts: Tuple[float, ...]) -> float:
+    divine_amount = amount[ResourceType.DIVINE_ESSENCE]
+    phoenix_amount = amount[ResourceType.PHOENIX_FEATHER]
+    if divine_amount >= 3.0 and phoenix_amount >= 1.0:
+        return min(divine_amount/3.0, phoenix_amount) * 0.3
+    return 0.0
+
+def _primal_essence_recipe(amount: Dict[ResourceType, float], amounts: Tuple[float, ...]) -> float:
+    core_amount = amount[ResourceType.ELEMENTAL_CORE]
+    mana_amount = amount[ResourceType.MANA_CRYSTAL]
+    void_amount = amount[ResourceType.VOID_ESSENCE]
+    if core_amount >= 2.0 and mana_amount >= 5.0 and void_amount >= 1.0:
+        return min(core_amount/2.0, mana_amount/5.0, void_amount) * 0.4
+    return 0.0
+
+def _chrono_crystal_recipe(amount: Dict[ResourceType, float], amounts: Tuple[float, ...]) -> float:
+    temporal_amount = amount[ResourceType.TEMPORAL_SHARD]
+    astral_amount = amount[ResourceType.ASTRAL_DUST]
+    if temporal_amount >= 1.0 and astral_amount >= 3.0:
+        base = min(temporal_amount, astral_amount/3.0)
+        return base * (1.0 + min(1.0, (max(temporal_amount, astral_amount/3.0) - base) * 0.2))
+    return 0.0
+
+def _spirit_crystal_recipe(amount: Dict[ResourceType, float], amounts: Tuple[float, ...]) -> float:
+    soul_amount = amount[ResourceType.SOUL_SHARD]
+    divine_amount = amount[ResourceType.DIVINE_ESSENCE]
+    void_amount = amount[ResourceType.VOID_ESSENCE]
+    if soul_amount >= 3.0 and divine_amount >= 1.0 and void_amount >= 2.0:
+        return (min(soul_amount/3.0, divine_amount, void_amount/2.0) * 0.5) * \
+               (1.0 + (max(soul_amount/3.0, divine_amount, void_amount/2.0) * 0.1))
+    return 0.0
+
+COMBINATION_RECIPES: Dict[Tuple[FrozenSet[ResourceType], ResourceType], CombinationRecipe] = {
+    # Basic combinations
+    (frozenset({ResourceType.MANA_CRYSTAL, ResourceType.VOID_ESSENCE}),
+     ResourceType.ASTRAL_DUST): _astral_dust_recipe,
+    (frozenset({ResourceType.SOUL_SHARD, ResourceType.MANA}),
+     ResourceType.ELEMENTAL_CORE): _elemental_core_recipe,
+    
+    # Advanced combinations
+    (frozenset({ResourceType.ASTRAL_DUST, ResourceType.TEMPORAL_SHARD, ResourceType.DIVINE_ESSENCE}),
+     ResourceType.PHOENIX_FEATHER): _phoenix_feather_recipe,
+    (frozenset({ResourceType.MANA_CRYSTAL, ResourceType.SOUL_SHARD, ResourceType.VOID_ESSENCE}),
+     ResourceType.DRAGON_SCALE): _dragon_scale_recipe,
+    (frozenset({ResourceType.ELEMENTAL_CORE, ResourceType.RUNIC_ESSENCE}),
+     ResourceType.CHAOS_FRAGMENT): _chaos_fragment_recipe,
+    
+    # Seasonal combinations
+    (frozenset({ResourceType.SEASONAL_ESSENCE, ResourceType.FESTIVAL_TOKEN}),
+     ResourceType.EVENT_TICKET): _event_ticket_recipe,
+    
+    # Divine, elemental, temporal and spirit combinations
+    (frozenset({ResourceType.DIVINE_ESSENCE, ResourceType.PHOENIX_FEATHER}),
+     ResourceType.CELESTIAL_SHARD): _celestial_shard_recipe,
+    (frozenset({ResourceType.ELEMENTAL_CORE, ResourceType.MANA_CRYSTAL, ResourceType.VOID_ESSENCE}),
+     ResourceType.PRIMAL_ESSENCE): _primal_essence_recipe,
+    (frozenset({ResourceType.TEMPORAL_SHARD, ResourceType.ASTRAL_DUST}),
+     ResourceType.CHRONO_CRYSTAL): _chrono_crystal_recipe,
+    (frozenset({ResourceType.SOUL_SHARD, ResourceType.DIVINE_ESSENCE, ResourceType.VOID_ESSENCE}),
+     ResourceType.SPIRIT_CRYSTAL): _spirit_crystal_recipe
+}
+
+# Faction combinations accept any mix containing at least two faction tokens
+FACTION_TOKENS = frozenset({
+    ResourceType.KNIGHT_INSIGNIA, ResourceType.MAGE_SEAL, ResourceType.RANGER_TOKEN
+})
+
+RESOURCE_INDEX: Dict[ResourceType, int] = {
+    resource_type: index for index, resource_type in enumerate(ResourceType)
+}
+
+# Number of lock stripes shared by all containers of a ResourceManager
+LOCK_STRIPES = 64
+
+# Relative slack when comparing chained conversion rates, so rounding on
+# break-even cycles is neither taken as an improvement nor as profit
+CHAIN_RATE_TOLERANCE = 1e-9
+
+# Amounts are bucketed to this many decimals before lookup so that repeated
+# crafts of the same combination share a memo entry
+AMOUNT_PRECISION = 3
+
+@lru_cache(maxsize=1024)
+def _evaluate_combination(ingredients: Tuple[Tuple[ResourceType, float], ...],
+                          target_type: ResourceType) -> float:
+    """Memoized recipe evaluation for a sorted tuple of (type, amount bucket)"""
+    types = frozenset(resource_type for resource_type, _ in ingredients)
+    amounts = tuple(amount for _, amount in ingredients)
+    
+    recipe = COMBINATION_RECIPES.get((types, target_type))
+    if recipe is None:
+        if target_type == ResourceType.GUILD_MARK and len(types & FACTION_TOKENS) >= 2:
+            recipe = _guild_mark_recipe
+        else:
+            return 0.0
+            
+    first_amounts: Dict[ResourceType, float] = {}
+    for resource_type, amount in ingredients:
+        first_amounts.setdefault(resource_type, amount)
+    return recipe(first_amounts, amounts)
 
 @dataclass
 class ResourceProperties:
@@ -222,8 +387,15 @@ class ResourceManager:
         self.containers: Dict[str, Dict[ResourceType, ResourceContainer]] = {}
         self.transaction_history: List[ResourceTransaction] = []
         self.conversion_rates: Dict[Tuple[ResourceType, ResourceType], float] = self._initialize_conversion_rates()
+        self._build_conversion_matrix()
         self.achievements: List[Achievement] = self._initialize_achievements()
         
+        # Containers hash onto a fixed set of striped locks; multi-container
+        # operations take their stripes in index order so they cannot deadlock
+        self._lock_stripes = [threading.RLock() for _ in range(LOCK_STRIPES)]
+        self._registry_lock = threading.RLock()
+        self._achievement_lock = threading.Lock()
+        
     def _setup_logging(self):
         """Initialize logging for the resource management system"""
         log_dir = Path("logs")
@@ -432,35 +604,123 @@ class ResourceManager:
             (ResourceType.RANGER_TOKEN, ResourceType.REPUTATION): 10.0
         }
         
-    def create_container(self, container_id: str, capacity: float) -> bool:
-        """Create a new resource container"""
-        if container_id in self.containers:
-            self.logger.warning(f"Container {container_id} already exists")
+    def _build_conversion_matrix(self) -> bool:
+        """Precompute direct and best multi-hop conversion rates as dense matrices.
+        
+        Returns False, leaving the current matrices in place, if the rates
+        contain a cycle that converts a resource back into more of itself.
+        """
+        size = len(ResourceType)
+        conversion_matrix = np.zeros((size, size))
+        for (from_type, to_type), rate in self.conversion_rates.items():
+            conversion_matrix[RESOURCE_INDEX[from_type], RESOURCE_INDEX[to_type]] = rate
+            
+        # Floyd-Warshall over (max, *): chaining multiplies rates, and without
+        # profitable cycles the best chain between two resources is simple
+        best_rates = conversion_matrix.copy()
+        hops = (best_rates > 0).astype(int)
+        for via in range(size):
+            through = best_rates[:, via, None] * best_rates[None, via, :]
+            improved = through > best_rates * (1 + CHAIN_RATE_TOLERANCE)
+            best_rates[improved] = through[improved]
+            hops[improved] = (hops[:, via, None] + hops[None, via, :])[improved]
+            
+        if (np.diag(best_rates) > 1 + CHAIN_RATE_TOLERANCE).any():
             return False
             
-        self.containers[container_id] = {
-            resource_type: ResourceContainer(capacity=capacity)
-            for resource_type in ResourceType
-        }
+        # Converting a resource into itself is not a chain
+        np.fill_diagonal(best_rates, 0.0)
+        np.fill_diagonal(hops, 0)
+        self.conversion_matrix = conversion_matrix
+        self.chain_conversion_rates = best_rates
+        self.conversion_hops = hops
+        return True
+        
+    def set_conversion_rate(self, from_type: ResourceType, to_type: ResourceType, rate: float) -> bool:
+        """Define or update a direct conversion rate; rates that would let a
+        chain of conversions create resources from nothing are rejected"""
+        previous = self.conversion_rates.get((from_type, to_type))
+        self.conversion_rates[(from_type, to_type)] = rate
+        if self._build_conversion_matrix():
+            return True
+            
+        if previous is None:
+            del self.conversion_rates[(from_type, to_type)]
+        else:
+            self.conversion_rates[(from_type, to_type)] = previous
+        self.logger.error(
+            f"Conversion rate {from_type.name} -> {to_type.name} of {rate} "
+            f"would create a profitable conversion cycle"
+        )
+        return False
+        
+    def get_conversion_rate(self, from_type: ResourceType, to_type: ResourceType,
+                            allow_chain: bool = False) -> Optional[float]:
+        """Get the conversion rate between two resources, optionally allowing
+        multi-hop conversions through intermediate resources"""
+        matrix = self.chain_conversion_rates if allow_chain else self.conversion_matrix
+        rate = matrix[RESOURCE_INDEX[from_type], RESOURCE_INDEX[to_type]]
+        return float(rate) if rate > 0 else None
+        
+    def _stripe_index(self, container_id: str) -> int:
+        return hash(container_id) % LOCK_STRIPES
+        
+    @contextmanager
+    def _locked(self, *container_ids: str) -> Iterator[None]:
+        """Hold the locks guarding the given containers"""
+        stripes = sorted({self._stripe_index(container_id) for container_id in container_ids})
+        for stripe in stripes:
+            self._lock_stripes[stripe].acquire()
+        try:
+            yield
+        finally:
+            for stripe in reversed(stripes):
+                self._lock_stripes[stripe].release()
+                
+    @contextmanager
+    def _all_locked(self) -> Iterator[None]:
+        """Hold every stripe, in index order, and the registry lock"""
+        for stripe in self._lock_stripes:
+            stripe.acquire()
+        try:
+            with self._registry_lock:
+                yield
+        finally:
+            for stripe in reversed(self._lock_stripes):
+                stripe.release()
+                
+    def create_container(self, container_id: str, capacity: float) -> bool:
+        """Create a new resource container"""
+        with self._registry_lock:
+            if container_id in self.containers:
+                self.logger.warning(f"Container {container_id} already exists")
+                return False
+                
+            self.containers[container_id] = {
+                resource_type: ResourceContainer(capacity=capacity)
+                for resource_type in ResourceType
+            }
         self.logger.info(f"Created container {container_id} with capacity {capacity}")
         return True
         
     def add_resource(self, container_id: str, resource_type: ResourceType, amount: float) -> bool:
         """Add resources to a container"""
-        if container_id not in self.containers:
-            self.logger.error(f"Container {container_id} does not exist")
-            return False
-            
-        container = self.containers[container_id][resource_type]
-        if container.is_locked:
-            self.logger.warning(f"Container {container_id} is locked")
-            return False
-            
-        if container.current_amount + amount > container.capacity:
-            self.logger.warning(f"Not enough capacity in container {container_id}")
-            return False
-            
-        container.current_amount += amount
+        # Checked under the stripe so import_state can't swap the container out
+        with self._locked(container_id):
+            if container_id not in self.containers:
+                self.logger.error(f"Container {container_id} does not exist")
+                return False
+                
+            container = self.containers[container_id][resource_type]
+            if container.is_locked:
+                self.logger.warning(f"Container {container_id} is locked")
+                return False
+                
+            if container.current_amount + amount > container.capacity:
+                self.logger.warning(f"Not enough capacity in container {container_id}")
+                return False
+                
+            container.current_amount += amount
         self._record_transaction(
             resource_type=resource_type,
             amount=amount,
@@ -473,20 +733,21 @@ class ResourceManager:
         
     def remove_resource(self, container_id: str, resource_type: ResourceType, amount: float) -> bool:
         """Remove resources from a container"""
-        if container_id not in self.containers:
-            self.logger.error(f"Container {container_id} does not exist")
-            return False
-            
-        container = self.containers[container_id][resource_type]
-        if container.is_locked:
-            self.logger.warning(f"Container {container_id} is locked")
-            return False
-            
-        if container.current_amount < amount:
-            self.logger.warning(f"Not enough resources in container {container_id}")
-            return False
-            
-        container.current_amount -= amount
+        with self._locked(container_id):
+            if container_id not in self.containers:
+                self.logger.error(f"Container {container_id} does not exist")
+                return False
+                
+            container = self.containers[container_id][resource_type]
+            if container.is_locked:
+                self.logger.warning(f"Container {container_id} is locked")
+                return False
+                
+            if container.current_amount < amount:
+                self.logger.warning(f"Not enough resources in container {container_id}")
+                return False
+                
+            container.current_amount -= amount
         self._record_transaction(
             resource_type=resource_type,
             amount=-amount,
@@ -499,79 +760,133 @@ class ResourceManager:
         
     def transfer_resource(self, from_id: str, to_id: str, resource_type: ResourceType, amount: float) -> bool:
         """Transfer resources between containers"""
-        if not self.remove_resource(from_id, resource_type, amount):
-            return False
-            
-        if not self.add_resource(to_id, resource_type, amount):
-            # Rollback the removal
-            self.add_resource(from_id, resource_type, amount)
-            return False
+        return self.transfer_batch([(from_id, to_id, resource_type, amount)])
+        
+    def transfer_batch(self, transfers: List[Tuple[str, str, ResourceType, float]]) -> bool:
+        """Atomically apply several (from_id, to_id, resource_type, amount)
+        transfers: either every transfer happens or none does"""
+        container_ids = {container_id for from_id, to_id, _, _ in transfers
+                         for container_id in (from_id, to_id)}
+        for container_id in container_ids:
+            if container_id not in self.containers:
+                self.logger.error(f"Container {container_id} does not exist")
+                return False
+                
+        # Net change per (container, resource) so the batch is validated as a whole
+        deltas: Dict[Tuple[str, ResourceType], float] = defaultdict(float)
+        for from_id, to_id, resource_type, amount in transfers:
+            if amount < 0:
+                self.logger.warning(f"Cannot transfer a negative amount of {resource_type.name}")
+                return False
+            deltas[(from_id, resource_type)] -= amount
+            deltas[(to_id, resource_type)] += amount
             
-        self._record_transaction(
-            resource_type=resource_type,
-            amount=amount,
-            transaction_type="transfer",
-            source=from_id,
-            destination=to_id,
-            success=True
-        )
+        with self._locked(*container_ids):
+            # import_state may have replaced the containers since the check above
+            if any(container_id not in self.containers for container_id in container_ids):
+                self.logger.error("Containers changed during transfer")
+                return False
+            if not self._can_apply_deltas(deltas):
+                return False
+            for (container_id, resource_type), delta in deltas.items():
+                self.containers[container_id][resource_type].current_amount += delta
+                
+        for from_id, to_id, resource_type, amount in transfers:
+            self._record_transaction(
+                resource_type=resource_type,
+                amount=amount,
+                transaction_type="transfer",
+                source=from_id,
+                destination=to_id,
+                success=True
+            )
         return True
         
-    def convert_resource(self, container_id: str, from_type: ResourceType, to_type: ResourceType, amount: float) -> bool:
+    def _can_apply_deltas(self, deltas: Dict[Tuple[str, ResourceType], float]) -> bool:
+        """Check that every change fits its container; caller holds the locks"""
+        for (container_id, resource_type), delta in deltas.items():
+            container = self.containers[container_id][resource_type]
+            if delta and container.is_locked:
+                self.logger.warning(f"Container {container_id} is locked")
+                return False
+            if container.current_amount + delta < 0:
+                self.logger.warning(f"Not enough resources in container {container_id}")
+                return False
+            if delta > 0 and container.current_amount + delta > container.capacity:
+                self.logger.warning(f"Not enough capacity in container {container_id}")
+                return False
+        return True
+        
+    def convert_resource(self, container_id: str, from_type: ResourceType, to_type: ResourceType, amount: float,
+                         allow_chain: bool = False) -> bool:
         """Convert one resource type to another"""
-        conversion_key = (from_type, to_type)
-        if conversion_key not in self.conversion_rates:
+        return self.convert_and_transfer(
+            container_id, container_id, from_type, to_type, amount, allow_chain
+        )
+        
+    def convert_and_transfer(self, from_id: str, to_id: str, from_type: ResourceType, to_type: ResourceType,
+                             amount: float, allow_chain: bool = False) -> bool:
+        """Atomically convert resources taken from one container into another"""
+        conversion_rate = self.get_conversion_rate(from_type, to_type, allow_chain)
+        if conversion_rate is None:
             self.logger.error(f"No conversion rate defined for {from_type} to {to_type}")
             return False
-            
-        conversion_rate = self.conversion_rates[conversion_key]
+                
         output_amount = amount * conversion_rate
+        deltas: Dict[Tuple[str, ResourceType], float] = defaultdict(float)
+        deltas[(from_id, from_type)] -= amount
+        deltas[(to_id, to_type)] += output_amount
         
-        if not self.remove_resource(container_id, from_type, amount):
-            return False
-            
-        if not self.add_resource(container_id, to_type, output_amount):
-            # Rollback the removal
-            self.add_resource(container_id, from_type, amount)
-            return False
-            
+        with self._locked(from_id, to_id):
+            for container_id in (from_id, to_id):
+                if container_id not in self.containers:
+                    self.logger.error(f"Container {container_id} does not exist")
+                    return False
+            if not self._can_apply_deltas(deltas):
+                return False
+            for (container_id, resource_type), delta in deltas.items():
+                self.containers[container_id][resource_type].current_amount += delta
+                
         self._record_transaction(
             resource_type=from_type,
             amount=amount,
             transaction_type="conversion",
-            source=container_id,
-            destination=container_id,
+            source=from_id,
+            destination=to_id,
             success=True,
             details={
                 "to_type": to_type.name,
                 "output_amount": output_amount,
-                "conversion_rate": conversion_rate
+                "conversion_rate": conversion_rate,
+                "hops": int(self.conversion_hops[RESOURCE_INDEX[from_type], RESOURCE_INDEX[to_type]])
+                        if allow_chain else 1
             }
         )
         return True
         
     def get_resource_amount(self, container_id: str, resource_type: ResourceType) -> Optional[float]:
         """Get the current amount of a resource in a container"""
-        if container_id not in self.containers:
+        containers = self.containers.get(container_id)
+        if containers is None:
             return None
-        return self.containers[container_id][resource_type].current_amount
+        return containers[resource_type].current_amount
         
     def lock_container(self, container_id: str) -> bool:
         """Lock a container to prevent modifications"""
-        if container_id not in self.containers:
-            return False
-            
-        for container in self.containers[container_id].values():
-            container.is_locked = True
+        with self._locked(container_id):
+            if container_id not in self.containers:
+                return False
+            for container in self.containers[container_id].values():
+                container.is_locked = True
         return True
         
     def unlock_container(self, container_id: str) -> bool:
         """Unlock a container to allow modifications"""
-        if container_id not in self.containers:
-            return False
-            
-        for container in self.containers[container_id].values():
-            container.is_locked = False
+        with self._locked(container_id):
+            if container_id not in self.containers:
+                return False
+            for container in self.containers[container_id].values():
+                container.is_locked = False
         return True
         
     def _record_transaction(self, resource_type: ResourceType, amount: float,
@@ -596,40 +911,41 @@ class ResourceManager:
         
     def update(self, delta_time: float):
         """Update resource regeneration and decay"""
-        for container_id, containers in self.containers.items():
-            for resource_type, container in containers.items():
-                if container.is_locked:
-                    continue
+        for container_id, containers in list(self.containers.items()):
+            with self._locked(container_id):
+                for resource_type, container in containers.items():
+                    if container.is_locked:
+                        continue
                     
-                properties = self.resources[resource_type]
-                if properties.regenerates:
-                    regen_amount = properties.regen_rate * delta_time
-                    space_available = container.capacity - container.current_amount
-                    actual_regen = min(regen_amount, space_available)
-                    if actual_regen > 0:
-                        container.current_amount += actual_regen
-                        self._record_transaction(
-                            resource_type=resource_type,
-                            amount=actual_regen,
-                            transaction_type="regeneration",
-                            source="system",
-                            destination=container_id,
-                            success=True
-                        )
+                    properties = self.resources[resource_type]
+                    if properties.regenerates:
+                        regen_amount = properties.regen_rate * delta_time
+                        space_available = container.capacity - container.current_amount
+                        actual_regen = min(regen_amount, space_available)
+                        if actual_regen > 0:
+                            container.current_amount += actual_regen
+                            self._record_transaction(
+                                resource_type=resource_type,
+                                amount=actual_regen,
+                                transaction_type="regeneration",
+                                source="system",
+                                destination=container_id,
+                                success=True
+                            )
                         
-                if properties.decay_rate > 0:
-                    decay_amount = properties.decay_rate * delta_time
-                    actual_decay = min(decay_amount, container.current_amount)
-                    if actual_decay > 0:
-                        container.current_amount -= actual_decay
-                        self._record_transaction(
-                            resource_type=resource_type,
-                            amount=-actual_decay,
-                            transaction_type="decay",
-                            source=container_id,
-                            destination="system",
-                            success=True
-                        )
+                    if properties.decay_rate > 0:
+                        decay_amount = properties.decay_rate * delta_time
+                        actual_decay = min(decay_amount, container.current_amount)
+                        if actual_decay > 0:
+                            container.current_amount -= actual_decay
+                            self._record_transaction(
+                                resource_type=resource_type,
+                                amount=-actual_decay,
+                                transaction_type="decay",
+                                source=container_id,
+                                destination="system",
+                                success=True
+                            )
                         
     def get_transaction_history(self, limit: int = None) -> List[ResourceTransaction]:
         """Get the transaction history, optionally limited to the most recent transactions"""
@@ -657,17 +973,20 @@ class ResourceManager:
     def import_state(self, state_json: str):
         """Import state from JSON"""
         state = json.loads(state_json)
-        self.containers.clear()
-        
-        for container_id, resources in state["containers"].items():
-            self.containers[container_id] = {}
-            for resource_name, data in resources.items():
-                resource_type = ResourceType[resource_name]
-                self.containers[container_id][resource_type] = ResourceContainer(
-                    capacity=data["capacity"],
-                    current_amount=data["current_amount"],
-                    is_locked=data["is_locked"]
-                ) 
+        # Replacing every container must not interleave with transfers, which
+        # only hold their containers' stripes
+        with self._all_locked():
+            self.containers.clear()
+            
+            for container_id, resources in state["containers"].items():
+                self.containers[container_id] = {}
+                for resource_name, data in resources.items():
+                    resource_type = ResourceType[resource_name]
+                    self.containers[container_id][resource_type] = ResourceContainer(
+                        capacity=data["capacity"],
+                        current_amount=data["current_amount"],
+                        is_locked=data["is_locked"]
+                    ) 
         
     def combine_resources(self, container_id: str, resource_types: List[ResourceType], amounts: List[float], 
                          target_type: ResourceType) -> bool:
@@ -676,32 +995,35 @@ class ResourceManager:
             self.logger.error("Resource types and amounts must have the same length")
             return False
             
-        # Check if all resources are available
-        for resource_type, amount in zip(resource_types, amounts):
-            if not self.has_resource(container_id, resource_type, amount):
-                self.logger.error(f"Not enough {resource_type.name}")
-                return False
-            
-        # Remove source resources
-        for resource_type, amount in zip(resource_types, amounts):
-            if not self.remove_resource(container_id, resource_type, amount):
-                # Rollback previous removals
-                for r_type, r_amount in zip(resource_types, amounts):
-                    if r_type == resource_type:
-                        break
-                    self.add_resource(container_id, r_type, r_amount)
-                return False
+        # Hold the container for the whole check-remove-add sequence; the
+        # nested add/remove calls re-enter the same stripe lock
+        with self._locked(container_id):
+            # Check if all resources are available
+            for resource_type, amount in zip(resource_types, amounts):
+                if not self.has_resource(container_id, resource_type, amount):
+                    self.logger.error(f"Not enough {resource_type.name}")
+                    return False
             
-        # Calculate output amount based on recipe
-        output_amount = self._calculate_combination_output(resource_types, amounts, target_type)
-        
-        # Add result
-        if not self.add_resource(container_id, target_type, output_amount):
-            # Rollback all removals
+            # Remove source resources
             for resource_type, amount in zip(resource_types, amounts):
-                self.add_resource(container_id, resource_type, amount)
-            return False
-        
+                if not self.remove_resource(container_id, resource_type, amount):
+                    # Rollback previous removals
+                    for r_type, r_amount in zip(resource_types, amounts):
+                        if r_type == resource_type:
+                            break
+                        self.add_resource(container_id, r_type, r_amount)
+                    return False
+            
+            # Calculate output amount based on recipe
+            output_amount = self._calculate_combination_output(resource_types, amounts, target_type)
+            
+            # Add result
+            if not self.add_resource(container_id, target_type, output_amount):
+                # Rollback all removals
+                for resource_type, amount in zip(resource_types, amounts):
+                    self.add_resource(container_id, resource_type, amount)
+                return False
+                
         self._record_transaction(
             resource_type=target_type,
             amount=output_amount,
@@ -719,96 +1041,14 @@ class ResourceManager:
     def _calculate_combination_output(self, resource_types: List[ResourceType], 
                                         amounts: List[float], target_type: ResourceType) -> float:
         """Calculate the output amount for a resource combination"""
-        # Basic combinations
-        if set(resource_types) == {ResourceType.MANA_CRYSTAL, ResourceType.VOID_ESSENCE} and \
-           target_type == ResourceType.ASTRAL_DUST:
-            return sum(amounts) * 0.5
-        elif set(resource_types) == {ResourceType.SOUL_SHARD, ResourceType.MANA} and \
-             target_type == ResourceType.ELEMENTAL_CORE:
-            return min(amounts) * 0.3
-            
-        # Advanced combinations
-        elif set(resource_types) == {ResourceType.ASTRAL_DUST, ResourceType.TEMPORAL_SHARD, ResourceType.DIVINE_ESSENCE} and \
-             target_type == ResourceType.PHOENIX_FEATHER:
-            # Complex formula based on ratios
-            astral_amount = amounts[resource_types.index(ResourceType.ASTRAL_DUST)]
-            temporal_amount = amounts[resource_types.index(ResourceType.TEMPORAL_SHARD)]
-            divine_amount = amounts[resource_types.index(ResourceType.DIVINE_ESSENCE)]
-            if astral_amount >= 5.0 and temporal_amount >= 2.0 and divine_amount >= 1.0:
-                return min(astral_amount/5.0, temporal_amount/2.0, divine_amount) * 0.5
-                
-        elif set(resource_types) == {ResourceType.MANA_CRYSTAL, ResourceType.SOUL_SHARD, ResourceType.VOID_ESSENCE} and \
-             target_type == ResourceType.DRAGON_SCALE:
-            # Requires specific ratios (2:1:1)
-            mana_amount = amounts[resource_types.index(ResourceType.MANA_CRYSTAL)]
-            soul_amount = amounts[resource_types.index(ResourceType.SOUL_SHARD)]
-            void_amount = amounts[resource_types.index(ResourceType.VOID_ESSENCE)]
-            if mana_amount >= 4.0 and soul_amount >= 2.0 and void_amount >= 2.0:
-                return min(mana_amount/4.0, soul_amount/2.0, void_amount/2.0)
-                
-        elif set(resource_types) == {ResourceType.ELEMENTAL_CORE, ResourceType.RUNIC_ESSENCE} and \
-             target_type == ResourceType.CHAOS_FRAGMENT:
-            # Exponential scaling with diminishing returns
-            core_amount = amounts[resource_types.index(ResourceType.ELEMENTAL_CORE)]
-            rune_amount = amounts[resource_types.index(ResourceType.RUNIC_ESSENCE)]
-            base_output = min(core_amount, rune_amount) * 0.4
-            bonus = min(1.0, (max(core_amount, rune_amount) - min(core_amount, rune_amount)) * 0.1)
-            return base_output * (1.0 + bonus)
-            
-        # Seasonal combinations
-        elif set(resource_types) == {ResourceType.SEASONAL_ESSENCE, ResourceType.FESTIVAL_TOKEN} and \
-             target_type == ResourceType.EVENT_TICKET:
-            # Linear scaling with minimum threshold
-            essence_amount = amounts[resource_types.index(ResourceType.SEASONAL_ESSENCE)]
-            token_amount = amounts[resource_types.index(ResourceType.FESTIVAL_TOKEN)]
-            if essence_amount >= 10.0 and token_amount >= 5.0:
-                return min(essence_amount/10.0, token_amount/5.0)
-                
-        # Faction combinations
-        elif len(set(resource_types).intersection({ResourceType.KNIGHT_INSIGNIA, ResourceType.MAGE_SEAL, ResourceType.RANGER_TOKEN})) >= 2 and \
-             target_type == ResourceType.GUILD_MARK:
-            # Requires any two faction tokens
-            total_tokens = sum(amounts)
-            if total_tokens >= 5.0:
-                return total_tokens * 0.2
-                
-        # New Divine Combinations
-        elif set(resource_types) == {ResourceType.DIVINE_ESSENCE, ResourceType.PHOENIX_FEATHER} and \
-             target_type == ResourceType.CELESTIAL_SHARD:
-            divine_amount = amounts[resource_types.index(ResourceType.DIVINE_ESSENCE)]
-            phoenix_amount = amounts[resource_types.index(ResourceType.PHOENIX_FEATHER)]
-            if divine_amount >= 3.0 and phoenix_amount >= 1.0:
-                return min(divine_amount/3.0, phoenix_amount) * 0.3
-                
-        # Elemental Combinations
-        elif set(resource_types) == {ResourceType.ELEMENTAL_CORE, ResourceType.MANA_CRYSTAL, ResourceType.VOID_ESSENCE} and \
-             target_type == ResourceType.PRIMAL_ESSENCE:
-            core_amount = amounts[resource_types.index(ResourceType.ELEMENTAL_CORE)]
-            mana_amount = amounts[resource_types.index(ResourceType.MANA_CRYSTAL)]
-            void_amount = amounts[resource_types.index(ResourceType.VOID_ESSENCE)]
-            if core_amount >= 2.0 and mana_amount >= 5.0 and void_amount >= 1.0:
-                return min(core_amount/2.0, mana_amount/5.0, void_amount) * 0.4
-                
-        # Temporal Combinations
-        elif set(resource_types) == {ResourceType.TEMPORAL_SHARD, ResourceType.ASTRAL_DUST} and \
-             target_type == ResourceType.CHRONO_CRYSTAL:
-            temporal_amount = amounts[resource_types.index(ResourceType.TEMPORAL_SHARD)]
-            astral_amount = amounts[resource_types.index(ResourceType.ASTRAL_DUST)]
-            if temporal_amount >= 1.0 and astral_amount >= 3.0:
-                base = min(temporal_amount, astral_amount/3.0)
-                return base * (1.0 + min(1.0, (max(temporal_amount, astral_amount/3.0) - base) * 0.2))
-                
-        # Spirit Combinations
-        elif set(resource_types) == {ResourceType.SOUL_SHARD, ResourceType.DIVINE_ESSENCE, ResourceType.VOID_ESSENCE} and \
-             target_type == ResourceType.SPIRIT_CRYSTAL:
-            soul_amount = amounts[resource_types.index(ResourceType.SOUL_SHARD)]
-            divine_amount = amounts[resource_types.index(ResourceType.DIVINE_ESSENCE)]
-            void_amount = amounts[resource_types.index(ResourceType.VOID_ESSENCE)]
-            if soul_amount >= 3.0 and divine_amount >= 1.0 and void_amount >= 2.0:
-                return (min(soul_amount/3.0, divine_amount, void_amount/2.0) * 0.5) * \
-                       (1.0 + (max(soul_amount/3.0, divine_amount, void_amount/2.0) * 0.1))
-                
-        return 0.0
+        # Stable sort keeps duplicate types in caller order, so "first amount
+        # of a type" means the same thing as before sorting
+        ingredients = tuple(sorted(
+            ((resource_type, round(amount, AMOUNT_PRECISION))
+             for resource_type, amount in zip(resource_types, amounts)),
+            key=lambda ingredient: ingredient[0].value
+        ))
+        return _evaluate_combination(ingredients, target_type)
         
     def has_resource(self, container_id: str, resource_type: ResourceType, amount: float) -> bool:
         """Check if a container has enough of a resource"""
@@ -817,10 +1057,6 @@ class ResourceManager:
         
     def create_specialized_container(self, container_id: str, capacity: float, container_type: str) -> bool:
         """Create a new specialized resource container"""
-        if container_id in self.containers:
-            self.logger.warning(f"Container {container_id} already exists")
-            return False
-            
         factory_methods = {
             "magical": ContainerFactory.create_magical_container,
             "void": ContainerFactory.create_void_container,
@@ -834,10 +1070,15 @@ class ResourceManager:
             return False
             
         container_creator = factory_methods[container_type]
-        self.containers[container_id] = {
-            resource_type: container_creator(capacity)
-            for resource_type in ResourceType
-        }
+        with self._registry_lock:
+            if container_id in self.containers:
+                self.logger.warning(f"Container {container_id} already exists")
+                return False
+                
+            self.containers[container_id] = {
+                resource_type: container_creator(capacity)
+                for resource_type in ResourceType
+            }
         
         self.logger.info(f"Created {container_type} container {container_id} with capacity {capacity}")
         return True 
@@ -915,14 +1156,16 @@ class ResourceManager:
     def check_achievements(self, container_id: str) -> List[Achievement]:
         """Check and award achievements for a container"""
         completed_achievements = []
-        for achievement in self.achievements:
-            if not achievement.is_completed:
-                current_amount = self.get_resource_amount(container_id, achievement.resource_type)
-                if current_amount is not None and current_amount >= achievement.threshold:
-                    achievement.is_completed = True
-                    achievement.completion_date = datetime.now()
-                    # Award achievement reward
-                    self.add_resource(container_id, achievement.reward_type, achievement.reward_amount)
-                    completed_achievements.append(achievement)
-                    self.logger.info(f"Achievement unlocked: {achievement.name}")
+        # Achievements are shared by all containers, so only one check runs at a time
+        with self._achievement_lock:
+            for achievement in self.achievements:
+                if not achievement.is_completed:
+                    current_amount = self.get_resource_amount(container_id, achievement.resource_type)
+                    if current_amount is not None and current_amount >= achievement.threshold:
+                        achievement.is_completed = True
+                        achievement.completion_date = datetime.now()
+                        # Award achievement reward
+                        self.add_resource(container_id, achievement.reward_type, achievement.reward_amount)
+                        completed_achievements.append(achievement)
+                        self.logger.info(f"Achievement unlocked: {achievement.name}")
         return completed_achievements 
\ No newline at end of file
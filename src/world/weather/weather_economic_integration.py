@@ -1,11 +1,15 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
+import heapq
+import itertools
 import logging
 import random
-import time
 
-from weather_system import WeatherSystem, WeatherType, CelestialPattern, MagicalStorm
+from weather_system import (
+    WeatherSystem, WeatherType, WeatherChangeType, CelestialPattern, MagicalStorm
+)
 from economic_system import EconomicSystem, MarketEvent, ResourceType, TradeGoodCategory
 
 class WeatherEconomicEffect(Enum):
@@ -28,11 +32,31 @@ class WeatherMarketModifier:
     affected_categories: List[TradeGoodCategory]
 
 class WeatherEconomicIntegration:
+    # How long a magical storm counts as applied when it carries no duration
+    DEFAULT_STORM_DURATION = 900.0
+
     def __init__(self, weather_system: WeatherSystem, economic_system: EconomicSystem):
         self.weather_system = weather_system
         self.economic_system = economic_system
         self.active_effects: Dict[str, List[WeatherMarketModifier]] = {}
         self.logger = self._setup_logger()
+
+        # Event-driven state: effects are applied when weather transitions and
+        # reverted when they expire, so stable weather costs nothing per update
+        self.game_time = 0.0
+        self.location_weather: Dict[str, Optional[WeatherType]] = {}
+        self.location_effects: Dict[str, WeatherMarketModifier] = {}
+        self.pending_transitions: List[Tuple[str, WeatherType]] = []
+        self.pending_patterns: List[CelestialPattern] = []
+        self.pending_storms: List[MagicalStorm] = []
+        self.applied_phenomena: Set[Hashable] = set()  # Keys of patterns/storms in effect
+        self.expiry_queue: List[Tuple[float, int, Callable]] = []  # min-heap on game time
+        self._expiry_sequence = itertools.count()
+        self._needs_resync = True
+
+        weather_system.add_listener(WeatherChangeType.WEATHER, self.on_weather_changed)
+        weather_system.add_listener(WeatherChangeType.CELESTIAL_PATTERN, self.on_celestial_pattern)
+        weather_system.add_listener(WeatherChangeType.MAGICAL_STORM, self.on_magical_storm)
         
         # Weather effect configurations
         self.weather_effects = {
@@ -111,55 +135,165 @@ class WeatherEconomicIntegration:
         return logger
 
     def update(self, delta_time: float):
-        """Update weather effects on economy"""
-        current_time = time.time()
-        
-        # Process regular weather effects
-        for location, weather in self.weather_system.get_weather_conditions().items():
-            if weather.weather_type in self.weather_effects:
-                self._apply_weather_effect(location, weather.weather_type)
-        
-        # Process celestial patterns
-        for pattern in self.weather_system.get_active_celestial_patterns():
-            self._apply_celestial_effect(pattern)
-        
-        # Process magical storms
-        for storm in self.weather_system.get_active_magical_storms():
-            self._apply_magical_storm_effect(storm)
-        
+        """Advance game time and apply weather changes since the last update"""
+        self.game_time += delta_time
+
+        if self._needs_resync:
+            self.resync()
+
+        if self.pending_transitions:
+            transitions, self.pending_transitions = self.pending_transitions, []
+            for location, current in transitions:
+                self._apply_weather_transition(location, current)
+
+        if self.pending_patterns:
+            patterns, self.pending_patterns = self.pending_patterns, []
+            for pattern in patterns:
+                self._apply_celestial_effect(pattern)
+
+        if self.pending_storms:
+            storms, self.pending_storms = self.pending_storms, []
+            for storm in storms:
+                self._apply_magical_storm_effect(storm)
+
         # Clean up expired effects
-        self._cleanup_expired_effects(current_time)
+        self._process_expired_effects()
+
+    def fast_forward(self, delta_time: float, ticks: int):
+        """Apply ``ticks`` calls of ``update`` in one pass.
+
+        Effects only change on weather transitions and expiries, so the skip
+        is the first tick (which applies any queued transitions) followed by
+        a single update over the remaining span.
+        """
+        if ticks > 0:
+            self.update(delta_time)
+            self.update(delta_time * (ticks - 1))
 
-    def _apply_weather_effect(self, location: str, weather_type: WeatherType):
+    def resync(self):
+        """Queue transitions for every location whose weather differs from
+        what has been applied, e.g. after construction or loading a save.
+
+        Celestial patterns and magical storms are only delivered through
+        their listeners as they start.
+        """
+        self._needs_resync = False
+
+        for location, weather_type in self.weather_system.location_weather.items():
+            if weather_type != self.location_weather.get(location):
+                self.pending_transitions.append((location, weather_type))
+
+    def on_weather_changed(
+        self,
+        location: str,
+        previous: Optional[WeatherType],
+        current: WeatherType
+    ):
+        """Weather listener: queue a location's transition for the next update"""
+        self.pending_transitions.append((location, current))
+
+    def on_celestial_pattern(self, pattern: CelestialPattern):
+        """Celestial pattern listener: queue a newly started pattern"""
+        key = self._phenomenon_key(pattern, "pattern_id", "pattern_type")
+        if key not in self.applied_phenomena:
+            self.applied_phenomena.add(key)
+            self.pending_patterns.append(pattern)
+
+    def on_magical_storm(self, storm: MagicalStorm):
+        """Magical storm listener: queue a newly started storm"""
+        key = self._phenomenon_key(storm, "storm_id", "storm_type")
+        if key not in self.applied_phenomena:
+            self.applied_phenomena.add(key)
+            self.pending_storms.append(storm)
+
+    @staticmethod
+    def _phenomenon_key(phenomenon: Any, id_attribute: str, type_attribute: str) -> Tuple:
+        """Stable identity for a pattern or storm: its id (or type) and start time"""
+        identifier = getattr(phenomenon, id_attribute, None)
+        if identifier is None:
+            identifier = getattr(phenomenon, type_attribute)
+        return (type_attribute, identifier, getattr(phenomenon, "start_time", None))
+
+    def _apply_weather_transition(self, location: str, current: WeatherType):
+        """Swap the effect of a location's previous weather for the new one"""
+        if self.location_weather.get(location) == current:
+            return
+        self.location_weather[location] = current
+
+        if location in self.location_effects:
+            self._remove_weather_effect(location, self.location_effects[location])
+
+        if current in self.weather_effects:
+            modifier = self._apply_weather_effect(location, current)
+            self._schedule_expiry(
+                modifier.duration,
+                partial(self._remove_weather_effect, location, modifier)
+            )
+
+    def _apply_weather_effect(
+        self,
+        location: str,
+        weather_type: WeatherType
+    ) -> Optional[WeatherMarketModifier]:
         """Apply weather effects to market conditions"""
         if weather_type not in self.weather_effects:
-            return
+            return None
             
         modifier = self.weather_effects[weather_type]
-        
+        self._scale_location_markets(location, modifier, 1)
+                
+        # Record active effect
+        self.location_effects[location] = modifier
+        if location not in self.active_effects:
+            self.active_effects[location] = []
+        self.active_effects[location].append(modifier)
+        return modifier
+
+    def _remove_weather_effect(self, location: str, modifier: WeatherMarketModifier):
+        """Revert a weather effect if it is still the one active at a location"""
+        if self.location_effects.get(location) is not modifier:
+            return  # Already replaced by a later transition
+
+        self._scale_location_markets(location, modifier, -1)
+        del self.location_effects[location]
+        self.active_effects[location].remove(modifier)
+        if not self.active_effects[location]:
+            del self.active_effects[location]
+
+    def _scale_location_markets(
+        self,
+        location: str,
+        modifier: WeatherMarketModifier,
+        exponent: int
+    ):
+        """Apply (exponent 1) or revert (exponent -1) a modifier's deltas"""
         # Apply to regular markets
         if location in self.economic_system.markets:
             market = self.economic_system.markets[location]
             for resource_type, item in market.items():
                 if (resource_type in modifier.affected_resources or
                     item.category in modifier.affected_categories):
-                    item.current_price *= modifier.price_multiplier
-                    item.supply *= modifier.supply_modifier
-                    item.demand *= modifier.demand_modifier
+                    item.current_price *= modifier.price_multiplier ** exponent
+                    item.supply *= modifier.supply_modifier ** exponent
+                    item.demand *= modifier.demand_modifier ** exponent
         
         # Apply to trade routes
         for route in self.economic_system.trade_routes:
             if route.source_location == location or route.destination_location == location:
-                route.risk_level *= modifier.trade_route_risk
-                
-        # Record active effect
-        if location not in self.active_effects:
-            self.active_effects[location] = []
-        self.active_effects[location].append(modifier)
+                route.risk_level *= modifier.trade_route_risk ** exponent
+
+    def _schedule_expiry(self, duration: float, callback: Callable):
+        """Run ``callback`` once ``duration`` of game time has passed"""
+        heapq.heappush(
+            self.expiry_queue,
+            (self.game_time + duration, next(self._expiry_sequence), callback)
+        )
 
     def _apply_celestial_effect(self, pattern: CelestialPattern):
         """Apply celestial weather effects to markets"""
+        key = self._phenomenon_key(pattern, "pattern_id", "pattern_type")
         if pattern.pattern_type not in self.celestial_effects:
+            self.applied_phenomena.discard(key)
             return
             
         modifier = self.celestial_effects[pattern.pattern_type]
@@ -171,16 +305,39 @@ class WeatherEconomicIntegration:
             duration=modifier.duration
         )
         
-        # Apply special effects to dimensional markets
-        if pattern.pattern_type in self.economic_system.dimensional_markets:
-            market = self.economic_system.dimensional_markets[pattern.pattern_type]
-            for resource_type, item in market.items():
-                if resource_type in modifier.affected_resources:
-                    item.current_price *= modifier.price_multiplier
-                    item.supply *= modifier.supply_modifier
+        # Apply special effects to dimensional markets until the pattern fades
+        self._scale_dimensional_market(pattern.pattern_type, modifier, 1)
+        self._schedule_expiry(
+            modifier.duration,
+            partial(self._expire_celestial_effect, key, pattern.pattern_type, modifier)
+        )
                     
         self.logger.info(f"Applied celestial effect: {pattern.pattern_type}")
 
+    def _expire_celestial_effect(
+        self,
+        key: Tuple,
+        pattern_type: str,
+        modifier: WeatherMarketModifier
+    ):
+        """Revert a celestial effect and forget its pattern"""
+        self._scale_dimensional_market(pattern_type, modifier, -1)
+        self.applied_phenomena.discard(key)
+
+    def _scale_dimensional_market(
+        self,
+        pattern_type: str,
+        modifier: WeatherMarketModifier,
+        exponent: int
+    ):
+        """Apply (exponent 1) or revert (exponent -1) a celestial modifier"""
+        if pattern_type in self.economic_system.dimensional_markets:
+            market = self.economic_system.dimensional_markets[pattern_type]
+            for resource_type, item in market.items():
+                if resource_type in modifier.affected_resources:
+                    item.current_price *= modifier.price_multiplier ** exponent
+                    item.supply *= modifier.supply_modifier ** exponent
+
     def _apply_magical_storm_effect(self, storm: MagicalStorm):
         """Apply magical storm effects to markets"""
         # Create special market opportunities
@@ -207,17 +364,24 @@ class WeatherEconomicIntegration:
                 # Increase available contraband
                 black_market.raid_chance *= 0.5
                 
+        duration = getattr(storm, "duration", None)
+        if not isinstance(duration, (int, float)):
+            duration = self.DEFAULT_STORM_DURATION
+        self._schedule_expiry(
+            duration,
+            partial(
+                self.applied_phenomena.discard,
+                self._phenomenon_key(storm, "storm_id", "storm_type")
+            )
+        )
+                
         self.logger.info(f"Applied magical storm effect: {storm.storm_type}")
 
-    def _cleanup_expired_effects(self, current_time: float):
-        """Remove expired weather effects"""
-        for location in list(self.active_effects.keys()):
-            self.active_effects[location] = [
-                effect for effect in self.active_effects[location]
-                if current_time - effect.start_time < effect.duration
-            ]
-            if not self.active_effects[location]:
-                del self.active_effects[location]
+    def _process_expired_effects(self):
+        """Revert effects whose game-time expiry has passed"""
+        while self.expiry_queue and self.expiry_queue[0][0] <= self.game_time:
+            _, _, callback = heapq.heappop(self.expiry_queue)
+            callback()
 
     def get_active_effects(self, location: str) -> List[WeatherEconomicEffect]:
         """Get active weather-economic effects for a location"""
@@ -235,11 +399,10 @@ class WeatherEconomicIntegration:
             return {"error": "Market not found"}
             
         active_effects = self.get_active_effects(location)
-        weather = self.weather_system.get_weather_conditions().get(location)
         
         return {
             "location": location,
-            "weather_type": weather.weather_type if weather else None,
+            "weather_type": self.weather_system.location_weather.get(location),
             "active_effects": [effect.value for effect in active_effects],
             "trade_route_status": self._get_trade_route_status(location),
             "market_modifiers": self._get_market_modifiers(location)
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from dataclasses import dataclass
 
 class WeatherType(Enum):
@@ -10,6 +10,11 @@ class WeatherType(Enum):
     FOGGY = "foggy"
     WINDY = "windy"
 
+class WeatherChangeType(Enum):
+    WEATHER = "weather"                       # listener(location, previous, current)
+    CELESTIAL_PATTERN = "celestial_pattern"   # listener(pattern)
+    MAGICAL_STORM = "magical_storm"           # listener(storm)
+
 @dataclass
 class WeatherEffect:
     type: WeatherType
@@ -17,11 +22,64 @@ class WeatherEffect:
     duration: int  # In game time units
     modifiers: Dict[str, float]
 
+@dataclass
+class CelestialPattern:
+    pattern_type: str
+    alignment: str
+    start_time: float = 0.0  # In game time units
+    duration: Optional[float] = None
+
+@dataclass
+class MagicalStorm:
+    storm_type: str
+    locations: List[str]
+    start_time: float = 0.0  # In game time units
+    duration: Optional[float] = None
+
+    def affects_location(self, location: str) -> bool:
+        return location in self.locations
+
 class WeatherSystem:
     def __init__(self):
         self.current_weather = WeatherType.CLEAR
         self.weather_history: List[WeatherType] = []
         self.active_effects: List[WeatherEffect] = []
+        self.location_weather: Dict[str, WeatherType] = {}
+        self.listeners: Dict[WeatherChangeType, List[Callable]] = {
+            change_type: [] for change_type in WeatherChangeType
+        }
+
+    def add_listener(self, change_type: WeatherChangeType, callback: Callable):
+        """Add a weather change listener"""
+        self.listeners[change_type].append(callback)
+
+    def remove_listener(self, change_type: WeatherChangeType, callback: Callable):
+        """Remove a weather change listener"""
+        self.listeners[change_type] = [
+            cb for cb in self.listeners[change_type]
+            if cb != callback
+        ]
+
+    def notify_listeners(self, change_type: WeatherChangeType, *args):
+        """Notify listeners of a weather change"""
+        for callback in self.listeners[change_type]:
+            callback(*args)
+
+    def set_location_weather(self, location: str, weather_type: WeatherType):
+        """Set the weather at a location, notifying listeners on transitions"""
+        previous = self.location_weather.get(location)
+        if previous == weather_type:
+            return
+        self.location_weather[location] = weather_type
+        self.notify_listeners(WeatherChangeType.WEATHER, location, previous, weather_type)
+
+    def start_celestial_pattern(self, pattern: CelestialPattern):
+        """Begin a celestial pattern, notifying listeners"""
+        self.notify_listeners(WeatherChangeType.CELESTIAL_PATTERN, pattern)
+
+    def start_magical_storm(self, storm: MagicalStorm):
+        """Begin a magical storm, notifying listeners"""
+        self.notify_listeners(WeatherChangeType.MAGICAL_STORM, storm)
         
     def update_weather(self, game_time: int) -> WeatherType:
         """Update weather based on game time and conditions"""
@@ -0,0 +1,128 @@
+import unittest
+import random
+import time
+
+from src.combat_system.ai_behavior import (
+    AIBehaviorSystem,
+    BehaviorPattern,
+    BehaviorType,
+    CombatPhase,
+    TacticalRole,
+    compile_conditions
+)
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+class TestBehaviorSelection(unittest.TestCase):
+    def setUp(self):
+        """Set up a behavior system with a controllable clock"""
+        self.now = 0.0
+        self.ai = AIBehaviorSystem()
+        self.ai.clock = lambda: self.now
+        self.ai.exploration_rate = 0.0
+        self.state = {
+            'combat_time': 30,
+            'advantage_score': 0.5,
+            'health_threshold': 0.8,
+            'target_distance': 'close',
+            'resource_threshold': 0.9
+        }
+        self.actions = {'close_distance', 'heavy_attack', 'combo_attack'}
+
+    def test_compiled_conditions(self):
+        """Test thresholds, exact matches and missing keys"""
+        predicate = compile_conditions({'health': 0.5, 'stealthed': True, 'range': 'far'})
+        self.assertTrue(predicate({'health': 0.5, 'stealthed': True, 'range': 'far'}))
+        self.assertFalse(predicate({'health': 0.4, 'stealthed': True, 'range': 'far'}))
+        self.assertFalse(predicate({'health': 0.9, 'stealthed': False, 'range': 'far'}))
+        self.assertFalse(predicate({'health': 0.9, 'stealthed': True}))
+
+    def test_selects_pattern_with_available_actions(self):
+        """Test that only patterns whose actions are all available are chosen"""
+        self.assertEqual(
+            self.ai.select_behavior(self.state, self.actions),
+            ['close_distance', 'heavy_attack', 'combo_attack']
+        )
+        self.assertIsNone(self.ai.select_behavior(self.state, {'close_distance', 'heavy_attack'}))
+
+    def test_cooldown_uses_monotonic_clock(self):
+        """Test that a pattern is unavailable until its cooldown passes"""
+        self.ai.behavior_patterns['all_out_attack'].cooldown = 5.0
+        self.assertIsNotNone(self.ai.select_behavior(self.state, self.actions))
+        self.assertIsNone(self.ai.select_behavior(self.state, self.actions))
+
+        self.now = 5.0
+        self.assertIsNone(self.ai.select_behavior(self.state, self.actions))
+        self.now = 5.1
+        self.assertIsNotNone(self.ai.select_behavior(self.state, self.actions))
+        self.assertEqual(self.ai.behavior_patterns['all_out_attack'].usage_count, 2)
+
+    def test_phase_restricted_patterns(self):
+        """Test that patterns limited to a phase are only offered in that phase"""
+        self.ai.add_behavior_pattern(BehaviorPattern(
+            name="opening_volley",
+            behavior_type=BehaviorType.AGGRESSIVE,
+            tactical_role=TacticalRole.DPS,
+            priority=1.0,
+            conditions={},
+            actions=['volley'],
+            phases={CombatPhase.OPENING}
+        ))
+        self.assertIsNone(self.ai.select_behavior(dict(self.state, advantage_score=0.7), {'volley'}))
+        self.assertEqual(
+            self.ai.select_behavior(dict(self.state, combat_time=0), {'volley'}),
+            ['volley']
+        )
+
+    def test_builtin_patterns_are_phase_indexed(self):
+        """Test that built-in patterns are only offered in their phases"""
+        self.assertTrue(all(pattern.phases for pattern in self.ai.behavior_patterns.values()))
+        retreat = {'create_distance', 'defensive_stance', 'heal'}
+        state = dict(self.state, health_threshold=0.3, has_escape_route=True)
+        self.assertIsNone(self.ai.select_behavior(dict(state, advantage_score=0.7), retreat))
+        self.assertEqual(
+            self.ai.select_behavior(dict(state, advantage_score=0.2), retreat),
+            ['create_distance', 'defensive_stance', 'heal']
+        )
+        self.assertIsNone(self.ai.select_behavior(dict(self.state, advantage_score=0.2), self.actions))
+
+    def test_assigned_patterns_are_indexed(self):
+        """Test that patterns assigned or deleted directly update the indexes"""
+        self.ai.behavior_patterns['volley'] = BehaviorPattern(
+            name="volley",
+            behavior_type=BehaviorType.AGGRESSIVE,
+            tactical_role=TacticalRole.DPS,
+            priority=1.0,
+            conditions={'ammo': 1},
+            actions=['volley']
+        )
+        self.assertEqual(self.ai.select_behavior(dict(self.state, ammo=3), {'volley'}), ['volley'])
+        self.assertIsNone(self.ai.select_behavior(dict(self.state, ammo=0), {'volley'}))
+
+        del self.ai.behavior_patterns['volley']
+        self.assertNotIn('volley', self.ai.behavior_patterns)
+        self.assertIsNone(self.ai.select_behavior(dict(self.state, ammo=3), {'volley'}))
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_many_agents_per_frame(self):
+        """Benchmark behavior selection for hundreds of agents"""
+        rng = random.Random(4)
+        action_pool = sorted({
+            action for pattern in self.ai.behavior_patterns.values() for action in pattern.actions
+        })
+        agents = []
+        for _ in range(500):
+            state = {
+                condition: rng.random() if isinstance(value, float) else value
+                for pattern in self.ai.behavior_patterns.values()
+                for condition, value in pattern.conditions.items()
+            }
+            state.update(combat_time=30, advantage_score=rng.random())
+            agents.append((state, set(rng.sample(action_pool, 30))))
+
+        start_time = time.perf_counter()
+        for state, actions in agents:
+            self.ai.select_behavior(state, actions)
+        self.assertLess(time.perf_counter() - start_time, 0.05)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import pickle
+import random
+
+import numpy as np
+
+from src.systems.combat.combat_ai import (
+    ACTION_HISTORY_LIMIT,
+    AIStateBatch,
+    CombatAI
+)
+
+ACTION_PREFIXES = {
+    "UseHealingAbility": "heal_",
+    "Retreat": "retreat",
+    "UseSpecialAbility": "special_",
+    "BasicAttack": "attack_",
+    "SupportAction": "support_"
+}
+
+def random_state(rng: random.Random):
+    return {
+        "health_percentage": rng.random(),
+        "energy_percentage": rng.random(),
+        "status_effects": rng.sample(["stunned", "burning", "slowed", "frozen"], rng.randint(0, 1)),
+        "available_abilities": rng.sample(
+            ["power_attack", "quick_strike", "heal_ally", "battle_buff", "cure_poison", "dash"],
+            rng.randint(0, 3)
+        ),
+        "allies_nearby": [
+            {"id": f"ally_{i}", "position": {"x": rng.uniform(-10, 10), "y": rng.uniform(-10, 10)}}
+            for i in range(rng.randint(0, 2))
+        ],
+        "enemies_nearby": [
+            {"id": f"enemy_{i}", "position": {"x": rng.uniform(-10, 10), "y": rng.uniform(-10, 10)}}
+            for i in range(rng.randint(0, 2))
+        ],
+        "position": {"x": 0.0, "y": 0.0},
+        "threat_level": rng.random()
+    }
+
+class TestBatchDecisions(unittest.TestCase):
+    def setUp(self):
+        """Set up an AI and a crowd of random agent states"""
+        self.ai = CombatAI()
+        rng = random.Random(11)
+        self.states = [random_state(rng) for _ in range(500)]
+
+    def test_matches_per_agent_decisions(self):
+        """Test that the compiled tree picks the same action as the tree walk"""
+        actions = self.ai.decide_actions_batch(self.states)
+        names = self.ai.compiled_tree.action_names
+
+        for state, action in zip(self.states, actions):
+            self.ai.update_state(state)
+            self.ai.decide_action()
+            chosen = self.ai.state.last_action
+            if action < 0:
+                self.assertIsNone(chosen)
+            else:
+                self.assertTrue(chosen.startswith(ACTION_PREFIXES[names[action]]))
+
+    def test_chunks_match_whole_batch(self):
+        """Test that splitting a batch for workers gives the same results"""
+        batch = AIStateBatch(self.states)
+        chunks = list(batch.chunks(64))
+        self.assertEqual([len(chunk) for chunk in chunks], [64] * 7 + [52])
+
+        # Compiled trees are picklable, so chunks can go to worker processes
+        tree = pickle.loads(pickle.dumps(self.ai.compiled_tree))
+        np.testing.assert_array_equal(
+            np.concatenate([tree.evaluate(chunk) for chunk in chunks]),
+            self.ai.compiled_tree.evaluate(batch)
+        )
+
+    def test_action_history_is_bounded(self):
+        """Test that long fights don't grow the action history forever"""
+        self.ai.update_state(self.states[0])
+        for _ in range(ACTION_HISTORY_LIMIT + 50):
+            self.ai.decide_action()
+        self.assertEqual(len(self.ai.action_history), ACTION_HISTORY_LIMIT)
+
+if __name__ == '__main__':
+    unittest.main()
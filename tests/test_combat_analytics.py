@@ -0,0 +1,136 @@
+import unittest
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+from src.systems.combat.combat_analytics import (
+    CombatAnalytics,
+    CombatEvent,
+    CombatEventType,
+    SessionEventStore
+)
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+def add_session(analytics, events, start_time=100.0, end_time=130.0, victory=True):
+    analytics.start_session({"level": 10}, {"count": 3}, "normal")
+    for event_type, timestamp, value, details in events:
+        analytics.current_session.events.append(CombatEvent(
+            event_type, timestamp, "player", "enemy", value, details
+        ))
+    analytics.end_session(victory)
+    session = analytics.sessions[-1]
+    session.start_time = start_time
+    session.end_time = end_time
+    return session
+
+class TestColumnarAnalytics(unittest.TestCase):
+    def setUp(self):
+        """Set up a session with a known event mix"""
+        self.analytics = CombatAnalytics()
+        self.session = add_session(self.analytics, [
+            (CombatEventType.DAMAGE_DEALT, 101.0, 40.0, {"positioned": True}),
+            (CombatEventType.ABILITY_USED, 102.0, 30.0, {"ability_name": "fireball"}),
+            (CombatEventType.DAMAGE_TAKEN, 105.0, 20.0, {}),
+            (CombatEventType.ABILITY_USED, 106.0, 50.0, {"ability_name": "fireball"}),
+            (CombatEventType.RESOURCE_CHANGE, 112.0, -30.0, {"resource_type": "mana"}),
+            (CombatEventType.RESOURCE_CHANGE, 113.0, 15.0, {"resource_type": "mana"}),
+            (CombatEventType.POSITION_CHANGE, 115.0, 0.0, {"position": {"x": 0, "y": 0}}),
+            (CombatEventType.POSITION_CHANGE, 116.0, 0.0, {"position": {"x": 3, "y": 4}}),
+            (CombatEventType.STATUS_EFFECT, 121.0, 2.0, {"effect_name": "burn", "duration": 4}),
+            (CombatEventType.DAMAGE_DEALT, 125.0, 60.0, {})
+        ])
+
+    def test_store_round_trips_events(self):
+        """Test that the columnar store yields the events it was given"""
+        events = list(self.session.events)
+        self.assertEqual(len(events), 10)
+        self.assertEqual(events[1].details, {"ability_name": "fireball"})
+        self.assertEqual(events[2].event_type, CombatEventType.DAMAGE_TAKEN)
+        self.assertEqual(self.session.events.total(CombatEventType.DAMAGE_DEALT), 100.0)
+
+    def test_session_analysis(self):
+        """Test vectorized damage, ability, resource and movement analysis"""
+        analysis = self.analytics.analyze_session(self.session)
+
+        damage = analysis["damage_stats"]
+        self.assertEqual(damage["total_dealt"], 100.0)
+        self.assertAlmostEqual(damage["dps"], 100.0 / 30)
+        self.assertEqual(damage["highest_hit"], 60.0)
+
+        abilities = analysis["ability_usage"]
+        self.assertEqual(abilities["usage_counts"], {"fireball": 2})
+        self.assertEqual(abilities["average_damage"], {"fireball": 40.0})
+        self.assertEqual(abilities["timing_patterns"]["fireball"]["average_interval"], 4.0)
+
+        self.assertEqual(analysis["resource_efficiency"]["mana"],
+                         {"total_consumed": 15.0, "efficiency": 0.5})
+        self.assertEqual(analysis["positioning"]["movement_patterns"]["total_distance"], 5.0)
+        self.assertEqual(analysis["positioning"]["positioning_effectiveness"]["effectiveness"], 40.0 / 120)
+        self.assertEqual(analysis["status_effects"]["burn"]["total_duration"], 4.0)
+
+        phases = analysis["combat_phases"]
+        self.assertEqual(phases["opening"]["ability_frequency"], 2 / 5)
+        self.assertEqual(phases["endgame"]["effectiveness"], 60.0)
+
+    def test_performance_trends(self):
+        """Test trends computed from per-session totals"""
+        add_session(self.analytics, [
+            (CombatEventType.DAMAGE_DEALT, 101.0, 200.0, {}),
+            (CombatEventType.DAMAGE_TAKEN, 102.0, 9.0, {})
+        ], victory=False)
+
+        trends = self.analytics.get_performance_trends()
+        self.assertEqual(trends["victory_rate"], 0.5)
+        self.assertEqual(trends["damage_trends"]["damage_dealt"], [100.0, 200.0])
+        self.assertEqual(dict(trends["ability_trends"]["fireball"]), {"usage": [2]})
+        first, second = 100.0 / 21 * 1.1, 200.0 / 10
+        self.assertAlmostEqual(trends["improvement_rate"]["rate"], (second - first) / first)
+
+    def test_export_import(self):
+        """Test that JSON and columnar exports reload to the same analysis"""
+        expected = self.analytics.analyze_session(self.session)
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ("analytics.json", "analytics.npz"):
+                path = os.path.join(directory, name)
+                self.analytics.export_analytics(path)
+                imported = CombatAnalytics()
+                imported.import_analytics(path)
+                self.assertEqual(imported.analyze_session(imported.sessions[0]), expected)
+
+            imported.import_analytics(os.path.join(directory, "analytics.npz"))
+            self.assertEqual(imported.sessions[0].player_stats, {"level": 10})
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_thousands_of_sessions(self):
+        """Benchmark trends and a columnar export over many sessions"""
+        rng = random.Random(8)
+        event_types = list(CombatEventType)
+        for _ in range(2000):
+            add_session(self.analytics, [
+                (rng.choice(event_types), 100.0 + i, rng.uniform(1, 50), {})
+                for i in range(50)
+            ], victory=rng.random() < 0.5)
+
+        start_time = time.perf_counter()
+        trends = self.analytics.get_performance_trends()
+        self.assertLess(time.perf_counter() - start_time, 0.5)
+        self.assertEqual(len(trends["damage_trends"]["damage_dealt"]), 2001)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "analytics.npz")
+            start_time = time.perf_counter()
+            self.analytics.export_analytics(path)
+            imported = CombatAnalytics()
+            imported.import_analytics(path)
+            self.assertLess(time.perf_counter() - start_time, 2.0)
+
+        np.testing.assert_array_equal(
+            imported.sessions[-1].events.column("value"),
+            self.analytics.sessions[-1].events.column("value")
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import time
+from dataclasses import replace
+
+from src.combat_system.combat_simulator import (
+    Combatant,
+    Matchup,
+    make_matchups,
+    run_sweep,
+    simulate_matchup,
+    summarize_results,
+    apply_balance_metrics
+)
+from src.combat_system.dimensional_combat import DimensionalCombat, DimensionalLayer
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+class TestCombatSimulator(unittest.TestCase):
+    def setUp(self):
+        """Set up a player and an enemy to sweep over"""
+        self.player = Combatant(
+            name="hero", health=500, attack=30, defense=40,
+            actions={'close_distance', 'heavy_attack', 'combo_attack', 'create_distance',
+                     'defensive_stance', 'heal', 'dimension_shift', 'dimensional_strike',
+                     'return_shift'},
+            traits={'target_vulnerable': True}
+        )
+        self.enemy = Combatant(
+            name="void_warrior", health=600, attack=25, defense=30,
+            layer=DimensionalLayer.VOID, damage_type='void'
+        )
+
+    def test_seed_determines_fight(self):
+        """Test that a seed replays a fight exactly"""
+        first = simulate_matchup(Matchup(self.player, self.enemy, seed=7))
+        second = simulate_matchup(Matchup(self.player, self.enemy, seed=7))
+        other = simulate_matchup(Matchup(self.player, self.enemy, seed=8))
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first.player_damage_dealt, other.player_damage_dealt)
+        self.assertGreater(first.combat_duration, 0)
+        self.assertIn('dimension_shift', first.abilities_used)
+
+    def test_enemy_hits_resolve_like_enemy_system(self):
+        """Test that enemy attacks use EnemySystem's untyped damage formula"""
+        baseline = simulate_matchup(Matchup(self.player, self.enemy, seed=7))
+
+        # Weaknesses play no part in enemy attacks, a flat resistance does
+        weak = replace(self.player, weakness={'void': 1.0})
+        self.assertEqual(simulate_matchup(Matchup(weak, self.enemy, seed=7)), baseline)
+        resistant = replace(self.player, resistance={'void': 0.5})
+        self.assertLess(simulate_matchup(Matchup(resistant, self.enemy, seed=7)).player_damage_taken,
+                        baseline.player_damage_taken)
+
+    def test_make_matchups(self):
+        """Test the variant grid, labels and per-fight seeds"""
+        matchups = make_matchups(self.player, self.enemy,
+                                 {'attack': [10, 20], 'defense': [5, 50]}, repeats=3)
+        self.assertEqual(len(matchups), 12)
+        self.assertEqual(matchups[0].label, "attack=10,defense=5")
+        self.assertEqual(matchups[-1].enemy.defense, 50)
+        self.assertEqual(len({matchup.seed for matchup in matchups}), 12)
+
+    def test_pool_matches_serial(self):
+        """Test that a process pool gives the same results as a serial run"""
+        matchups = make_matchups(self.player, self.enemy, {'attack': [15, 40]},
+                                 repeats=4, base_seed=3)
+        self.assertEqual(run_sweep(matchups, workers=2, chunksize=2),
+                         run_sweep(matchups, workers=1))
+
+    def test_balance_metrics(self):
+        """Test that stronger enemies win more and metrics feed DimensionalCombat"""
+        results = run_sweep(
+            make_matchups(self.player, self.enemy, {'attack': [10, 60]}, repeats=20),
+            workers=1
+        )
+        summary = summarize_results(results)
+        self.assertEqual(summary["attack=10"]["fights"], 20)
+        self.assertGreater(summary["attack=10"]["victory_rate"],
+                           summary["attack=60"]["victory_rate"])
+
+        combat = DimensionalCombat()
+        recommendations = apply_balance_metrics(results, combat)
+        self.assertGreater(combat.balance_metrics['avg_damage_per_second'], 0)
+        self.assertGreater(combat.balance_metrics['avg_survival_time'], 0)
+        self.assertIsInstance(recommendations, list)
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_sweep_throughput(self):
+        """Benchmark a serial sweep of a few hundred fights"""
+        matchups = make_matchups(self.player, self.enemy, {'attack': [15, 25, 40]}, repeats=100)
+        start_time = time.perf_counter()
+        run_sweep(matchups, workers=1)
+        self.assertLess(time.perf_counter() - start_time, 10.0)  # Thousands per minute per core
+
+if __name__ == '__main__':
+    unittest.main()
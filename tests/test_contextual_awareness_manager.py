@@ -0,0 +1,101 @@
+import unittest
+import json
+import os
+import tempfile
+import time
+from unittest import mock
+
+from src.ai.learning.contextual_awareness_manager import ContextualAwarenessManager
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+class TestContextualAwarenessManager(unittest.TestCase):
+    def setUp(self):
+        """Set up a manager persisting rules to a temporary directory"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "context_rules.json")
+        self.manager = ContextualAwarenessManager(self.path, history_size=3, save_delay=0.05)
+
+    def tearDown(self):
+        if self.manager.save_timer is not None:
+            self.manager.save_timer.cancel()
+        self.directory.cleanup()
+
+    def test_indexed_rules_match_context_values(self):
+        """Test that context values are looked up in the compiled index"""
+        applied = self.manager.manage_context({
+            "location": "forest",
+            "time_of_day": "night",
+            "weather": "foggy",
+            "party": ["ranger"],
+            "mood": "calm"
+        })
+        self.assertEqual(applied, {
+            "location": ("tree", "rock", "stream"),
+            "time_of_day": ("moon", "dark")
+        })
+
+    def test_history_is_bounded(self):
+        """Test that only the most recent contexts are kept"""
+        for hour in range(10):
+            self.manager.manage_context({"hour": hour})
+        self.assertEqual(self.manager.get_context_history(),
+                         [{"hour": 7}, {"hour": 8}, {"hour": 9}])
+        self.assertEqual(self.manager.get_context(), {"hour": 9})
+
+    def test_rule_edits_are_written_behind(self):
+        """Test that a burst of rule edits becomes one debounced write"""
+        with mock.patch("builtins.print"):
+            self.manager.add_context_rule("season", {"winter": ["snow"]})
+            self.manager.update_context_rule("season", {"winter": ["snow", "ice"]})
+            self.manager.remove_context_rule("weather")
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(self.manager.manage_context({"season": "winter", "weather": "sunny"}),
+                         {"season": ("snow", "ice")})
+
+        deadline = time.time() + 2
+        while not os.path.exists(self.path) and time.time() < deadline:
+            time.sleep(0.01)
+        with open(self.path) as f:
+            saved = json.load(f)
+        self.assertEqual(saved["season"], {"winter": ["snow", "ice"]})
+        self.assertNotIn("weather", saved)
+
+        reloaded = ContextualAwarenessManager(self.path)
+        self.assertEqual(reloaded.manage_context({"season": "winter"}), {"season": ("snow", "ice")})
+
+    def test_close_writes_pending_edits(self):
+        """Test that closing writes edits still waiting on the save timer"""
+        self.manager.save_delay = 60
+        with mock.patch("builtins.print"):
+            self.manager.add_context_rule("season", {"winter": ["snow"]})
+        self.assertFalse(os.path.exists(self.path))
+
+        self.manager.close()
+        self.assertIsNone(self.manager.save_timer)
+        self.assertFalse(self.manager.rules_dirty)
+        with open(self.path) as f:
+            self.assertEqual(json.load(f)["season"], {"winter": ["snow"]})
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_context_tick_benchmark(self):
+        """Benchmark context changes at game-tick rate"""
+        with mock.patch("builtins.print"):
+            for i in range(200):
+                self.manager.add_context_rule(f"zone_{i}", {f"state_{j}": [f"action_{j}"]
+                                                            for j in range(20)})
+        self.manager.flush()
+        contexts = [{f"zone_{(tick + i) % 200}": f"state_{tick % 20}" for i in range(20)}
+                    for tick in range(100)]
+
+        with mock.patch("builtins.open", side_effect=AssertionError("file I/O on tick")):
+            start_time = time.perf_counter()
+            for _ in range(100):
+                for context in contexts:
+                    applied = self.manager.manage_context(context)
+            elapsed = time.perf_counter() - start_time
+
+        self.assertEqual(len(applied), 20)
+        self.assertLess(elapsed, 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+import unittest
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from src.characters.enemies.damage_resolver import BatchDamageResolver
+from src.characters.enemies.enemy_system import (
+    CombatAbilities,
+    CombatCalculator,
+    Enemy,
+    EnemyCore,
+    EnemySystem,
+    EnemyType,
+    InteractionSystem,
+    ScalingSystem,
+    SystemIntegrationHandlers
+)
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+def make_combatant(critical_rate=0.0, critical_damage=1.5, defense=0.0, dodge_chance=0.0,
+                   resistance=None, weakness=None):
+    return SimpleNamespace(stats=SimpleNamespace(
+        critical_rate=critical_rate,
+        critical_damage=critical_damage,
+        defense=defense,
+        dodge_chance=dodge_chance,
+        resistance=resistance or {},
+        weakness=weakness or {}
+    ))
+
+def make_enemy(enemy_id, faction, critical_rate=0.0, defense=0.0, resistance=0.0):
+    stats = SimpleNamespace(damage=20.0, health=1000.0, max_health=1000.0,
+                            critical_rate=critical_rate, critical_damage=1.5, defense=defense,
+                            dodge_chance=0.1, resistance=resistance)
+    return Enemy(
+        core=EnemyCore(enemy_id, enemy_id, EnemyType.NORMAL, 1, "grunt", faction),
+        stats=stats,
+        abilities=CombatAbilities([], [], {}, [], {}, {}),
+        behavior=SimpleNamespace(),
+        scaling=ScalingSystem(1.0, {}, {}, 0.0, {}),
+        interaction=InteractionSystem({}, {}, {}, {})
+    )
+
+class TestBatchDamageResolver(unittest.TestCase):
+    def setUp(self):
+        """Set up a small raid"""
+        self.attackers = [make_combatant(critical_rate=0.3) for _ in range(4)]
+        self.targets = [
+            make_combatant(defense=25 * i, dodge_chance=0.1, resistance={'fire': 0.9},
+                           weakness={'ice': 1.0})
+            for i in range(5)
+        ]
+
+    def test_same_seed_reproduces_results(self):
+        """Test that a seed fully determines a batch"""
+        attackers = [self.attackers[i % 4] for i in range(1000)]
+        targets = [self.targets[i % 5] for i in range(1000)]
+        first = BatchDamageResolver(seed=42).resolve(attackers, targets, 50.0, 'fire')
+        second = BatchDamageResolver(seed=42).resolve(attackers, targets, 50.0, 'fire')
+        other = BatchDamageResolver(seed=43).resolve(attackers, targets, 50.0, 'fire')
+
+        np.testing.assert_array_equal(first.damage, second.damage)
+        np.testing.assert_array_equal(first.critical, second.critical)
+        self.assertFalse(np.array_equal(first.damage, other.damage))
+
+    def test_damage_formula(self):
+        """Test defense, capped resistance and weakness without randomness"""
+        resolver = BatchDamageResolver(seed=1, base_damage_variance=0.0)
+        attacker = make_combatant()
+        target = make_combatant(defense=100, resistance={'fire': 0.9}, weakness={'ice': 1.0})
+
+        batch = resolver.resolve_area(attacker, [target, target, target], 100.0, 'fire')
+        np.testing.assert_allclose(batch.damage, 100.0 * 0.5 * 0.25)
+
+        batch = resolver.resolve([attacker, attacker], [target, target], [100.0, 40.0], ['ice', 'shadow'])
+        np.testing.assert_allclose(batch.damage, [100.0 * 1.5 * 0.5, 40.0 * 0.5])
+
+    def test_criticals_and_dodges(self):
+        """Test that certain crits multiply damage and dodged hits deal nothing"""
+        resolver = BatchDamageResolver(seed=3, base_damage_variance=0.0)
+        attacker = make_combatant(critical_rate=1.0, critical_damage=1.5)
+        batch = resolver.resolve_area(attacker, [make_combatant()] * 10, 10.0, 'physical')
+        self.assertTrue(batch.critical.all())
+        np.testing.assert_allclose(batch.damage, 10.0 * 2.0 * 1.5)
+
+        batch = resolver.resolve_area(attacker, [make_combatant(dodge_chance=1.0)] * 10, 10.0, 'physical')
+        self.assertTrue(batch.dodged.all())
+        self.assertEqual(batch.total_damage, 0.0)
+
+    def test_mismatched_lengths(self):
+        """Test that attacker and target lists must line up"""
+        with self.assertRaises(ValueError):
+            BatchDamageResolver().resolve(self.attackers, self.targets, 10.0, 'fire')
+        with self.assertRaises(ValueError):
+            BatchDamageResolver().resolve_basic(self.attackers, self.targets, 10.0)
+
+    def test_basic_formula_matches_enemy_damage(self):
+        """Test resolve_basic against Enemy._calculate_damage with fixed rolls"""
+        resolver = BatchDamageResolver(seed=1, base_damage_variance=0.0)
+        enemy = make_enemy("attacker", "Storm Legion", critical_rate=1.0)
+        targets = [make_enemy(f"target_{i}", "Crystal Conclave", defense=25.0 * i, resistance=0.2 * i)
+                   for i in range(4)]
+        for target in targets:
+            target.stats.dodge_chance = 0.0
+
+        with patch('random.random', return_value=0.0), patch('random.uniform', return_value=1.0):
+            expected = [enemy._calculate_damage(enemy, target, 40.0) for target in targets]
+        batch = resolver.resolve_basic([enemy] * 4, targets, 40.0)
+        self.assertTrue(batch.critical.all())
+        np.testing.assert_allclose(batch.damage, expected)
+
+        # Critical damage and weakness are not part of the basic formula
+        np.testing.assert_allclose(batch.damage[0], 40.0 * 2.0)
+
+    def test_attack_moves_use_the_system_resolver(self):
+        """Test that enemy attack moves roll on their system's seeded resolver"""
+        with patch.object(EnemySystem, '_initialize_systems'), \
+                patch('src.characters.enemies.enemy_system.SystemIntegrationHandlers'):
+            system = EnemySystem(None, None, None, None, damage_seed=21)
+        attacker = make_enemy("attacker", "Storm Legion", critical_rate=0.5)
+        targets = [make_enemy(f"target_{i}", "Crystal Conclave", defense=10.0 * i, resistance=0.1)
+                   for i in range(6)]
+        system.register_enemy(attacker, (0, 0))
+        for i, target in enumerate(targets):
+            system.register_enemy(target, (i * 0.5, 0))
+
+        move = {'damage': 1.5, 'target_type': 'enemy', 'range': 3, 'max_targets': 6,
+                'target_priority': 'lowest_defense'}
+        with patch.object(Enemy, 'particle_system', Mock(), create=True), \
+                patch.object(Enemy, 'sound_system', Mock(), create=True):
+            attacker._execute_attack_move(attacker, move)
+
+        expected = BatchDamageResolver(seed=21).resolve_basic([attacker] * 6, targets, 30.0)
+        np.testing.assert_allclose([1000.0 - t.stats.health for t in targets], expected.damage)
+
+    def test_integration_handler_batches_through_combat_system(self):
+        """Test that the damage handler gathers modifiers once per batch"""
+        calculate_damage = Mock(side_effect=lambda **kwargs: kwargs['base_damage'] * 2)
+        combat_system = SimpleNamespace(calculate_damage=calculate_damage)
+        system = SimpleNamespace(combat_system=combat_system, event_system=None, faction_system=None)
+        with patch.object(SystemIntegrationHandlers, '_initialize_handlers'):
+            handlers = SystemIntegrationHandlers(system)
+        attacker = make_enemy("attacker", "Storm Legion")
+        with patch.object(SystemIntegrationHandlers, '_get_damage_modifiers',
+                          return_value={'base': 1.0}) as modifiers:
+            self.assertEqual(handlers._handle_damage_batch(attacker, ['a', 'b', 'c'], 10.0), [20.0] * 3)
+            self.assertEqual(handlers._handle_damage_calculation(attacker, 'a', 5.0), 10.0)
+        self.assertEqual(modifiers.call_count, 2)
+        self.assertEqual(calculate_damage.call_count, 4)
+
+        system.combat_system = None
+        self.assertEqual(handlers._handle_damage_batch(attacker, ['a', 'b'], 10.0), [10.0, 10.0])
+
+    def test_combat_calculator_as_combat_system(self):
+        """Test that the integration handlers can drive a CombatCalculator"""
+        system = SimpleNamespace(combat_system=CombatCalculator(seed=5),
+                                 event_system=None, faction_system=None)
+        with patch.object(SystemIntegrationHandlers, '_initialize_handlers'):
+            handlers = SystemIntegrationHandlers(system)
+        attacker = make_combatant(critical_rate=0.3)
+        targets = [make_combatant(defense=20.0, dodge_chance=0.2) for _ in range(8)]
+
+        with patch.object(SystemIntegrationHandlers, '_get_damage_modifiers',
+                          return_value={'base': 1.0, 'level': 1.5}):
+            damage = handlers._handle_damage_batch(attacker, targets, 10.0)
+            single = handlers._handle_damage_calculation(attacker, targets[0], 10.0)
+
+        expected = BatchDamageResolver(seed=5).resolve_area(attacker, targets, 15.0, 'enemy')
+        self.assertEqual(damage, expected.damage.tolist())
+        self.assertGreaterEqual(single, 0.0)
+
+        batch = system.combat_system.resolve_damage_batch([attacker] * 8, targets, 10.0, 'fire')
+        self.assertEqual(len(batch), 8)
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_raid_throughput(self):
+        """Benchmark resolving a raid-sized volley of hits"""
+        attackers = [make_combatant(critical_rate=0.2) for _ in range(40)]
+        targets = [make_combatant(defense=30, dodge_chance=0.05) for _ in range(200)]
+        hit_attackers = [attackers[i % 40] for i in range(10000)]
+        hit_targets = [targets[i % 200] for i in range(10000)]
+        resolver = BatchDamageResolver(seed=5)
+
+        start_time = time.perf_counter()
+        batch = resolver.resolve(hit_attackers, hit_targets, 75.0, 'physical')
+        elapsed = time.perf_counter() - start_time
+
+        self.assertEqual(len(batch), 10000)
+        self.assertLess(elapsed, 0.1)  # Well within a frame budget
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+import unittest
+import time
+
+from src.characters.npc.dialogue_system import (
+    DialogueCategory,
+    DialogueContext,
+    DialogueContextCache,
+    DialogueSystem
+)
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+class StatManager:
+    def apply_stat_changes(self, changes, player_state):
+        player_state.update(changes)
+        return changes
+
+class HubDialogueSystem(DialogueSystem):
+    """DialogueSystem with the content lookups a game would provide"""
+    def __init__(self):
+        super().__init__(StatManager(), None, None)
+        self.evaluations = 0
+        self.option_builds = 0
+
+    def _get_conditions(self, dialogue_id):
+        if dialogue_id.startswith("rumor"):
+            return {"world": {"festival": True}}
+        if dialogue_id.startswith("contract"):
+            return {"quests": {"bounty": "active"}, "factions": {"guild": 10}}
+        return {"player": {"level": 5}, "world": {"festival": True}}
+
+    def _get_effects(self, dialogue_id):
+        self.evaluations += 1
+        return {"reputation": 1}
+
+    def _get_dialogue_info(self, dialogue_id):
+        return {"category": DialogueCategory.SIDE_QUEST}
+
+    def _get_dialogue_modifiers(self):
+        return {}
+
+    def _prepare_dialogue_response(self, dialogue_id, state):
+        return {"dialogue_id": dialogue_id, "state": state}
+
+    def _get_choice_info(self, dialogue_id, choice_id):
+        return {"stat_changes": {"charisma": 1}} if choice_id == "flatter" else {}
+
+    def _update_states(self, dialogue_state, choice_results, context):
+        return {"last_effects": dict(choice_results["stat_changes"])}
+
+    def _generate_response(self, dialogue_id, choice_id, context, state_changes):
+        return f"{dialogue_id}:{choice_id}"
+
+    def _get_available_options(self, dialogue_id, context, state_changes):
+        self.option_builds += 1
+        return ["ask", "flatter", "leave"]
+
+def make_context(npc_id, level=6, tension=False):
+    return DialogueContext(
+        world_state={"festival": True, "danger_level": 0.2},
+        player_state={"level": level, "gold": 50},
+        npc_state={"npc_id": npc_id, "importance": 0.8},
+        environmental_factors={"tension": 1.0} if tension else {},
+        active_effects={"blessed"}
+    )
+
+class TestDialogueContextCache(unittest.TestCase):
+    def setUp(self):
+        """Set up a dialogue system with instrumented content lookups"""
+        self.dialogue = HubDialogueSystem()
+
+    def test_repeat_opens_are_cached(self):
+        """Test that the same dialogue in the same context is evaluated once"""
+        first = self.dialogue.initialize_dialogue("harvest_tale", DialogueCategory.SIDE_QUEST,
+                                                  make_context("farmer"))
+        second = self.dialogue.initialize_dialogue("harvest_tale", DialogueCategory.SIDE_QUEST,
+                                                   make_context("farmer"))
+        self.assertEqual(self.dialogue.evaluations, 1)
+        self.assertEqual(first["state"], second["state"])
+        self.assertIsNot(first["state"], second["state"])
+        self.assertAlmostEqual(first["state"].importance, 0.75)
+
+        # Context changes are part of the fingerprint
+        tense = self.dialogue.initialize_dialogue("harvest_tale", DialogueCategory.SIDE_QUEST,
+                                                  make_context("farmer", tension=True))
+        self.assertEqual(self.dialogue.evaluations, 2)
+        self.assertAlmostEqual(tense["state"].urgency, 0.36)
+
+        # Unavailable results are cached too
+        self.assertIsNone(self.dialogue.initialize_dialogue(
+            "harvest_tale", DialogueCategory.SIDE_QUEST, make_context("farmer", level=2)))
+        self.assertIsNone(self.dialogue.initialize_dialogue(
+            "harvest_tale", DialogueCategory.SIDE_QUEST, make_context("farmer", level=2)))
+        self.assertEqual(self.dialogue.context_cache.misses, 3)
+
+    def test_stat_changes_invalidate(self):
+        """Test that choices changing stats drop dependent entries"""
+        context = make_context("bard")
+        self.dialogue.initialize_dialogue("song", DialogueCategory.RELATIONSHIP, context)
+        self.dialogue.process_dialogue_choice("song", "ask", context)
+        self.dialogue.process_dialogue_choice("song", "ask", context)
+        self.assertEqual(self.dialogue.option_builds, 1)
+
+        results = self.dialogue.process_dialogue_choice("song", "flatter", context)
+        self.assertEqual(results["new_options"], ["ask", "flatter", "leave"])
+        self.assertEqual(self.dialogue.option_builds, 2)
+        self.assertEqual(self.dialogue.context_cache.tagged["stats"],
+                         set(self.dialogue.context_cache.entries))
+
+        # Nothing in this dialogue reads quests
+        self.dialogue.invalidate_context("quests")
+        self.assertEqual(len(self.dialogue.context_cache.entries), 1)
+        self.dialogue.invalidate_context()
+        self.assertEqual(len(self.dialogue.context_cache.entries), 0)
+
+    def test_entries_are_tagged_with_what_they_read(self):
+        """Test that invalidation only drops dialogues reading the changed state"""
+        context = make_context("innkeeper")
+        for dialogue_id in ("greeting", "rumor_mill", "contract_board"):
+            self.dialogue.initialize_dialogue(dialogue_id, DialogueCategory.DYNAMIC, context)
+        cache = self.dialogue.context_cache
+        self.assertEqual(cache.entries[cache.fingerprint(
+            "open", "contract_board", DialogueCategory.DYNAMIC, context)][1], ("factions", "quests"))
+
+        self.dialogue.invalidate_context("stats")
+        self.assertEqual(len(cache.entries), 2)
+        self.dialogue.invalidate_context("factions")
+        self.assertEqual(len(cache.entries), 1)
+
+        # Dialogues with only context conditions are never invalidated
+        self.dialogue.invalidate_context()
+        self.dialogue.initialize_dialogue("rumor_mill", DialogueCategory.DYNAMIC, context)
+        self.assertEqual(cache.hits, 1)
+
+    def test_lru_bound_and_unhashable_contexts(self):
+        """Test eviction and contexts that can't be fingerprinted"""
+        cache = DialogueContextCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.get_or_compute(cache.fingerprint(key), ("stats",), lambda: key)
+        self.assertEqual(len(cache.entries), 2)
+        self.assertEqual(len(cache.tagged["stats"]), 2)
+
+        calls = []
+        self.assertIsNone(cache.fingerprint({"items": [bytearray()]}))
+        cache.get_or_compute(None, ("stats",), lambda: calls.append(1))
+        cache.get_or_compute(None, ("stats",), lambda: calls.append(1))
+        self.assertEqual(len(calls), 2)
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_dialogue_hub_benchmark(self):
+        """Benchmark hundreds of NPCs offering dialogue every frame"""
+        contexts = [make_context(f"npc_{i}") for i in range(300)]
+        start_time = time.perf_counter()
+        for _ in range(20):
+            for i, context in enumerate(contexts):
+                self.dialogue.initialize_dialogue(f"greeting_{i % 10}",
+                                                  DialogueCategory.DYNAMIC, context)
+        elapsed = time.perf_counter() - start_time
+
+        self.assertEqual(self.dialogue.evaluations, 300)
+        self.assertEqual(self.dialogue.context_cache.hits, 19 * 300)
+        self.assertLess(elapsed, 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import os
+import tempfile
+import time
+import tracemalloc
+
+from src.characters.npc.dialogue_system import (
+    CONTENT_ATTRIBUTES,
+    DIALOGUE_CONTENT,
+    DialogueContentRegistry,
+    DialogueSystem
+)
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+class TestDialogueContentRegistry(unittest.TestCase):
+    def setUp(self):
+        """Set up a fresh registry so lazy building can be observed"""
+        self.registry = DialogueContentRegistry()
+
+    def test_builds_only_what_is_used(self):
+        """Test that content is built per group on first use"""
+        dialogue = DialogueSystem(None, None, None, content=self.registry)
+        self.assertEqual(self.registry._built, set())
+
+        ritual = dialogue.ritual_types["celestial_summoning"]
+        self.assertEqual(ritual.name, "Celestial Summoning")
+        self.assertEqual(self.registry._built, {"ritual_types"})
+
+        # Variations come from two groups, built in source order
+        variations = dialogue.ritual_variations
+        self.assertIn("astral_convergence", variations["celestial_summoning"])
+        self.assertIn("abyssal_calling", variations["void_summoning"])
+
+    def test_content_is_shared_and_read_only(self):
+        """Test that instances share content but not mutable dialogue state"""
+        first = DialogueSystem(None, None, None)
+        second = DialogueSystem(None, None, None)
+        self.assertIs(first.content, DIALOGUE_CONTENT)
+        self.assertIs(first.effect_chains, second.effect_chains)
+        self.assertIn("betrayal_revelation", first.effect_chains)
+        with self.assertRaises(TypeError):
+            first.ritual_types["new_ritual"] = None
+
+        first.knowledge_tracker.known_facts.add("secret_door")
+        self.assertNotIn("secret_door", second.knowledge_tracker.known_facts)
+
+    def test_extending_groups_load_after_their_base(self):
+        """Test groups that extend content another group never created"""
+        self.registry.load_group("advanced_complexes")
+        self.assertIn("advanced_emotional_states", self.registry._built)
+        self.assertEqual(len(self.registry.get("emotional_complexes")), 4)
+        self.assertEqual(len(self.registry.get("special_interactions")), 2)
+
+        dialogue = DialogueSystem(None, None, None, content=self.registry)
+        dialogue.initialize_recovery_variations()
+        self.assertIn("recovery_variations", self.registry._built)
+
+    def test_pickle_cache(self):
+        """Test that a compiled cache loads without running builders"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "dialogue_content.pickle")
+            DialogueContentRegistry().compile_cache(path)
+
+            cached = DialogueContentRegistry(path)
+            self.assertEqual(cached.get("ritual_types")["celestial_summoning"].name,
+                             "Celestial Summoning")
+            self.assertEqual(cached._built, set())
+            for attribute in CONTENT_ATTRIBUTES:
+                self.assertEqual(cached.get(attribute), self.registry.get(attribute))
+
+            # Without a usable cache the registry builds instead
+            missing = DialogueContentRegistry(os.path.join(directory, "missing.pickle"))
+            self.assertIn("celestial_summoning", missing.get("ritual_types"))
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_construction_benchmark(self):
+        """Benchmark constructing many dialogue systems"""
+        DIALOGUE_CONTENT.load_group("ritual_types")
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        systems = [DialogueSystem(None, None, None) for _ in range(1000)]
+        elapsed = time.perf_counter() - start_time
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertTrue(all(system.ritual_types is systems[0].ritual_types for system in systems))
+        self.assertLess(elapsed, 0.1)
+        self.assertLess(memory, 1000 * 2048)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import time
+
+import numpy as np
+
+from src.combat_system.dimensional_combat import (
+    DimensionalCombat,
+    DimensionalLayer,
+    LAYER_INDEX,
+    Position
+)
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+class TestBatchDistortion(unittest.TestCase):
+    def setUp(self):
+        """Set up distorted layers and random coordinates"""
+        self.combat = DimensionalCombat()
+        void = self.combat.dimensional_states[DimensionalLayer.VOID]
+        void.distortion_level = 0.4
+        void.corruption_level = 0.3
+        void.energy_level = 0.8
+        self.combat.dimensional_states[DimensionalLayer.ETHEREAL].distortion_level = 0.2
+
+        rng = np.random.default_rng(3)
+        self.coordinates = rng.uniform(-50, 50, (1000, 3))
+        self.layer_index = rng.integers(0, len(DimensionalLayer), 1000)
+        self.intensity = rng.uniform(0.5, 2.0, 1000)
+
+    def _scalar(self, coordinates, layers, intensity):
+        layer_list = list(DimensionalLayer)
+        result = []
+        for (x, y, z), layer, scale in zip(coordinates, layers, intensity):
+            distorted = self.combat.apply_dimensional_distortion(
+                Position(x, y, z), layer_list[layer], scale
+            )
+            result.append((distorted.x, distorted.y, distorted.z))
+        return np.array(result)
+
+    def test_matches_scalar_path(self):
+        """Test per-layer batch distortion against the scalar transform"""
+        expected = self._scalar(self.coordinates, self.layer_index, self.intensity)
+        coordinates = self.coordinates.copy()
+        result = self.combat.apply_dimensional_distortion_batch(
+            coordinates, self.layer_index, self.intensity
+        )
+
+        self.assertIs(result, coordinates)
+        np.testing.assert_allclose(coordinates, expected, rtol=1e-9, atol=1e-9)
+
+        # Rows on undistorted layers are left exactly as they were
+        still = self.layer_index == LAYER_INDEX[DimensionalLayer.PHYSICAL]
+        np.testing.assert_array_equal(coordinates[still], self.coordinates[still])
+
+    def test_single_layer(self):
+        """Test distorting every position on one layer"""
+        coordinates = self.coordinates.copy()
+        self.combat.apply_dimensional_distortion_batch(coordinates, DimensionalLayer.VOID)
+        expected = self._scalar(
+            self.coordinates, [LAYER_INDEX[DimensionalLayer.VOID]] * 1000, [1.0] * 1000
+        )
+        np.testing.assert_allclose(coordinates, expected, rtol=1e-9, atol=1e-9)
+
+        coordinates = self.coordinates.copy()
+        self.combat.apply_dimensional_distortion_batch(coordinates, DimensionalLayer.CELESTIAL)
+        np.testing.assert_array_equal(coordinates, self.coordinates)
+
+    def test_single_precision(self):
+        """Test that float32 buffers stay float32 and close to the scalar path"""
+        coordinates = self.coordinates.astype(np.float32)
+        self.combat.apply_dimensional_distortion_batch(coordinates, self.layer_index, self.intensity)
+        expected = self._scalar(self.coordinates, self.layer_index, self.intensity)
+
+        self.assertEqual(coordinates.dtype, np.float32)
+        np.testing.assert_allclose(coordinates, expected, rtol=1e-3, atol=1e-2)
+
+    def test_rejects_integer_coordinates(self):
+        """Test that integer arrays, which can't hold the result, are rejected"""
+        coordinates = np.arange(30).reshape(10, 3)
+        with self.assertRaises(TypeError):
+            self.combat.apply_dimensional_distortion_batch(coordinates, DimensionalLayer.VOID)
+        np.testing.assert_array_equal(coordinates, np.arange(30).reshape(10, 3))
+
+    def _speedup(self, dtype):
+        """Scalar time over best batch time for 10k positions on one layer"""
+        rng = np.random.default_rng(9)
+        coordinates = rng.uniform(-50, 50, (10000, 3)).astype(dtype)
+        positions = [Position(float(x), float(y), float(z)) for x, y, z in coordinates]
+
+        start_time = time.perf_counter()
+        for position in positions:
+            self.combat.apply_dimensional_distortion(position, DimensionalLayer.VOID)
+        scalar_time = time.perf_counter() - start_time
+
+        batch_time = float('inf')
+        for _ in range(5):
+            batch = coordinates.copy()
+            start_time = time.perf_counter()
+            self.combat.apply_dimensional_distortion_batch(batch, DimensionalLayer.VOID)
+            batch_time = min(batch_time, time.perf_counter() - start_time)
+        return scalar_time / batch_time
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_batch_throughput(self):
+        """Benchmark a 10k float32 particle buffer against the scalar path"""
+        self.assertGreaterEqual(self._speedup(np.float32), 50)
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_double_precision_throughput(self):
+        """Benchmark 10k float64 positions against the scalar path.
+
+        float64 sin/cos aren't SIMD-vectorised in NumPy, so this path
+        reaches about 25-30x rather than float32's 50x and up.
+        """
+        self.assertGreaterEqual(self._speedup(np.float64), 15)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from datetime import datetime, timedelta
+
+from src.combat_system.dimensional_combat import (
+    DimensionalCombat,
+    DimensionalEffect,
+    DimensionalLayer,
+    CombatModifier,
+    ModifierStore
+)
+
+class TestModifierStore(unittest.TestCase):
+    def setUp(self):
+        """Set up an empty modifier store"""
+        self.store = ModifierStore(['damage', 'dimensional_power'])
+
+    def test_totals_combine_additive_and_multiplicative(self):
+        """Test the total formula and that unknown types are neutral"""
+        self.store.add('damage', CombatModifier(value=0.2, duration=60))
+        self.store.add('damage', CombatModifier(value=0.3, duration=60))
+        self.store.add('damage', CombatModifier(value=0.5, duration=60, is_multiplicative=True))
+
+        self.assertAlmostEqual(self.store.total('damage'), 1.5 * 1.5)
+        self.assertEqual(self.store.total('dimensional_power'), 1.0)
+        self.assertEqual(self.store.total('speed'), 1.0)
+        self.assertFalse(self.store.add('speed', CombatModifier(value=1.0, duration=60)))
+
+    def test_expired_modifiers_are_dropped(self):
+        """Test that the expiry heap removes modifiers and invalidates totals"""
+        start = datetime.now()
+        self.store.add('damage', CombatModifier(value=0.5, duration=5, timestamp=start))
+        self.store.add('damage', CombatModifier(value=0.25, duration=60, timestamp=start))
+        self.assertAlmostEqual(self.store.total('damage'), 1.75)
+
+        self.store.expire(start + timedelta(seconds=10))
+        self.assertEqual(len(self.store['damage']), 1)
+        self.assertAlmostEqual(self.store.total('damage'), 1.25)
+
+        self.store.expire(start + timedelta(seconds=61))
+        self.assertEqual(self.store.total('damage'), 1.0)
+
+class TestLayerMatrix(unittest.TestCase):
+    def setUp(self):
+        """Set up a combat system with default dimensions"""
+        self.combat = DimensionalCombat()
+
+    def test_affinity_lookup(self):
+        """Test cross-dimensional power from the cached matrix"""
+        power, effects = self.combat.calculate_dimensional_effect(
+            DimensionalLayer.PHYSICAL, DimensionalLayer.CELESTIAL, 100.0
+        )
+        self.assertAlmostEqual(power, 150.0)
+        self.assertEqual(effects, [])
+
+        power, _ = self.combat.calculate_dimensional_effect(
+            DimensionalLayer.ETHEREAL, DimensionalLayer.VOID, 100.0
+        )
+        self.assertAlmostEqual(power, 200.0)
+
+    def test_state_changes_refresh_matrix(self):
+        """Test that stability, corruption and effect changes are picked up"""
+        void = self.combat.dimensional_states[DimensionalLayer.VOID]
+        physical = self.combat.dimensional_states[DimensionalLayer.PHYSICAL]
+        self.combat.calculate_dimensional_effect(DimensionalLayer.PHYSICAL, DimensionalLayer.VOID, 100.0)
+
+        void.stability = 0.5
+        void.corruption_level = 0.5
+        power, _ = self.combat.calculate_dimensional_effect(
+            DimensionalLayer.PHYSICAL, DimensionalLayer.VOID, 100.0
+        )
+        self.assertAlmostEqual(power, 100.0 * 0.5 * 0.5 * 0.7)
+
+        physical.add_effect(DimensionalEffect.RESONANCE)
+        void.active_effects = {DimensionalEffect.DISSONANCE}
+        power, effects = self.combat.calculate_dimensional_effect(
+            DimensionalLayer.PHYSICAL, DimensionalLayer.VOID, 100.0
+        )
+        self.assertAlmostEqual(power, 100.0 * 0.5 * 0.5 * 0.7 * 1.5 * 0.7)
+        self.assertEqual(effects, [DimensionalEffect.RESONANCE, DimensionalEffect.DISSONANCE])
+
+    def test_combat_modifiers_apply(self):
+        """Test that dimensional power modifiers scale the result"""
+        self.combat.add_combat_modifier('dimensional_power', 0.5, duration=60)
+        power, _ = self.combat.calculate_dimensional_effect(
+            DimensionalLayer.PHYSICAL, DimensionalLayer.ETHEREAL, 100.0
+        )
+        self.assertAlmostEqual(power, 150.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from unittest.mock import Mock
+import copy
+
+from economic_system import EconomicSystem
+from trading_system import TradeManager, TradeRoute, EconomicCrisis, TradeItemType
+from economy_simulation import EconomySimulation
+
+class TestEconomySimulation(unittest.TestCase):
+    def setUp(self):
+        """Set up a small trade network"""
+        self.trade_manager = TradeManager(visual_system=Mock())
+        self.trade_manager.trade_network = {
+            "north": TradeRoute("capital", "frost_hold", 12, 0.4, set()),
+            "south": TradeRoute("capital", "sun_port", 8, 0.2, set()),
+            "east": TradeRoute("sun_port", "ember_gate", 20, 0.6, set())
+        }
+        self.trade_manager.active_crises = [
+            EconomicCrisis(
+                name="Trade Route Collapse",
+                duration=48,
+                effects={"route_safety": 0.99, "transport_cost": 1.001},
+                affected_regions={"sun_port"},
+                affected_items=set()
+            )
+        ]
+        event = Mock(modifiers={TradeItemType.FOOD: 1.05, TradeItemType.GEM: 0.97})
+        self.trade_manager.market_state["current_events"].append(event)
+
+    def _step_copy(self, game_time: int, ticks: int) -> TradeManager:
+        stepped = copy.deepcopy(self.trade_manager)
+        for tick in range(ticks):
+            stepped.update_market_conditions(game_time + tick)
+            stepped.update_trade_routes(game_time + tick)
+        return stepped
+
+    def test_fast_forward_matches_stepping(self):
+        """Test that a skip ends in the same state as individual ticks"""
+        stepped = self._step_copy(80, 400)
+        simulation = EconomySimulation(EconomicSystem(), self.trade_manager)
+        result = simulation.fast_forward(80, 400)
+
+        self.assertEqual(result["ticks"], 400)
+        self.assertEqual(result["end_time"], 480)
+        for route_id, route in stepped.trade_network.items():
+            skipped = self.trade_manager.trade_network[route_id]
+            self.assertAlmostEqual(skipped.maintenance_cost / route.maintenance_cost, 1.0)
+            self.assertAlmostEqual(skipped.risk_level / route.risk_level, 1.0)
+
+        for item_type in TradeItemType:
+            self.assertAlmostEqual(
+                self.trade_manager.market_state["supply_demand"][item_type],
+                stepped.market_state["supply_demand"][item_type]
+            )
+            self.assertEqual(
+                self.trade_manager._calculate_market_trend(item_type),
+                stepped._calculate_market_trend(item_type)
+            )
+
+    def test_zero_ticks_is_noop(self):
+        """Test that skipping no time changes nothing"""
+        simulation = EconomySimulation(EconomicSystem(), self.trade_manager)
+        result = simulation.fast_forward(10, 0)
+
+        self.assertEqual(result["ticks"], 0)
+        self.assertEqual(self.trade_manager.trade_network["north"].maintenance_cost, 1.0)
+        self.assertEqual(self.trade_manager.market_state["supply_demand"], {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+import random
+import time
+from collections import Counter
+
+from src.combat_system.encounter_generator import (
+    EncounterGenerator,
+    EncounterTemplate,
+    EncounterType,
+    EncounterPhase,
+    TerrainType
+)
+from src.combat_system.dimensional_combat import DimensionalLayer
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+def make_template(name, level_range, difficulty, stability):
+    return EncounterTemplate(
+        name=name,
+        encounter_type=EncounterType.STANDARD,
+        level_range=level_range,
+        enemy_composition={'void_warrior': (1, 2)},
+        terrain_types=[TerrainType.OPEN],
+        dimensional_properties={DimensionalLayer.PHYSICAL: stability},
+        phase_progression=[EncounterPhase.INTRODUCTION],
+        difficulty_rating=difficulty,
+        rewards={'experience': 100},
+        special_conditions={}
+    )
+
+def brute_force_candidates(generator, player_level, difficulty, stability):
+    """The original linear filter over every template"""
+    names = set()
+    for template in generator.encounter_templates.values():
+        avg = sum(template.dimensional_properties.values()) / len(template.dimensional_properties)
+        if (template.level_range[0] <= player_level <= template.level_range[1]
+                and abs(template.difficulty_rating - difficulty) <= 0.5
+                and abs(avg - stability) <= 0.3
+                and template.name != generator.last_encounter):
+            names.add(template.name)
+    return names
+
+class TestEncounterTemplateIndex(unittest.TestCase):
+    def setUp(self):
+        """Set up a generator with many extra templates"""
+        random.seed(7)
+        self.generator = EncounterGenerator()
+        rng = random.Random(3)
+        for i in range(300):
+            low = rng.randint(1, 45)
+            self.generator.add_encounter_template(make_template(
+                f"extra_{i}", (low, low + rng.randint(0, 10)),
+                rng.uniform(1.0, 3.5), rng.uniform(0.2, 0.9)
+            ))
+
+    def test_candidates_match_linear_filter(self):
+        """Test that the level band index finds the same templates as a full scan"""
+        rng = random.Random(5)
+        for _ in range(200):
+            level = rng.randint(1, 50)
+            difficulty = rng.uniform(1.0, 3.5)
+            stability = rng.uniform(0.2, 0.9)
+            templates, cumulative = self.generator._get_weight_table(
+                level, difficulty, stability, self.generator.last_encounter
+            )
+            self.assertEqual(
+                {template.name for template in templates},
+                brute_force_candidates(self.generator, level, difficulty, stability)
+            )
+            self.assertEqual(cumulative, sorted(cumulative))
+
+    def test_sampling_follows_weights(self):
+        """Test that bisect sampling picks templates in proportion to weight"""
+        generator = EncounterGenerator()
+        generator.add_encounter_template(make_template("near", (10, 10), 2.0, 0.5))
+        generator.add_encounter_template(make_template("far", (10, 10), 2.5, 0.5))
+        picks = Counter(
+            generator._select_encounter_template(10, 2.0, 0.5).name for _ in range(4000)
+        )
+        # Weights are 1 and 1 / 1.5 for the difficulty mismatch
+        self.assertAlmostEqual(picks['near'] / picks['far'], 1.5, delta=0.2)
+
+    def test_removed_templates_are_unindexed(self):
+        """Test that replaced and removed templates stop being selected"""
+        self.generator.add_encounter_template(make_template("solo", (49, 50), 9.0, 0.5))
+        self.assertEqual(self.generator._select_encounter_template(50, 9.0, 0.5).name, "solo")
+        self.generator.remove_encounter_template("solo")
+        self.assertIsNone(self.generator._select_encounter_template(50, 9.0, 0.5))
+
+    def test_generate_encounters_for_region(self):
+        """Test batch generation never repeats a template back to back"""
+        encounters = self.generator.generate_encounters(50, 10, 1.8, 0.6)
+        self.assertEqual(len(encounters), 50)
+        names = [encounter['template_name'] for encounter in encounters]
+        self.assertTrue(all(a != b for a, b in zip(names, names[1:])))
+        for encounter in encounters:
+            self.assertEqual(len(encounter['spawn_points']), len(encounter['enemies']))
+
+        self.assertEqual(self.generator.generate_encounters(5, 50, 9.0, 0.0), [])
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_selection_throughput(self):
+        """Benchmark repeated template selection for one region"""
+        start_time = time.perf_counter()
+        for _ in range(10000):
+            self.generator._select_encounter_template(20, 2.0, 0.6)
+        self.assertLess(time.perf_counter() - start_time, 0.1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import random
+import time
+
+from src.combat_system.encounter_pool import EncounterPool
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+class TestEncounterPool(unittest.TestCase):
+    def setUp(self):
+        """Set up a running pool with one region"""
+        random.seed(2)
+        self.pool = EncounterPool(pool_size=3)
+        self.pool.start()
+        self.pool.update_region("void_wastes", 10, 1.8, 0.6)
+
+    def tearDown(self):
+        self.pool.stop()
+
+    def test_acquire_from_filled_pool(self):
+        """Test that the worker fills a region and acquire takes from it"""
+        self.assertTrue(self.pool.wait_until_ready("void_wastes", timeout=5))
+        self.assertEqual(self.pool.ready_count("void_wastes"), 3)
+
+        encounter = self.pool.acquire("void_wastes")
+
+        self.assertIn(encounter['template_name'], {'void_breach', 'shadow_infiltration'})
+        self.assertEqual(self.pool.hits, 1)
+
+        # The worker tops the queue back up
+        self.assertTrue(self.pool.wait_until_ready("void_wastes", timeout=5))
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_acquire_latency(self):
+        """Test that taking a ready encounter doesn't wait on generation"""
+        self.assertTrue(self.pool.wait_until_ready("void_wastes", timeout=5))
+
+        start_time = time.perf_counter()
+        encounter = self.pool.acquire("void_wastes")
+        elapsed = time.perf_counter() - start_time
+
+        self.assertIsNotNone(encounter)
+        self.assertLess(elapsed, 0.005)
+
+    def test_small_drift_keeps_pool(self):
+        """Test that inputs within tolerance don't discard ready encounters"""
+        self.assertTrue(self.pool.wait_until_ready("void_wastes", timeout=5))
+        region = self.pool.regions["void_wastes"]
+        self.pool.update_region("void_wastes", 11, 1.8, 0.65)
+        self.assertIs(self.pool.regions["void_wastes"], region)
+        self.assertEqual(self.pool.ready_count("void_wastes"), 3)
+
+    def test_drift_invalidates_pool(self):
+        """Test that a large change in inputs regenerates the region"""
+        self.assertTrue(self.pool.wait_until_ready("void_wastes", timeout=5))
+        self.pool.update_region("void_wastes", 30, 3.5, 0.45)
+        self.assertTrue(self.pool.wait_until_ready("void_wastes", timeout=5))
+
+        encounter = self.pool.acquire("void_wastes")
+        self.assertIn(encounter['template_name'], {'void_apocalypse', 'primordial_chaos'})
+
+    def test_fallback_and_unknown_regions(self):
+        """Test synchronous generation on a miss and unknown regions"""
+        self.pool.stop()
+        self.pool.update_region("rift", 20, 2.0, 0.6)
+        self.assertIsNotNone(self.pool.acquire("rift"))
+        self.assertEqual(self.pool.misses, 1)
+        self.assertIsNone(self.pool.acquire("nowhere"))
+
+    def test_regions_with_no_templates(self):
+        """Test that the worker gives up on regions no template fits"""
+        self.pool.update_region("empty", 50, 9.0, 0.0)
+        self.assertTrue(self.pool.wait_until_ready("empty", timeout=5))
+        self.assertTrue(self.pool.regions["empty"].exhausted)
+        self.assertIsNone(self.pool.acquire("empty"))
+
+    def test_single_template_region_refills(self):
+        """Test that repeat avoidance only pauses a region with one template"""
+        self.pool.remove_region("void_wastes")
+        # At levels 5-9 void_breach is the only template that fits
+        self.pool.update_region("breach", 7, 1.8, 0.6)
+        self.assertTrue(self.pool.wait_until_ready("breach", timeout=5))
+        region = self.pool.regions["breach"]
+        self.assertFalse(region.exhausted)
+        self.assertEqual(region.blocked_by, 'void_breach')
+        self.assertEqual(self.pool.acquire("breach")['template_name'], 'void_breach')
+
+        # Another region's encounter moves the generator off void_breach,
+        # and the worker comes back to the paused region before refilling it
+        self.pool.update_region("void_wastes", 12, 2.0, 0.6)
+        self.assertTrue(self.pool.wait_until_ready("void_wastes", timeout=5))
+        self.assertGreaterEqual(self.pool.ready_count("breach"), 1)
+        self.assertEqual(self.pool.acquire("breach")['template_name'], 'void_breach')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,247 @@
+import unittest
+import random
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.characters.enemies.enemy_system import (
+    BehaviorSystem,
+    CombatAbilities,
+    Enemy,
+    EnemyCore,
+    EnemySystem,
+    EnemyType,
+    InteractionSystem,
+    ScalingSystem
+)
+from src.characters.enemies.spatial_index import SpatialHashGrid
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+FACTIONS = ["Shadow Covenant", "Crystal Conclave", "Storm Legion"]
+
+class TestSpatialHashGrid(unittest.TestCase):
+    def setUp(self):
+        """Set up a grid populated with random enemies"""
+        self.rng = random.Random(11)
+        self.grid = SpatialHashGrid(cell_size=5.0)
+        self.positions = {}
+        self.factions = {}
+        for i in range(300):
+            key = f"enemy_{i}"
+            position = (self.rng.randint(-50, 50), self.rng.randint(-50, 50))
+            faction = self.rng.choice(FACTIONS)
+            self.grid.insert(key, key, position, faction)
+            self.positions[key] = position
+            self.factions[key] = faction
+
+    def _brute_force(self, position, radius, faction=None, exclude_faction=None):
+        return sorted(
+            key for key, (x, y) in self.positions.items()
+            if (x - position[0]) ** 2 + (y - position[1]) ** 2 <= radius * radius
+            and (faction is None or self.factions[key] == faction)
+            and (exclude_faction is None or self.factions[key] != exclude_faction)
+        )
+
+    def test_radius_query_matches_brute_force(self):
+        """Test radius and faction filtered queries against a full scan"""
+        for _ in range(50):
+            center = (self.rng.uniform(-60, 60), self.rng.uniform(-60, 60))
+            radius = self.rng.uniform(1, 15)
+            self.assertEqual(
+                sorted(self.grid.query_radius(center, radius)),
+                self._brute_force(center, radius)
+            )
+            self.assertEqual(
+                sorted(self.grid.query_radius(center, radius, faction=FACTIONS[0])),
+                self._brute_force(center, radius, faction=FACTIONS[0])
+            )
+            self.assertEqual(
+                sorted(self.grid.query_radius(center, radius, exclude_faction=FACTIONS[1])),
+                self._brute_force(center, radius, exclude_faction=FACTIONS[1])
+            )
+
+    def test_nearest_matches_brute_force(self):
+        """Test k-nearest ordering against sorting every distance"""
+        for _ in range(30):
+            center = (self.rng.uniform(-60, 60), self.rng.uniform(-60, 60))
+            nearest = self.grid.nearest(center, k=5, faction=FACTIONS[2])
+            distances = sorted(
+                (x - center[0]) ** 2 + (y - center[1]) ** 2
+                for key, (x, y) in self.positions.items()
+                if self.factions[key] == FACTIONS[2]
+            )[:5]
+            found = [
+                (self.positions[key][0] - center[0]) ** 2 + (self.positions[key][1] - center[1]) ** 2
+                for key in nearest
+            ]
+            self.assertEqual(len(found), 5)
+            for expected, actual in zip(distances, found):
+                self.assertAlmostEqual(expected, actual)
+
+    def test_incremental_move_and_remove(self):
+        """Test that moves and removals keep queries and occupancy correct"""
+        for key in list(self.positions)[:100]:
+            position = (self.rng.randint(-50, 50), self.rng.randint(-50, 50))
+            self.grid.move(key, position)
+            self.positions[key] = position
+        for key in list(self.positions)[100:150]:
+            self.assertTrue(self.grid.remove(key))
+            del self.positions[key]
+
+        self.assertEqual(len(self.grid), 250)
+        self.assertFalse(self.grid.remove("enemy_100"))
+        self.assertEqual(
+            sorted(self.grid.query_radius((0, 0), 20)),
+            self._brute_force((0, 0), 20)
+        )
+        for center in ((0, 0), (-45, 30), (60, -60)):
+            nearest = self.grid.nearest(center, k=3)
+            distances = sorted(
+                (x - center[0]) ** 2 + (y - center[1]) ** 2 for x, y in self.positions.values()
+            )[:3]
+            for expected, key in zip(distances, nearest):
+                x, y = self.positions[key]
+                self.assertAlmostEqual(expected, (x - center[0]) ** 2 + (y - center[1]) ** 2)
+        occupied = set(self.positions.values())
+        for x in range(-50, 51, 7):
+            for y in range(-50, 51, 7):
+                self.assertEqual(self.grid.is_occupied((x, y)), (x, y) in occupied)
+
+    def test_bounds_follow_removals(self):
+        """Test that the cell bounds used by nearest() shrink as edge cells empty"""
+        grid = SpatialHashGrid(cell_size=1.0)
+        grid.insert("near", "near", (0.5, 0.5))
+        grid.insert("far", "far", (90.5, -40.5))
+        self.assertEqual(grid._grid_bounds(), (0, -41, 90, 0))
+        self.assertEqual(grid.nearest((80, -30)), ["far"])
+
+        grid.remove("far")
+        self.assertEqual(grid._grid_bounds(), (0, 0, 0, 0))
+        self.assertEqual(grid.nearest((80, -30)), ["near"])
+        grid.move("near", (-3.5, 2.5))
+        self.assertEqual(grid._grid_bounds(), (-4, 2, -4, 2))
+        self.assertEqual(grid.nearest((0, 0), max_radius=2), [])
+
+    def test_exclude_and_predicate(self):
+        """Test that the querying enemy and filtered entities are skipped"""
+        grid = SpatialHashGrid(cell_size=2.0)
+        grid.insert("a", "a", (0, 0), "Storm Legion")
+        grid.insert("b", "b", (1, 0), "Storm Legion")
+        grid.insert("c", "c", (0, 1), "Storm Legion")
+
+        self.assertEqual(
+            sorted(grid.query_radius((0, 0), 3, faction="Storm Legion", exclude="a")),
+            ["b", "c"]
+        )
+        self.assertEqual(grid.nearest((0, 0), exclude="a", predicate=lambda e: e != "b"), ["c"])
+        self.assertEqual(grid.nearest((0, 0), faction="Void Seekers"), [])
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_neighbor_query_benchmark(self):
+        """Benchmark per-tick neighbour query cost against enemy count"""
+        tick_costs = {}
+        for enemy_count in (250, 500, 1000):
+            rng = random.Random(enemy_count)
+            # Constant density: the map grows with the enemy count
+            extent = int((enemy_count * 25) ** 0.5)
+            grid = SpatialHashGrid(cell_size=5.0)
+            positions = {}
+            for i in range(enemy_count):
+                position = (rng.uniform(0, extent), rng.uniform(0, extent))
+                grid.insert(i, i, position, rng.choice(FACTIONS))
+                positions[i] = position
+
+            # One AI tick: every enemy moves a little and queries its neighbours
+            start_time = time.perf_counter()
+            for key, (x, y) in positions.items():
+                grid.move(key, (x + rng.uniform(-1, 1), y + rng.uniform(-1, 1)))
+                grid.query_radius(grid.position_of(key), 5, exclude=key)
+            tick_costs[enemy_count] = time.perf_counter() - start_time
+
+        # With constant density the cost per enemy stays roughly flat, where
+        # a full scan per enemy would grow fourfold from 250 to 1000 enemies
+        per_enemy_small = tick_costs[250] / 250
+        per_enemy_large = tick_costs[1000] / 1000
+        self.assertLess(per_enemy_large, per_enemy_small * 3)
+        self.assertLess(tick_costs[1000], 0.5)
+
+def make_enemy(enemy_id, faction, harmless=False):
+    power = 0.0 if harmless else 1.0
+    return Enemy(
+        core=EnemyCore(enemy_id, enemy_id, EnemyType.NORMAL, 1, "grunt", faction),
+        stats=SimpleNamespace(damage=power, health=power, max_health=1.0, speed=power, defense=power),
+        abilities=CombatAbilities([], [], {}, [], {}, {}),
+        behavior=BehaviorSystem(power, power, power, power, [], {}, {}),
+        scaling=ScalingSystem(1.0, {}, {}, 0.0, {}),
+        interaction=InteractionSystem({}, {}, {}, {})
+    )
+
+class TestEnemySystemNeighbors(unittest.TestCase):
+    def setUp(self):
+        """Set up an enemy system with registered enemies from several factions"""
+        # Template loading and the other systems' handlers are not under test
+        with patch.object(EnemySystem, '_initialize_systems'), \
+                patch('src.characters.enemies.enemy_system.SystemIntegrationHandlers'):
+            self.system = EnemySystem(None, None, None, None)
+        self.rng = random.Random(5)
+        for i in range(200):
+            enemy = make_enemy(f"enemy_{i}", self.rng.choice(FACTIONS), harmless=i % 7 == 0)
+            self.system.register_enemy(enemy, (self.rng.uniform(0, 40), self.rng.uniform(0, 40)))
+        self.system.enemies["enemy_3"].current_action = 'escaped'
+
+    def _full_scan(self, enemy, radius, keep):
+        return sorted(
+            other.core.id for other in self.system.enemies.values()
+            if other is not enemy and keep(other)
+            and enemy._calculate_distance(enemy.position, other.position) <= radius
+        )
+
+    def _assert_matches_full_scan(self):
+        for enemy in self.system.enemies.values():
+            faction = enemy.core.faction
+            self.assertEqual(
+                sorted(other.core.id for other in enemy._get_nearby_allies(enemy)),
+                self._full_scan(enemy, 5, lambda other: other.core.faction == faction)
+            )
+            self.assertEqual(
+                sorted(other.core.id for other in enemy._get_nearby_threats(enemy, range=8)),
+                self._full_scan(enemy, 8, lambda other: other.core.faction != faction
+                                and enemy._calculate_threat_level(other) > 0)
+            )
+            self.assertEqual(
+                sorted(other.core.id for other in enemy._get_nearby_targets(enemy, range=3)),
+                self._full_scan(enemy, 3, lambda other: other.core.faction != faction
+                                and other.current_action != 'escaped')
+            )
+            allies = self._full_scan(enemy, 5, lambda other: other.core.faction == faction)
+            nearest = enemy._find_nearest_ally(enemy)
+            if allies:
+                self.assertEqual(
+                    enemy._calculate_distance(enemy.position, nearest.position),
+                    min(enemy._calculate_distance(enemy.position, self.system.enemies[key].position)
+                        for key in allies)
+                )
+            else:
+                self.assertIsNone(nearest)
+
+    def test_queries_match_full_scan(self):
+        """Test enemy neighbour queries against scanning every enemy"""
+        self.assertTrue(all(enemy.system is self.system for enemy in self.system.enemies.values()))
+        self._assert_matches_full_scan()
+
+    def test_queries_follow_moves_and_removals(self):
+        """Test that moved, teleported and unregistered enemies are found where they are"""
+        enemies = list(self.system.enemies.values())
+        for enemy in enemies[:60]:
+            self.system.move_enemy(enemy, (self.rng.uniform(0, 40), self.rng.uniform(0, 40)))
+        with patch.object(Enemy, '_calculate_teleport_position', create=True, return_value=(20, 20)):
+            enemies[90]._execute_utility_move(enemies[90], {'utility_type': 'teleport'})
+        self.assertEqual(self.system.spatial_index.position_of(enemies[90].core.id), (20, 20))
+        for enemy in enemies[100:130]:
+            self.system.unregister_enemy(enemy)
+
+        self.assertEqual(len(self.system.spatial_index), 170)
+        self._assert_matches_full_scan()
+
+if __name__ == '__main__':
+    unittest.main()
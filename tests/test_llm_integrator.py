@@ -0,0 +1,135 @@
+import unittest
+import re
+import sys
+import threading
+import time
+
+import numpy as np
+
+from src.ai.learning.llm_integrator import LLMIntegrator
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+class FixtureClassifier:
+    """Offline bag-of-words classifier standing in for the transformer model"""
+    def __init__(self, vocabulary=("attack", "trade", "talk", "flee"), pass_cost=0.002):
+        self.vocabulary = {word: index for index, word in enumerate(vocabulary)}
+        self.pass_cost = pass_cost
+        self.model = None
+        self.tokenizer = None
+        self.loads = 0
+        self.batch_sizes = []
+
+    def load(self):
+        if self.model is None:
+            self.loads += 1
+            self.model = np.eye(len(self.vocabulary))
+            self.tokenizer = self.vocabulary
+
+    def prepare_input(self, texts):
+        counts = np.zeros((len(texts), len(self.vocabulary)))
+        for row, text in enumerate(texts):
+            for word in re.findall(r"[a-z]+", text):
+                if word in self.vocabulary:
+                    counts[row, self.vocabulary[word]] += 1
+        return counts
+
+    def classify(self, texts):
+        self.load()
+        self.batch_sizes.append(len(texts))
+        # A forward pass has a fixed cost regardless of batch size
+        time.sleep(self.pass_cost)
+        return np.argmax(self.prepare_input(texts) @ self.model, axis=1).tolist()
+
+class TestLLMIntegrator(unittest.TestCase):
+    def setUp(self):
+        """Set up an integrator backed by the offline fixture model"""
+        self.classifier = FixtureClassifier()
+        self.integrator = LLMIntegrator(classifier=self.classifier, batch_wait=0.02)
+
+    def tearDown(self):
+        self.integrator.stop()
+
+    def test_model_loads_lazily(self):
+        """Test that nothing is loaded until the first classification"""
+        self.assertEqual(self.classifier.loads, 0)
+        self.assertNotIn("torch", sys.modules)
+        self.assertEqual(self.integrator.integrate_llm("The guard wants to TRADE"), 1)
+        self.assertEqual(self.integrator.get_context(), "The guard wants to TRADE")
+        self.integrator.integrate_llm("flee flee attack")
+        self.assertEqual(self.classifier.loads, 1)
+
+    def test_cache_normalizes_context(self):
+        """Test that equivalent contexts share a cached result"""
+        self.assertEqual(self.integrator.classify("  Attack   the bandit "), 0)
+        self.assertEqual(self.integrator.classify("attack the BANDIT"), 0)
+        self.assertEqual(self.integrator.classify({"b": "talk", "a": 1}), 2)
+        self.assertEqual(self.integrator.classify({"a": 1, "b": "TALK"}), 2)
+        self.assertEqual(self.integrator.forward_passes, 2)
+        self.assertEqual(self.integrator.cache_hits, 2)
+
+        small = LLMIntegrator(classifier=self.classifier, cache_size=2)
+        for text in ("attack", "trade", "talk"):
+            small.classify(text)
+        self.assertEqual(list(small.cache), ["trade", "talk"])
+
+    def test_concurrent_calls_share_a_forward_pass(self):
+        """Test that the batch worker coalesces concurrent requests"""
+        self.integrator.start()
+        texts = [f"npc {i} wants to talk" for i in range(12)] + ["attack now"] * 4
+        results = [None] * len(texts)
+        barrier = threading.Barrier(len(texts))
+
+        def request(index):
+            barrier.wait()
+            results[index] = self.integrator.classify(texts[index])
+
+        threads = [threading.Thread(target=request, args=(i,)) for i in range(len(texts))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [2] * 12 + [0] * 4)
+        self.assertLess(self.integrator.forward_passes, len(texts))
+        # Identical texts in one batch only take one row
+        self.assertLessEqual(sum(self.classifier.batch_sizes), 13)
+
+        self.integrator.stop()
+        self.assertFalse(self.integrator.is_running)
+        self.assertEqual(self.integrator.classify("trade"), 1)
+
+    def test_stop_while_requests_arrive(self):
+        """Test that requests racing stop() still complete"""
+        for round_number in range(20):
+            self.integrator.start()
+            results = []
+            threads = [
+                threading.Thread(target=lambda i=i: results.append(
+                    self.integrator.classify(f"round {round_number} npc {i} attack")))
+                for i in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            self.integrator.stop()
+            for thread in threads:
+                thread.join(2)
+                self.assertFalse(thread.is_alive())
+            self.assertEqual(results, [0] * 8)
+        self.assertEqual(self.integrator.forward_passes,
+                         len(self.classifier.batch_sizes))
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_classification_benchmark(self):
+        """Benchmark classifying NPC contexts with batching and caching"""
+        contexts = [f"merchant {i % 50} offers to trade" for i in range(2000)]
+        start_time = time.perf_counter()
+        results = self.integrator.classify_many(contexts)
+        results += [self.integrator.classify(context) for context in contexts]
+        elapsed = time.perf_counter() - start_time
+
+        self.assertEqual(set(results), {1})
+        self.assertEqual(self.integrator.forward_passes, 4)
+        self.assertLess(elapsed, 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
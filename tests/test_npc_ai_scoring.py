@@ -0,0 +1,154 @@
+import unittest
+import random
+import time
+
+import numpy as np
+
+from src.character.ability_system import (
+    Ability,
+    AbilityCost,
+    AbilityEffect,
+    AbilitySystem,
+    AbilityTrigger,
+    AbilityType,
+    ResourceType
+)
+from src.character.npc_ai import BehaviorType, NPCAI, TacticalRole, TacticalState
+from src.combat_system.dimensional_combat import DimensionalEffect, Position
+from src.world.terrain_generator import TerrainCell
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+def make_ability(name, ability_type, costs=(), buff=False, radius=0.0,
+                 effect_type=DimensionalEffect.RESONANCE):
+    return Ability(
+        name=name,
+        description=name,
+        ability_type=ability_type,
+        trigger=AbilityTrigger.ON_CAST,
+        base_power=1.0,
+        base_cooldown=1.0,
+        costs=[AbilityCost(resource, amount) for resource, amount in costs],
+        effects=[AbilityEffect(effect_type, 1.0, 1.0, radius=radius, is_buff=buff)],
+        requirements={},
+        dimension_requirements=set(),
+        scaling_stats={}
+    )
+
+ABILITIES = {
+    "cleave": make_ability("cleave", AbilityType.PHYSICAL, [(ResourceType.STAMINA, 0.2)], radius=2.0),
+    "ward": make_ability("ward", AbilityType.UTILITY, [(ResourceType.MANA, 0.3)], buff=True),
+    "anchor": make_ability("anchor", AbilityType.DIMENSIONAL,
+                           [(ResourceType.MANA, 0.1), (ResourceType.FOCUS, 0.4)],
+                           effect_type=DimensionalEffect.PURIFICATION),
+    "void_lance": make_ability("void_lance", AbilityType.VOID, [(ResourceType.MANA, 0.9)]),
+    "punch": make_ability("punch", AbilityType.PHYSICAL)
+}
+
+def make_state(rng, allies=4, enemies=5, cooldowns=(), health=0.25):
+    def position():
+        return Position(rng.uniform(-10, 10), rng.uniform(-10, 10), 0.0)
+    return TacticalState(
+        health_percentage=health,
+        resource_percentages={str(ResourceType.MANA): 0.6, str(ResourceType.STAMINA): 0.5},
+        current_position=Position(0.5, -1.0, 0.0),
+        nearby_allies=[position() for _ in range(allies)],
+        nearby_enemies=[position() for _ in range(enemies)],
+        active_effects={DimensionalEffect.WARPING},
+        current_terrain=TerrainCell(None, 2.0, None, True, 0.5, 0.8),
+        available_abilities=set(ABILITIES),
+        ability_cooldowns={name: 1.0 for name in cooldowns}
+    )
+
+class TestNPCAIBatchScoring(unittest.TestCase):
+    def setUp(self):
+        """Set up a tank NPC AI with a fixed ability set"""
+        self.ability_system = AbilitySystem()
+        for ability in ABILITIES.values():
+            self.ability_system.register_ability(ability)
+        self.ai = NPCAI(
+            BehaviorType.DEFENSIVE,
+            TacticalRole.TANK,
+            self.ability_system,
+            None
+        )
+        self.ai.combat_memory.damage_dealt.update({"cleave": 30.0, "ward": 0.0})
+        self.ai.combat_memory.damage_taken.update({"cleave": 10.0, "ward": 5.0})
+        self.rng = random.Random(7)
+
+    def test_position_scores_match_scalar_scoring(self):
+        """Test batch position scores against the per-position calculation"""
+        state = make_state(self.rng)
+        positions, scores = self.ai.score_tactical_positions(state)
+        self.assertEqual(len(positions), 8)
+
+        for position, score in zip(positions, scores):
+            expected = sum(
+                self.ai._score_ally_distance(self.ai._calculate_distance(position, ally))
+                for ally in state.nearby_allies
+            ) + sum(
+                self.ai._score_enemy_distance(self.ai._calculate_distance(position, enemy))
+                for enemy in state.nearby_enemies
+            )
+            expected += self.ai._evaluate_terrain(state.current_terrain)
+            expected += self.ai._evaluate_stability(state.active_effects, state.current_terrain)
+            self.assertAlmostEqual(score, expected)
+
+        best = self.ai.choose_tactical_position(state)
+        self.assertEqual(best, positions[int(np.argmax(scores))])
+
+        alone = make_state(self.rng, allies=0, enemies=0)
+        self.assertEqual(len(set(self.ai.score_tactical_positions(alone)[1])), 1)
+
+    def test_ability_scores_match_scalar_scoring(self):
+        """Test batch ability scores against scoring abilities one at a time"""
+        state = make_state(self.rng, cooldowns=["punch"])
+        target = Position(3.0, 2.0, 0.0)
+        names, scores = self.ai.score_abilities(state, target)
+        self.assertEqual(names, sorted(ABILITIES))
+
+        for name, score in zip(names, scores):
+            if name == "punch":
+                self.assertEqual(score, -np.inf)
+            else:
+                self.assertAlmostEqual(score, self.ai._score_ability(ABILITIES[name], state, target))
+        self.assertLess(scores[names.index("void_lance")], -900)
+        expected = max((name for name in names if name != "punch"),
+                       key=lambda name: self.ai._score_ability(ABILITIES[name], state, target))
+        self.assertEqual(self.ai.choose_ability(state, target), expected)
+
+    def test_reregistered_ability_replaces_cached_table(self):
+        """Test that replacing an ability under the same name is picked up"""
+        state = make_state(self.rng)
+        target = Position(3.0, 2.0, 0.0)
+        names, before = self.ai.score_abilities(state, target)
+
+        cheap_lance = make_ability("void_lance", AbilityType.VOID)
+        self.ability_system.register_ability(cheap_lance)
+        names, after = self.ai.score_abilities(state, target)
+
+        lance = names.index("void_lance")
+        self.assertGreater(after[lance], before[lance])
+        self.assertAlmostEqual(after[lance], self.ai._score_ability(cheap_lance, state, target))
+
+    def test_choose_ability_without_options(self):
+        """Test that no ability is chosen when none are ready"""
+        state = make_state(self.rng, cooldowns=list(ABILITIES))
+        self.assertIsNone(self.ai.choose_ability(state, Position(0.0, 0.0, 0.0)))
+        state.available_abilities = set()
+        self.assertIsNone(self.ai.choose_ability(state, Position(0.0, 0.0, 0.0)))
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_large_fight_benchmark(self):
+        """Benchmark per-tick decisions for every NPC in a large fight"""
+        states = [make_state(self.rng, allies=60, enemies=60, health=self.rng.random())
+                  for _ in range(200)]
+        target = Position(0.0, 0.0, 0.0)
+        start_time = time.perf_counter()
+        for state in states:
+            self.ai.choose_tactical_position(state)
+            self.ai.choose_ability(state, target)
+        elapsed = time.perf_counter() - start_time
+        self.assertLess(elapsed, 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import time
+import tracemalloc
+
+from src.characters.npc.npc_system import (
+    NPC,
+    NPCType,
+    NPCSpecialization,
+    SAMSBehaviorPattern,
+    get_archetype
+)
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+class TestNPCArchetypes(unittest.TestCase):
+    def setUp(self):
+        """Set up two merchants sharing an archetype"""
+        self.first = NPC("Mira", NPCType.MERCHANT, None, None)
+        self.second = NPC("Oren", NPCType.MERCHANT, None, None)
+
+    def test_archetype_is_shared_and_read_only(self):
+        """Test that NPCs of one type share a read-only archetype"""
+        self.assertIs(self.first.archetype, self.second.archetype)
+        self.assertIsNot(self.first.archetype, get_archetype(NPCType.GUARD))
+        with self.assertRaises(TypeError):
+            self.first.archetype.behavior_patterns["new"] = None
+        with self.assertRaises(AttributeError):
+            self.first.mood_swing = True
+
+    def test_behavior_patterns_copy_on_lookup(self):
+        """Test that adapting a pattern only changes that NPC"""
+        patterns = self.first.behavior_patterns
+        self.assertIn("merchant_supply_chain", patterns)
+        self.assertIn("combat_defensive", patterns)
+        self.assertEqual(len(patterns), 7)
+        self.assertEqual(patterns.local, {})
+
+        patterns["trade_cautious"].priority = 0.1
+        patterns["trade_cautious"].response_sequence.append("walk_away")
+        del patterns["social_friendly"]
+
+        other = self.second.behavior_patterns
+        self.assertEqual(other["trade_cautious"].priority, 0.65)
+        self.assertEqual(other["trade_cautious"].response_sequence[-1], "limited_offer")
+        self.assertIn("social_friendly", other)
+        self.assertNotIn("social_friendly", patterns)
+        self.assertEqual(set(patterns.local), {"trade_cautious"})
+
+        patterns["haggle"] = SAMSBehaviorPattern("haggle", [], ["counter_offer"], 0.4, 60.0)
+        self.assertEqual(len(patterns), 7)
+
+    def test_emotional_profile_overrides_are_deltas(self):
+        """Test that emotional changes are stored per NPC over shared defaults"""
+        profile = self.first.emotional_profile
+        self.assertEqual(profile.base_emotions["joy"], 0.5)
+        self.assertEqual(profile.emotional_thresholds["anger"], 0.7)
+
+        profile.base_emotions["joy"] = 0.9
+        self.assertEqual(profile.base_emotions.maps[0], {"joy": 0.9})
+        self.assertEqual(self.second.emotional_profile.base_emotions["joy"], 0.5)
+
+    def test_lazy_state_and_specialization(self):
+        """Test that per-NPC state is built on demand and specialization switches archetype"""
+        self.first.player_relationships["player_1"] = 10.0
+        self.assertEqual(self.first.player_relationships, {"player_1": 10.0})
+        self.assertEqual(self.second.player_relationships, {})
+        self.assertEqual(self.first.personality.base_mood, self.first.current_mood)
+
+        # Types without their own patterns still get the base set
+        guard = NPC("Tess", NPCType.GUARD, None, None)
+        self.assertEqual(len(guard.behavior_patterns), 6)
+
+        self.first.behavior_patterns["trade_cautious"].priority = 0.1
+        self.first.specialize(NPCSpecialization.ALCHEMIST)
+        self.assertIs(self.first.archetype,
+                      get_archetype(NPCType.MERCHANT, NPCSpecialization.ALCHEMIST))
+        self.assertEqual(self.first.behavior_patterns["trade_cautious"].priority, 0.1)
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_spawn_thousand_npcs(self):
+        """Benchmark spawn time and resident memory per 1,000 NPCs"""
+        npc_types = list(NPCType)
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        npcs = [NPC(f"npc_{i}", npc_types[i % len(npc_types)], None, None)
+                for i in range(1000)]
+        elapsed = time.perf_counter() - start_time
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertEqual(len(npcs), 1000)
+        self.assertLess(elapsed, 0.1)
+        self.assertLess(memory, 1000 * 1024)
+
+if __name__ == '__main__':
+    unittest.main()
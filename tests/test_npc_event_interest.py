@@ -0,0 +1,103 @@
+import unittest
+import time
+
+from src.characters.npc.event_interest import NPCInterestManager
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+class RecordingNPC:
+    """Stand-in NPC that records what it was told"""
+    def __init__(self, location, faction="neutral"):
+        self.location = location
+        self.faction = faction
+        self.events = []
+        self.summaries = []
+
+    def process_world_event(self, event_type, event_data):
+        self.events.append((event_type, event_data))
+
+    def process_event_summary(self, event_counts):
+        self.summaries.append(event_counts)
+
+class TestNPCInterestManager(unittest.TestCase):
+    def setUp(self):
+        """Set up NPCs spread over two towns"""
+        self.manager = NPCInterestManager(summary_interval=3)
+        self.smith = RecordingNPC("ashford", "artificers_guild")
+        self.guard = RecordingNPC("ashford")
+        self.spy = RecordingNPC("brightwater", "shadow_syndicate")
+        self.farmer = RecordingNPC("brightwater")
+        self.manager.subscribe(self.smith)
+        self.manager.subscribe(self.guard, event_types=["combat"])
+        self.manager.subscribe(self.spy, factions=["artificers_guild"])
+        self.manager.subscribe(self.farmer, background=True)
+
+    def test_location_event_type_and_faction_matching(self):
+        """Test that events only reach NPCs whose subscription matches"""
+        self.manager.publish("trade", {"item": "gear"}, location="ashford")
+        self.manager.publish("combat", {"threat_level": 0.9}, location="ashford")
+        self.manager.publish("heist", {}, location="elsewhere", faction="artificers_guild")
+        self.assertEqual(self.manager.update(), 5)
+
+        self.assertEqual([e for e, _ in self.smith.events], ["trade", "combat", "heist"])
+        self.assertEqual(self.guard.events, [("combat", {"threat_level": 0.9})])
+        self.assertEqual(self.spy.events, [("heist", {})])
+        self.assertEqual(self.farmer.events, [])
+
+    def test_global_events_and_deferred_summaries(self):
+        """Test that background NPCs get event counts every few ticks"""
+        self.manager.publish("eclipse", {}, location=None)
+        self.manager.publish("trade", {}, location="brightwater")
+        self.manager.update()
+        self.manager.publish("trade", {}, location="brightwater")
+        self.manager.update()
+        self.assertEqual(self.farmer.summaries, [])
+
+        self.manager.update()
+        self.assertEqual(self.farmer.summaries, [{"eclipse": 1, "trade": 2}])
+        self.assertEqual(self.manager.summarized, 1)
+
+        # Promoting an NPC flushes what it missed first
+        self.manager.publish("trade", {}, location="brightwater")
+        self.manager.update()
+        self.manager.set_background(self.farmer, False)
+        self.assertEqual(self.farmer.summaries[-1], {"trade": 1})
+        self.manager.publish("trade", {}, location="brightwater")
+        self.manager.update()
+        self.assertEqual(self.farmer.events, [("trade", {})])
+
+    def test_refresh_and_unsubscribe(self):
+        """Test that moved NPCs are re-indexed and removed NPCs dropped"""
+        self.guard.location = "brightwater"
+        self.manager.refresh(self.guard)
+        self.manager.unsubscribe(self.smith)
+        self.manager.publish("combat", {}, location="ashford")
+        self.manager.publish("combat", {}, location="brightwater")
+        self.manager.update()
+
+        self.assertEqual(len(self.guard.events), 1)
+        self.assertEqual(self.smith.events, [])
+        self.assertNotIn("ashford", self.manager.by_location)
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_fan_out_benchmark(self):
+        """Benchmark local events against thousands of NPCs"""
+        manager = NPCInterestManager()
+        npcs = [RecordingNPC(f"region_{i % 100}") for i in range(10000)]
+        for npc in npcs:
+            manager.subscribe(npc)
+
+        start_time = time.perf_counter()
+        for tick in range(10):
+            for region in range(10):
+                manager.publish("trade", {"tick": tick}, location=f"region_{region}")
+            manager.update()
+        elapsed = time.perf_counter() - start_time
+
+        # Each event reaches only the 100 NPCs in its region
+        self.assertEqual(manager.delivered, 10 * 10 * 100)
+        self.assertEqual(len(npcs[0].events), 10)
+        self.assertEqual(npcs[50].events, [])
+        self.assertLess(elapsed, 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+import json
+import random
+import time
+
+from src.characters.npc.npc_memory import NPCMemoryStore
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+def make_memory(event_type, timestamp, importance, player_id=None):
+    data = {"player_id": player_id} if player_id else {}
+    return {
+        "type": event_type,
+        "data": data,
+        "time": timestamp,
+        "importance": importance,
+        "emotional_impact": {"trust": 0.1}
+    }
+
+class TestNPCMemoryStore(unittest.TestCase):
+    def setUp(self):
+        """Set up a small store with a decay of one unit per hour"""
+        self.store = NPCMemoryStore(capacity=3, decay_rate=1.0)
+
+    def test_evicts_lowest_importance_times_recency(self):
+        """Test that the weakest memory goes once the store is full"""
+        self.store.append(make_memory("combat", 0.0, 0.9))
+        self.store.append(make_memory("trade", 3600.0, 0.4))
+        self.store.append(make_memory("quest", 7200.0, 0.5))
+        self.store.append(make_memory("trade", 7200.0, 0.3))
+
+        # 0.9 * e^-2 is weaker than 0.4 * e^-1, so the old combat memory goes
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual([m["type"] for m in self.store], ["trade", "quest", "trade"])
+
+        # A much older important memory outlasts a fresh trivial one
+        self.store.append(make_memory("gossip", 10800.0, 0.01))
+        self.assertNotIn("gossip", [m["type"] for m in self.store])
+
+    def test_recall_by_type_player_and_time(self):
+        """Test indexed recall, newest first"""
+        store = NPCMemoryStore(capacity=10)
+        store.append(make_memory("trade", 10.0, 0.4, "p1"))
+        store.append(make_memory("combat", 20.0, 0.8, "p2"))
+        store.append(make_memory("trade", 30.0, 0.4, "p2"))
+        store.append(make_memory("trade", 40.0, 0.4))
+
+        self.assertEqual([m["time"] for m in store.recall(event_type="trade")], [40.0, 30.0, 10.0])
+        self.assertEqual([m["time"] for m in store.recall(player_id="p2")], [30.0, 20.0])
+        self.assertEqual([m["time"] for m in store.recall(event_type="trade", player_id="p2")], [30.0])
+        self.assertEqual([m["time"] for m in store.recall(since=20.0, limit=2)], [40.0, 30.0])
+        self.assertEqual(store.latest("combat")["time"], 20.0)
+        self.assertIsNone(store.latest("quest"))
+
+    def test_compact_round_trip(self):
+        """Test that the column form survives JSON and rebuilds the indexes"""
+        store = NPCMemoryStore(capacity=10)
+        for i in range(6):
+            store.append(make_memory(("trade", "combat")[i % 2], float(i), 0.5, f"p{i % 3}"))
+
+        state = json.loads(json.dumps(store.to_dict()))
+        self.assertEqual(state["types"], ["trade", "combat"])
+        restored = NPCMemoryStore.from_dict(state)
+        self.assertEqual(list(restored), list(store))
+        self.assertEqual(restored.recall(player_id="p1"), store.recall(player_id="p1"))
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_long_lived_npc_benchmark(self):
+        """Benchmark a long-lived NPC remembering many events"""
+        rng = random.Random(4)
+        store = NPCMemoryStore(capacity=200)
+        event_types = ["combat", "trade", "quest", "conversation", "world_event"]
+
+        start_time = time.perf_counter()
+        for i in range(20000):
+            store.append(make_memory(rng.choice(event_types), i * 60.0,
+                                     rng.random(), f"p{rng.randrange(50)}"))
+        for _ in range(1000):
+            store.recall(event_type="trade", player_id="p7", limit=5)
+        elapsed = time.perf_counter() - start_time
+
+        self.assertEqual(len(store), 200)
+        self.assertEqual(sum(len(index) for index in store._by_type.values()), 200)
+        self.assertLess(elapsed, 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+import time
+from types import SimpleNamespace
+
+from src.characters.npc.npc_scheduler import LODTier, NPCSimulationScheduler, routine_activity
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+class ScheduledStubNPC:
+    """Stand-in NPC with a position, a routine and update counters"""
+    def __init__(self, distance):
+        self.distance = distance
+        self.schedule = SimpleNamespace(
+            daily_routine={6: "work", 18: "tavern", 22: "sleep"},
+            current_activity="idle"
+        )
+        self.behavior_updates = 0
+        self.schedule_events = []
+
+    def update_behavior(self):
+        self.behavior_updates += 1
+
+    def update_schedule(self, current_time):
+        if current_time in self.schedule.daily_routine:
+            self.schedule.current_activity = self.schedule.daily_routine[current_time]
+            self.schedule_events.append(current_time)
+
+class TestNPCSimulationScheduler(unittest.TestCase):
+    def setUp(self):
+        """Set up a scheduler measuring distance from a stub attribute"""
+        self.scheduler = NPCSimulationScheduler(
+            distance_fn=lambda npc: npc.distance,
+            frame_budget=10,
+            reduced_interval=4
+        )
+
+    def test_routine_activity_wraps_midnight(self):
+        """Test the schedule-only activity model"""
+        routine = {6: "work", 18: "tavern", 22: "sleep"}
+        self.assertEqual(routine_activity(routine, 3), "sleep")
+        self.assertEqual(routine_activity(routine, 6), "work")
+        self.assertEqual(routine_activity(routine, 20), "tavern")
+        self.assertIsNone(routine_activity({}, 5))
+
+    def test_tiers_and_update_rates(self):
+        """Test that each tier is updated at its own rate"""
+        near, middle, far = ScheduledStubNPC(5), ScheduledStubNPC(80), ScheduledStubNPC(500)
+        for npc in (near, middle, far):
+            self.scheduler.add_npc(npc)
+        self.assertEqual(self.scheduler.tier_of(near), LODTier.FULL)
+        self.assertEqual(self.scheduler.tier_of(middle), LODTier.REDUCED)
+        self.assertEqual(self.scheduler.tier_of(far), LODTier.SCHEDULE)
+
+        for _ in range(8):
+            self.scheduler.update(current_hour=12)
+        self.assertEqual(near.behavior_updates, 8)
+        self.assertEqual(middle.behavior_updates, 2)
+        self.assertEqual(far.behavior_updates, 0)
+        self.assertEqual(self.scheduler.current_activity(far), "work")
+        self.assertEqual(far.schedule.current_activity, "idle")
+
+    def test_promotion_catches_schedule_up(self):
+        """Test that interacting with a distant NPC syncs its schedule"""
+        far = ScheduledStubNPC(500)
+        self.scheduler.add_npc(far)
+        self.scheduler.update(current_hour=19)
+        self.assertEqual(far.schedule_events, [])
+
+        self.scheduler.record_interaction(far)
+        self.assertEqual(self.scheduler.tier_of(far), LODTier.FULL)
+        self.assertEqual(far.schedule.current_activity, "tavern")
+        self.assertEqual(far.schedule_events, [18])
+
+        # Interaction keeps it at full detail even though it is far away
+        self.scheduler.update(current_hour=23)
+        self.assertEqual(self.scheduler.tier_of(far), LODTier.FULL)
+        self.assertEqual(far.schedule.current_activity, "sleep")
+
+        self.scheduler.remove_npc(far)
+        self.scheduler.update(current_hour=23)
+        self.assertEqual(far.behavior_updates, 1)
+        self.assertIsNone(self.scheduler.tier_of(far))
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_fixed_budget_with_large_population(self):
+        """Benchmark ticks with thousands of NPCs under a fixed budget"""
+        scheduler = NPCSimulationScheduler(
+            distance_fn=lambda npc: npc.distance,
+            frame_budget=64,
+            retier_budget=128
+        )
+        npcs = [ScheduledStubNPC(i % 1000) for i in range(20000)]
+        for npc in npcs:
+            scheduler.add_npc(npc)
+
+        start_time = time.perf_counter()
+        for tick in range(100):
+            updates = scheduler.update(current_hour=tick // 10)
+            self.assertLessEqual(updates, 64)
+        elapsed = time.perf_counter() - start_time
+
+        self.assertEqual(sum(npc.behavior_updates for npc in npcs), 6400)
+        self.assertLess(elapsed, 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+import json
+import os
+import tempfile
+import threading
+import time
+
+from src.ai.behavior.player_behavior_learner import (
+    OnlineCentroidClassifier,
+    PlayerBehaviorLearner
+)
+from src.infrastructure.test_framework import TestDecorators, TestType
+
+class SlowModel(OnlineCentroidClassifier):
+    """Batch model whose training blocks until the test releases it"""
+    release = None
+
+    def fit(self, X, y):
+        SlowModel.release.wait(5)
+        return super().fit(X, y)
+
+def game_state(action, noise=0.0):
+    return {"attack": [1.0, 0.0, noise], "trade": [0.0, 1.0, noise], "flee": [-1.0, -1.0, noise]}[action]
+
+class TestPlayerBehaviorLearner(unittest.TestCase):
+    def setUp(self):
+        """Set up a temporary directory for the sample log"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "player_behavior_data.bin")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_sample_log_round_trip(self):
+        """Test that the append-only log reloads and survives a torn write"""
+        learner = PlayerBehaviorLearner(self.path, model_factory=OnlineCentroidClassifier,
+                                        retrain_interval=1000)
+        for i in range(10):
+            learner.collect_data("attack" if i % 2 else 7, game_state("attack", i))
+        learner.stop()
+        with open(self.path, "ab") as f:
+            f.write(b"\x05\x00\x03")
+
+        reloaded = PlayerBehaviorLearner(self.path, model_factory=OnlineCentroidClassifier)
+        self.assertEqual(len(reloaded.buffer), 10)
+        self.assertEqual(list(reloaded.buffer.y[:2]), [7, "attack"])
+        self.assertEqual(list(reloaded.buffer.X[3]), [1.0, 0.0, 3.0])
+
+        # The torn record is dropped, so new appends stay readable
+        reloaded.collect_data("trade", game_state("trade"))
+        reloaded.stop()
+        self.assertEqual(len(PlayerBehaviorLearner(self.path).buffer), 11)
+
+    def test_legacy_json_is_migrated(self):
+        """Test that data in the old JSON file is carried over"""
+        legacy = [{"player_action": "flee", "game_state": game_state("flee")}] * 3
+        with open(os.path.join(self.directory.name, "player_behavior_data.json"), "w") as f:
+            json.dump(legacy, f)
+        learner = PlayerBehaviorLearner(self.path, incremental=True)
+        learner.stop()
+        self.assertEqual(learner.predict_player_action(game_state("flee")), "flee")
+        self.assertEqual(len(PlayerBehaviorLearner(self.path).buffer), 3)
+
+    def test_background_retraining_hot_swaps(self):
+        """Test that retraining runs off the game thread and swaps the model in"""
+        SlowModel.release = threading.Event()
+        learner = PlayerBehaviorLearner(self.path, model_factory=SlowModel, retrain_interval=6)
+        learner.start()
+        try:
+            start_time = time.perf_counter()
+            for action in ("attack", "trade", "flee") * 2:
+                learner.collect_data(action, game_state(action))
+            self.assertLess(time.perf_counter() - start_time, 2.0)
+            self.assertIsNone(learner.predict_player_action(game_state("trade")))
+
+            SlowModel.release.set()
+            deadline = time.time() + 5
+            while learner.model_version == 0 and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(learner.model_version, 1)
+            self.assertEqual(learner.predict_player_action(game_state("trade", 0.1)), "trade")
+        finally:
+            SlowModel.release.set()
+            learner.stop()
+
+    @TestDecorators.test_type(TestType.PERFORMANCE)
+    def test_incremental_learning_benchmark(self):
+        """Benchmark per-action updates and prediction as data grows"""
+        learner = PlayerBehaviorLearner(self.path, incremental=True)
+        actions = ("attack", "trade", "flee")
+
+        def predict_time():
+            start_time = time.perf_counter()
+            for _ in range(200):
+                learner.predict_player_action(game_state("attack"))
+            return time.perf_counter() - start_time
+
+        learner.collect_data("attack", game_state("attack"))
+        early = predict_time()
+        start_time = time.perf_counter()
+        for i in range(5000):
+            action = actions[i % 3]
+            learner.collect_data(action, game_state(action, i % 5 / 10))
+        elapsed = time.perf_counter() - start_time
+        learner.stop()
+
+        self.assertEqual(learner.predict_player_action(game_state("flee")), "flee")
+        self.assertEqual(list(learner.model.counts), [1668, 1667, 1666])
+        self.assertLess(elapsed, 2.0)
+        self.assertLess(predict_time(), early * 5 + 0.05)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2195,5 +2195,83 @@ class TestResourceIntegration(unittest.TestCase):
         quest_reward_value = new_price * 50.0  # Value of 50 crystals
         self.assertGreater(quest_reward_value, initial_price * 50.0)
 
+    def test_transfers_only_wait_for_their_own_stripes(self):
+        """Test that a held stripe blocks only transfers touching it"""
+        import threading
+        
+        container_ids = [f"stripe_vault_{i}" for i in range(64)]
+        for container_id in container_ids:
+            self.resource_manager.create_container(container_id, 1000.0)
+            self.resource_manager.add_resource(container_id, ResourceType.GOLD, 100.0)
+        held = container_ids[0]
+        held_stripe = self.resource_manager._stripe_index(held)
+        free_from, free_to = [
+            container_id for container_id in container_ids
+            if self.resource_manager._stripe_index(container_id) != held_stripe
+        ][:2]
+        
+        def transfer(from_id, to_id):
+            thread = threading.Thread(
+                target=self.resource_manager.transfer_resource,
+                args=(from_id, to_id, ResourceType.GOLD, 10.0)
+            )
+            thread.start()
+            return thread
+            
+        with self.resource_manager._locked(held):
+            unrelated = transfer(free_from, free_to)
+            unrelated.join(2)
+            self.assertFalse(unrelated.is_alive())
+            
+            contended = transfer(held, free_to)
+            contended.join(0.1)
+            self.assertTrue(contended.is_alive())
+        contended.join(2)
+        self.assertFalse(contended.is_alive())
+        self.assertAlmostEqual(
+            self.resource_manager.get_resource_amount(free_to, ResourceType.GOLD), 120.0
+        )
+        
+    def test_import_state_during_concurrent_transfers(self):
+        """Test that importing state never interleaves with transfers"""
+        import threading
+        import random
+        
+        container_ids = [f"transfer_vault_{i}" for i in range(64)]
+        for container_id in container_ids:
+            self.resource_manager.create_container(container_id, 100000.0)
+            self.resource_manager.add_resource(container_id, ResourceType.GOLD, 1000.0)
+        snapshot = self.resource_manager.export_state()
+        errors = []
+        stop = threading.Event()
+        
+        def worker(seed: int):
+            rng = random.Random(seed)
+            try:
+                while not stop.is_set():
+                    from_id, to_id, other_id = rng.sample(container_ids, 3)
+                    self.resource_manager.transfer_batch([
+                        (from_id, to_id, ResourceType.GOLD, 1.0),
+                        (to_id, other_id, ResourceType.GOLD, 0.5)
+                    ])
+            except Exception as error:
+                errors.append(error)
+                
+        threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(4)]
+        for thread in threads:
+            thread.start()
+        for _ in range(20):
+            self.resource_manager.import_state(snapshot)
+        stop.set()
+        for thread in threads:
+            thread.join()
+            
+        self.assertEqual(errors, [])
+        total_gold = sum(
+            self.resource_manager.get_resource_amount(container_id, ResourceType.GOLD)
+            for container_id in container_ids
+        )
+        self.assertAlmostEqual(total_gold, 64000.0)
+        
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -279,6 +279,251 @@ class TestResourceManagement(unittest.TestCase):
                 resource_type
             )
             self.assertEqual(actual_amount, expected_amount)
+            
+    def test_combination_output_is_order_independent(self):
+        """Test that memoized combinations ignore ingredient order"""
+        output = self.resource_manager._calculate_combination_output(
+            [ResourceType.MANA_CRYSTAL, ResourceType.SOUL_SHARD, ResourceType.VOID_ESSENCE],
+            [8.0, 2.0, 4.0],
+            ResourceType.DRAGON_SCALE
+        )
+        reordered = self.resource_manager._calculate_combination_output(
+            [ResourceType.VOID_ESSENCE, ResourceType.MANA_CRYSTAL, ResourceType.SOUL_SHARD],
+            [4.0, 8.0, 2.0],
+            ResourceType.DRAGON_SCALE
+        )
+        self.assertEqual(output, 1.0)  # min(8/4, 2/2, 4/2)
+        self.assertEqual(reordered, output)
+        
+        # Unknown recipes and unmet ratios produce nothing
+        self.assertEqual(
+            self.resource_manager._calculate_combination_output(
+                [ResourceType.WOOD, ResourceType.STONE], [1.0, 1.0], ResourceType.GOLD
+            ),
+            0.0
+        )
+        self.assertEqual(
+            self.resource_manager._calculate_combination_output(
+                [ResourceType.KNIGHT_INSIGNIA, ResourceType.MAGE_SEAL], [1.0, 1.0],
+                ResourceType.GUILD_MARK
+            ),
+            0.0
+        )
+        
+    def test_chain_conversion(self):
+        """Test multi-hop conversion rates"""
+        # No direct Soul Shard -> Astral Dust conversion
+        self.assertIsNone(
+            self.resource_manager.get_conversion_rate(
+                ResourceType.SOUL_SHARD, ResourceType.ASTRAL_DUST
+            )
+        )
+        # Soul Shard -> Void Essence -> Astral Dust
+        self.assertAlmostEqual(
+            self.resource_manager.get_conversion_rate(
+                ResourceType.SOUL_SHARD, ResourceType.ASTRAL_DUST, allow_chain=True
+            ),
+            0.5 * 0.2
+        )
+        # The direct rate beats the two-hop route through Void Essence
+        self.assertEqual(
+            self.resource_manager.get_conversion_rate(
+                ResourceType.SOUL_SHARD, ResourceType.MANA, allow_chain=True
+            ),
+            150.0
+        )
+        
+        self.resource_manager.add_resource(self.test_container_id, ResourceType.SOUL_SHARD, 10.0)
+        result = self.resource_manager.convert_resource(
+            self.test_container_id,
+            ResourceType.SOUL_SHARD,
+            ResourceType.ASTRAL_DUST,
+            10.0,
+            allow_chain=True
+        )
+        self.assertTrue(result)
+        self.assertAlmostEqual(
+            self.resource_manager.get_resource_amount(
+                self.test_container_id, ResourceType.ASTRAL_DUST
+            ),
+            1.0
+        )
+        
+    def test_set_conversion_rate_rebuilds_chains(self):
+        """Test that new conversion rates are picked up by chained conversions"""
+        self.resource_manager.set_conversion_rate(
+            ResourceType.GOLD, ResourceType.WOOD, 0.5
+        )
+        self.assertAlmostEqual(
+            self.resource_manager.get_conversion_rate(
+                ResourceType.GOLD, ResourceType.ENERGY, allow_chain=True
+            ),
+            5.0
+        )
+
+    def test_profitable_conversion_cycles_are_rejected(self):
+        """Test that a rate closing a profitable cycle is refused"""
+        self.assertTrue(self.resource_manager.set_conversion_rate(
+            ResourceType.WOOD, ResourceType.GOLD, 2.0
+        ))
+        self.assertFalse(self.resource_manager.set_conversion_rate(
+            ResourceType.GOLD, ResourceType.WOOD, 2.0
+        ))
+        self.assertIsNone(
+            self.resource_manager.get_conversion_rate(
+                ResourceType.GOLD, ResourceType.WOOD, allow_chain=True
+            )
+        )
+        self.assertFalse(self.resource_manager.set_conversion_rate(
+            ResourceType.GOLD, ResourceType.GOLD, 1.5
+        ))
+        
+        # A break-even return route is allowed but never chains back to itself
+        self.assertTrue(self.resource_manager.set_conversion_rate(
+            ResourceType.GOLD, ResourceType.WOOD, 0.5
+        ))
+        self.assertAlmostEqual(
+            self.resource_manager.get_conversion_rate(
+                ResourceType.GOLD, ResourceType.ENERGY, allow_chain=True
+            ),
+            5.0
+        )
+        self.assertIsNone(
+            self.resource_manager.get_conversion_rate(
+                ResourceType.GOLD, ResourceType.GOLD, allow_chain=True
+            )
+        )
 
+    def test_transfer_batch_is_atomic(self):
+        """Test that a failing leg leaves every container unchanged"""
+        self.resource_manager.create_container("second_container", 100.0)
+        self.resource_manager.add_resource(self.test_container_id, ResourceType.GOLD, 100.0)
+        self.resource_manager.add_resource(self.test_container_id, ResourceType.WOOD, 50.0)
+        
+        # The second leg overflows the target's capacity
+        result = self.resource_manager.transfer_batch([
+            (self.test_container_id, "second_container", ResourceType.GOLD, 60.0),
+            (self.test_container_id, "second_container", ResourceType.GOLD, 40.0),
+            (self.test_container_id, "second_container", ResourceType.WOOD, 200.0)
+        ])
+        self.assertFalse(result)
+        self.assertEqual(
+            self.resource_manager.get_resource_amount(self.test_container_id, ResourceType.GOLD),
+            100.0
+        )
+        self.assertEqual(
+            self.resource_manager.get_resource_amount("second_container", ResourceType.GOLD),
+            0.0
+        )
+        
+        result = self.resource_manager.transfer_batch([
+            (self.test_container_id, "second_container", ResourceType.GOLD, 60.0),
+            (self.test_container_id, "second_container", ResourceType.WOOD, 20.0)
+        ])
+        self.assertTrue(result)
+        self.assertEqual(
+            self.resource_manager.get_resource_amount("second_container", ResourceType.GOLD),
+            60.0
+        )
+        self.assertEqual(
+            self.resource_manager.get_resource_amount(self.test_container_id, ResourceType.WOOD),
+            30.0
+        )
+        
+    def test_convert_and_transfer(self):
+        """Test converting resources straight into another container"""
+        self.resource_manager.create_container("second_container", 1000.0)
+        self.resource_manager.add_resource(self.test_container_id, ResourceType.MANA_CRYSTAL, 10.0)
+        
+        result = self.resource_manager.convert_and_transfer(
+            self.test_container_id,
+            "second_container",
+            ResourceType.MANA_CRYSTAL,
+            ResourceType.MANA,
+            5.0
+        )
+        self.assertTrue(result)
+        self.assertEqual(
+            self.resource_manager.get_resource_amount(self.test_container_id, ResourceType.MANA_CRYSTAL),
+            5.0
+        )
+        self.assertEqual(
+            self.resource_manager.get_resource_amount("second_container", ResourceType.MANA),
+            500.0
+        )
+        self.assertEqual(
+            self.resource_manager.get_resource_amount(self.test_container_id, ResourceType.MANA),
+            0.0
+        )
+        
+    def test_concurrent_transfers_conserve_totals(self):
+        """Test that concurrent transfers neither create nor lose resources"""
+        import random
+        import threading
+        
+        container_ids = [f"vault_{i}" for i in range(8)]
+        for container_id in container_ids:
+            self.resource_manager.create_container(container_id, 1000.0)
+            self.resource_manager.add_resource(container_id, ResourceType.GOLD, 100.0)
+            
+        def worker(seed: int):
+            rng = random.Random(seed)
+            for _ in range(300):
+                from_id, to_id = rng.sample(container_ids, 2)
+                self.resource_manager.transfer_resource(
+                    from_id, to_id, ResourceType.GOLD, rng.uniform(1.0, 30.0)
+                )
+                
+        threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+            
+        amounts = [
+            self.resource_manager.get_resource_amount(container_id, ResourceType.GOLD)
+            for container_id in container_ids
+        ]
+        self.assertAlmostEqual(sum(amounts), 800.0)
+        self.assertTrue(all(amount >= 0.0 for amount in amounts))
+        
+    def test_container_replaced_before_lock(self):
+        """Test that operations re-check containers once they hold the lock"""
+        from contextlib import contextmanager
+        from unittest.mock import patch
+        
+        self.resource_manager.create_container("second_container", 1000.0)
+        self.resource_manager.add_resource(self.test_container_id, ResourceType.MANA_CRYSTAL, 10.0)
+        locked = self.resource_manager._locked
+        
+        @contextmanager
+        def import_state_first(*container_ids):
+            # As if import_state swapped in a state without the container
+            # while the caller was waiting for the stripe
+            self.resource_manager.containers.pop(self.test_container_id, None)
+            with locked(*container_ids):
+                yield
+                
+        operations = [
+            lambda: self.resource_manager.add_resource(self.test_container_id, ResourceType.GOLD, 1.0),
+            lambda: self.resource_manager.remove_resource(self.test_container_id, ResourceType.GOLD, 1.0),
+            lambda: self.resource_manager.convert_and_transfer(
+                self.test_container_id, "second_container",
+                ResourceType.MANA_CRYSTAL, ResourceType.MANA, 1.0
+            ),
+            lambda: self.resource_manager.lock_container(self.test_container_id),
+            lambda: self.resource_manager.unlock_container(self.test_container_id)
+        ]
+        with patch.object(self.resource_manager, '_locked', import_state_first):
+            for operation in operations:
+                self.assertFalse(operation())
+        self.assertIsNone(
+            self.resource_manager.get_resource_amount(self.test_container_id, ResourceType.GOLD)
+        )
+        self.assertEqual(
+            self.resource_manager.get_resource_amount("second_container", ResourceType.MANA),
+            0.0
+        )
+        
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+
+from trading_system import (
+    MarketTrend,
+    MarketTrendHistory,
+    TradeItemType,
+    ITEM_TYPES,
+    SEASONAL_EFFECTS
+)
+
+class TestMarketTrendHistory(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment"""
+        self.history = MarketTrendHistory(size=30)
+
+    def test_history_is_bounded(self):
+        """Test that only the most recent samples are kept"""
+        for i in range(40):
+            self.history.push(np.full(len(ITEM_TYPES), 1.0 + i * 0.01))
+
+        weapon_history = self.history.history(TradeItemType.WEAPON)
+        self.assertEqual(len(weapon_history), 30)
+        self.assertAlmostEqual(weapon_history[0], 1.10)
+        self.assertAlmostEqual(weapon_history[-1], 1.39)
+
+    def test_running_mean_matches_full_history(self):
+        """Test running average against recomputing every change"""
+        rng = np.random.default_rng(7)
+        for _ in range(75):
+            self.history.push(rng.uniform(0.5, 1.5, len(ITEM_TYPES)))
+
+        for index, item_type in enumerate(ITEM_TYPES):
+            values = self.history.history(item_type)
+            changes = [
+                (values[i] - values[i - 1]) / values[i - 1]
+                for i in range(1, len(values))
+            ]
+            self.assertAlmostEqual(
+                self.history.average_changes()[index],
+                sum(changes) / len(changes)
+            )
+
+    def test_trend_classification(self):
+        """Test trends from a rising and a falling series"""
+        for i in range(10):
+            modifiers = np.ones(len(ITEM_TYPES))
+            modifiers[0] = 1.3 ** i
+            modifiers[1] = 0.7 ** i
+            self.history.push(modifiers)
+
+        self.assertEqual(self.history.trend(ITEM_TYPES[0]), MarketTrend.BOOMING)
+        self.assertEqual(self.history.trend(ITEM_TYPES[1]), MarketTrend.CRASHING)
+        self.assertEqual(self.history.trend(ITEM_TYPES[2]), MarketTrend.STABLE)
+
+        fluctuations = self.history.trend_fluctuations()
+        self.assertAlmostEqual(fluctuations[0], 1.4)
+        self.assertAlmostEqual(fluctuations[1], 0.6)
+        self.assertAlmostEqual(fluctuations[2], 1.0)
+
+    def test_stable_until_enough_samples(self):
+        """Test that short histories are treated as stable"""
+        for i in range(4):
+            self.history.push(np.full(len(ITEM_TYPES), 2.0 ** i))
+
+        self.assertEqual(self.history.trend(TradeItemType.GEM), MarketTrend.STABLE)
+        self.assertTrue(np.all(self.history.trend_fluctuations() == 1.0))
+
+    def test_seasonal_effects_table(self):
+        """Test the precomputed seasonal table"""
+        self.assertEqual(SEASONAL_EFFECTS["winter"][TradeItemType.FOOD], 1.3)
+        self.assertNotIn(TradeItemType.RELIC, SEASONAL_EFFECTS["summer"])
+
+if __name__ == '__main__':
+    unittest.main()
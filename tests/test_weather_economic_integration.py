@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import Mock, patch
+from types import SimpleNamespace
 import time
 from typing import Dict, List
 
@@ -14,6 +15,7 @@ from weather_economic_integration import (
 class TestWeatherEconomicIntegration(unittest.TestCase):
     def setUp(self):
         self.weather_system = Mock(spec=WeatherSystem)
+        self.weather_system.location_weather = {}
         self.economic_system = Mock(spec=EconomicSystem)
         self.integration = WeatherEconomicIntegration(
             self.weather_system,
@@ -38,13 +40,14 @@ class TestWeatherEconomicIntegration(unittest.TestCase):
             )
         }
         self.economic_system.markets = {self.test_location: self.market_items}
+        self.economic_system.trade_routes = []
+        self.economic_system.black_markets = {}
+        self.economic_system.dimensional_markets = {}
 
     def test_weather_effect_application(self):
         """Test application of weather effects to markets"""
         # Setup weather conditions
-        self.weather_system.get_weather_conditions.return_value = {
-            self.test_location: Mock(weather_type=WeatherType.STORM)
-        }
+        self.weather_system.location_weather[self.test_location] = WeatherType.STORM
         
         # Initial price
         initial_price = self.market_items[ResourceType.FOOD].current_price
@@ -69,7 +72,7 @@ class TestWeatherEconomicIntegration(unittest.TestCase):
             pattern_type="CELESTIAL_CONVERGENCE",
             alignment="CONVERGENCE"
         )
-        self.weather_system.get_active_celestial_patterns.return_value = [pattern]
+        self.integration.on_celestial_pattern(pattern)
         
         # Update integration
         self.integration.update(1.0)
@@ -84,7 +87,7 @@ class TestWeatherEconomicIntegration(unittest.TestCase):
             storm_type="CHAOS_STORM",
             affects_location=lambda x: True
         )
-        self.weather_system.get_active_magical_storms.return_value = [storm]
+        self.integration.on_magical_storm(storm)
         
         # Setup black market
         black_market = Mock(
@@ -105,9 +108,7 @@ class TestWeatherEconomicIntegration(unittest.TestCase):
     def test_trade_route_modification(self):
         """Test weather effects on trade routes"""
         # Setup weather
-        self.weather_system.get_weather_conditions.return_value = {
-            self.test_location: Mock(weather_type=WeatherType.STORM)
-        }
+        self.weather_system.location_weather[self.test_location] = WeatherType.STORM
         
         # Setup trade route
         route = Mock(
@@ -126,10 +127,7 @@ class TestWeatherEconomicIntegration(unittest.TestCase):
     def test_market_weather_status(self):
         """Test market weather status reporting"""
         # Setup weather conditions
-        weather = Mock(weather_type=WeatherType.STORM)
-        self.weather_system.get_weather_conditions.return_value = {
-            self.test_location: weather
-        }
+        self.weather_system.location_weather[self.test_location] = WeatherType.STORM
         
         # Get status
         status = self.integration.get_market_weather_status(self.test_location)
@@ -142,28 +140,114 @@ class TestWeatherEconomicIntegration(unittest.TestCase):
         self.assertIn("market_modifiers", status)
 
     def test_effect_cleanup(self):
-        """Test cleanup of expired effects"""
-        # Add test effect
-        modifier = WeatherMarketModifier(
-            price_multiplier=1.2,
-            supply_modifier=0.7,
-            demand_modifier=1.1,
-            trade_route_risk=1.5,
-            duration=1,  # Short duration
-            affected_resources=[ResourceType.FOOD],
-            affected_categories=[TradeGoodCategory.CONSUMABLES]
+        """Test cleanup of expired effects on game time"""
+        self.weather_system.location_weather[self.test_location] = WeatherType.STORM
+        self.integration.update(1.0)
+        self.assertIn(self.test_location, self.integration.active_effects)
+        
+        # Storm effects last 3600 units of game time
+        self.integration.update(3600)
+        
+        # Verify effect cleanup and reverted prices
+        self.assertNotIn(self.test_location, self.integration.active_effects)
+        self.assertAlmostEqual(
+            self.market_items[ResourceType.FOOD].current_price,
+            100
         )
-        self.integration.active_effects[self.test_location] = [modifier]
+
+    def test_stable_weather_is_not_reapplied(self):
+        """Test that unchanged weather only applies its effect once"""
+        self.weather_system.location_weather[self.test_location] = WeatherType.STORM
         
-        # Wait for effect to expire
-        time.sleep(2)
+        for _ in range(10):
+            self.integration.update(1.0)
         
-        # Update integration
+        self.assertAlmostEqual(
+            self.market_items[ResourceType.FOOD].current_price,
+            100 * 1.2
+        )
+        self.assertEqual(len(self.integration.active_effects[self.test_location]), 1)
+
+    def test_weather_transition_applies_delta(self):
+        """Test that a weather change swaps the old effect for the new one"""
+        self.integration.on_weather_changed(self.test_location, None, WeatherType.STORM)
         self.integration.update(1.0)
+        self.assertAlmostEqual(self.market_items[ResourceType.FOOD].supply, 0.7)
+        
+        self.integration.on_weather_changed(
+            self.test_location, WeatherType.STORM, WeatherType.CLEAR
+        )
+        self.integration.update(1.0)
+        
+        # Storm reverted; clear weather does not touch consumables
+        self.assertAlmostEqual(self.market_items[ResourceType.FOOD].supply, 1.0)
+        self.assertAlmostEqual(self.market_items[ResourceType.FOOD].current_price, 100)
         
-        # Verify effect cleanup
+        # The stale storm expiry must not revert anything twice
+        self.integration.update(7200)
+        self.assertAlmostEqual(self.market_items[ResourceType.FOOD].supply, 1.0)
+
+    def test_fast_forward_matches_stepping(self):
+        """Test that skipping time expires effects like individual updates"""
+        # Applied on the first tick (game time 1), so it expires at 3601
+        self.integration.on_weather_changed(self.test_location, None, WeatherType.STORM)
+        self.integration.fast_forward(1.0, 3600)
+        self.assertIn(self.test_location, self.integration.active_effects)
+        
+        self.integration.fast_forward(1.0, 1)
         self.assertNotIn(self.test_location, self.integration.active_effects)
 
+    def test_expired_storms_are_forgotten(self):
+        """Test that storm keys are pruned on expiry and new storms still apply"""
+        black_market = Mock(guard_activity=1.0, raid_chance=0.5)
+        self.economic_system.black_markets = {self.test_location: black_market}
+        first = SimpleNamespace(storm_type="CHAOS_STORM", start_time=1.0, duration=100.0,
+                                affects_location=lambda location: True)
+
+        with patch("random.random", return_value=1.0):
+            self.integration.on_magical_storm(first)
+            self.integration.on_magical_storm(first)
+            self.integration.update(1.0)
+            self.assertAlmostEqual(black_market.guard_activity, 0.7)
+            self.assertEqual(len(self.integration.applied_phenomena), 1)
+
+            self.integration.update(100.0)
+            self.assertEqual(self.integration.applied_phenomena, set())
+
+            # A later storm of the same type is a different phenomenon
+            second = SimpleNamespace(storm_type="CHAOS_STORM", start_time=500.0,
+                                     affects_location=lambda location: True)
+            self.integration.on_magical_storm(second)
+            self.integration.update(1.0)
+            self.assertAlmostEqual(black_market.guard_activity, 0.49)
+
+        self.integration.update(self.integration.DEFAULT_STORM_DURATION)
+        self.assertEqual(self.integration.applied_phenomena, set())
+
+    def test_real_weather_system_notifications(self):
+        """Test that a WeatherSystem drives the integration through its listeners"""
+        weather_system = WeatherSystem()
+        weather_system.set_location_weather(self.test_location, WeatherType.STORM)
+        integration = WeatherEconomicIntegration(weather_system, self.economic_system)
+        black_market = Mock(guard_activity=1.0, raid_chance=0.5)
+        self.economic_system.black_markets = {self.test_location: black_market}
+        food = self.market_items[ResourceType.FOOD]
+
+        # Weather set before construction is picked up by the first update
+        integration.update(1.0)
+        self.assertAlmostEqual(food.current_price, 120)
+
+        with patch("random.random", return_value=1.0):
+            weather_system.start_magical_storm(
+                MagicalStorm("CHAOS_STORM", [self.test_location], start_time=1.0)
+            )
+            integration.update(1.0)
+        self.assertAlmostEqual(black_market.guard_activity, 0.7)
+
+        weather_system.set_location_weather(self.test_location, WeatherType.CLEAR)
+        integration.update(1.0)
+        self.assertAlmostEqual(food.current_price, 100)
+
     def test_void_market_creation(self):
         """Test void market creation during void storms"""
         # Setup void storm
@@ -171,7 +255,7 @@ class TestWeatherEconomicIntegration(unittest.TestCase):
             pattern_type="VOID_STORM",
             alignment="VOID"
         )
-        self.weather_system.get_active_celestial_patterns.return_value = [pattern]
+        self.integration.on_celestial_pattern(pattern)
         
         # Update integration
         self.integration.update(1.0)
@@ -186,14 +270,12 @@ class TestWeatherEconomicIntegration(unittest.TestCase):
     def test_weather_effect_stacking(self):
         """Test stacking of multiple weather effects"""
         # Setup multiple weather conditions
-        self.weather_system.get_weather_conditions.return_value = {
-            self.test_location: Mock(weather_type=WeatherType.STORM)
-        }
+        self.weather_system.location_weather[self.test_location] = WeatherType.STORM
         pattern = Mock(
             pattern_type="CELESTIAL_CONVERGENCE",
             alignment="CONVERGENCE"
         )
-        self.weather_system.get_active_celestial_patterns.return_value = [pattern]
+        self.integration.on_celestial_pattern(pattern)
         
         # Initial price
         initial_price = self.market_items[ResourceType.FOOD].current_price
@@ -209,12 +291,7 @@ class TestWeatherEconomicIntegration(unittest.TestCase):
     def test_market_isolation(self):
         """Test market isolation during severe weather"""
         # Setup severe weather
-        self.weather_system.get_weather_conditions.return_value = {
-            self.test_location: Mock(
-                weather_type=WeatherType.STORM,
-                severity=1.0
-            )
-        }
+        self.weather_system.location_weather[self.test_location] = WeatherType.STORM
         
         # Setup trade routes
         route = Mock(
@@ -234,9 +311,7 @@ class TestWeatherEconomicIntegration(unittest.TestCase):
     def test_resource_scarcity(self):
         """Test resource scarcity during weather events"""
         # Setup weather
-        self.weather_system.get_weather_conditions.return_value = {
-            self.test_location: Mock(weather_type=WeatherType.STORM)
-        }
+        self.weather_system.location_weather[self.test_location] = WeatherType.STORM
         
         # Initial supply
         initial_supply = self.market_items[ResourceType.FOOD].supply
@@ -0,0 +1,50 @@
+"""Measure ResourceManager transfer throughput as the number of threads grows.
+
+Usage:
+    python tools/profiling/resource_transfer_benchmark.py [operations]
+"""
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.systems.resource_management import ResourceManager, ResourceType
+
+def run(num_threads: int, total_operations: int) -> float:
+    manager = ResourceManager()
+    container_ids = [f"transfer_vault_{i}" for i in range(64)]
+    for container_id in container_ids:
+        manager.create_container(container_id, 100000.0)
+        manager.add_resource(container_id, ResourceType.GOLD, 1000.0)
+
+    def worker(seed: int, num_operations: int):
+        rng = random.Random(seed)
+        for _ in range(num_operations):
+            from_id, to_id, other_id = rng.sample(container_ids, 3)
+            manager.transfer_batch([
+                (from_id, to_id, ResourceType.GOLD, 1.0),
+                (to_id, other_id, ResourceType.GOLD, 0.5)
+            ])
+
+    threads = [
+        threading.Thread(target=worker, args=(seed, total_operations // num_threads))
+        for seed in range(num_threads)
+    ]
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return total_operations / (time.perf_counter() - start_time)
+
+def main():
+    total_operations = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    for num_threads in (1, 2, 4, 8):
+        throughput = run(num_threads, total_operations)
+        print(f"{num_threads} threads: {throughput:,.0f} batches/s")
+
+if __name__ == "__main__":
+    main()